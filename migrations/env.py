@@ -30,6 +30,13 @@ target_metadata = Base.metadata
 settings = Settings()
 
 
+def include_name(name, type_, parent_names):
+    """Skip lessons partitions: they are managed at runtime, not by autogenerate."""
+    if type_ == "table":
+        return not (name or "").startswith("lessons_")
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -49,6 +56,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -60,6 +68,7 @@ def do_run_migrations(connection: Connection) -> None:
         connection=connection,
         target_metadata=target_metadata,
         compare_type=True,
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -0,0 +1,44 @@
+"""perf: lessons covering index
+
+Revision ID: 4f1c2a9d7e31
+Revises: 136cb8b0581d
+Create Date: 2026-10-19 10:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1c2a9d7e31'
+down_revision: Union[str, Sequence[str], None] = '136cb8b0581d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Folds idx_lessons_lookup into uq_lesson_unique: the unique index already
+    leads with (subgroup_id, date, start_time), so INCLUDE-ing the payload
+    columns makes it a covering index for the day and range reads.
+    """
+    op.drop_index('idx_lessons_lookup', table_name='lessons')
+    op.drop_constraint('uq_lesson_unique', 'lessons', type_='unique')
+    # op.create_unique_constraint() cannot reference INCLUDE columns
+    op.execute(
+        'ALTER TABLE lessons ADD CONSTRAINT uq_lesson_unique '
+        'UNIQUE (subgroup_id, date, start_time, subject) '
+        'INCLUDE (end_time, lesson_type, teacher, room)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_lesson_unique', 'lessons', type_='unique')
+    op.create_unique_constraint(
+        'uq_lesson_unique', 'lessons', ['subgroup_id', 'date', 'start_time', 'subject']
+    )
+    op.create_index('idx_lessons_lookup', 'lessons', ['subgroup_id', 'date'], unique=False)
@@ -0,0 +1,52 @@
+"""feat: notification outbox
+
+Revision ID: 5d1f8a2c6b47
+Revises: e2a7b4c9d613
+Create Date: 2026-10-19 18:05:26.371840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f8a2c6b47'
+down_revision: Union[str, Sequence[str], None] = 'e2a7b4c9d613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('outbox',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('key', sa.String(length=100), nullable=True),
+    sa.Column('chat_id', sa.BigInteger(), nullable=False),
+    sa.Column('body', sa.Text(), nullable=False),
+    sa.Column('attempts', sa.SmallInteger(), server_default='0', nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('available_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('done_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('error', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key')
+    )
+    op.create_index(
+        'idx_outbox_pending',
+        'outbox',
+        ['available_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('done_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'idx_outbox_pending',
+        table_name='outbox',
+        postgresql_where=sa.text('done_at IS NULL'),
+    )
+    op.drop_table('outbox')
@@ -0,0 +1,44 @@
+"""feat: lesson reminders
+
+Revision ID: 8c4e2f6a1b93
+Revises: 5d1f8a2c6b47
+Create Date: 2026-10-19 19:12:40.117305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e2f6a1b93'
+down_revision: Union[str, Sequence[str], None] = '5d1f8a2c6b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Nullable column, so existing users keep reminders off and the table is
+    not rewritten. The partial index only covers users who opted in.
+    """
+    op.add_column('users', sa.Column('remind_before_minutes', sa.SmallInteger(), nullable=True))
+    op.create_index(
+        'idx_users_reminders',
+        'users',
+        ['subgroup_id', 'remind_before_minutes', 'telegram_id'],
+        unique=False,
+        postgresql_where=sa.text('remind_before_minutes IS NOT NULL AND subgroup_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'idx_users_reminders',
+        table_name='users',
+        postgresql_where=sa.text('remind_before_minutes IS NOT NULL AND subgroup_id IS NOT NULL'),
+    )
+    op.drop_column('users', 'remind_before_minutes')
@@ -0,0 +1,108 @@
+"""perf: partition lessons by semester
+
+Revision ID: 9b7e5c3a1d20
+Revises: 4f1c2a9d7e31
+Create Date: 2026-10-19 11:04:17.294551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b7e5c3a1d20'
+down_revision: Union[str, Sequence[str], None] = '4f1c2a9d7e31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LESSON_COLUMNS = (
+    'id, subgroup_id, subject, lesson_type, date, start_time, end_time, teacher, address, room'
+)
+
+# Semester terms as in core.academic_calendar.get_semester_term:
+# fall is [Aug 1, Feb 1), spring is [Feb 1, Aug 1).
+TERM_START_SQL = """
+    SELECT DISTINCT CASE
+        WHEN extract(month FROM date) >= 8 THEN make_date(extract(year FROM date)::int, 8, 1)
+        WHEN extract(month FROM date) >= 2 THEN make_date(extract(year FROM date)::int, 2, 1)
+        ELSE make_date(extract(year FROM date)::int - 1, 8, 1)
+    END AS term_start
+    FROM lessons_unpartitioned
+    ORDER BY term_start
+"""
+
+
+def _create_lessons_table(partitioned: bool) -> None:
+    op.execute(
+        f"""
+        CREATE TABLE lessons (
+            id BIGINT NOT NULL DEFAULT nextval('lessons_id_seq'),
+            subgroup_id INTEGER NOT NULL,
+            subject VARCHAR(255) NOT NULL,
+            lesson_type lessontype NOT NULL,
+            date DATE NOT NULL,
+            start_time TIME WITHOUT TIME ZONE NOT NULL,
+            end_time TIME WITHOUT TIME ZONE NOT NULL,
+            teacher VARCHAR(255),
+            address VARCHAR(255),
+            room VARCHAR(100),
+            CONSTRAINT lessons_pkey PRIMARY KEY ({'id, date' if partitioned else 'id'}),
+            CONSTRAINT uq_lesson_unique UNIQUE (subgroup_id, date, start_time, subject)
+                INCLUDE (end_time, lesson_type, teacher, room),
+            CONSTRAINT lessons_subgroup_id_fkey FOREIGN KEY (subgroup_id)
+                REFERENCES subgroups (id) ON DELETE CASCADE
+        ) {'PARTITION BY RANGE (date)' if partitioned else ''}
+        """
+    )
+
+
+def _swap_out_lessons() -> None:
+    """Rename the current lessons table and its constraints out of the way."""
+    op.execute('ALTER TABLE lessons RENAME TO lessons_unpartitioned')
+    op.execute('ALTER TABLE lessons_unpartitioned RENAME CONSTRAINT lessons_pkey TO lessons_old_pkey')
+    op.execute(
+        'ALTER TABLE lessons_unpartitioned RENAME CONSTRAINT uq_lesson_unique TO uq_lesson_unique_old'
+    )
+    op.execute(
+        'ALTER TABLE lessons_unpartitioned '
+        'RENAME CONSTRAINT lessons_subgroup_id_fkey TO lessons_old_subgroup_id_fkey'
+    )
+
+
+def _copy_and_drop_old() -> None:
+    op.execute(
+        f'INSERT INTO lessons ({LESSON_COLUMNS}) '
+        f'SELECT {LESSON_COLUMNS} FROM lessons_unpartitioned'
+    )
+    op.execute('ALTER SEQUENCE lessons_id_seq OWNED BY lessons.id')
+    op.execute('DROP TABLE lessons_unpartitioned')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _swap_out_lessons()
+    _create_lessons_table(partitioned=True)
+    op.execute('CREATE TABLE lessons_default PARTITION OF lessons DEFAULT')
+
+    for (term_start,) in op.get_bind().execute(sa.text(TERM_START_SQL)):
+        if term_start.month == 8:
+            name = f'lessons_{term_start.year}_{term_start.year + 1}_fall'
+            term_end = term_start.replace(year=term_start.year + 1, month=2)
+        else:
+            name = f'lessons_{term_start.year - 1}_{term_start.year}_spring'
+            term_end = term_start.replace(month=8)
+        op.execute(
+            f"CREATE TABLE {name} PARTITION OF lessons "
+            f"FOR VALUES FROM ('{term_start.isoformat()}') TO ('{term_end.isoformat()}')"
+        )
+
+    _copy_and_drop_old()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _swap_out_lessons()
+    _create_lessons_table(partitioned=False)
+    _copy_and_drop_old()
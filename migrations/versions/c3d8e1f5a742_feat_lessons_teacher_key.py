@@ -0,0 +1,63 @@
+"""feat: lessons teacher key
+
+Revision ID: c3d8e1f5a742
+Revises: 9b7e5c3a1d20
+Create Date: 2026-10-19 14:21:08.617402
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8e1f5a742'
+down_revision: Union[str, Sequence[str], None] = '9b7e5c3a1d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def _teacher_key(name: str) -> str | None:
+    """Same normalization as core.schedule_parser.make_teacher_key."""
+    return NON_WORD_RE.sub(' ', name.casefold().replace('ё', 'е')).strip() or None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Backfills teacher_key per distinct teacher name in Python rather than
+    with lower() / regex classes, whose Cyrillic handling depends on the
+    database locale.
+    """
+    op.add_column('lessons', sa.Column('teacher_key', sa.String(length=255), nullable=True))
+    conn = op.get_bind()
+    teachers = conn.execute(
+        sa.text('SELECT DISTINCT teacher FROM lessons WHERE teacher IS NOT NULL')
+    ).scalars()
+    for teacher in list(teachers):
+        conn.execute(
+            sa.text('UPDATE lessons SET teacher_key = :key WHERE teacher = :teacher'),
+            {'key': _teacher_key(teacher), 'teacher': teacher},
+        )
+    op.create_index(
+        'idx_lessons_teacher',
+        'lessons',
+        ['teacher_key', 'date', 'start_time'],
+        unique=False,
+        postgresql_include=['end_time', 'subject', 'lesson_type', 'room', 'subgroup_id'],
+        postgresql_where=sa.text('teacher_key IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'idx_lessons_teacher',
+        table_name='lessons',
+        postgresql_where=sa.text('teacher_key IS NOT NULL'),
+    )
+    op.drop_column('lessons', 'teacher_key')
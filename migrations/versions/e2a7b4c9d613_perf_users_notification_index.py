@@ -0,0 +1,43 @@
+"""perf: users notification index
+
+Revision ID: e2a7b4c9d613
+Revises: c3d8e1f5a742
+Create Date: 2026-10-19 16:37:52.918204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7b4c9d613'
+down_revision: Union[str, Sequence[str], None] = 'c3d8e1f5a742'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Partial index over subscribed users with a subgroup, keyed so the daily
+    digest reads a minute's recipients in subgroup order without a heap
+    fetch or a sort.
+    """
+    op.create_index(
+        'idx_users_notification',
+        'users',
+        ['notification_time', 'subgroup_id', 'telegram_id'],
+        unique=False,
+        postgresql_where=sa.text('is_subscribed AND subgroup_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'idx_users_notification',
+        table_name='users',
+        postgresql_where=sa.text('is_subscribed AND subgroup_id IS NOT NULL'),
+    )
@@ -0,0 +1,268 @@
+import asyncio
+import logging
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Iterable
+from enum import StrEnum
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramForbiddenError, TelegramRetryAfter
+from dishka import AsyncContainer
+
+from services.settings_service import SettingsService
+
+logger = logging.getLogger(__name__)
+
+# Telegram allows about one message per second to the same chat
+CHAT_INTERVAL_SECONDS = 1.0
+MAX_RETRIES = 3
+PROGRESS_EVERY = 500
+
+
+class Delivery(StrEnum):
+    SENT = "sent"
+    BLOCKED = "blocked"
+    FAILED = "failed"
+
+
+class TokenBucket:
+    """Async token bucket shared by every sender of a broadcast.
+
+    Kept as the time the next token is due rather than a fractional token
+    count, so waiters wake exactly on their slot. Waiters are served one at
+    a time in arrival order, and `pause` pushes the next slot past a
+    deadline, so a flood-control reply stops all senders.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize TokenBucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Largest burst; 1 paces acquisitions evenly
+            clock: Monotonic time source
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._next = clock()
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds` from now."""
+        self._next = max(self._next, self._clock() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait for a token and take it."""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                # Idle time banks at most `capacity` tokens
+                self._next = max(self._next, now - (self.capacity - 1) / self.rate)
+                delay = self._next - now
+                if delay <= 0:
+                    self._next += 1 / self.rate
+                    return
+                await asyncio.sleep(delay)
+
+
+class BroadcastProgress:
+    """Running counts of a broadcast, passed to progress callbacks."""
+
+    __slots__ = ("blocked", "failed", "retried", "sent", "total")
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.sent = 0
+        self.blocked = 0
+        self.failed = 0
+        self.retried = 0
+
+    @property
+    def done(self) -> int:
+        """Messages that reached a final outcome."""
+        return self.sent + self.blocked + self.failed
+
+
+ProgressCallback = Callable[[BroadcastProgress], Awaitable[None]]
+
+
+class Broadcaster:
+    """Sends mass messages at the highest rate Telegram accepts.
+
+    Every message takes a token from one bucket shared by all broadcasts, so
+    concurrent digests and announcements together stay under the global
+    limit, and messages to the same chat are spaced by CHAT_INTERVAL_SECONDS.
+    A flood-control reply pauses the whole bucket for its retry_after and the
+    message is retried. Users who blocked the bot are unsubscribed in one
+    update when the broadcast ends.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        container: AsyncContainer,
+        rate: float = 30,
+        workers: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize Broadcaster.
+
+        Args:
+            bot: Bot to send messages with
+            container: Application container to open request scopes from
+            rate: Messages per second across all broadcasts
+            workers: Sends in flight at once, enough to hide request latency
+            clock: Monotonic time source
+        """
+        self.bot = bot
+        self.container = container
+        self.workers = workers
+        self.bucket = TokenBucket(rate, clock=clock)
+        self._clock = clock
+        self._chat_ready: dict[int, float] = {}
+        # Held while a message to the chat is paced and sent; dropped once unused
+        self._chat_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    async def broadcast(
+        self,
+        chat_ids: Iterable[int],
+        text: str,
+        on_progress: ProgressCallback | None = None,
+    ) -> BroadcastProgress:
+        """Send the same text to many chats.
+
+        Args:
+            chat_ids: Recipients
+            text: Message text
+            on_progress: Called every PROGRESS_EVERY messages and at the end
+
+        Returns:
+            Final counts
+        """
+        return await self.send_all([(chat_id, text) for chat_id in chat_ids], on_progress)
+
+    async def send_all(
+        self,
+        messages: Iterable[tuple[int, str]],
+        on_progress: ProgressCallback | None = None,
+    ) -> BroadcastProgress:
+        """Send (chat_id, text) messages.
+
+        Args:
+            messages: Messages to send
+            on_progress: Called every PROGRESS_EVERY messages and at the end
+
+        Returns:
+            Final counts
+        """
+        progress, _ = await self._send(list(messages), on_progress)
+        return progress
+
+    async def deliver_all(self, messages: Iterable[tuple[int, str]]) -> list[Delivery]:
+        """Send (chat_id, text) messages and report each one's outcome.
+
+        Args:
+            messages: Messages to send
+
+        Returns:
+            Outcome of every message, in the order given
+        """
+        _, outcomes = await self._send(list(messages), None)
+        return outcomes
+
+    async def _send(
+        self,
+        messages: list[tuple[int, str]],
+        on_progress: ProgressCallback | None,
+    ) -> tuple[BroadcastProgress, list[Delivery]]:
+        progress = BroadcastProgress(len(messages))
+        outcomes = [Delivery.FAILED] * len(messages)
+        blocked: list[int] = []
+        pending = enumerate(messages)
+
+        async def worker() -> None:
+            # Workers share one iterator; next() never awaits, so no message is taken twice
+            for index, (chat_id, text) in pending:
+                delivery = outcomes[index] = await self._deliver(chat_id, text, progress)
+                if delivery is Delivery.SENT:
+                    progress.sent += 1
+                elif delivery is Delivery.BLOCKED:
+                    progress.blocked += 1
+                    blocked.append(chat_id)
+                else:
+                    progress.failed += 1
+                if on_progress and progress.done % PROGRESS_EVERY == 0:
+                    await on_progress(progress)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.workers, len(messages)))))
+        self._forget_idle_chats()
+
+        if blocked:
+            await self._unsubscribe(blocked)
+        if on_progress and progress.done % PROGRESS_EVERY != 0:
+            await on_progress(progress)
+        logger.info(
+            "Broadcast finished: %d sent, %d blocked, %d failed, %d retried of %d",
+            progress.sent,
+            progress.blocked,
+            progress.failed,
+            progress.retried,
+            progress.total,
+        )
+        return progress, outcomes
+
+    async def _deliver(self, chat_id: int, text: str, progress: BroadcastProgress) -> Delivery:
+        lock = self._chat_locks.setdefault(chat_id, asyncio.Lock())
+        async with lock:
+            return await self._deliver_paced(chat_id, text, progress)
+
+    async def _deliver_paced(
+        self, chat_id: int, text: str, progress: BroadcastProgress
+    ) -> Delivery:
+        for _ in range(MAX_RETRIES + 1):
+            await self._wait_for_chat(chat_id)
+            await self.bucket.acquire()
+            self._chat_ready[chat_id] = self._clock() + CHAT_INTERVAL_SECONDS
+            try:
+                await self.bot.send_message(chat_id, text)
+            except TelegramRetryAfter as e:
+                # A 429 means the limit was overshot: every sender backs off, not just this one
+                logger.warning("Flood control, pausing broadcast for %ds", e.retry_after)
+                self.bucket.pause(e.retry_after)
+                progress.retried += 1
+            except TelegramForbiddenError:
+                return Delivery.BLOCKED
+            except TelegramAPIError as e:
+                logger.warning("Broadcast to %d failed: %s", chat_id, e)
+                return Delivery.FAILED
+            else:
+                return Delivery.SENT
+        logger.warning("Broadcast to %d gave up after %d retries", chat_id, MAX_RETRIES)
+        return Delivery.FAILED
+
+    async def _wait_for_chat(self, chat_id: int) -> None:
+        delay = self._chat_ready.get(chat_id, 0.0) - self._clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _forget_idle_chats(self) -> None:
+        now = self._clock()
+        self._chat_ready = {
+            chat_id: ready for chat_id, ready in self._chat_ready.items() if ready > now
+        }
+
+    async def _unsubscribe(self, chat_ids: list[int]) -> None:
+        try:
+            async with self.container() as request:
+                settings_service = await request.get(SettingsService)
+                await settings_service.unsubscribe_users(chat_ids)
+        except Exception as e:
+            logger.error("Unsubscribing %d blocked users failed: %s", len(chat_ids), e)
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+from aiogram_dialog import BaseDialogManager, DialogManager, ShowMode
+
+logger = logging.getLogger(__name__)
+
+# Renders of one chat are at least this far apart while navigating
+RENDER_WINDOW_SECONDS = 0.5
+# Render times kept before the expired ones are dropped
+RENDERED_PRUNE_SIZE = 4096
+
+
+class RenderCoalescer:
+    """Collapses bursts of navigation in a chat into one trailing render.
+
+    The first step renders at once. Steps arriving within RENDER_WINDOW_SECONDS
+    of the last render only update the dialog state and skip rendering; one
+    background update then renders whatever state the chat has reached when
+    the window closes. Five quick taps on ▶️ run the getter and edit the
+    message twice instead of five times, and a single tap is not delayed.
+    """
+
+    def __init__(
+        self,
+        window: float = RENDER_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize RenderCoalescer.
+
+        Args:
+            window: Least time between two renders of a chat, in seconds
+            clock: Monotonic time source
+        """
+        self.window = window
+        self._clock = clock
+        self._rendered: dict[int, float] = {}
+        self._pending: dict[int, asyncio.Task[None]] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of chats with a deferred render."""
+        return len(self._pending)
+
+    def coalesce(self, manager: DialogManager) -> bool:
+        """Let the current step render now or fold it into a deferred render.
+
+        Call from a navigation handler once it has updated `dialog_data`.
+
+        Returns:
+            Whether the step renders now
+        """
+        chat = manager.middleware_data.get("event_chat")
+        if chat is None:
+            return True
+
+        if chat.id in self._pending:
+            manager.show_mode = ShowMode.NO_UPDATE
+            return False
+
+        now = self._clock()
+        last = self._rendered.get(chat.id)
+        if last is None or now - last >= self.window:
+            self._rendered[chat.id] = now
+            if len(self._rendered) > RENDERED_PRUNE_SIZE:
+                self._prune(now)
+            return True
+
+        manager.show_mode = ShowMode.NO_UPDATE
+        self._pending[chat.id] = asyncio.create_task(
+            self._render_later(chat.id, manager.bg(), last + self.window - now)
+        )
+        return False
+
+    async def _render_later(self, chat_id: int, bg: BaseDialogManager, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+            self._rendered[chat_id] = self._clock()
+            # An empty update re-renders the current window from the saved state
+            await bg.update({}, show_mode=ShowMode.EDIT)
+        except Exception as e:
+            logger.warning("Deferred render for chat %d failed: %s", chat_id, e)
+        finally:
+            del self._pending[chat_id]
+
+    def _prune(self, now: float) -> None:
+        self._rendered = {
+            chat_id: rendered
+            for chat_id, rendered in self._rendered.items()
+            if now - rendered < self.window
+        }
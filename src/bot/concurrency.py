@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, User
+
+logger = logging.getLogger(__name__)
+
+# Waits for a handler slot longer than this are logged
+SLOW_WAIT_SECONDS = 1.0
+
+Handler = Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]]
+
+
+class LimiterStats(NamedTuple):
+    """Queue depths and counters of an UpdateLimiter."""
+
+    running: int
+    waiting: int
+    queued: int
+    peak_waiting: int
+    handled: int
+
+
+class _Lane:
+    """Updates of one user: the lock they take in turn and how many hold a place."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class UpdateLimiter(BaseMiddleware):
+    """Outer update middleware bounding how many updates are handled at once.
+
+    Updates of the same user are handled one at a time in arrival order, so
+    rapid clicks cannot race each other over the same dialog. None is
+    dropped: a navigation click is a relative step, so every one must be
+    applied, and collapsing their renders is left to the RenderCoalescer.
+    An update whose turn has come then waits for one of `limit` global
+    slots, so a peak queues in memory instead of exhausting the database
+    pool, and a user waiting behind themselves holds no slot.
+    """
+
+    def __init__(self, limit: int, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize UpdateLimiter.
+
+        Args:
+            limit: Updates handled at once across all users
+            clock: Monotonic time source
+        """
+        self.limit = limit
+        self._clock = clock
+        self._slots = asyncio.Semaphore(limit)
+        self._lanes: dict[int, _Lane] = {}
+        self._running = 0
+        self._waiting = 0
+        self._queued = 0
+        self._peak_waiting = 0
+        self._handled = 0
+
+    @property
+    def stats(self) -> LimiterStats:
+        """Current queue depths and totals since start."""
+        return LimiterStats(
+            running=self._running,
+            waiting=self._waiting,
+            queued=self._queued,
+            peak_waiting=self._peak_waiting,
+            handled=self._handled,
+        )
+
+    async def __call__(
+        self,
+        handler: Handler,
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        user: User | None = data.get("event_from_user")
+        if user is None:
+            return await self._handle(handler, event, data)
+
+        lane = self._lanes.get(user.id)
+        if lane is None:
+            lane = self._lanes[user.id] = _Lane()
+        lane.users += 1
+        self._queued += 1
+        queued = True
+        try:
+            async with lane.lock:
+                self._queued -= 1
+                queued = False
+                return await self._handle(handler, event, data)
+        finally:
+            if queued:
+                # Cancelled while queued
+                self._queued -= 1
+            lane.users -= 1
+            if not lane.users:
+                del self._lanes[user.id]
+
+    async def _handle(self, handler: Handler, event: TelegramObject, data: dict[str, Any]) -> Any:
+        queued_at = self._clock()
+        self._waiting += 1
+        self._peak_waiting = max(self._peak_waiting, self._waiting)
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        waited = self._clock() - queued_at
+        if waited > SLOW_WAIT_SECONDS:
+            logger.warning(
+                "Update waited %.2fs for a handler slot; %d running, %d waiting",
+                waited,
+                self._running,
+                self._waiting,
+            )
+        self._running += 1
+        try:
+            return await handler(event, data)
+        finally:
+            self._running -= 1
+            self._handled += 1
+            self._slots.release()
@@ -1,15 +1,19 @@
 from .admin import admin_dialog
+from .free_rooms import free_rooms_dialog
 from .group_selection import group_selection_dialog
 from .main_menu import main_menu_dialog
 from .onboarding import onboarding_dialog
 from .schedule import schedule_dialog
 from .settings import settings_dialog
+from .teacher_schedule import teacher_schedule_dialog
 
 __all__ = [
     "admin_dialog",
+    "free_rooms_dialog",
     "group_selection_dialog",
     "main_menu_dialog",
     "onboarding_dialog",
     "schedule_dialog",
     "settings_dialog",
+    "teacher_schedule_dialog",
 ]
@@ -0,0 +1,3 @@
+from .dialog import dialog as free_rooms_dialog
+
+__all__ = ["free_rooms_dialog"]
@@ -0,0 +1,80 @@
+from datetime import date, datetime
+
+from aiogram.types import CallbackQuery, Message
+from aiogram_dialog import DialogManager
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Button, Select
+
+from bot.dialogs.schedule.callbacks import shift_anchor
+from core.academic_calendar import UNIVERSITY_TZ, parse_time_string
+from .states import FreeRoomsSG
+
+
+def parse_time_query(text: str) -> tuple[str, str | None] | None:
+    """Parse "13:00" or "13:00-14:30" into ISO start and optional end times."""
+    text = text.replace(" ", "").replace("–", "-")
+    try:
+        if "-" in text:
+            start, end = parse_time_string(text)
+            return start.isoformat("minutes"), end.isoformat("minutes")
+        start, _ = parse_time_string(f"{text}-{text}")
+    except ValueError:
+        return None
+    return start.isoformat("minutes"), None
+
+
+async def _show_rooms(manager: DialogManager, start: str, end: str | None) -> None:
+    manager.dialog_data.update(start_time=start, end_time=end, invalid_time=False)
+    manager.dialog_data.setdefault("anchor_date", date.today().isoformat())
+    await manager.switch_to(FreeRoomsSG.rooms)
+
+
+async def on_time_entered(
+    message: Message,
+    _widget: MessageInput,
+    manager: DialogManager,
+) -> None:
+    parsed = parse_time_query(message.text or "")
+    if parsed is None:
+        manager.dialog_data["invalid_time"] = True
+        return
+    await _show_rooms(manager, *parsed)
+
+
+async def on_now(
+    _callback: CallbackQuery,
+    _widget: Button,
+    manager: DialogManager,
+) -> None:
+    now = datetime.now(UNIVERSITY_TZ)
+    manager.dialog_data["anchor_date"] = now.date().isoformat()
+    await _show_rooms(manager, now.time().isoformat("minutes"), None)
+
+
+async def on_room_selected(
+    _callback: CallbackQuery,
+    _widget: Select[str],
+    manager: DialogManager,
+    item_id: str,
+) -> None:
+    # Addresses can exceed the callback data limit, so buttons carry list positions
+    manager.dialog_data["room"] = manager.dialog_data["free_rooms"][int(item_id)]
+    await manager.switch_to(FreeRoomsSG.room)
+
+
+async def on_prev_day(
+    _callback: CallbackQuery,
+    _widget: Button,
+    manager: DialogManager,
+) -> None:
+    """Move to the previous day."""
+    shift_anchor(manager, -1)
+
+
+async def on_next_day(
+    _callback: CallbackQuery,
+    _widget: Button,
+    manager: DialogManager,
+) -> None:
+    """Move to the next day."""
+    shift_anchor(manager, 1)
@@ -0,0 +1,57 @@
+from aiogram_dialog import Dialog, Window
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Button, Cancel, Group, ScrollingGroup, Select, SwitchTo
+from aiogram_dialog.widgets.text import Const, Format
+
+from .callbacks import (
+    on_next_day,
+    on_now,
+    on_prev_day,
+    on_room_selected,
+    on_time_entered,
+)
+from .getters import get_free_rooms, get_query, get_room_schedule
+from .states import FreeRoomsSG
+
+dialog = Dialog(
+    Window(
+        Const("Введите время, например «13:00», или период, например «13:00-14:30»:"),
+        Const("\n⚠️ Не удалось распознать время.", when="invalid_time"),
+        MessageInput(on_time_entered),
+        Button(Const("🕒 Сейчас"), id="now", on_click=on_now),
+        Cancel(Const("← В меню")),
+        state=FreeRoomsSG.query,
+        getter=get_query,
+    ),
+    Window(
+        Format("{rooms_text}"),
+        ScrollingGroup(
+            Select(
+                Format("{item[1]}"),
+                id="room_select",
+                items="items",
+                item_id_getter=lambda x: str(x[0]),
+                on_click=on_room_selected,
+            ),
+            id="rooms_scroll",
+            width=1,
+            height=8,
+            hide_on_single_page=True,
+        ),
+        Group(
+            Button(Const("◀️"), id="prev_day", on_click=on_prev_day),
+            Button(Const("▶️"), id="next_day", on_click=on_next_day),
+            width=2,
+        ),
+        SwitchTo(Const("🕒 Другое время"), id="to_query", state=FreeRoomsSG.query),
+        Cancel(Const("← В меню")),
+        state=FreeRoomsSG.rooms,
+        getter=get_free_rooms,
+    ),
+    Window(
+        Format("{room_text}"),
+        SwitchTo(Const("← К списку"), id="to_rooms", state=FreeRoomsSG.rooms),
+        state=FreeRoomsSG.room,
+        getter=get_room_schedule,
+    ),
+)
@@ -0,0 +1,75 @@
+from datetime import date, time
+from typing import Any
+
+from aiogram_dialog import DialogManager
+from dishka import FromDishka
+from dishka.integrations.aiogram_dialog import inject
+
+from services.schedule_service import ScheduleService
+
+NO_DATA_TEXT = "⚠️ Нет данных о занятости аудиторий на эту дату."
+
+
+def _period_title(dialog_data: dict[str, Any]) -> str:
+    anchor = date.fromisoformat(dialog_data["anchor_date"])
+    period = dialog_data["start_time"]
+    if dialog_data.get("end_time"):
+        period += f"–{dialog_data['end_time']}"
+    return f"{anchor:%d.%m}, {period}"
+
+
+async def get_query(dialog_manager: DialogManager, **_: object) -> dict[str, Any]:
+    return {"invalid_time": dialog_manager.dialog_data.get("invalid_time", False)}
+
+
+@inject
+async def get_free_rooms(
+    dialog_manager: DialogManager,
+    schedule_service: FromDishka[ScheduleService],
+    **_: object,
+) -> dict[str, Any]:
+    data = dialog_manager.dialog_data
+    end_time = data.get("end_time")
+    rooms = await schedule_service.find_free_rooms(
+        date.fromisoformat(data["anchor_date"]),
+        time.fromisoformat(data["start_time"]),
+        time.fromisoformat(end_time) if end_time else None,
+    )
+    data["free_rooms"] = [(room.address, room.room) for room in rooms or ()]
+
+    title = f"🚪 <b>Свободные аудитории</b> ({_period_title(data)})"
+    if rooms is None:
+        text = f"{title}\n\n{NO_DATA_TEXT}"
+    elif not rooms:
+        text = f"{title}\n\n📭 Свободных аудиторий нет"
+    else:
+        text = f"{title}\n\nНайдено: {len(rooms)}. Выберите аудиторию, чтобы увидеть её занятия."
+
+    items = []
+    for position, room in enumerate(rooms or ()):
+        label = f"{room.room} — {room.address}" if room.address else room.room
+        if room.free_until is not None:
+            label += f" (до {room.free_until:%H:%M})"
+        items.append((position, label))
+
+    return {"rooms_text": text, "items": items}
+
+
+@inject
+async def get_room_schedule(
+    dialog_manager: DialogManager,
+    schedule_service: FromDishka[ScheduleService],
+    **_: object,
+) -> dict[str, Any]:
+    anchor = date.fromisoformat(dialog_manager.dialog_data["anchor_date"])
+    address, room = dialog_manager.dialog_data["room"]
+    slots = await schedule_service.get_room_schedule(anchor, address, room)
+
+    title = f"🚪 <b>{room}</b>{f' · {address}' if address else ''}\n📅 {anchor:%d.%m}"
+    if slots is None:
+        return {"room_text": f"{title}\n\n{NO_DATA_TEXT}"}
+    if not slots:
+        return {"room_text": f"{title}\n\n📭 Занятий нет"}
+
+    lines = [f"🕒 {s.start_time:%H:%M}–{s.end_time:%H:%M} — {s.subject}" for s in slots]
+    return {"room_text": f"{title}\n\n" + "\n".join(lines)}
@@ -0,0 +1,7 @@
+from aiogram.fsm.state import State, StatesGroup
+
+
+class FreeRoomsSG(StatesGroup):
+    query = State()
+    rooms = State()
+    room = State()
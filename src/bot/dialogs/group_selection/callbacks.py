@@ -1,10 +1,12 @@
-from aiogram.types import CallbackQuery
+from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import DialogManager
+from aiogram_dialog.widgets.input import MessageInput
 from aiogram_dialog.widgets.kbd import Select
 from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
 
 from services.user_service import UserService
+from .states import GroupSelectionSG
 
 
 async def on_speciality_selected(
@@ -60,3 +62,25 @@ async def on_subgroup_selected(
     telegram_id = callback.from_user.id
     await user_service.set_user_subgroup(telegram_id, subgroup_id)
     await manager.next()
+
+
+async def on_search_query(
+    message: Message,
+    _widget: MessageInput,
+    manager: DialogManager,
+) -> None:
+    manager.dialog_data["search_query"] = (message.text or "").strip()
+
+
+@inject
+async def on_search_result_selected(
+    callback: CallbackQuery,
+    _widget: Select[str],
+    manager: DialogManager,
+    item_id: str,
+    user_service: FromDishka[UserService],
+) -> None:
+    subgroup_id = int(item_id)
+    manager.dialog_data["subgroup_id"] = subgroup_id
+    await user_service.set_user_subgroup(callback.from_user.id, subgroup_id)
+    await manager.switch_to(GroupSelectionSG.success)
@@ -1,16 +1,26 @@
 from aiogram_dialog import Dialog, Window
-from aiogram_dialog.widgets.kbd import Back, Cancel, Column, Select, Start
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Back, Cancel, Column, Select, Start, SwitchTo
 from aiogram_dialog.widgets.text import Const, Format
 
 from bot.dialogs.main_menu.states import MainMenuSG
 from .callbacks import (
     on_course_selected,
     on_group_selected,
+    on_search_query,
+    on_search_result_selected,
     on_speciality_selected,
     on_stream_selected,
     on_subgroup_selected,
 )
-from .getters import get_courses, get_groups, get_specialities, get_streams, get_subgroups
+from .getters import (
+    get_courses,
+    get_groups,
+    get_search_results,
+    get_specialities,
+    get_streams,
+    get_subgroups,
+)
 from .states import GroupSelectionSG
 
 dialog = Dialog(
@@ -25,6 +35,7 @@ dialog = Dialog(
                 on_click=on_speciality_selected,
             ),
         ),
+        SwitchTo(Const("🔍 Найти по названию"), id="to_search", state=GroupSelectionSG.search),
         Cancel(Const("❌ Отмена")),
         state=GroupSelectionSG.speciality,
         getter=get_specialities,
@@ -94,4 +105,21 @@ dialog = Dialog(
         Start(Const("⬅️ Вернуться в меню"), id="to_main_menu", state=MainMenuSG.menu),
         state=GroupSelectionSG.success,
     ),
+    Window(
+        Const("Введите номер группы или специальность, например «103» или «Лечебное 2 курс»:"),
+        Format("\nНичего не найдено по запросу «{query}».", when="not_found"),
+        MessageInput(on_search_query),
+        Column(
+            Select(
+                Format("{item[1]}"),
+                id="search_select",
+                items="items",
+                item_id_getter=lambda x: str(x[0]),
+                on_click=on_search_result_selected,  # type: ignore[arg-type]
+            ),
+        ),
+        SwitchTo(Const("← Назад"), id="search_back", state=GroupSelectionSG.speciality),
+        state=GroupSelectionSG.search,
+        getter=get_search_results,
+    ),
 )
@@ -1,3 +1,5 @@
+from typing import Any
+
 from aiogram_dialog import DialogManager
 from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
@@ -69,3 +71,18 @@ async def get_subgroups(
     return {
         "items": [(sg.id, sg.name) for sg in subgroups],
     }
+
+
+@inject
+async def get_search_results(
+    dialog_manager: DialogManager,
+    group_service: FromDishka[GroupSelectionService],
+    **_: object,
+) -> dict[str, Any]:
+    query = dialog_manager.dialog_data.get("search_query", "")
+    matches = await group_service.search_subgroups(query) if query else []
+    return {
+        "query": query,
+        "not_found": bool(query) and not matches,
+        "items": [(m.subgroup_id, m.label) for m in matches],
+    }
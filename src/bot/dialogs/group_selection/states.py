@@ -10,3 +10,4 @@ class GroupSelectionSG(StatesGroup):
     group = State()
     subgroup = State()
     success = State()
+    search = State()
@@ -4,9 +4,11 @@ from aiogram_dialog.widgets.text import Const
 from magic_filter import F
 
 from bot.dialogs.admin.states import AdminSG
+from bot.dialogs.free_rooms.states import FreeRoomsSG
 from bot.dialogs.group_selection.states import GroupSelectionSG
 from bot.dialogs.schedule.states import ScheduleSG
 from bot.dialogs.settings.states import SettingsSG
+from bot.dialogs.teacher_schedule.states import TeacherScheduleSG
 from .getters import get_main_menu_data
 from .states import MainMenuSG
 
@@ -16,6 +18,12 @@ dialog = Dialog(
         Const("\n\n👥 Группа не выбрана", when=~F["has_group"]),
         Group(
             Start(Const("📅 Расписание"), id="schedule", state=ScheduleSG.view),
+            Start(
+                Const("👨‍🏫 Расписание преподавателя"),
+                id="teacher_schedule",
+                state=TeacherScheduleSG.search,
+            ),
+            Start(Const("🚪 Свободные аудитории"), id="free_rooms", state=FreeRoomsSG.query),
             Start(Const("👥 Выбрать группу"), id="group", state=GroupSelectionSG.speciality),
             Start(Const("⚙️ Настройки"), id="settings", state=SettingsSG.view),
             Start(Const("🛠 Админ-панель"), id="admin", state=AdminSG.menu, when="is_admin"),
@@ -1,8 +1,17 @@
 from datetime import date, timedelta
 
-from aiogram.types import CallbackQuery
-from aiogram_dialog import ChatEvent, DialogManager
+from aiogram.types import CallbackQuery, Message
+from aiogram_dialog import ChatEvent, DialogManager, ShowMode
 from aiogram_dialog.widgets.kbd import Button, ManagedCheckbox
+from dishka import FromDishka
+from dishka.integrations.aiogram_dialog import inject
+
+from bot.coalescing import RenderCoalescer
+from bot.files import StreamingInputFile
+from services.calendar_export import CalendarExportService
+from services.schedule_prefetcher import SchedulePrefetcher
+from services.schedule_service import ScheduleService
+from .states import ScheduleSG
 
 
 async def on_mode_changed(
@@ -13,33 +22,162 @@ async def on_mode_changed(
     manager.dialog_data["mode"] = "week" if checkbox.is_checked() else "day"
 
 
-async def on_prev(
-    _callback: CallbackQuery,
-    _widget: Button,
+async def on_skip_empty_changed(
+    _event: ChatEvent,
+    checkbox: ManagedCheckbox,
     manager: DialogManager,
 ) -> None:
-    """Navigate to previous day or week based on mode."""
+    manager.dialog_data["skip_empty"] = checkbox.is_checked()
+
+
+def shift_anchor(manager: DialogManager, direction: int) -> date:
+    """Move the anchor one day or week in `direction` and return the new anchor."""
     mode = manager.dialog_data.get("mode", "day")
     anchor_str = manager.dialog_data.get("anchor_date", date.today().isoformat())
     anchor = date.fromisoformat(anchor_str)
 
     delta = timedelta(days=1) if mode == "day" else timedelta(weeks=1)
-    new_anchor = anchor - delta
+    new_anchor = anchor + delta * direction
 
     manager.dialog_data["anchor_date"] = new_anchor.isoformat()
+    return new_anchor
+
+
+def _prefetch_ahead(
+    manager: DialogManager,
+    prefetcher: SchedulePrefetcher,
+    anchor: date,
+    direction: int,
+) -> None:
+    """Warm the cache for the anchors after `anchor` in the same direction."""
+    subgroup_id = manager.dialog_data.get("subgroup_id")
+    if subgroup_id is None:
+        return
+    weekly = manager.dialog_data.get("mode", "day") == "week"
+    prefetcher.prefetch(subgroup_id, anchor, weekly=weekly, direction=direction)
+
+
+def _prefetch_lesson_days(
+    schedule_service: ScheduleService,
+    prefetcher: SchedulePrefetcher,
+    subgroup_id: int,
+    anchor: date,
+    direction: int,
+) -> None:
+    """Warm the cache for the next days with lessons after `anchor` in the same direction."""
+    days: list[date] = []
+    day = anchor
+    for _ in range(prefetcher.depth):
+        next_day = schedule_service.find_lesson_day(subgroup_id, day, direction)
+        if next_day is None:
+            break
+        days.append(next_day)
+        day = next_day
+    prefetcher.prefetch_days(subgroup_id, days)
+
+
+async def _navigate(
+    callback: CallbackQuery,
+    manager: DialogManager,
+    schedule_service: ScheduleService,
+    prefetcher: SchedulePrefetcher,
+    coalescer: RenderCoalescer,
+    direction: int,
+) -> None:
+    subgroup_id = manager.dialog_data.get("subgroup_id")
+    skip_empty = manager.dialog_data.get("skip_empty", True)
+    if manager.dialog_data.get("mode", "day") != "day" or not skip_empty or subgroup_id is None:
+        new_anchor = shift_anchor(manager, direction)
+        _prefetch_ahead(manager, prefetcher, new_anchor, direction)
+        coalescer.coalesce(manager)
+        return
+
+    # Jump straight to the nearest day with lessons, resolved in memory
+    anchor = date.fromisoformat(manager.dialog_data.get("anchor_date", date.today().isoformat()))
+    target = schedule_service.find_lesson_day(subgroup_id, anchor, direction)
+    if target is None:
+        await callback.answer("Дальше занятий нет")
+        return
+    manager.dialog_data["anchor_date"] = target.isoformat()
+    _prefetch_lesson_days(schedule_service, prefetcher, subgroup_id, target, direction)
+    coalescer.coalesce(manager)
+
+
+@inject
+async def on_prev(
+    callback: CallbackQuery,
+    _widget: Button,
+    manager: DialogManager,
+    schedule_service: FromDishka[ScheduleService],
+    prefetcher: FromDishka[SchedulePrefetcher],
+    coalescer: FromDishka[RenderCoalescer],
+) -> None:
+    """Navigate to the previous day with lessons, day or week based on mode."""
+    await _navigate(callback, manager, schedule_service, prefetcher, coalescer, -1)
 
 
+@inject
 async def on_next(
+    callback: CallbackQuery,
+    _widget: Button,
+    manager: DialogManager,
+    schedule_service: FromDishka[ScheduleService],
+    prefetcher: FromDishka[SchedulePrefetcher],
+    coalescer: FromDishka[RenderCoalescer],
+) -> None:
+    """Navigate to the next day with lessons, day or week based on mode."""
+    await _navigate(callback, manager, schedule_service, prefetcher, coalescer, 1)
+
+
+async def on_open_month(
     _callback: CallbackQuery,
     _widget: Button,
     manager: DialogManager,
 ) -> None:
-    """Navigate to next day or week based on mode."""
-    mode = manager.dialog_data.get("mode", "day")
-    anchor_str = manager.dialog_data.get("anchor_date", date.today().isoformat())
-    anchor = date.fromisoformat(anchor_str)
+    """Open the month calendar on the month of the current anchor."""
+    anchor = date.fromisoformat(manager.dialog_data.get("anchor_date", date.today().isoformat()))
+    manager.find("month").set_offset(anchor.replace(day=1))
+    await manager.switch_to(ScheduleSG.month)
 
-    delta = timedelta(days=1) if mode == "day" else timedelta(weeks=1)
-    new_anchor = anchor + delta
 
-    manager.dialog_data["anchor_date"] = new_anchor.isoformat()
+async def on_month_day_selected(
+    _callback: CallbackQuery,
+    _widget: object,
+    manager: DialogManager,
+    selected_date: date,
+) -> None:
+    """Show the day picked in the month calendar."""
+    manager.dialog_data["anchor_date"] = selected_date.isoformat()
+    await manager.find("mode").set_checked(False)
+    await manager.switch_to(ScheduleSG.view)
+
+
+@inject
+async def on_export_calendar(
+    callback: CallbackQuery,
+    _widget: Button,
+    manager: DialogManager,
+    export_service: FromDishka[CalendarExportService],
+) -> None:
+    """Send the semester as an .ics document, reusing the last upload if unchanged."""
+    subgroup_id = manager.dialog_data.get("subgroup_id")
+    if subgroup_id is None or not isinstance(callback.message, Message):
+        return
+
+    # One date for both, so the ETag names the semester that is streamed
+    today = date.today()
+    etag = export_service.etag(subgroup_id, today)
+    file_id = export_service.cached_file_id(subgroup_id, etag)
+    if file_id is not None:
+        await callback.message.answer_document(file_id)
+    else:
+        document = StreamingInputFile(
+            export_service.stream_semester(subgroup_id, today),
+            filename=export_service.filename(subgroup_id),
+        )
+        sent = await callback.message.answer_document(document)
+        if sent.document is not None:
+            export_service.remember_file_id(subgroup_id, etag, sent.document.file_id)
+
+    # Re-send the schedule window below the document
+    manager.show_mode = ShowMode.DELETE_AND_SEND
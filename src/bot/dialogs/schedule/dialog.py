@@ -1,21 +1,26 @@
 from aiogram_dialog import Dialog, Window
-from aiogram_dialog.widgets.kbd import Button, Cancel, Checkbox, Group
+from aiogram_dialog.widgets.kbd import Button, Cancel, Checkbox, Group, SwitchTo
 from aiogram_dialog.widgets.text import Const, Format
 
 from .callbacks import (
+    on_export_calendar,
     on_mode_changed,
+    on_month_day_selected,
     on_next,
+    on_open_month,
     on_prev,
+    on_skip_empty_changed,
 )
-from .getters import get_schedule
+from .getters import get_month, get_schedule
 from .states import ScheduleSG
+from .widgets import LESSON_DAY_MARK, LessonCalendar
 
 dialog = Dialog(
     Window(
         Format("{schedule_text}"),
         Group(
-            Button(Const("◀️"), id="prev", on_click=on_prev),
-            Button(Const("▶️"), id="next", on_click=on_next),
+            Button(Const("◀️"), id="prev", on_click=on_prev),  # type: ignore[arg-type]
+            Button(Const("▶️"), id="next", on_click=on_next),  # type: ignore[arg-type]
             width=2,
         ),
         Checkbox(
@@ -24,8 +29,34 @@ dialog = Dialog(
             id="mode",
             on_state_changed=on_mode_changed,
         ),
+        Checkbox(
+            Const("⏭ Только дни с парами"),
+            Const("➡️ Все дни подряд"),
+            id="skip_empty",
+            default=True,
+            on_state_changed=on_skip_empty_changed,
+            when="is_day_mode",
+        ),
+        Button(Const("🗓 Месяц"), id="to_month", on_click=on_open_month, when="has_subgroup"),
+        Button(
+            Const("📥 Экспорт в календарь"),
+            id="export_ics",
+            on_click=on_export_calendar,  # type: ignore[arg-type]
+            when="has_subgroup",
+        ),
         Cancel(Const("← В меню")),
         state=ScheduleSG.view,
         getter=get_schedule,
     ),
+    Window(
+        Format(
+            "🗓 <b>{month_title}</b>\n"
+            "Дней с занятиями: {lesson_day_count}\n\n"
+            f"{LESSON_DAY_MARK} — есть пары. Нажмите на день, чтобы открыть его."
+        ),
+        LessonCalendar(id="month", on_click=on_month_day_selected),
+        SwitchTo(Const("← К расписанию"), id="to_view", state=ScheduleSG.view),
+        state=ScheduleSG.month,
+        getter=get_month,
+    ),
 )
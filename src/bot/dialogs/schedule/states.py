@@ -3,3 +3,4 @@ from aiogram.fsm.state import State, StatesGroup
 
 class ScheduleSG(StatesGroup):
     view = State()
+    month = State()
@@ -0,0 +1,63 @@
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from aiogram_dialog import DialogManager
+from aiogram_dialog.widgets.kbd import Calendar, CalendarScope
+from aiogram_dialog.widgets.kbd.calendar_kbd import (
+    CalendarDaysView,
+    CalendarMonthView,
+    CalendarScopeView,
+    CalendarYearsView,
+)
+from aiogram_dialog.widgets.text import Text
+
+from core.schedule_renderer import MONTH_NAMES, WEEKDAY_ABBRS
+
+LESSON_DAY_MARK = "•"
+
+
+class DateText(Text):
+    """Calendar button text computed from the button's date and the getter data."""
+
+    def __init__(self, render: Callable[[date, dict[str, Any]], str]) -> None:
+        super().__init__()
+        self._render = render
+
+    async def _render_text(self, data: dict[str, Any], _manager: DialogManager) -> str:
+        return self._render(data["date"], data["data"])
+
+
+def _day_text(template: str) -> DateText:
+    def render(day: date, data: dict[str, Any]) -> str:
+        # One bit test per button against the subgroup's lesson-day bitmap
+        mark = LESSON_DAY_MARK if day in data["lesson_days"] else ""
+        return template.format(day=day.day, mark=mark)
+
+    return DateText(render)
+
+
+class LessonCalendar(Calendar):
+    """Russian month calendar marking the days that have lessons.
+
+    The window getter must provide `lesson_days`, a container of dates.
+    """
+
+    def _init_views(self) -> dict[CalendarScope, CalendarScopeView]:
+        return {
+            CalendarScope.DAYS: CalendarDaysView(
+                self._item_callback_data,
+                date_text=_day_text("{day}{mark}"),
+                today_text=_day_text("[{day}{mark}]"),
+                weekday_text=DateText(lambda d, _: WEEKDAY_ABBRS[d.weekday()]),
+                header_text=DateText(lambda d, _: f"🗓 {MONTH_NAMES[d.month - 1]} {d.year}"),
+                prev_month_text=DateText(lambda d, _: f"<< {MONTH_NAMES[d.month - 1]}"),
+                next_month_text=DateText(lambda d, _: f"{MONTH_NAMES[d.month - 1]} >>"),
+            ),
+            CalendarScope.MONTHS: CalendarMonthView(
+                self._item_callback_data,
+                month_text=DateText(lambda d, _: MONTH_NAMES[d.month - 1]),
+                this_month_text=DateText(lambda d, _: f"[ {MONTH_NAMES[d.month - 1]} ]"),
+            ),
+            CalendarScope.YEARS: CalendarYearsView(self._item_callback_data),
+        }
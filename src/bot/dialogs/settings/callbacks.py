@@ -1,6 +1,6 @@
 from aiogram.types import CallbackQuery
 from aiogram_dialog import DialogManager
-from aiogram_dialog.widgets.kbd import ManagedCheckbox
+from aiogram_dialog.widgets.kbd import ManagedCheckbox, Select
 from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
 
@@ -28,3 +28,19 @@ async def on_toggle_notifications(
     await settings_service.toggle_notifications(callback.from_user.id, not current_state)
 
     await callback.answer("✅ Настройки обновлены")
+
+
+@inject
+async def on_reminder_selected(
+    callback: CallbackQuery,
+    _widget: Select[str],
+    _manager: DialogManager,
+    item_id: str,
+    settings_service: FromDishka[SettingsService],
+) -> None:
+    if not callback.from_user:
+        return
+
+    await settings_service.set_reminder(callback.from_user.id, int(item_id) or None)
+
+    await callback.answer("✅ Настройки обновлены")
@@ -1,20 +1,30 @@
 from aiogram_dialog import Dialog, Window
-from aiogram_dialog.widgets.kbd import Cancel, Checkbox
+from aiogram_dialog.widgets.kbd import Cancel, Checkbox, Row, Select
 from aiogram_dialog.widgets.text import Const, Format
 
-from .callbacks import on_toggle_notifications
+from .callbacks import on_reminder_selected, on_toggle_notifications
 from .getters import get_user_settings
 from .states import SettingsSG
 
 dialog = Dialog(
     Window(
         Format("{settings_text}"),
+        Const("\n⏳ Напоминать о паре за:"),
         Checkbox(
             Const("🔔 Включить уведомления"),
             Const("🔕 Отключить уведомления"),
             id="notifications",
             on_click=on_toggle_notifications,  # type: ignore[arg-type]
         ),
+        Row(
+            Select(
+                Format("{item[1]}"),
+                id="reminder",
+                item_id_getter=lambda x: str(x[0]),
+                items="reminder_options",
+                on_click=on_reminder_selected,  # type: ignore[arg-type]
+            ),
+        ),
         Cancel(Const("← Назад")),
         state=SettingsSG.view,
         getter=get_user_settings,
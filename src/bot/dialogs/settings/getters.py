@@ -4,6 +4,7 @@ from aiogram_dialog import DialogManager
 from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
 
+from services.lesson_reminders import REMINDER_LEADS
 from services.user_service import UserService
 
 
@@ -20,19 +21,31 @@ async def get_user_settings(
         return {
             "settings_text": "❌ Пользователь не найден",
             "is_subscribed": False,
+            "reminder_options": [],
         }
 
     subscription_status = "✅ Включены" if user.is_subscribed else "❌ Выключены"
     notification_time = user.notification_time.strftime("%H:%M")
 
+    reminder = user.remind_before_minutes
+    reminder_status = f"за {reminder} мин" if reminder else "❌ Выключены"
+
     settings_text = (
         f"⚙️ <b>Настройки</b>\n\n"
         f"🔔 Уведомления: {subscription_status}\n"
-        f"⏰ Время уведомлений: {notification_time}"
+        f"⏰ Время уведомлений: {notification_time}\n"
+        f"⏳ Напоминания о парах: {reminder_status}"
     )
 
+    # (minutes, label) choices; 0 turns reminders off
+    reminder_options = [
+        (minutes, f"{'✅ ' if minutes == (reminder or 0) else ''}{label}")
+        for minutes, label in [(0, "Выкл"), *((m, f"{m} мин") for m in REMINDER_LEADS)]
+    ]
+
     return {
         "settings_text": settings_text,
         "is_subscribed": user.is_subscribed,
         "notification_time": notification_time,
+        "reminder_options": reminder_options,
     }
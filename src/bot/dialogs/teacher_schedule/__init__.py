@@ -0,0 +1,3 @@
+from .dialog import dialog as teacher_schedule_dialog
+
+__all__ = ["teacher_schedule_dialog"]
@@ -0,0 +1,63 @@
+from datetime import date
+
+from aiogram.types import CallbackQuery, Message
+from aiogram_dialog import DialogManager
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Button, Select
+from dishka import FromDishka
+from dishka.integrations.aiogram_dialog import inject
+
+from bot.coalescing import RenderCoalescer
+from bot.dialogs.schedule.callbacks import shift_anchor
+from services.schedule_service import ScheduleService
+from .states import TeacherScheduleSG
+
+
+@inject
+async def on_teacher_query(
+    message: Message,
+    _widget: MessageInput,
+    manager: DialogManager,
+    schedule_service: FromDishka[ScheduleService],
+) -> None:
+    query = (message.text or "").strip()
+    manager.dialog_data["teacher_query"] = query
+    # Keys can exceed the callback data limit, so buttons carry list positions
+    manager.dialog_data["teachers"] = list(await schedule_service.find_teachers(query))
+
+
+async def on_teacher_selected(
+    _callback: CallbackQuery,
+    _widget: Select[str],
+    manager: DialogManager,
+    item_id: str,
+) -> None:
+    teacher_key, teacher_name = manager.dialog_data["teachers"][int(item_id)]
+    manager.dialog_data["teacher_key"] = teacher_key
+    manager.dialog_data["teacher_name"] = teacher_name
+    manager.dialog_data["anchor_date"] = date.today().isoformat()
+    await manager.switch_to(TeacherScheduleSG.view)
+
+
+@inject
+async def on_prev(
+    _callback: CallbackQuery,
+    _widget: Button,
+    manager: DialogManager,
+    coalescer: FromDishka[RenderCoalescer],
+) -> None:
+    """Navigate to previous day or week based on mode."""
+    shift_anchor(manager, -1)
+    coalescer.coalesce(manager)
+
+
+@inject
+async def on_next(
+    _callback: CallbackQuery,
+    _widget: Button,
+    manager: DialogManager,
+    coalescer: FromDishka[RenderCoalescer],
+) -> None:
+    """Navigate to next day or week based on mode."""
+    shift_anchor(manager, 1)
+    coalescer.coalesce(manager)
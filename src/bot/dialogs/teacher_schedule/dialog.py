@@ -0,0 +1,47 @@
+from aiogram_dialog import Dialog, Window
+from aiogram_dialog.widgets.input import MessageInput
+from aiogram_dialog.widgets.kbd import Button, Cancel, Checkbox, Column, Group, Select, SwitchTo
+from aiogram_dialog.widgets.text import Const, Format
+
+from bot.dialogs.schedule.callbacks import on_mode_changed
+from .callbacks import on_next, on_prev, on_teacher_query, on_teacher_selected
+from .getters import get_teacher_schedule, get_teachers
+from .states import TeacherScheduleSG
+
+dialog = Dialog(
+    Window(
+        Const("Введите фамилию преподавателя, например «Иванов» или «Иванов И.»:"),
+        Format("\nНичего не найдено по запросу «{query}».", when="not_found"),
+        MessageInput(on_teacher_query),  # type: ignore[arg-type]
+        Column(
+            Select(
+                Format("{item[1]}"),
+                id="teacher_select",
+                items="items",
+                item_id_getter=lambda x: str(x[0]),
+                on_click=on_teacher_selected,
+            ),
+        ),
+        Cancel(Const("← В меню")),
+        state=TeacherScheduleSG.search,
+        getter=get_teachers,
+    ),
+    Window(
+        Format("{schedule_text}"),
+        Group(
+            Button(Const("◀️"), id="prev", on_click=on_prev),  # type: ignore[arg-type]
+            Button(Const("▶️"), id="next", on_click=on_next),  # type: ignore[arg-type]
+            width=2,
+        ),
+        Checkbox(
+            Const("📆 Неделя"),
+            Const("📅 День"),
+            id="mode",
+            on_state_changed=on_mode_changed,
+        ),
+        SwitchTo(Const("🔍 Другой преподаватель"), id="to_search", state=TeacherScheduleSG.search),
+        Cancel(Const("← В меню")),
+        state=TeacherScheduleSG.view,
+        getter=get_teacher_schedule,
+    ),
+)
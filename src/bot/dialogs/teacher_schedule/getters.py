@@ -0,0 +1,71 @@
+from datetime import date
+from typing import Any
+
+from aiogram_dialog import DialogManager
+from dishka import FromDishka
+from dishka.integrations.aiogram_dialog import inject
+
+from core.schedule_renderer import (
+    LESSON_TYPE_TITLES,
+    NO_LESSONS,
+    day_header,
+    format_date_title,
+    time_range,
+)
+from services.schedule_service import ScheduleService, TeacherLesson
+
+
+def format_teacher_lesson(lesson: TeacherLesson) -> str:
+    header = f"🕒 {time_range(lesson.start_time, lesson.end_time)} — <b>{lesson.subject}</b>"
+
+    meta_parts: list[str] = [LESSON_TYPE_TITLES.get(lesson.lesson_type, lesson.lesson_type)]
+    if lesson.room:
+        meta_parts.append(f"🚪 {lesson.room}")
+    if lesson.subgroups:
+        meta_parts.append(f"👥 {', '.join(lesson.subgroups)}")
+
+    return f"{header}\n   {' · '.join(meta_parts)}"
+
+
+async def get_teachers(dialog_manager: DialogManager, **_: object) -> dict[str, Any]:
+    query = dialog_manager.dialog_data.get("teacher_query", "")
+    teachers = dialog_manager.dialog_data.get("teachers", [])
+    return {
+        "query": query,
+        "not_found": bool(query) and not teachers,
+        "items": [(position, name) for position, (_key, name) in enumerate(teachers)],
+    }
+
+
+@inject
+async def get_teacher_schedule(
+    dialog_manager: DialogManager,
+    schedule_service: FromDishka[ScheduleService],
+    **_: object,
+) -> dict[str, Any]:
+    teacher_key = dialog_manager.dialog_data["teacher_key"]
+    mode = dialog_manager.dialog_data.get("mode", "day")
+    anchor = date.fromisoformat(
+        dialog_manager.dialog_data.get("anchor_date", date.today().isoformat())
+    )
+
+    if mode == "day":
+        lessons = await schedule_service.get_teacher_schedule_for_date(teacher_key, anchor)
+    else:
+        lessons = await schedule_service.get_teacher_schedule_for_week(teacher_key, anchor)
+
+    teacher_name = dialog_manager.dialog_data["teacher_name"]
+    title = f"👨‍🏫 <b>{teacher_name}</b>\n{format_date_title(anchor, mode)}"
+
+    if not lessons:
+        return {"schedule_text": f"{title}\n\n{NO_LESSONS}"}
+
+    parts = [title]
+    current_date = None
+    for lesson in lessons:
+        if mode == "week" and lesson.date != current_date:
+            parts.append(day_header(lesson.date))
+            current_date = lesson.date
+        parts.append(format_teacher_lesson(lesson))
+
+    return {"schedule_text": "\n\n".join(parts)}
@@ -0,0 +1,6 @@
+from aiogram.fsm.state import State, StatesGroup
+
+
+class TeacherScheduleSG(StatesGroup):
+    search = State()
+    view = State()
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from dishka import AsyncContainer
+
+from core.academic_calendar import UNIVERSITY_TZ
+from services.daily_digest import DailyDigestService
+from services.outbox import OutboxService
+from services.settings_service import SettingsService
+
+logger = logging.getLogger(__name__)
+
+# Minutes missed while the loop was blocked or the bot restarting that are still sent
+DIGEST_CATCH_UP_MINUTES = 5
+
+# How often the notification wheel is rebuilt from the users table
+WHEEL_RECONCILE_INTERVAL = timedelta(hours=1)
+
+MINUTE = timedelta(minutes=1)
+
+
+def local_now() -> datetime:
+    """Current time in the university's timezone, whatever the host's is."""
+    return datetime.now(UNIVERSITY_TZ)
+
+
+class DigestDispatcher:
+    """Sends the daily digests when their subscribers' notification minute comes.
+
+    Wakes at every minute boundary, builds the due digests in a fresh request
+    scope and enqueues each subgroup's single rendered text for every one of
+    its subscribers in the outbox, which the outbox worker delivers. Messages
+    are keyed by minute and user, so dispatching a minute again enqueues
+    nothing new; on start the dispatcher therefore catches up the last
+    DIGEST_CATCH_UP_MINUTES. The notification wheel is loaded on start and
+    reconciled every WHEEL_RECONCILE_INTERVAL.
+    """
+
+    def __init__(
+        self,
+        container: AsyncContainer,
+        clock: Callable[[], datetime] = local_now,
+    ) -> None:
+        """Initialize DigestDispatcher.
+
+        Args:
+            container: Application container to open request scopes from
+            clock: Source of the current local time
+        """
+        self.container = container
+        self._clock = clock
+        self._last_minute: datetime | None = None
+        self._reconciled_at: datetime | None = None
+
+    async def run(self) -> None:
+        """Dispatch digests every minute until cancelled."""
+        logger.info("Digest dispatcher started")
+        while True:
+            now = self._clock()
+            if self._reconciled_at is None or now - self._reconciled_at >= WHEEL_RECONCILE_INTERVAL:
+                try:
+                    await self.reconcile()
+                    self._reconciled_at = now
+                except Exception as e:
+                    logger.error("Notification wheel reconciliation failed: %s", e)
+            try:
+                await self.tick(now)
+            except Exception as e:
+                logger.error("Digest dispatch failed: %s", e)
+            next_minute = now.replace(second=0, microsecond=0) + MINUTE
+            await asyncio.sleep(max((next_minute - self._clock()).total_seconds(), 0))
+
+    async def reconcile(self) -> int:
+        """Rebuild the notification wheel from the database.
+
+        Returns:
+            Number of subscribers whose wheel entry was out of date
+        """
+        async with self.container() as request:
+            settings_service = await request.get(SettingsService)
+            return await settings_service.reconcile_notification_wheel()
+
+    async def tick(self, now: datetime) -> int:
+        """Dispatch the minutes that came since the previous tick.
+
+        Returns:
+            Number of digests enqueued
+        """
+        minute = now.replace(second=0, microsecond=0)
+        first = minute - MINUTE * (DIGEST_CATCH_UP_MINUTES - 1)
+        if self._last_minute is not None:
+            first = max(self._last_minute + MINUTE, first)
+        self._last_minute = max(minute, self._last_minute or minute)
+
+        enqueued = 0
+        while first <= minute:
+            enqueued += await self.dispatch(first)
+            first += MINUTE
+        return enqueued
+
+    async def dispatch(self, minute: datetime) -> int:
+        """Build the digests due at a minute and enqueue them.
+
+        Returns:
+            Number of digests enqueued
+        """
+        async with self.container() as request:
+            digest_service = await request.get(DailyDigestService)
+            digests = await digest_service.build_digests(minute.time(), minute.date())
+            if not digests:
+                return 0
+            outbox_service = await request.get(OutboxService)
+            stamp = minute.strftime("%Y-%m-%dT%H:%M")
+            enqueued = await outbox_service.enqueue(
+                (f"digest:{stamp}:{user_id}", user_id, digest.text)
+                for digest in digests
+                for user_id in digest.user_ids
+            )
+        logger.info("Enqueued %d digests due at %s", enqueued, minute.strftime("%H:%M"))
+        return enqueued
@@ -0,0 +1,22 @@
+from collections.abc import AsyncGenerator, AsyncIterable
+
+from aiogram import Bot
+from aiogram.types import InputFile
+
+
+class StreamingInputFile(InputFile):
+    """Upload a document from an async byte stream without buffering it whole."""
+
+    def __init__(self, stream: AsyncIterable[bytes], filename: str) -> None:
+        """Initialize StreamingInputFile.
+
+        Args:
+            stream: Parts of the file in order; consumed once during upload
+            filename: Document name shown in Telegram
+        """
+        super().__init__(filename=filename)
+        self.stream = stream
+
+    async def read(self, bot: Bot) -> AsyncGenerator[bytes]:  # noqa: ARG002
+        async for chunk in self.stream:
+            yield chunk
@@ -0,0 +1,104 @@
+from collections.abc import Sequence
+from datetime import date
+
+from aiogram import Router
+from aiogram.types import (
+    InlineQuery,
+    InlineQueryResultArticle,
+    InlineQueryResultsButton,
+    InputTextMessageContent,
+)
+from dishka import FromDishka
+from dishka.integrations.aiogram import inject
+
+from core.schedule_renderer import NO_LESSONS, WEEKDAY_ABBRS, format_lesson, short_date, time_range
+from repositories.lesson_repo import LessonRow
+from services.group_search import SubgroupMatch
+from services.inline_schedule import InlineScheduleService, RenderedDay, parse_inline_query
+from services.user_service import UserService
+
+# Telegram caches answers per user and query string for this long; inline
+# queries arrive on every keystroke, so repeats never reach the bot
+INLINE_CACHE_SECONDS = 300
+
+router = Router()
+
+
+def render_inline_day(name: str, day: date, lessons: Sequence[LessonRow]) -> RenderedDay:
+    """Render a day's lessons as a message to share in a chat."""
+    title = f"📅 <b>{name}</b> · {short_date(day)} ({WEEKDAY_ABBRS[day.weekday()]})"
+    if not lessons:
+        return RenderedDay(f"{title}\n\n{NO_LESSONS}", "Занятий нет")
+
+    body = "\n\n".join(map(format_lesson, lessons))
+    summary = f"Занятий: {len(lessons)} · {time_range(lessons[0].start_time, lessons[-1].end_time)}"
+    return RenderedDay(f"{title}\n\n{body}", summary)
+
+
+async def get_rendered_days(
+    inline_service: InlineScheduleService, matches: Sequence[SubgroupMatch], day: date
+) -> list[RenderedDay]:
+    """Rendered day of every match; lessons of the uncached ones are fetched together."""
+    etags = {match.subgroup_id: inline_service.etag(match.subgroup_id) for match in matches}
+    rendered: dict[int, RenderedDay] = {}
+    missing = []
+    for match in matches:
+        cached = inline_service.cached_day(match.subgroup_id, day, etags[match.subgroup_id])
+        if cached is None:
+            missing.append(match)
+        else:
+            rendered[match.subgroup_id] = cached
+    if missing:
+        lessons = await inline_service.get_lessons([match.subgroup_id for match in missing], day)
+        for match in missing:
+            name = match.label.partition(" — ")[0]
+            day_rendered = render_inline_day(name, day, lessons[match.subgroup_id])
+            inline_service.remember_day(
+                match.subgroup_id, day, etags[match.subgroup_id], day_rendered
+            )
+            rendered[match.subgroup_id] = day_rendered
+    return [rendered[match.subgroup_id] for match in matches]
+
+
+@router.inline_query()
+@inject
+async def inline_schedule(
+    inline_query: InlineQuery,
+    inline_service: FromDishka[InlineScheduleService],
+    user_service: FromDishka[UserService],
+) -> None:
+    lookup = parse_inline_query(inline_query.query, date.today())
+
+    if lookup.group_query:
+        matches = inline_service.resolve(lookup.group_query)
+    else:
+        # A bare day word shows the user's own subgroup
+        user = await user_service.get_by_telegram_id(inline_query.from_user.id)
+        own = user and user.subgroup_id and inline_service.own_subgroup(user.subgroup_id)
+        matches = [own] if own else []
+
+    results = []
+    rendered_days = await get_rendered_days(inline_service, matches, lookup.day)
+    for match, rendered in zip(matches, rendered_days, strict=True):
+        results.append(
+            InlineQueryResultArticle(
+                id=f"{match.subgroup_id}:{lookup.day.isoformat()}",
+                title=match.label,
+                description=f"{short_date(lookup.day)} ({WEEKDAY_ABBRS[lookup.day.weekday()]}) · "
+                f"{rendered.summary}",
+                input_message_content=InputTextMessageContent(message_text=rendered.text),
+            )
+        )
+
+    button = None
+    if not results and not lookup.group_query:
+        button = InlineQueryResultsButton(text="Выбрать группу", start_parameter="inline")
+
+    # Only a bare day word depends on the user's own subgroup; answers naming
+    # a group are the same for everyone and may be shared from Telegram's cache
+    await inline_query.answer(
+        results,
+        cache_time=INLINE_CACHE_SECONDS,
+        is_personal=not lookup.group_query,
+        button=button,
+    )
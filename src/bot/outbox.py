@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
+
+from dishka import AsyncContainer
+
+from repositories.outbox_repo import OutboxRow
+from services.outbox import OutboxService
+from .broadcaster import Broadcaster, Delivery
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 100
+# Pause between claims while the outbox is empty
+OUTBOX_IDLE_SECONDS = 1.0
+# Settled messages are kept this long, then purged
+OUTBOX_RETENTION = timedelta(days=1)
+OUTBOX_PURGE_INTERVAL = timedelta(hours=1)
+
+
+class BatchStats(NamedTuple):
+    """Outcome and throughput of one delivered batch."""
+
+    claimed: int
+    sent: int
+    blocked: int
+    failed: int
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        """Messages settled per second."""
+        return self.claimed / self.seconds if self.seconds > 0 else 0.0
+
+
+class OutboxWorker:
+    """Delivers the messages persisted in the outbox.
+
+    Claims a batch in one short transaction, sends it through the
+    rate-limited broadcaster with no database session held, and records the
+    outcomes in a second transaction. Claims skip rows other workers hold, so
+    any number of replicas can run a worker, and a batch lost to a crash is
+    claimed again when its lease expires: delivery is at-least-once.
+    """
+
+    def __init__(
+        self,
+        broadcaster: Broadcaster,
+        container: AsyncContainer,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize OutboxWorker.
+
+        Args:
+            broadcaster: Broadcaster to send the messages with
+            container: Application container to open request scopes from
+            batch_size: Messages claimed at once
+            clock: Monotonic time source for the batch metrics
+        """
+        self.broadcaster = broadcaster
+        self.container = container
+        self.batch_size = batch_size
+        self._clock = clock
+        self._purged_at: float | None = None
+
+    async def run(self) -> None:
+        """Deliver batches until cancelled."""
+        logger.info("Outbox worker started")
+        while True:
+            claimed = 0
+            try:
+                claimed = (await self.process_batch()).claimed
+            except Exception as e:
+                logger.error("Outbox delivery failed: %s", e)
+            if self._purge_due():
+                try:
+                    await self.purge()
+                except Exception as e:
+                    logger.error("Outbox purge failed: %s", e)
+            if claimed < self.batch_size:
+                await asyncio.sleep(OUTBOX_IDLE_SECONDS)
+
+    async def process_batch(self) -> BatchStats:
+        """Claim, send and settle one batch.
+
+        Returns:
+            Counts and duration of the batch
+        """
+        started = self._clock()
+        async with self.container() as request:
+            outbox_service = await request.get(OutboxService)
+            rows = await outbox_service.claim_batch(self.batch_size)
+        if not rows:
+            return BatchStats(0, 0, 0, 0, 0.0)
+
+        outcomes = await self.broadcaster.deliver_all((row.chat_id, row.body) for row in rows)
+        sent: list[int] = []
+        blocked: list[int] = []
+        failed: list[OutboxRow] = []
+        for row, outcome in zip(rows, outcomes, strict=True):
+            if outcome is Delivery.SENT:
+                sent.append(row.id)
+            elif outcome is Delivery.BLOCKED:
+                blocked.append(row.id)
+            else:
+                failed.append(row)
+
+        async with self.container() as request:
+            outbox_service = await request.get(OutboxService)
+            await outbox_service.settle(sent, blocked, failed)
+
+        stats = BatchStats(len(rows), len(sent), len(blocked), len(failed), self._clock() - started)
+        logger.info(
+            "Outbox batch: %d claimed, %d sent, %d blocked, %d failed in %.2fs (%.1f msg/s)",
+            stats.claimed,
+            stats.sent,
+            stats.blocked,
+            stats.failed,
+            stats.seconds,
+            stats.rate,
+        )
+        return stats
+
+    async def purge(self) -> int:
+        """Delete messages settled more than OUTBOX_RETENTION ago.
+
+        Returns:
+            Number of messages deleted
+        """
+        async with self.container() as request:
+            outbox_service = await request.get(OutboxService)
+            return await outbox_service.purge(datetime.now(UTC) - OUTBOX_RETENTION)
+
+    def _purge_due(self) -> bool:
+        now = self._clock()
+        if (
+            self._purged_at is not None
+            and now - self._purged_at < OUTBOX_PURGE_INTERVAL.total_seconds()
+        ):
+            return False
+        self._purged_at = now
+        return True
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import datetime
+
+from dishka import AsyncContainer
+
+from services.lesson_reminders import LessonReminderService
+from services.outbox import OutboxService
+from .digest import MINUTE, local_now
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderDispatcher:
+    """Sends the pre-lesson reminders when they come due.
+
+    Wakes at every minute boundary and, in a fresh request scope, rebuilds
+    the reminder heap if it went stale, pops the due events and enqueues each
+    rendered reminder for its recipients in the outbox. Messages are keyed by
+    lesson start, lead time and user, so an event fired again after a rebuild
+    or a restart enqueues nothing new, while a user who changed their lead
+    time still gets the new reminder.
+    """
+
+    def __init__(
+        self,
+        container: AsyncContainer,
+        clock: Callable[[], datetime] = local_now,
+    ) -> None:
+        """Initialize ReminderDispatcher.
+
+        Args:
+            container: Application container to open request scopes from
+            clock: Source of the current local time
+        """
+        self.container = container
+        self._clock = clock
+
+    async def run(self) -> None:
+        """Dispatch reminders every minute until cancelled."""
+        logger.info("Reminder dispatcher started")
+        while True:
+            now = self._clock()
+            try:
+                await self.tick(now)
+            except Exception as e:
+                logger.error("Reminder dispatch failed: %s", e)
+            next_minute = now.replace(second=0, microsecond=0) + MINUTE
+            await asyncio.sleep(max((next_minute - self._clock()).total_seconds(), 0))
+
+    async def tick(self, now: datetime) -> int:
+        """Enqueue the reminders due by `now`.
+
+        Returns:
+            Number of reminders enqueued
+        """
+        async with self.container() as request:
+            reminder_service = await request.get(LessonReminderService)
+            if reminder_service.schedule.is_stale(now.date()):
+                await reminder_service.rebuild(now)
+            reminders = await reminder_service.build_reminders(now)
+            if not reminders:
+                return 0
+            outbox_service = await request.get(OutboxService)
+            return await outbox_service.enqueue(
+                (
+                    f"remind:{reminder.starts_at:%Y-%m-%dT%H:%M}:{reminder.minutes}:{user_id}",
+                    user_id,
+                    reminder.text,
+                )
+                for reminder in reminders
+                for user_id in reminder.user_ids
+            )
@@ -0,0 +1,99 @@
+import asyncio
+import contextlib
+import logging
+import signal
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+
+from core.config import BotSettings
+
+logger = logging.getLogger(__name__)
+
+# Seconds in-flight updates get to finish once the server stops accepting new ones
+WEBHOOK_SHUTDOWN_TIMEOUT = 30.0
+
+
+def create_webhook_app(dispatcher: Dispatcher, bot: Bot, settings: BotSettings) -> web.Application:
+    """Build the aiohttp app that feeds webhook updates to the dispatcher.
+
+    Requests without the configured secret token are rejected with 401.
+    Updates are handled within their request, so Telegram only counts one as
+    delivered once it was processed, and at most `webhook_max_connections`
+    are in flight per instance.
+
+    Args:
+        dispatcher: Dispatcher to feed updates to
+        bot: Bot the updates belong to
+        settings: Bot settings with the webhook configured
+
+    Returns:
+        The app, with dispatcher startup and shutdown bound to its own
+    """
+    app = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dispatcher, bot=bot, handle_in_background=False, secret_token=_secret(settings)
+    ).register(app, path=settings.webhook_path)
+    setup_application(app, dispatcher, bot=bot)
+    return app
+
+
+async def run_webhook(
+    dispatcher: Dispatcher,
+    bot: Bot,
+    settings: BotSettings,
+    stop: asyncio.Event | None = None,
+) -> None:
+    """Serve the webhook until `stop` is set or SIGINT/SIGTERM arrives.
+
+    The server listens before the webhook is set, so no delivery hits a
+    closed port. On shutdown it stops accepting updates and lets the ones in
+    flight finish. The webhook itself is left in place: other instances
+    behind the same URL keep receiving, and Telegram queues updates while
+    none is up.
+
+    Args:
+        dispatcher: Dispatcher to feed updates to
+        bot: Bot to set the webhook for
+        settings: Bot settings with the webhook configured
+        stop: Event ending the server; created and bound to signals if omitted
+    """
+    signals: list[signal.Signals] = []
+    if stop is None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            # Not supported by the Windows event loops; Ctrl+C still cancels the run
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, stop.set)
+                signals.append(sig)
+
+    runner = web.AppRunner(
+        create_webhook_app(dispatcher, bot, settings), shutdown_timeout=WEBHOOK_SHUTDOWN_TIMEOUT
+    )
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, settings.webhook_host, settings.webhook_port).start()
+        await bot.set_webhook(
+            url=settings.webhook_endpoint,
+            secret_token=_secret(settings),
+            allowed_updates=dispatcher.resolve_used_update_types(),
+            max_connections=settings.webhook_max_connections,
+        )
+        logger.info(
+            "Webhook server listening on %s:%d%s",
+            settings.webhook_host,
+            settings.webhook_port,
+            settings.webhook_path,
+        )
+        await stop.wait()
+    finally:
+        logger.info("Webhook server stopping")
+        for sig in signals:
+            asyncio.get_running_loop().remove_signal_handler(sig)
+        await runner.cleanup()
+
+
+def _secret(settings: BotSettings) -> str | None:
+    return settings.webhook_secret.get_secret_value() if settings.webhook_secret else None
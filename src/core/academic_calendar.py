@@ -1,5 +1,10 @@
 import datetime
 from enum import IntEnum, StrEnum
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+# Timezone the university gives every lesson date and time in
+UNIVERSITY_TZ = ZoneInfo("Europe/Moscow")
 
 
 class WeekDay(IntEnum):
@@ -27,6 +32,25 @@ class Semester(IntEnum):
     SPRING = 2
 
 
+FALL_TERM_START_MONTH = 8
+SPRING_TERM_START_MONTH = 2
+
+
+class SemesterTerm(NamedTuple):
+    """Half-open date range [start_date, end_date) covering one semester."""
+
+    academic_year_start: int
+    semester: Semester
+    start_date: datetime.date
+    end_date: datetime.date
+
+    @property
+    def slug(self) -> str:
+        """Stable identifier like "2025_2026_fall"."""
+        season = "fall" if self.semester == Semester.FALL else "spring"
+        return f"{self.academic_year_start}_{self.academic_year_start + 1}_{season}"
+
+
 DAY_NAME_MAP = {
     "пн": WeekDay.MONDAY,
     "вт": WeekDay.TUESDAY,
@@ -113,3 +137,35 @@ def get_semester_week_dates(
     week_end = week_start + datetime.timedelta(days=6)
 
     return week_start, week_end
+
+
+def get_semester_term(d: datetime.date) -> SemesterTerm:
+    """
+    Get the semester term containing a date.
+
+    Fall terms span August 1 to February 1 (winter exams included), spring
+    terms span February 1 to August 1 (summer exams included).
+    """
+    fall = FALL_TERM_START_MONTH
+    spring = SPRING_TERM_START_MONTH
+
+    if d.month >= fall:
+        return SemesterTerm(
+            d.year,
+            Semester.FALL,
+            datetime.date(d.year, fall, 1),
+            datetime.date(d.year + 1, spring, 1),
+        )
+    if d.month >= spring:
+        return SemesterTerm(
+            d.year - 1,
+            Semester.SPRING,
+            datetime.date(d.year, spring, 1),
+            datetime.date(d.year, fall, 1),
+        )
+    return SemesterTerm(
+        d.year - 1,
+        Semester.FALL,
+        datetime.date(d.year - 1, fall, 1),
+        datetime.date(d.year, spring, 1),
+    )
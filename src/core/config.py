@@ -1,15 +1,21 @@
+import re
 from pathlib import Path
+from typing import Self
 
 from pydantic import (
     Field,
     HttpUrl,
     PositiveInt,
     SecretStr,
+    model_validator,
 )
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 BASE_DIR = Path(__file__).parent.parent.parent
 
+# Characters Telegram accepts in a webhook secret token
+_WEBHOOK_SECRET_RE = re.compile(r"[A-Za-z0-9_-]{1,256}")
+
 
 class ConfigBase(BaseSettings):
     model_config = SettingsConfigDict(
@@ -26,24 +32,88 @@ class BotSettings(ConfigBase):
     admin_ids: list[int] = Field(default_factory=list, description="List of admin Telegram IDs")
     use_redis: bool = Field(default=False, description="Use RedisStorage vs MemoryStorage")
     run_initial_sync: bool = Field(default=True, description="Run initial schedule sync on startup")
+    webhook_url: HttpUrl | None = Field(
+        default=None,
+        description="Public HTTPS base URL to receive updates by webhook; None uses long polling",
+    )
+    webhook_path: str = Field(
+        default="/webhook", pattern=r"^/", description="Path the webhook is served and set on"
+    )
+    webhook_host: str = Field(
+        default="0.0.0.0",  # noqa: S104
+        description="Interface the webhook server binds",
+    )
+    webhook_port: int = Field(
+        default=8080, ge=1, le=65535, description="Port the webhook server listens on"
+    )
+    webhook_secret: SecretStr | None = Field(
+        default=None,
+        description="Token Telegram sends in X-Telegram-Bot-Api-Secret-Token; "
+        "required with webhook_url",
+    )
+    webhook_max_connections: int = Field(
+        default=40, ge=1, le=100, description="Concurrent connections Telegram opens to deliver"
+    )
+
+    @model_validator(mode="after")
+    def check_webhook_secret(self) -> Self:
+        if self.webhook_url is None:
+            return self
+        if self.webhook_secret is None or not _WEBHOOK_SECRET_RE.fullmatch(
+            self.webhook_secret.get_secret_value()
+        ):
+            raise ValueError(
+                "webhook_secret of 1-256 characters A-Z, a-z, 0-9, _ and - is required"
+            )
+        return self
+
+    @property
+    def webhook_endpoint(self) -> str | None:
+        """Full URL Telegram delivers updates to, or None in polling mode."""
+        if self.webhook_url is None:
+            return None
+        return str(self.webhook_url).rstrip("/") + self.webhook_path
 
 
 class DatabaseSettings(ConfigBase):
-    model_config = SettingsConfigDict(env_prefix="DB_")
+    model_config = SettingsConfigDict(env_prefix="DB_", env_parse_none_str="none")
 
     host: str = Field(default="localhost", description="DB host")
     port: int = Field(default=5432, description="DB port")
     user: str = Field(..., description="DB user")
     password: SecretStr = Field(..., description="DB password")
     database: str = Field(..., description="DB name")
+    replica_hosts: list[str] = Field(
+        default_factory=list, description="Read replica hosts as host or host:port"
+    )
+    replica_retry_seconds: PositiveInt = Field(
+        default=30, description="Seconds to skip a replica after a failed connect"
+    )
+    prepare_threshold: int | None = Field(
+        default=1,
+        ge=0,
+        description="Executions before psycopg prepares a statement server-side; "
+        "none disables (required behind PgBouncer in transaction mode)",
+    )
 
-    @property
-    def dsn(self) -> str:
+    def _build_dsn(self, host: str, port: int) -> str:
         return (
             f"postgresql+psycopg://{self.user}:{self.password.get_secret_value()}"
-            f"@{self.host}:{self.port}/{self.database}"
+            f"@{host}:{port}/{self.database}"
         )
 
+    @property
+    def dsn(self) -> str:
+        return self._build_dsn(self.host, self.port)
+
+    @property
+    def replica_dsns(self) -> list[str]:
+        dsns = []
+        for replica in self.replica_hosts:
+            host, _, port = replica.partition(":")
+            dsns.append(self._build_dsn(host, int(port) if port else self.port))
+        return dsns
+
 
 class RedisSettings(ConfigBase):
     model_config = SettingsConfigDict(env_prefix="REDIS_")
@@ -72,6 +142,22 @@ class AppSettings(ConfigBase):
 
     cache_ttl_seconds: PositiveInt = Field(default=3600)
     log_level: str = Field(default="INFO")
+    schedule_cache_size: PositiveInt = Field(
+        default=4096, description="Max cached schedule views (subgroup × date range)"
+    )
+    prefetch_depth: int = Field(
+        default=2, ge=0, description="Anchors to prefetch ahead on schedule navigation"
+    )
+    prefetch_max_pending: PositiveInt = Field(
+        default=32, description="Cap on outstanding schedule prefetch tasks"
+    )
+    broadcast_rate: PositiveInt = Field(
+        default=30, description="Messages per second for mass sends (Telegram allows about 30)"
+    )
+    update_concurrency: PositiveInt = Field(
+        default=10,
+        description="Updates handled at once; keep below the database pool size (15 by default)",
+    )
 
 
 class Settings(ConfigBase):
@@ -0,0 +1,141 @@
+import hashlib
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from .academic_calendar import UNIVERSITY_TZ
+from .schedule_renderer import LESSON_TYPE_TITLES
+
+if TYPE_CHECKING:
+    from repositories.lesson_repo import LessonRow
+
+PRODID = "-//Shrek Technologies//SZGMU Schedule Bot//RU"
+UID_DOMAIN = "szgmu-schedule-bot"
+TZID = UNIVERSITY_TZ.key
+MAX_LINE_OCTETS = 75
+
+# Moscow time has had no DST since 2014, so one STANDARD rule is exact
+_VTIMEZONE = (
+    "BEGIN:VTIMEZONE",
+    f"TZID:{TZID}",
+    "BEGIN:STANDARD",
+    "DTSTART:19700101T000000",
+    "TZOFFSETFROM:+0300",
+    "TZOFFSETTO:+0300",
+    "TZNAME:MSK",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+)
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """Fold a content line to 75 octets without splitting UTF-8 characters.
+
+    Returns:
+        The folded line terminated with CRLF
+    """
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return f"{line}\r\n"
+
+    parts: list[str] = []
+    current = ""
+    size = 0
+    limit = MAX_LINE_OCTETS
+    for char in line:
+        char_size = len(char.encode())
+        if size + char_size > limit:
+            parts.append(current)
+            # Continuation lines start with a space that counts towards the limit
+            current, size, limit = "", 0, MAX_LINE_OCTETS - 1
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _content(name: str, value: str) -> str:
+    return fold_line(f"{name}:{value}")
+
+
+def calendar_header(name: str) -> str:
+    """VCALENDAR opening lines with the calendar name and time zone."""
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        f"X-WR-TIMEZONE:{TZID}",
+        *_VTIMEZONE,
+    ]
+    return "".join(fold_line(line) for line in lines)
+
+
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+
+def render_event(lesson: LessonRow, uid_prefix: str, dtstamp: datetime) -> str:
+    """Render one lesson as a VEVENT.
+
+    Args:
+        lesson: Lesson row
+        uid_prefix: Prefix making UIDs unique per calendar, e.g. the subgroup ID
+        dtstamp: Time the calendar content was produced
+
+    Returns:
+        VEVENT lines terminated with CRLF
+    """
+    subject_hash = hashlib.sha1(lesson.subject.encode(), usedforsecurity=False).hexdigest()[:8]
+    start = f"{lesson.date:%Y%m%d}T{lesson.start_time:%H%M%S}"
+    end = f"{lesson.date:%Y%m%d}T{lesson.end_time:%H%M%S}"
+    title = LESSON_TYPE_TITLES.get(lesson.lesson_type, lesson.lesson_type)
+
+    parts = [
+        "BEGIN:VEVENT\r\n",
+        _content("UID", f"{uid_prefix}-{start}-{subject_hash}@{UID_DOMAIN}"),
+        _content("DTSTAMP", f"{dtstamp.astimezone(UTC):%Y%m%dT%H%M%SZ}"),
+        _content(f"DTSTART;TZID={TZID}", start),
+        _content(f"DTEND;TZID={TZID}", end),
+        _content("SUMMARY", escape_text(f"{lesson.subject} ({title})")),
+    ]
+    if lesson.room:
+        parts.append(_content("LOCATION", escape_text(f"ауд. {lesson.room}")))
+    if lesson.teacher:
+        parts.append(_content("DESCRIPTION", escape_text(lesson.teacher)))
+    parts.append("END:VEVENT\r\n")
+    return "".join(parts)
+
+
+async def iter_calendar(
+    name: str,
+    chunks: AsyncIterable[Sequence[LessonRow]],
+    uid_prefix: str,
+    dtstamp: datetime,
+) -> AsyncIterator[bytes]:
+    """Encode a calendar chunk by chunk as lesson rows arrive.
+
+    Args:
+        name: Calendar name shown by calendar apps
+        chunks: Lesson rows in date order, a chunk at a time
+        uid_prefix: Prefix making UIDs unique per calendar
+        dtstamp: Time the calendar content was produced
+
+    Yields:
+        UTF-8 encoded calendar parts
+    """
+    yield calendar_header(name).encode()
+    async for chunk in chunks:
+        yield "".join(render_event(lesson, uid_prefix, dtstamp) for lesson in chunk).encode()
+    yield CALENDAR_FOOTER.encode()
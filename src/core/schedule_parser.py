@@ -1,5 +1,6 @@
 import datetime
 import logging
+import re
 from typing import NamedTuple
 
 from api.schemas.responses import ScheduleLesson, XlsxScheduleDetail
@@ -15,6 +16,20 @@ from models import EducationLevel, LessonType
 
 logger = logging.getLogger(__name__)
 
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def make_teacher_key(name: str | None) -> str | None:
+    """Normalize a teacher name into a lookup key.
+
+    Case, the letter yo and punctuation are folded, so "Иванов И.И." and
+    "иванов  и. и." share the key "иванов и и".
+    """
+    if not name:
+        return None
+    key = _NON_WORD_RE.sub(" ", name.casefold().replace("ё", "е")).strip()
+    return key or None
+
 
 class ParsedLesson(NamedTuple):
     """Parsed lesson data ready for insertion."""
@@ -27,6 +42,7 @@ class ParsedLesson(NamedTuple):
     teacher: str | None
     address: str | None
     room: str | None
+    teacher_key: str | None = None
 
 
 class ParsedGroupSchedule(NamedTuple):
@@ -163,13 +179,16 @@ class ScheduleParser:
         start_time, end_time = parse_time_string(lesson_dto.pair_time)
         lesson_type = parse_lesson_type(lesson_dto.lesson_type)
 
+        teacher = (lesson_dto.lector_name or "").strip() or None
+
         return ParsedLesson(
             subject=(lesson_dto.subject_name or "").strip(),
             lesson_type=lesson_type,
             date=lesson_date,
             start_time=start_time,
             end_time=end_time,
-            teacher=(lesson_dto.lector_name or "").strip() or None,
+            teacher=teacher,
             address=(lesson_dto.location_address or "").strip() or None,
             room=(lesson_dto.auditory_number or "").strip() or None,
+            teacher_key=make_teacher_key(teacher),
         )
@@ -0,0 +1,121 @@
+from collections.abc import Sequence
+from datetime import date, time, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from models import LessonType
+
+if TYPE_CHECKING:
+    from repositories.lesson_repo import LessonRow
+
+WEEKDAY_NAMES = ("Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье")
+WEEKDAY_ABBRS = ("пн", "вт", "ср", "чт", "пт", "сб", "вс")
+MONTH_NAMES = (
+    "Январь",
+    "Февраль",
+    "Март",
+    "Апрель",
+    "Май",
+    "Июнь",
+    "Июль",
+    "Август",
+    "Сентябрь",
+    "Октябрь",
+    "Ноябрь",
+    "Декабрь",
+)
+
+LESSON_TYPE_TITLES = {
+    LessonType.LECTURE: "Лекция",
+    LessonType.SEMINAR: "Семинар",
+}
+
+NO_LESSONS = "📭 Занятий нет"
+
+
+# Lessons start and end on a handful of bell times and a view spans a few
+# dozen dates, so formatted labels are cached instead of re-running strftime
+@lru_cache(maxsize=256)
+def time_range(start: time, end: time) -> str:
+    """Format a lesson's start and end time joined by an en dash."""
+    return f"{start.hour:02d}:{start.minute:02d}–{end.hour:02d}:{end.minute:02d}"
+
+
+@lru_cache(maxsize=1024)
+def short_date(d: date) -> str:
+    """Format a date as "dd.mm"."""
+    return f"{d.day:02d}.{d.month:02d}"
+
+
+@lru_cache(maxsize=1024)
+def day_header(d: date) -> str:
+    """Bold weekday header of a day inside a week view."""
+    return f"<b>{WEEKDAY_NAMES[d.weekday()]} · {short_date(d)}</b>"
+
+
+def format_lesson(lesson: LessonRow) -> str:
+    """Format a lesson as a time and subject line followed by its details."""
+    meta = LESSON_TYPE_TITLES.get(lesson.lesson_type, lesson.lesson_type)
+    if lesson.room:
+        meta = f"{meta} · 🚪 {lesson.room}"
+    if lesson.teacher:
+        meta = f"{meta} · 👨‍🏫 {lesson.teacher}"
+    return (
+        f"🕒 {time_range(lesson.start_time, lesson.end_time)} — <b>{lesson.subject}</b>\n   {meta}"
+    )
+
+
+def format_date_title(d: date, mode: str, today: date | None = None) -> str:
+    """Format the title of a day or week view.
+
+    Args:
+        d: Shown day, or the first day of the shown week
+        mode: "day" or "week"
+        today: Date "today" and "tomorrow" are relative to, defaults to today
+    """
+    if mode != "day":
+        week_end = d + timedelta(days=6)
+        return f"📅 <b>Расписание на неделю</b> ({short_date(d)} — {short_date(week_end)})"
+
+    today = today or date.today()
+    if d == today:
+        return f"📅 <b>Расписание на сегодня</b> ({short_date(d)})"
+    if d == today + timedelta(days=1):
+        return f"📅 <b>Расписание на завтра</b> ({short_date(d)})"
+    return f"📅 <b>Расписание на {short_date(d)}</b> ({WEEKDAY_ABBRS[d.weekday()]})"
+
+
+def render_day(title: str, lessons: Sequence[LessonRow]) -> str:
+    """Render a day view: the title followed by one block per lesson."""
+    if not lessons:
+        return f"{title}\n\n{NO_LESSONS}"
+    return "\n\n".join([title, *map(format_lesson, lessons)])
+
+
+def render_reminder(minutes: int, lessons: Sequence[LessonRow]) -> str:
+    """Render a reminder of the lessons starting in `minutes`."""
+    return "\n\n".join([f"⏰ <b>Через {minutes} мин</b>", *map(format_lesson, lessons)])
+
+
+def render_week(title: str, lessons: Sequence[LessonRow]) -> str:
+    """Render a week view with a header before each day's lessons.
+
+    Args:
+        title: View title
+        lessons: Lessons sorted by date and start time
+    """
+    if not lessons:
+        return f"{title}\n\n{NO_LESSONS}"
+
+    parts = [title, "\n\n"]
+    current_date = None
+    for lesson in lessons:
+        if lesson.date != current_date:
+            if current_date is not None:
+                parts.append("\n")
+            parts.append(day_header(lesson.date))
+            parts.append("\n")
+            current_date = lesson.date
+        parts.append(format_lesson(lesson))
+        parts.append("\n\n")
+    return "".join(parts)
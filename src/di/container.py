@@ -2,6 +2,7 @@ from dishka import AsyncContainer, make_async_container
 from dishka.integrations.aiogram import AiogramProvider
 
 from .providers.api_client import ApiProvider
+from .providers.bot import BotProvider
 from .providers.config import ConfigProvider
 from .providers.database import DatabaseProvider
 from .providers.repositories import RepositoryProvider
@@ -16,5 +17,6 @@ def create_container() -> AsyncContainer:
         ApiProvider(),
         RepositoryProvider(),
         ServiceProvider(),
+        BotProvider(),
         AiogramProvider(),
     )
@@ -0,0 +1,10 @@
+from dishka import Provider, Scope, provide
+
+from bot.coalescing import RenderCoalescer
+
+
+class BotProvider(Provider):
+    @provide(scope=Scope.APP)
+    def provide_render_coalescer(self) -> RenderCoalescer:
+        # Shared by every dialog navigating a schedule, as a chat shows one at a time
+        return RenderCoalescer()
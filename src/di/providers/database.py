@@ -9,20 +9,41 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.ext.asyncio.engine import AsyncEngine
 
 from core.config import DatabaseSettings
+from repositories.session import ReadOnlySession, ReplicaPool
+
+
+def _create_engine(dsn: str, db_settings: DatabaseSettings) -> AsyncEngine:
+    return create_async_engine(
+        dsn,
+        echo=False,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        connect_args={"prepare_threshold": db_settings.prepare_threshold},
+    )
 
 
 class DatabaseProvider(Provider):
     @provide(scope=Scope.APP)
     async def provide_engine(self, db_settings: DatabaseSettings) -> AsyncIterator[AsyncEngine]:
-        engine = create_async_engine(
-            db_settings.dsn,
-            echo=False,
-            pool_pre_ping=True,
-            pool_recycle=300,
-        )
+        engine = _create_engine(db_settings.dsn, db_settings)
         yield engine
         await engine.dispose()
 
+    @provide(scope=Scope.APP)
+    async def provide_replica_pool(
+        self,
+        engine: AsyncEngine,
+        db_settings: DatabaseSettings,
+    ) -> AsyncIterator[ReplicaPool]:
+        replicas = [_create_engine(dsn, db_settings) for dsn in db_settings.replica_dsns]
+        yield ReplicaPool(
+            primary=engine,
+            replicas=replicas,
+            retry_after=db_settings.replica_retry_seconds,
+        )
+        for replica in replicas:
+            await replica.dispose()
+
     @provide(scope=Scope.APP)
     def provide_session_factory(
         self,
@@ -49,3 +70,11 @@ class DatabaseProvider(Provider):
                 raise
             finally:
                 await session.close()
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_read_session(
+        self,
+        replica_pool: ReplicaPool,
+    ) -> AsyncIterator[ReadOnlySession]:
+        async with replica_pool.session() as session:
+            yield session
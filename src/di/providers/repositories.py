@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from repositories.group_repo import GroupRepository
 from repositories.lesson_repo import LessonRepository
+from repositories.outbox_repo import OutboxRepository
 from repositories.speciality_repo import SpecialityRepository
 from repositories.subgroup_repo import SubgroupRepository
 from repositories.user_repo import UserRepository
@@ -45,3 +46,10 @@ class RepositoryProvider(Provider):
         session: AsyncSession,
     ) -> UserRepository:
         return UserRepository(session)
+
+    @provide
+    def provide_outbox_repo(
+        self,
+        session: AsyncSession,
+    ) -> OutboxRepository:
+        return OutboxRepository(session)
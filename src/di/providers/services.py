@@ -1,14 +1,32 @@
+from collections.abc import AsyncIterator
+
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.client import ScheduleAPIClient
+from core.config import AppSettings
 from repositories.group_repo import GroupRepository
 from repositories.lesson_repo import LessonRepository
+from repositories.outbox_repo import OutboxRepository
+from repositories.session import ReadOnlySession, ReplicaPool
 from repositories.speciality_repo import SpecialityRepository
 from repositories.subgroup_repo import SubgroupRepository
 from repositories.user_repo import UserRepository
+from services.calendar_export import CalendarExportService, CalendarFileCache
+from services.daily_digest import DailyDigestService
+from services.group_catalog import GroupCatalogStore
 from services.group_selection_service import GroupSelectionService
+from services.inline_schedule import InlineScheduleService, RenderedDayCache
+from services.lesson_dates import LessonDatesStore
+from services.lesson_reminders import LessonReminderService, ReminderSchedule
+from services.notification_wheel import NotificationWheel
+from services.outbox import OutboxService
+from services.room_occupancy import RoomOccupancyStore
+from services.schedule_cache import ScheduleCache
+from services.schedule_changes import LessonSnapshots, ScheduleAlertService
+from services.schedule_prefetcher import SchedulePrefetcher
 from services.schedule_service import ScheduleService
+from services.schedule_versions import ScheduleVersions
 from services.settings_service import SettingsService
 from services.sync_service import SyncService
 from services.user_service import UserService
@@ -17,36 +35,179 @@ from services.user_service import UserService
 class ServiceProvider(Provider):
     scope = Scope.REQUEST
 
+    @provide(scope=Scope.APP)
+    def provide_group_catalog_store(self) -> GroupCatalogStore:
+        return GroupCatalogStore()
+
+    @provide(scope=Scope.APP)
+    def provide_calendar_file_cache(self) -> CalendarFileCache:
+        return CalendarFileCache()
+
+    @provide(scope=Scope.APP)
+    def provide_schedule_versions(self) -> ScheduleVersions:
+        return ScheduleVersions()
+
+    @provide(scope=Scope.APP)
+    def provide_lesson_dates_store(self) -> LessonDatesStore:
+        return LessonDatesStore()
+
+    @provide(scope=Scope.APP)
+    def provide_notification_wheel(self) -> NotificationWheel:
+        return NotificationWheel()
+
+    @provide(scope=Scope.APP)
+    def provide_reminder_schedule(self) -> ReminderSchedule:
+        return ReminderSchedule()
+
+    @provide(scope=Scope.APP)
+    def provide_lesson_snapshots(self) -> LessonSnapshots:
+        return LessonSnapshots()
+
+    @provide(scope=Scope.APP)
+    def provide_rendered_day_cache(self) -> RenderedDayCache:
+        return RenderedDayCache()
+
+    @provide(scope=Scope.APP)
+    def provide_room_occupancy_store(self) -> RoomOccupancyStore:
+        return RoomOccupancyStore()
+
+    @provide(scope=Scope.APP)
+    def provide_schedule_cache(self, app_settings: AppSettings) -> ScheduleCache:
+        return ScheduleCache(
+            ttl_seconds=app_settings.cache_ttl_seconds,
+            max_entries=app_settings.schedule_cache_size,
+        )
+
+    @provide(scope=Scope.APP)
+    async def provide_schedule_prefetcher(
+        self,
+        replica_pool: ReplicaPool,
+        cache: ScheduleCache,
+        app_settings: AppSettings,
+    ) -> AsyncIterator[SchedulePrefetcher]:
+        prefetcher = SchedulePrefetcher(
+            session_factory=replica_pool.session,
+            cache=cache,
+            depth=app_settings.prefetch_depth,
+            max_pending=app_settings.prefetch_max_pending,
+        )
+        yield prefetcher
+        await prefetcher.close()
+
     @provide
     def provide_group_selection_service(
         self,
-        session: AsyncSession,
-        speciality_repo: SpecialityRepository,
-        group_repo: GroupRepository,
-        subgroup_repo: SubgroupRepository,
+        catalog_store: GroupCatalogStore,
     ) -> GroupSelectionService:
-        return GroupSelectionService(
+        return GroupSelectionService(catalog_store=catalog_store)
+
+    @provide
+    def provide_calendar_export_service(
+        self,
+        session: ReadOnlySession,
+        versions: ScheduleVersions,
+        file_cache: CalendarFileCache,
+        catalog_store: GroupCatalogStore,
+    ) -> CalendarExportService:
+        return CalendarExportService(
             session=session,
-            speciality_repo=speciality_repo,
-            group_repo=group_repo,
-            subgroup_repo=subgroup_repo,
+            lesson_repo=LessonRepository(session),
+            versions=versions,
+            file_cache=file_cache,
+            catalog_store=catalog_store,
         )
 
     @provide
-    def provide_schedule_service(
+    def provide_daily_digest_service(
+        self,
+        session: ReadOnlySession,
+        wheel: NotificationWheel,
+    ) -> DailyDigestService:
+        return DailyDigestService(
+            session=session,
+            lesson_repo=LessonRepository(session),
+            wheel=wheel,
+        )
+
+    @provide
+    def provide_lesson_reminder_service(
+        self,
+        session: ReadOnlySession,
+        schedule: ReminderSchedule,
+    ) -> LessonReminderService:
+        return LessonReminderService(
+            session=session,
+            lesson_repo=LessonRepository(session),
+            user_repo=UserRepository(session),
+            schedule=schedule,
+        )
+
+    @provide
+    def provide_outbox_service(
         self,
         session: AsyncSession,
-        lesson_repo: LessonRepository,
+        outbox_repo: OutboxRepository,
+    ) -> OutboxService:
+        return OutboxService(session=session, outbox_repo=outbox_repo)
+
+    @provide
+    def provide_schedule_alert_service(
+        self,
+        session: AsyncSession,
+        user_repo: UserRepository,
+        outbox_service: OutboxService,
+    ) -> ScheduleAlertService:
+        return ScheduleAlertService(
+            session=session, user_repo=user_repo, outbox_service=outbox_service
+        )
+
+    @provide
+    def provide_schedule_service(
+        self,
+        session: ReadOnlySession,
+        cache: ScheduleCache,
+        catalog_store: GroupCatalogStore,
+        room_store: RoomOccupancyStore,
+        lesson_dates_store: LessonDatesStore,
     ) -> ScheduleService:
-        return ScheduleService(session=session, lesson_repo=lesson_repo)
+        return ScheduleService(
+            session=session,
+            lesson_repo=LessonRepository(session),
+            cache=cache,
+            catalog_store=catalog_store,
+            room_store=room_store,
+            lesson_dates_store=lesson_dates_store,
+        )
+
+    @provide
+    def provide_inline_schedule_service(
+        self,
+        schedule_service: ScheduleService,
+        versions: ScheduleVersions,
+        rendered_cache: RenderedDayCache,
+        catalog_store: GroupCatalogStore,
+    ) -> InlineScheduleService:
+        return InlineScheduleService(
+            schedule_service=schedule_service,
+            versions=versions,
+            rendered_cache=rendered_cache,
+            catalog_store=catalog_store,
+        )
 
     @provide
     def provide_settings_service(
         self,
         session: AsyncSession,
         user_repo: UserRepository,
+        wheel: NotificationWheel,
+        reminder_schedule: ReminderSchedule,
     ) -> SettingsService:
-        return SettingsService(session=session, user_repo=user_repo)
+        return SettingsService(
+            session=session,
+            user_repo=user_repo,
+            wheel=wheel,
+            reminders=reminder_schedule,
+        )
 
     @provide
     def provide_sync_service(
@@ -57,6 +218,14 @@ class ServiceProvider(Provider):
         group_repo: GroupRepository,
         subgroup_repo: SubgroupRepository,
         lesson_repo: LessonRepository,
+        schedule_cache: ScheduleCache,
+        catalog_store: GroupCatalogStore,
+        room_store: RoomOccupancyStore,
+        schedule_versions: ScheduleVersions,
+        lesson_dates_store: LessonDatesStore,
+        reminder_schedule: ReminderSchedule,
+        lesson_snapshots: LessonSnapshots,
+        alert_service: ScheduleAlertService,
     ) -> SyncService:
         return SyncService(
             session=session,
@@ -65,6 +234,14 @@ class ServiceProvider(Provider):
             group_repo=group_repo,
             subgroup_repo=subgroup_repo,
             lesson_repo=lesson_repo,
+            schedule_cache=schedule_cache,
+            catalog_store=catalog_store,
+            room_store=room_store,
+            schedule_versions=schedule_versions,
+            lesson_dates_store=lesson_dates_store,
+            reminder_schedule=reminder_schedule,
+            lesson_snapshots=lesson_snapshots,
+            alert_service=alert_service,
         )
 
     @provide
@@ -72,8 +249,12 @@ class ServiceProvider(Provider):
         self,
         session: AsyncSession,
         user_repo: UserRepository,
+        wheel: NotificationWheel,
+        reminder_schedule: ReminderSchedule,
     ) -> UserService:
         return UserService(
             session=session,
             user_repo=user_repo,
+            wheel=wheel,
+            reminders=reminder_schedule,
         )
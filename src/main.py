@@ -12,16 +12,25 @@ from aiogram.types import BotCommand
 from aiogram_dialog import setup_dialogs
 from dishka.integrations.aiogram import setup_dishka
 
+from bot.broadcaster import Broadcaster
+from bot.concurrency import UpdateLimiter
 from bot.dialogs import (
     admin_dialog,
+    free_rooms_dialog,
     group_selection_dialog,
     main_menu_dialog,
     onboarding_dialog,
     schedule_dialog,
     settings_dialog,
+    teacher_schedule_dialog,
 )
+from bot.digest import DigestDispatcher
+from bot.handlers.inline import router as inline_router
 from bot.handlers.user import router as user_router
-from core.config import BotSettings, RedisSettings
+from bot.outbox import OutboxWorker
+from bot.reminders import ReminderDispatcher
+from bot.webhook import run_webhook
+from core.config import AppSettings, BotSettings, RedisSettings
 from di.container import create_container
 from services.sync_service import SyncService
 
@@ -71,6 +80,16 @@ async def run_initial_sync(sync_service: SyncService):
         logger.error("Initial sync failed: %s", e)
 
 
+async def load_snapshots(sync_service: SyncService) -> None:
+    """Load the in-memory group catalog, room occupancy and lesson-date snapshots."""
+    try:
+        await sync_service.refresh_catalog()
+        await sync_service.refresh_room_occupancy()
+        await sync_service.refresh_lesson_dates()
+    except Exception as e:
+        logger.error("Snapshot load failed: %s", e)
+
+
 async def main() -> None:
     logger.info("Starting bot initialization...")
 
@@ -78,6 +97,7 @@ async def main() -> None:
 
     bot_settings: BotSettings = await container.get(BotSettings)
     redis_settings: RedisSettings = await container.get(RedisSettings)
+    app_settings: AppSettings = await container.get(AppSettings)
 
     storage = create_storage(use_redis=bot_settings.use_redis, redis_settings=redis_settings)
 
@@ -88,37 +108,55 @@ async def main() -> None:
     dp = Dispatcher(storage=storage)
 
     await setup_bot_commands(bot)
+    # Registered ahead of dishka so a queued update holds no request scope
+    dp.update.outer_middleware(UpdateLimiter(app_settings.update_concurrency))
     setup_dishka(container, dp)
     setup_dialogs(dp)
 
     dp.include_router(user_router)
+    dp.include_router(inline_router)
     dp.include_routers(
         main_menu_dialog,
         onboarding_dialog,
         group_selection_dialog,
         schedule_dialog,
+        teacher_schedule_dialog,
+        free_rooms_dialog,
         settings_dialog,
         admin_dialog,
     )
 
     sync_task: asyncio.Task | None = None
-    if bot_settings.run_initial_sync:
-        async with container() as nested_container:
-            sync_service = await nested_container.get(SyncService)
+    async with container() as nested_container:
+        sync_service = await nested_container.get(SyncService)
+        await load_snapshots(sync_service)
+        if bot_settings.run_initial_sync:
             sync_task = asyncio.create_task(run_initial_sync(sync_service))
 
+    broadcaster = Broadcaster(bot, container, rate=app_settings.broadcast_rate)
+    digest_task = asyncio.create_task(DigestDispatcher(container).run())
+    reminder_task = asyncio.create_task(ReminderDispatcher(container).run())
+    outbox_task = asyncio.create_task(OutboxWorker(broadcaster, container).run())
+
     try:
-        logger.info("Bot started polling...")
-        await dp.start_polling(bot)
+        if bot_settings.webhook_url is not None:
+            logger.info("Bot started on webhook %s", bot_settings.webhook_endpoint)
+            await run_webhook(dp, bot, bot_settings)
+        else:
+            # A webhook left by a previous webhook-mode run would make getUpdates fail
+            await bot.delete_webhook()
+            logger.info("Bot started polling...")
+            await dp.start_polling(bot)
     except Exception as e:
-        logger.error("Bot polling failed: %s", e)
+        logger.error("Bot failed: %s", e)
         raise
     finally:
-        # Ensure sync task is completed or cancelled
-        if sync_task and not sync_task.done():
-            sync_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await sync_task
+        # Ensure background tasks are completed or cancelled
+        for task in (sync_task, digest_task, reminder_task, outbox_task):
+            if task and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
         await container.close()
         await bot.session.close()
 
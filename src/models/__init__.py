@@ -1,6 +1,7 @@
 from .enums import EducationLevel, LessonType
 from .group import Group
 from .lesson import Lesson
+from .outbox import OutboxMessage
 from .speciality import Speciality
 from .subgroup import Subgroup
 from .user import User
@@ -10,6 +11,7 @@ __all__ = [
     "Group",
     "Lesson",
     "LessonType",
+    "OutboxMessage",
     "Speciality",
     "Subgroup",
     "User",
@@ -20,10 +20,13 @@ class Group(Base):
     stream: Mapped[str] = mapped_column(String(10))
     name: Mapped[str] = mapped_column(String(20))
 
-    speciality: Mapped[Speciality] = relationship(back_populates="groups")
+    speciality: Mapped[Speciality] = relationship(back_populates="groups", lazy="raise")
 
     subgroups: Mapped[list[Subgroup]] = relationship(
-        back_populates="group", lazy="selectin", cascade="all, delete-orphan"
+        back_populates="group",
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     __table_args__ = (
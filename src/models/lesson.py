@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import BigInteger, ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy import DDL, BigInteger, ForeignKey, Index, String, UniqueConstraint, event, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -10,7 +10,9 @@ from .enums import LessonType
 class Lesson(Base):
     __tablename__ = "lessons"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # The table is range-partitioned by date, so the physical primary key is
+    # (id, date). The ORM identity stays on id alone, which is unique on its own.
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
     subgroup_id: Mapped[int] = mapped_column(
         ForeignKey("subgroups.id", ondelete="CASCADE"), index=False
@@ -19,15 +21,47 @@ class Lesson(Base):
     subject: Mapped[str] = mapped_column(String(255))
     lesson_type: Mapped[LessonType] = mapped_column()
 
-    date: Mapped[datetime.date] = mapped_column(index=False)
+    date: Mapped[datetime.date] = mapped_column(primary_key=True, index=False)
     start_time: Mapped[datetime.time] = mapped_column()
     end_time: Mapped[datetime.time] = mapped_column()
 
     teacher: Mapped[str | None] = mapped_column(String(255))
+    # Normalized teacher name, see core.schedule_parser.make_teacher_key
+    teacher_key: Mapped[str | None] = mapped_column(String(255))
     address: Mapped[str | None] = mapped_column(String(255))
     room: Mapped[str | None] = mapped_column(String(100))
 
+    # The unique index doubles as the covering index for day/range reads:
+    # its key order matches ORDER BY date, start_time and the rendered payload
+    # columns are INCLUDEd, so lookups are index-only scans without a sort.
     __table_args__ = (
-        Index("idx_lessons_lookup", "subgroup_id", "date"),
-        UniqueConstraint("subgroup_id", "date", "start_time", "subject", name="uq_lesson_unique"),
+        UniqueConstraint(
+            "subgroup_id",
+            "date",
+            "start_time",
+            "subject",
+            name="uq_lesson_unique",
+            postgresql_include=["end_time", "lesson_type", "teacher", "room"],
+        ),
+        # Teacher timetable reads: one index range scan across all subgroups
+        Index(
+            "idx_lessons_teacher",
+            "teacher_key",
+            "date",
+            "start_time",
+            postgresql_include=["end_time", "subject", "lesson_type", "room", "subgroup_id"],
+            postgresql_where=text("teacher_key IS NOT NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
+
+    __mapper_args__ = {"primary_key": [id]}  # noqa: RUF012
+
+
+# Catch-all partition for dates without a semester partition yet;
+# LessonRepository.ensure_partitions moves such rows out when it creates one.
+event.listen(
+    Lesson.__table__,
+    "after_create",
+    DDL("CREATE TABLE lessons_default PARTITION OF lessons DEFAULT"),
+)
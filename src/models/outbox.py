@@ -0,0 +1,43 @@
+import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, SmallInteger, String, Text, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class OutboxMessage(Base):
+    """A message waiting to be sent, or sent recently.
+
+    Rows are claimed by delivery workers with a lease (available_at moves into
+    the future), marked done after sending and purged a day later. Kept done
+    rows make `key` an idempotency key for producers.
+    """
+
+    __tablename__ = "outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    key: Mapped[str | None] = mapped_column(String(100), unique=True)
+    chat_id: Mapped[int] = mapped_column(BigInteger)
+    body: Mapped[str] = mapped_column(Text)
+
+    attempts: Mapped[int] = mapped_column(SmallInteger, default=0, server_default="0")
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    available_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    done_at: Mapped[datetime.datetime | None] = mapped_column(DateTime(timezone=True))
+    error: Mapped[str | None] = mapped_column(String(255))
+
+    # Claims read pending rows in availability order without a sort
+    __table_args__ = (
+        Index(
+            "idx_outbox_pending",
+            "available_at",
+            "id",
+            postgresql_where=text("done_at IS NULL"),
+        ),
+    )
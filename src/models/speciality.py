@@ -21,5 +21,8 @@ class Speciality(Base):
     level: Mapped[EducationLevel | None] = mapped_column(nullable=True)
 
     groups: Mapped[list[Group]] = relationship(
-        back_populates="speciality", lazy="selectin", cascade="all, delete-orphan"
+        back_populates="speciality",
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
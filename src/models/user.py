@@ -1,6 +1,6 @@
 from datetime import time
 
-from sqlalchemy import BigInteger, Boolean, ForeignKey, String
+from sqlalchemy import BigInteger, Boolean, ForeignKey, Index, SmallInteger, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -20,5 +20,28 @@ class User(Base):
     # Subscription Config
     is_subscribed: Mapped[bool] = mapped_column(Boolean, default=False)
     notification_time: Mapped[time] = mapped_column(default=time(7, 0))  # 7:00 AM default
-
-    subgroup: Mapped[Subgroup] = relationship()
+    # Minutes before each lesson to send a reminder at; None turns reminders off
+    remind_before_minutes: Mapped[int | None] = mapped_column(SmallInteger)
+
+    subgroup: Mapped[Subgroup] = relationship(lazy="raise")
+
+    # Notification wheel load: every subscriber with a subgroup and their
+    # time, read by an index-only scan
+    __table_args__ = (
+        Index(
+            "idx_users_notification",
+            "notification_time",
+            "subgroup_id",
+            "telegram_id",
+            postgresql_where=text("is_subscribed AND subgroup_id IS NOT NULL"),
+        ),
+        # Lesson reminders: distinct (subgroup, lead) pairs and the recipients
+        # of one pair, both read by index-only scans
+        Index(
+            "idx_users_reminders",
+            "subgroup_id",
+            "remind_before_minutes",
+            "telegram_id",
+            postgresql_where=text("remind_before_minutes IS NOT NULL AND subgroup_id IS NOT NULL"),
+        ),
+    )
@@ -1,12 +1,24 @@
 from collections.abc import Sequence
+from typing import NamedTuple
 
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload
 
 from models.group import Group
 from repositories.base import BaseRepository
 
 
+class GroupRow(NamedTuple):
+    """Read-only group projection for the group catalog."""
+
+    id: int
+    speciality_id: int
+    course_number: int
+    stream: str
+    name: str
+
+
 class GroupRepository(BaseRepository):
     """Repository for group operations."""
 
@@ -36,17 +48,17 @@ class GroupRepository(BaseRepository):
                 },
             )
             .returning(Group)
+            .execution_options(populate_existing=True)
         )
 
         result = await self.session.execute(stmt)
-        group = result.scalar_one()
+        return result.scalar_one()
 
-        await self.session.refresh(group)
-        return group
-
-    async def find_by_id(self, group_id: int) -> Group | None:
-        """Find group by ID with relationships loaded."""
+    async def find_by_id(self, group_id: int, load_subgroups: bool = False) -> Group | None:
+        """Find group by ID, optionally with its subgroups eagerly loaded."""
         stmt = select(Group).where(Group.id == group_id)
+        if load_subgroups:
+            stmt = stmt.options(selectinload(Group.subgroups))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -57,7 +69,7 @@ class GroupRepository(BaseRepository):
         stream: str,
         name: str,
     ) -> Group | None:
-        """Find group by its complete structure with relationships loaded."""
+        """Find group by its complete structure."""
         stmt = select(Group).where(
             Group.speciality_id == speciality_id,
             Group.course_number == course_number,
@@ -114,3 +126,11 @@ class GroupRepository(BaseRepository):
         )
         result = await self.session.execute(stmt)
         return result.scalars().all()
+
+    async def find_all_rows(self) -> Sequence[GroupRow]:
+        """Find all groups as GroupRow tuples."""
+        stmt = select(
+            Group.id, Group.speciality_id, Group.course_number, Group.stream, Group.name
+        ).order_by(Group.name)
+        result = await self.session.execute(stmt)
+        return [GroupRow._make(row) for row in result.tuples()]
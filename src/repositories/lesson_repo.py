@@ -1,13 +1,74 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
 from datetime import date, time
-from typing import Any
+from typing import Any, NamedTuple
 
-from sqlalchemy import and_, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import and_, column, delete, func, select, table, text, tuple_
+from sqlalchemy.dialects.postgresql import Insert, insert
 
+from core.academic_calendar import SemesterTerm, get_semester_term
 from models import Lesson, LessonType
 from repositories.base import BaseRepository
 
+DEFAULT_PARTITION = "lessons_default"
+DEFAULT_CHUNK_SIZE = 500
+
+
+class LessonRow(NamedTuple):
+    """Read-only lesson projection with only the columns needed for rendering."""
+
+    date: date
+    start_time: time
+    end_time: time
+    subject: str
+    lesson_type: LessonType
+    teacher: str | None
+    room: str | None
+
+
+class TeacherLessonRow(NamedTuple):
+    """Read-only projection of a teacher's lesson in one subgroup."""
+
+    date: date
+    start_time: time
+    end_time: time
+    subject: str
+    lesson_type: LessonType
+    room: str | None
+    subgroup_id: int
+
+
+class RoomSlotRow(NamedTuple):
+    """Read-only projection of a lesson's place and time."""
+
+    date: date
+    address: str | None
+    room: str
+    start_time: time
+    end_time: time
+    subject: str
+
+
+_LESSON_ROW_COLUMNS = (
+    Lesson.date,
+    Lesson.start_time,
+    Lesson.end_time,
+    Lesson.subject,
+    Lesson.lesson_type,
+    Lesson.teacher,
+    Lesson.room,
+)
+
+# Key and INCLUDE columns of idx_lessons_teacher, so teacher reads are index-only
+_TEACHER_LESSON_ROW_COLUMNS = (
+    Lesson.date,
+    Lesson.start_time,
+    Lesson.end_time,
+    Lesson.subject,
+    Lesson.lesson_type,
+    Lesson.room,
+    Lesson.subgroup_id,
+)
+
 
 class LessonRepository(BaseRepository):
     """Repository for lesson operations."""
@@ -23,6 +84,7 @@ class LessonRepository(BaseRepository):
         teacher: str | None = None,
         address: str | None = None,
         room: str | None = None,
+        teacher_key: str | None = None,
     ) -> Lesson:
         """Upsert a lesson based on unique constraint."""
         stmt = (
@@ -35,6 +97,7 @@ class LessonRepository(BaseRepository):
                 start_time=start_time,
                 end_time=end_time,
                 teacher=teacher,
+                teacher_key=teacher_key,
                 address=address,
                 room=room,
             )
@@ -44,18 +107,17 @@ class LessonRepository(BaseRepository):
                     "subject": subject,
                     "lesson_type": lesson_type,
                     "teacher": teacher,
+                    "teacher_key": teacher_key,
                     "address": address,
                     "room": room,
                 },
             )
             .returning(Lesson)
+            .execution_options(populate_existing=True)
         )
 
         result = await self.session.execute(stmt)
-        lesson = result.scalar_one()
-
-        await self.session.refresh(lesson)
-        return lesson
+        return result.scalar_one()
 
     async def bulk_upsert(self, lessons_data: Sequence[dict[str, Any]]) -> Sequence[Lesson]:
         """Bulk upsert lessons."""
@@ -63,16 +125,21 @@ class LessonRepository(BaseRepository):
             return []
 
         insert_stmt = insert(Lesson).values(lessons_data)
-        stmt = insert_stmt.on_conflict_do_update(
-            constraint="uq_lesson_unique",
-            set_={
-                "end_time": insert_stmt.excluded.end_time,
-                "teacher": insert_stmt.excluded.teacher,
-                "lesson_type": insert_stmt.excluded.lesson_type,
-                "address": insert_stmt.excluded.address,
-                "room": insert_stmt.excluded.room,
-            },
-        ).returning(Lesson)
+        stmt = (
+            insert_stmt.on_conflict_do_update(
+                constraint="uq_lesson_unique",
+                set_={
+                    "end_time": insert_stmt.excluded.end_time,
+                    "teacher": insert_stmt.excluded.teacher,
+                    "teacher_key": insert_stmt.excluded.teacher_key,
+                    "lesson_type": insert_stmt.excluded.lesson_type,
+                    "address": insert_stmt.excluded.address,
+                    "room": insert_stmt.excluded.room,
+                },
+            )
+            .returning(Lesson)
+            .execution_options(populate_existing=True)
+        )
 
         result = await self.session.execute(stmt)
         return result.scalars().all()
@@ -114,3 +181,302 @@ class LessonRepository(BaseRepository):
         )
         result = await self.session.execute(stmt)
         return result.scalars().all()
+
+    async def find_rows_for_subgroup_on_date(
+        self,
+        subgroup_id: int,
+        lesson_date: date,
+    ) -> Sequence[LessonRow]:
+        """Find lesson rows for a subgroup on a specific date without ORM hydration."""
+        stmt = (
+            select(*_LESSON_ROW_COLUMNS)
+            .where(
+                Lesson.subgroup_id == subgroup_id,
+                Lesson.date == lesson_date,
+            )
+            .order_by(Lesson.start_time)
+        )
+        result = await self.session.execute(stmt)
+        return [LessonRow._make(row) for row in result.tuples()]
+
+    async def find_rows_for_subgroup_in_range(
+        self,
+        subgroup_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[LessonRow]:
+        """Find lesson rows for a subgroup within a date range without ORM hydration."""
+        stmt = (
+            select(*_LESSON_ROW_COLUMNS)
+            .where(
+                Lesson.subgroup_id == subgroup_id,
+                Lesson.date >= start_date,
+                Lesson.date <= end_date,
+            )
+            .order_by(Lesson.date, Lesson.start_time)
+        )
+        result = await self.session.execute(stmt)
+        return [LessonRow._make(row) for row in result.tuples()]
+
+    async def find_rows_for_subgroups_on_date(
+        self,
+        subgroup_ids: Iterable[int],
+        lesson_date: date,
+    ) -> dict[int, list[LessonRow]]:
+        """Find lesson rows of several subgroups on a date with one query.
+
+        Returns:
+            Lesson rows by subgroup ID; subgroups without lessons are absent
+        """
+        stmt = (
+            select(Lesson.subgroup_id, *_LESSON_ROW_COLUMNS)
+            .where(
+                Lesson.subgroup_id.in_(list(subgroup_ids)),
+                Lesson.date == lesson_date,
+            )
+            .order_by(Lesson.subgroup_id, Lesson.start_time)
+        )
+        result = await self.session.execute(stmt)
+        rows: dict[int, list[LessonRow]] = {}
+        for subgroup_id, *columns in result.tuples():
+            rows.setdefault(subgroup_id, []).append(LessonRow._make(columns))
+        return rows
+
+    async def find_rows_for_subgroups_in_range(
+        self,
+        subgroup_ids: Iterable[int],
+        start_date: date,
+        end_date: date,
+    ) -> dict[int, list[LessonRow]]:
+        """Find lesson rows of several subgroups within a date range with one query.
+
+        Returns:
+            Lesson rows by subgroup ID; subgroups without lessons are absent
+        """
+        stmt = (
+            select(Lesson.subgroup_id, *_LESSON_ROW_COLUMNS)
+            .where(
+                Lesson.subgroup_id.in_(list(subgroup_ids)),
+                Lesson.date >= start_date,
+                Lesson.date <= end_date,
+            )
+            .order_by(Lesson.subgroup_id, Lesson.date, Lesson.start_time)
+        )
+        result = await self.session.execute(stmt)
+        rows: dict[int, list[LessonRow]] = {}
+        for subgroup_id, *columns in result.tuples():
+            rows.setdefault(subgroup_id, []).append(LessonRow._make(columns))
+        return rows
+
+    async def delete_by_keys(self, keys: Sequence[tuple[int, date, time, str]]) -> int:
+        """Delete lessons by (subgroup_id, date, start_time, subject) with one query.
+
+        Returns:
+            Number of lessons deleted
+        """
+        if not keys:
+            return 0
+        stmt = (
+            delete(Lesson)
+            .where(
+                tuple_(Lesson.subgroup_id, Lesson.date, Lesson.start_time, Lesson.subject).in_(
+                    list(keys)
+                )
+            )
+            .returning(Lesson.id)
+        )
+        result = await self.session.execute(stmt)
+        return len(result.scalars().all())
+
+    async def iter_rows_for_subgroup_in_range(
+        self,
+        subgroup_id: int,
+        start_date: date,
+        end_date: date,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[Sequence[LessonRow]]:
+        """Yield lesson rows for a subgroup within a date range in date-ordered chunks.
+
+        Each chunk is a keyset query continuing after the last row of the
+        previous one, so it walks uq_lesson_unique without OFFSET and without
+        holding a server-side cursor open between chunks.
+        """
+        order = (Lesson.date, Lesson.start_time, Lesson.subject)
+        stmt = (
+            select(*_LESSON_ROW_COLUMNS)
+            .where(
+                Lesson.subgroup_id == subgroup_id,
+                Lesson.date >= start_date,
+                Lesson.date <= end_date,
+            )
+            .order_by(*order)
+            .limit(chunk_size)
+        )
+        chunk_stmt = stmt
+        while True:
+            result = await self.session.execute(chunk_stmt)
+            rows = [LessonRow._make(row) for row in result.tuples()]
+            if rows:
+                yield rows
+            if len(rows) < chunk_size:
+                return
+            last = rows[-1]
+            chunk_stmt = stmt.where(tuple_(*order) > (last.date, last.start_time, last.subject))
+
+    async def find_rows_for_teacher_in_range(
+        self,
+        teacher_key: str,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[TeacherLessonRow]:
+        """Find a teacher's lesson rows across all subgroups within a date range.
+
+        A lesson taught to several subgroups at once yields one row per subgroup.
+        """
+        stmt = (
+            select(*_TEACHER_LESSON_ROW_COLUMNS)
+            .where(
+                Lesson.teacher_key == teacher_key,
+                Lesson.date >= start_date,
+                Lesson.date <= end_date,
+            )
+            .order_by(Lesson.date, Lesson.start_time)
+        )
+        result = await self.session.execute(stmt)
+        return [TeacherLessonRow._make(row) for row in result.tuples()]
+
+    async def find_room_slots(self, start_date: date, end_date: date) -> Sequence[RoomSlotRow]:
+        """Find distinct room slots of all lessons within a date range.
+
+        Meant for building the in-memory room occupancy at sync time: it reads
+        every subgroup's lessons in the range, pruned to the semester partitions.
+        """
+        stmt = (
+            select(
+                Lesson.date,
+                Lesson.address,
+                Lesson.room,
+                Lesson.start_time,
+                Lesson.end_time,
+                Lesson.subject,
+            )
+            .distinct()
+            .where(
+                Lesson.room.is_not(None),
+                Lesson.date >= start_date,
+                Lesson.date <= end_date,
+            )
+            .order_by(Lesson.date, Lesson.address, Lesson.room, Lesson.start_time)
+        )
+        result = await self.session.execute(stmt)
+        return [RoomSlotRow._make(row) for row in result.tuples()]
+
+    async def find_lesson_dates(self, start_date: date) -> Sequence[tuple[int, date]]:
+        """Find the distinct (subgroup_id, date) pairs of all lessons from a date on.
+
+        Meant for building the in-memory lesson-date index at sync time.
+        """
+        stmt = (
+            select(Lesson.subgroup_id, Lesson.date)
+            .distinct()
+            .where(Lesson.date >= start_date)
+            .order_by(Lesson.subgroup_id, Lesson.date)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.tuples())
+
+    async def find_teachers(self) -> Sequence[tuple[str, str]]:
+        """Find all distinct teachers as (teacher_key, display name) pairs."""
+        stmt = (
+            select(Lesson.teacher_key, func.min(Lesson.teacher))
+            .where(Lesson.teacher_key.is_not(None))
+            .group_by(Lesson.teacher_key)
+            .order_by(Lesson.teacher_key)
+        )
+        result = await self.session.execute(stmt)
+        return [(key, name) for key, name in result.tuples()]
+
+    @staticmethod
+    def partition_name(term: SemesterTerm) -> str:
+        """Name of the lessons partition holding a semester term."""
+        return f"lessons_{term.slug}"
+
+    async def ensure_partitions(self, dates: Iterable[date]) -> list[str]:
+        """Create semester partitions covering the given dates if missing.
+
+        Rows that already landed in the default partition for a new term are
+        moved into it, so the attach never conflicts. Returns created names.
+        """
+        created = []
+        for term in sorted({get_semester_term(d) for d in dates}):
+            name = self.partition_name(term)
+            exists = await self.session.scalar(select(func.to_regclass(name)))
+            if exists is not None:
+                continue
+
+            await self.session.execute(
+                text(f"CREATE TABLE {name} (LIKE lessons INCLUDING DEFAULTS)")
+            )
+            await self.session.execute(self._move_default_rows_stmt(name, term))
+            await self.session.execute(
+                text(
+                    f"ALTER TABLE lessons ATTACH PARTITION {name} "
+                    f"FOR VALUES FROM ('{term.start_date.isoformat()}') "
+                    f"TO ('{term.end_date.isoformat()}')"
+                )
+            )
+            created.append(name)
+        return created
+
+    @staticmethod
+    def _move_default_rows_stmt(name: str, term: SemesterTerm) -> Insert:
+        """Build DELETE ... RETURNING from the default partition into `name`."""
+        names = [c.name for c in Lesson.__table__.columns]
+        default_partition = table(DEFAULT_PARTITION, *map(column, names))
+        moved = (
+            delete(default_partition)
+            .where(
+                default_partition.c.date >= term.start_date,
+                default_partition.c.date < term.end_date,
+            )
+            .returning(*default_partition.c)
+            .cte("moved")
+        )
+        return insert(table(name, *map(column, names))).from_select(names, select(*moved.c))
+
+    async def find_partitions(self) -> Sequence[str]:
+        """Find names of attached semester partitions, oldest first."""
+        stmt = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = 'lessons' AND child.relname <> :default "
+            "ORDER BY child.relname"
+        )
+        result = await self.session.execute(stmt, {"default": DEFAULT_PARTITION})
+        return result.scalars().all()
+
+    async def detach_partition(self, term: SemesterTerm) -> bool:
+        """Detach a semester partition, keeping its rows in a standalone table.
+
+        This is a catalog-only operation, unlike deleting the term's rows.
+        Returns False if the partition does not exist.
+        """
+        name = self.partition_name(term)
+        if name not in await self.find_partitions():
+            return False
+        await self.session.execute(text(f"ALTER TABLE lessons DETACH PARTITION {name}"))
+        return True
+
+    async def drop_partition(self, term: SemesterTerm) -> bool:
+        """Drop a semester's lessons in O(1) by dropping its partition.
+
+        Works for both attached and previously detached partitions.
+        Returns False if the partition does not exist.
+        """
+        name = self.partition_name(term)
+        exists = await self.session.scalar(select(func.to_regclass(name)))
+        if exists is None:
+            return False
+        await self.session.execute(text(f"DROP TABLE {name}"))
+        return True
@@ -0,0 +1,110 @@
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from models.outbox import OutboxMessage
+from repositories.base import BaseRepository
+
+# Rows per INSERT, well under PostgreSQL's 65535 bind parameters
+APPEND_CHUNK_SIZE = 5000
+
+
+class OutboxRow(NamedTuple):
+    """A claimed outbox message."""
+
+    id: int
+    chat_id: int
+    body: str
+    attempts: int
+
+
+class OutboxRepository(BaseRepository):
+    """Repository for the notification outbox."""
+
+    async def append(self, messages: Sequence[dict[str, Any]]) -> int:
+        """Append messages, skipping ones whose key is already in the outbox.
+
+        Args:
+            messages: Dicts with chat_id, body and an optional idempotency key
+
+        Returns:
+            Number of messages appended
+        """
+        appended = 0
+        for start in range(0, len(messages), APPEND_CHUNK_SIZE):
+            stmt = (
+                insert(OutboxMessage)
+                .values(messages[start : start + APPEND_CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=[OutboxMessage.key])
+                .returning(OutboxMessage.id)
+            )
+            result = await self.session.execute(stmt)
+            appended += len(result.scalars().all())
+        return appended
+
+    async def claim(self, limit: int, lease: timedelta) -> Sequence[OutboxRow]:
+        """Claim up to `limit` due messages for `lease`.
+
+        Rows locked by another worker's claim are skipped rather than waited
+        for, so workers on any number of replicas claim disjoint batches. A
+        claim is a lease: rows not completed or released before it expires
+        are claimed again, which makes delivery at-least-once.
+        """
+        due = (
+            select(OutboxMessage.id)
+            .where(OutboxMessage.done_at.is_(None), OutboxMessage.available_at <= func.now())
+            .order_by(OutboxMessage.available_at, OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(due.scalar_subquery()))
+            .values(
+                available_at=func.now() + lease,
+                attempts=OutboxMessage.attempts + 1,
+            )
+            .returning(
+                OutboxMessage.id,
+                OutboxMessage.chat_id,
+                OutboxMessage.body,
+                OutboxMessage.attempts,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return sorted((OutboxRow._make(row) for row in result.tuples()), key=lambda r: r.id)
+
+    async def mark_done(self, ids: Sequence[int], error: str | None = None) -> None:
+        """Mark messages as finished, successfully unless an error is given."""
+        if not ids:
+            return
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(ids))
+            .values(done_at=func.now(), error=error)
+        )
+        await self.session.execute(stmt)
+
+    async def release(self, ids: Sequence[int], delay: timedelta) -> None:
+        """Return claimed messages to the queue to be retried after `delay`."""
+        if not ids:
+            return
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(ids))
+            .values(available_at=func.now() + delay)
+        )
+        await self.session.execute(stmt)
+
+    async def purge(self, done_before: datetime) -> int:
+        """Delete messages finished before a moment. Returns the count deleted."""
+        stmt = (
+            delete(OutboxMessage)
+            .where(OutboxMessage.done_at < done_before)
+            .returning(OutboxMessage.id)
+        )
+        result = await self.session.execute(stmt)
+        return len(result.scalars().all())
@@ -0,0 +1,113 @@
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, cast
+
+from sqlalchemy import Connection
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+
+logger = logging.getLogger(__name__)
+
+
+class ReadOnlySession(AsyncSession):
+    """AsyncSession bound to a read replica, or to the primary as a fallback."""
+
+
+class _LazyReplicaSession(Session):
+    """Sync side of a ReplicaPool session, connecting on the first statement."""
+
+    def __init__(self, *, replica_pool: ReplicaPool, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.replica_pool = replica_pool
+        self.replica_connection: AsyncConnection | None = None
+
+    def get_bind(self, mapper: Any = None, **kwargs: Any) -> Connection:  # noqa: ARG002
+        # Runs inside AsyncSession's greenlet, so the pool can be awaited here
+        if self.replica_connection is None:
+            self.replica_connection = await_only(self.replica_pool.connect())
+        return self.replica_connection.sync_connection
+
+
+class ReplicaPool:
+    """Round-robin router over read replicas with fallback to the primary.
+
+    A replica that fails to connect is skipped for `retry_after` seconds,
+    so an outage costs one failed connect per interval rather than per read.
+    Connections run in autocommit: lookups need no transaction, which saves
+    the BEGIN and ROLLBACK round trips on every read.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        retry_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize ReplicaPool.
+
+        Args:
+            primary: Engine of the primary database
+            replicas: Engines of the read replicas
+            retry_after: Seconds to skip a replica after a failed connect
+            clock: Monotonic time source
+        """
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.retry_after = retry_after
+        self._clock = clock
+        self._next = 0
+        self._down_until: dict[int, float] = {}
+
+    def _candidates(self) -> list[AsyncEngine]:
+        """Available replicas in round-robin order, followed by the primary."""
+        now = self._clock()
+        count = len(self.replicas)
+        start = self._next
+        self._next = (self._next + 1) % count if count else 0
+
+        ordered = [self.replicas[(start + i) % count] for i in range(count)]
+        available = [e for e in ordered if self._down_until.get(id(e), 0.0) <= now]
+        return [*available, self.primary]
+
+    async def connect(self) -> AsyncConnection:
+        """Connect to the next healthy replica, falling back to the primary."""
+        for engine in self._candidates():
+            if engine is self.primary:
+                return await self._autocommit(engine)
+            try:
+                return await self._autocommit(engine)
+            except (OperationalError, DBAPIError, OSError) as e:
+                self._down_until[id(engine)] = self._clock() + self.retry_after
+                logger.warning("Replica %s unavailable, skipping: %s", engine.url.host, e)
+        raise AssertionError("unreachable: primary is always a candidate")  # pragma: no cover
+
+    @staticmethod
+    async def _autocommit(engine: AsyncEngine) -> AsyncConnection:
+        connection = await engine.connect()
+        return await connection.execution_options(isolation_level="AUTOCOMMIT")
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ReadOnlySession]:
+        """Open a read-only session on a replica connection.
+
+        The connection is taken on the session's first statement, so a
+        request that never reads holds no connection.
+        """
+        session = ReadOnlySession(
+            sync_session_class=_LazyReplicaSession,
+            replica_pool=self,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        sync_session = cast("_LazyReplicaSession", session.sync_session)
+        try:
+            async with session:
+                yield session
+        finally:
+            if sync_session.replica_connection is not None:
+                await sync_session.replica_connection.close()
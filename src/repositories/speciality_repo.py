@@ -1,12 +1,23 @@
 from collections.abc import Sequence
+from typing import NamedTuple
 
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload
 
 from models import EducationLevel, Speciality
 from repositories.base import BaseRepository
 
 
+class SpecialityRow(NamedTuple):
+    """Read-only speciality projection for the group catalog."""
+
+    id: int
+    code: str
+    full_name: str
+    clean_name: str
+
+
 class SpecialityRepository(BaseRepository):
     """Repository for speciality operations."""
 
@@ -36,17 +47,21 @@ class SpecialityRepository(BaseRepository):
                 },
             )
             .returning(Speciality)
+            .execution_options(populate_existing=True)
         )
 
         result = await self.session.execute(stmt)
-        speciality = result.scalar_one()
-
-        await self.session.refresh(speciality)
-        return speciality
+        return result.scalar_one()
 
-    async def find_by_id(self, speciality_id: int) -> Speciality | None:
-        """Find speciality by ID."""
+    async def find_by_id(
+        self,
+        speciality_id: int,
+        load_groups: bool = False,
+    ) -> Speciality | None:
+        """Find speciality by ID, optionally with its groups eagerly loaded."""
         stmt = select(Speciality).where(Speciality.id == speciality_id)
+        if load_groups:
+            stmt = stmt.options(selectinload(Speciality.groups))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -61,3 +76,11 @@ class SpecialityRepository(BaseRepository):
         stmt = select(Speciality).order_by(Speciality.code)
         result = await self.session.execute(stmt)
         return result.scalars().all()
+
+    async def find_all_rows(self) -> Sequence[SpecialityRow]:
+        """Find all specialities as SpecialityRow tuples."""
+        stmt = select(
+            Speciality.id, Speciality.code, Speciality.full_name, Speciality.clean_name
+        ).order_by(Speciality.code)
+        result = await self.session.execute(stmt)
+        return [SpecialityRow._make(row) for row in result.tuples()]
@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from typing import NamedTuple
 
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
@@ -7,6 +8,14 @@ from models.subgroup import Subgroup
 from repositories.base import BaseRepository
 
 
+class SubgroupRow(NamedTuple):
+    """Read-only subgroup projection for the group catalog."""
+
+    id: int
+    group_id: int
+    name: str
+
+
 class SubgroupRepository(BaseRepository):
     """Repository for subgroup operations."""
 
@@ -30,13 +39,11 @@ class SubgroupRepository(BaseRepository):
                 },
             )
             .returning(Subgroup)
+            .execution_options(populate_existing=True)
         )
 
         result = await self.session.execute(stmt)
-        subgroup = result.scalar_one()
-
-        await self.session.refresh(subgroup)
-        return subgroup
+        return result.scalar_one()
 
     async def find_by_id(self, subgroup_id: int) -> Subgroup | None:
         """Find subgroup by ID."""
@@ -62,3 +69,9 @@ class SubgroupRepository(BaseRepository):
         stmt = select(Subgroup).where(Subgroup.group_id == group_id).order_by(Subgroup.name)
         result = await self.session.execute(stmt)
         return result.scalars().all()
+
+    async def find_all_rows(self) -> Sequence[SubgroupRow]:
+        """Find all subgroups as SubgroupRow tuples."""
+        stmt = select(Subgroup.id, Subgroup.group_id, Subgroup.name).order_by(Subgroup.name)
+        result = await self.session.execute(stmt)
+        return [SubgroupRow._make(row) for row in result.tuples()]
@@ -1,7 +1,7 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import time
 
-from sqlalchemy import select, update
+from sqlalchemy import select, tuple_, update
 from sqlalchemy.dialects.postgresql import insert
 
 from models.user import User
@@ -39,13 +39,11 @@ class UserRepository(BaseRepository):
                 },
             )
             .returning(User)
+            .execution_options(populate_existing=True)
         )
 
         result = await self.session.execute(stmt)
-        user = result.scalar_one()
-
-        await self.session.refresh(user)
-        return user
+        return result.scalar_one()
 
     async def find_by_id(self, telegram_id: int) -> User | None:
         """Find user by Telegram ID."""
@@ -69,6 +67,18 @@ class UserRepository(BaseRepository):
         result = await self.session.execute(stmt)
         return bool(result.scalar_one_or_none())
 
+    async def unsubscribe_many(self, telegram_ids: Sequence[int]) -> int:
+        """Turn off the subscriptions of several users at once. Returns the count updated."""
+        stmt = (
+            update(User)
+            .where(User.telegram_id.in_(telegram_ids), User.is_subscribed)
+            .values(is_subscribed=False)
+            .returning(User.telegram_id)
+        )
+
+        result = await self.session.execute(stmt)
+        return len(result.scalars().all())
+
     async def update_notification_time(
         self,
         telegram_id: int,
@@ -101,6 +111,18 @@ class UserRepository(BaseRepository):
         result = await self.session.execute(stmt)
         return bool(result.scalar_one_or_none())
 
+    async def update_reminder(self, telegram_id: int, minutes: int | None) -> bool:
+        """Set how many minutes before a lesson user is reminded; None turns it off."""
+        stmt = (
+            update(User)
+            .where(User.telegram_id == telegram_id)
+            .values(remind_before_minutes=minutes)
+            .returning(User.telegram_id)
+        )
+
+        result = await self.session.execute(stmt)
+        return bool(result.scalar_one_or_none())
+
     async def find_subscribed_users_by_time(self, target_time: time) -> Sequence[User]:
         """Find all users with active subscriptions for a specific time."""
         stmt = (
@@ -115,6 +137,19 @@ class UserRepository(BaseRepository):
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def find_subscriptions(self) -> Sequence[tuple[int, time, int]]:
+        """Find (telegram_id, notification_time, subgroup_id) of every subscriber with a subgroup.
+
+        Meant for loading the in-memory notification wheel; served by an
+        index-only scan of idx_users_notification.
+        """
+        stmt = select(User.telegram_id, User.notification_time, User.subgroup_id).where(
+            User.is_subscribed,
+            User.subgroup_id.is_not(None),
+        )
+        result = await self.session.execute(stmt)
+        return list(result.tuples())
+
     async def find_subscribed_users(self) -> Sequence[User]:
         """Find all users with active subscriptions."""
         stmt = (
@@ -127,3 +162,57 @@ class UserRepository(BaseRepository):
         )
         result = await self.session.execute(stmt)
         return result.scalars().all()
+
+    async def find_reminder_leads(self) -> Sequence[tuple[int, int]]:
+        """Find the distinct (subgroup_id, remind_before_minutes) pairs users chose.
+
+        Served by an index-only scan of idx_users_reminders.
+        """
+        stmt = (
+            select(User.subgroup_id, User.remind_before_minutes)
+            .where(User.remind_before_minutes.is_not(None), User.subgroup_id.is_not(None))
+            .distinct()
+        )
+        result = await self.session.execute(stmt)
+        return list(result.tuples())
+
+    async def find_reminder_recipients(
+        self, leads: Iterable[tuple[int, int]]
+    ) -> dict[tuple[int, int], list[int]]:
+        """Find the users of several (subgroup_id, remind_before_minutes) pairs with one query.
+
+        Returns:
+            Telegram IDs by pair; pairs nobody chose are absent
+        """
+        stmt = (
+            select(User.subgroup_id, User.remind_before_minutes, User.telegram_id)
+            .where(
+                tuple_(User.subgroup_id, User.remind_before_minutes).in_(list(leads)),
+                User.subgroup_id.is_not(None),
+            )
+            .order_by(User.subgroup_id, User.remind_before_minutes, User.telegram_id)
+        )
+        result = await self.session.execute(stmt)
+        recipients: dict[tuple[int, int], list[int]] = {}
+        for subgroup_id, minutes, telegram_id in result.tuples():
+            recipients.setdefault((subgroup_id, minutes), []).append(telegram_id)
+        return recipients
+
+    async def find_subscribers_by_subgroup(
+        self, subgroup_ids: Iterable[int]
+    ) -> dict[int, list[int]]:
+        """Find the subscribers of several subgroups with one query.
+
+        Returns:
+            Telegram IDs by subgroup ID; subgroups without subscribers are absent
+        """
+        stmt = (
+            select(User.subgroup_id, User.telegram_id)
+            .where(User.is_subscribed, User.subgroup_id.in_(list(subgroup_ids)))
+            .order_by(User.subgroup_id, User.telegram_id)
+        )
+        result = await self.session.execute(stmt)
+        subscribers: dict[int, list[int]] = {}
+        for subgroup_id, telegram_id in result.tuples():
+            subscribers.setdefault(subgroup_id, []).append(telegram_id)
+        return subscribers
@@ -0,0 +1,111 @@
+import logging
+from collections.abc import AsyncIterator
+from datetime import date, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.academic_calendar import get_semester_term
+from core.ical import iter_calendar
+from repositories.lesson_repo import LessonRepository
+from .group_catalog import GroupCatalogStore
+from .schedule_versions import ScheduleVersions
+
+logger = logging.getLogger(__name__)
+
+
+class CalendarFileCache:
+    """Telegram file_id of the last uploaded calendar per subgroup, keyed by ETag."""
+
+    def __init__(self) -> None:
+        """Initialize CalendarFileCache."""
+        self._files: dict[int, tuple[str, str]] = {}
+
+    def get(self, subgroup_id: int, etag: str) -> str | None:
+        """Cached file_id if it was uploaded for this ETag."""
+        cached = self._files.get(subgroup_id)
+        if cached is None or cached[0] != etag:
+            return None
+        return cached[1]
+
+    def put(self, subgroup_id: int, etag: str, file_id: str) -> None:
+        """Remember the file_id Telegram assigned to an uploaded calendar."""
+        self._files[subgroup_id] = (etag, file_id)
+
+
+class CalendarExportService:
+    """Service for exporting a subgroup's semester as an iCalendar file."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        lesson_repo: LessonRepository,
+        versions: ScheduleVersions,
+        file_cache: CalendarFileCache,
+        catalog_store: GroupCatalogStore | None = None,
+    ) -> None:
+        """Initialize CalendarExportService.
+
+        Args:
+            session: AsyncSession for database operations
+            lesson_repo: Repository for lessons
+            versions: Per-subgroup sync generations the ETag is derived from
+            file_cache: Uploaded calendar file_ids
+            catalog_store: Catalog used for subgroup names
+        """
+        self.session = session
+        self.lesson_repo = lesson_repo
+        self.versions = versions
+        self.file_cache = file_cache
+        self.catalog_store = catalog_store if catalog_store is not None else GroupCatalogStore()
+
+    def etag(self, subgroup_id: int, target_date: date | None = None) -> str:
+        """ETag of a subgroup's calendar for the semester containing a date.
+
+        Changes only when a sync changes the subgroup's lessons or the date
+        falls into another semester.
+        """
+        term = get_semester_term(target_date or date.today())
+        return self.versions.etag(subgroup_id, term.slug)
+
+    def cached_file_id(self, subgroup_id: int, etag: str) -> str | None:
+        """File_id of an already uploaded calendar with this ETag."""
+        return self.file_cache.get(subgroup_id, etag)
+
+    def remember_file_id(self, subgroup_id: int, etag: str, file_id: str) -> None:
+        """Cache the file_id of an uploaded calendar for repeat requests."""
+        self.file_cache.put(subgroup_id, etag, file_id)
+
+    def filename(self, subgroup_id: int) -> str:
+        """Document name for a subgroup's calendar."""
+        return f"schedule_{self._subgroup_name(subgroup_id)}.ics"
+
+    def stream_semester(
+        self, subgroup_id: int, target_date: date | None = None
+    ) -> AsyncIterator[bytes]:
+        """Stream the calendar of the semester containing a date.
+
+        Lessons are read and encoded chunk by chunk, so the whole semester is
+        never held in memory.
+
+        Args:
+            subgroup_id: ID of the subgroup
+            target_date: Any date of the semester, defaults to today
+
+        Returns:
+            Async iterator of UTF-8 encoded calendar parts
+        """
+        term = get_semester_term(target_date or date.today())
+        chunks = self.lesson_repo.iter_rows_for_subgroup_in_range(
+            subgroup_id, term.start_date, term.end_date - timedelta(days=1)
+        )
+        logger.info("Exporting calendar of subgroup %d for %s", subgroup_id, term.slug)
+        return iter_calendar(
+            name=f"Расписание {self._subgroup_name(subgroup_id)}",
+            chunks=chunks,
+            uid_prefix=str(subgroup_id),
+            dtstamp=self.versions.get(subgroup_id).updated_at,
+        )
+
+    def _subgroup_name(self, subgroup_id: int) -> str:
+        subgroup = self.catalog_store.current.subgroups_by_id.get(subgroup_id)
+        return subgroup.name if subgroup is not None else str(subgroup_id)
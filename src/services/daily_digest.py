@@ -0,0 +1,89 @@
+import logging
+from datetime import date, time, timedelta
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.schedule_renderer import format_date_title, render_day
+from repositories.lesson_repo import LessonRepository
+from .notification_wheel import NotificationWheel
+
+logger = logging.getLogger(__name__)
+
+# Digests sent from this time on announce the next day instead of the current one
+DIGEST_NEXT_DAY_FROM = time(15, 0)
+
+
+class Digest(NamedTuple):
+    """A subgroup's rendered digest and the subscribers to send it to."""
+
+    subgroup_id: int
+    text: str
+    user_ids: list[int]
+
+
+def digest_day(target_time: time, today: date) -> date:
+    """Date a digest sent at `target_time` announces."""
+    if target_time >= DIGEST_NEXT_DAY_FROM:
+        return today + timedelta(days=1)
+    return today
+
+
+class DailyDigestService:
+    """Builds the daily schedule digests due at a notification time."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        lesson_repo: LessonRepository,
+        wheel: NotificationWheel,
+    ) -> None:
+        """Initialize DailyDigestService.
+
+        Args:
+            session: AsyncSession for database operations
+            lesson_repo: Repository for lessons
+            wheel: Timing wheel of subscribers by notification time
+        """
+        self.session = session
+        self.lesson_repo = lesson_repo
+        self.wheel = wheel
+
+    async def build_digests(self, target_time: time, today: date) -> list[Digest]:
+        """Render one digest per subgroup with subscribers due at `target_time`.
+
+        Recipients come from the notification wheel, so a minute nobody is
+        due at costs no query and any other costs one, for the lessons of all
+        due subgroups. Subgroups without lessons on the announced day get no
+        digest.
+
+        Args:
+            target_time: Notification time that has come
+            today: Current local date
+
+        Returns:
+            Digests of the subgroups that have lessons
+        """
+        due = self.wheel.due(target_time)
+        if not due:
+            return []
+
+        recipients: dict[int, list[int]] = {}
+        for telegram_id, subgroup_id in sorted(due.items()):
+            recipients.setdefault(subgroup_id, []).append(telegram_id)
+        day = digest_day(target_time, today)
+        lessons = await self.lesson_repo.find_rows_for_subgroups_on_date(recipients, day)
+
+        title = format_date_title(day, "day", today)
+        digests = [
+            Digest(subgroup_id, render_day(title, lessons[subgroup_id]), user_ids)
+            for subgroup_id, user_ids in recipients.items()
+            if subgroup_id in lessons
+        ]
+        logger.info(
+            "Built %d digests for %d subscribers due at %s",
+            len(digests),
+            len(due),
+            target_time,
+        )
+        return digests
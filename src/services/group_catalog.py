@@ -0,0 +1,176 @@
+import logging
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+
+from core.schedule_parser import make_teacher_key
+from repositories.group_repo import GroupRepository, GroupRow
+from repositories.lesson_repo import LessonRepository
+from repositories.speciality_repo import SpecialityRepository, SpecialityRow
+from repositories.subgroup_repo import SubgroupRepository, SubgroupRow
+from .group_search import GroupSearchIndex
+
+logger = logging.getLogger(__name__)
+
+StreamKey = tuple[int, int]
+GroupKey = tuple[int, int, str]
+
+
+class GroupCatalog:
+    """Immutable snapshot of the speciality -> course -> stream -> group -> subgroup tree.
+
+    Children of every node are precomputed as sorted tuples, so each onboarding
+    step is a single dictionary lookup. The name search index and the teacher
+    directory are built along with it. A catalog is never mutated: a sync
+    builds a new one and swaps it into GroupCatalogStore.
+    """
+
+    __slots__ = (
+        "_courses",
+        "_groups",
+        "_streams",
+        "_subgroups",
+        "_teacher_words",
+        "groups_by_id",
+        "search_index",
+        "specialities",
+        "specialities_by_id",
+        "subgroups_by_id",
+        "teachers",
+    )
+
+    def __init__(
+        self,
+        specialities: Iterable[SpecialityRow] = (),
+        groups: Iterable[GroupRow] = (),
+        subgroups: Iterable[SubgroupRow] = (),
+        teachers: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        """Build the catalog from projection rows.
+
+        Args:
+            specialities: All speciality rows
+            groups: All group rows
+            subgroups: All subgroup rows
+            teachers: (teacher_key, display name) pairs
+        """
+        self.specialities = tuple(sorted(specialities, key=lambda s: (s.code, s.full_name)))
+        self.specialities_by_id = {s.id: s for s in self.specialities}
+
+        sorted_groups = sorted(groups, key=lambda g: g.name)
+        self.groups_by_id = {g.id: g for g in sorted_groups}
+        courses: defaultdict[int, set[int]] = defaultdict(set)
+        streams: defaultdict[StreamKey, set[str]] = defaultdict(set)
+        groups_by_key: defaultdict[GroupKey, list[GroupRow]] = defaultdict(list)
+        for group in sorted_groups:
+            courses[group.speciality_id].add(group.course_number)
+            streams[group.speciality_id, group.course_number].add(group.stream)
+            groups_by_key[group.speciality_id, group.course_number, group.stream].append(group)
+
+        self._courses = {key: tuple(sorted(values)) for key, values in courses.items()}
+        self._streams = {key: tuple(sorted(values)) for key, values in streams.items()}
+        self._groups = {key: tuple(values) for key, values in groups_by_key.items()}
+
+        sorted_subgroups = sorted(subgroups, key=lambda sg: sg.name)
+        self.subgroups_by_id = {sg.id: sg for sg in sorted_subgroups}
+        subgroups_by_group: defaultdict[int, list[SubgroupRow]] = defaultdict(list)
+        for subgroup in sorted_subgroups:
+            subgroups_by_group[subgroup.group_id].append(subgroup)
+        self._subgroups = {key: tuple(values) for key, values in subgroups_by_group.items()}
+
+        self.search_index = GroupSearchIndex(
+            self.specialities_by_id, self.groups_by_id, sorted_subgroups
+        )
+
+        self.teachers = dict(sorted(teachers))
+        self._teacher_words = {key: key.split() for key in self.teachers}
+
+    @classmethod
+    async def load(
+        cls,
+        speciality_repo: SpecialityRepository,
+        group_repo: GroupRepository,
+        subgroup_repo: SubgroupRepository,
+        lesson_repo: LessonRepository,
+    ) -> GroupCatalog:
+        """Load a fresh catalog with one projection query per table."""
+        return cls(
+            specialities=await speciality_repo.find_all_rows(),
+            groups=await group_repo.find_all_rows(),
+            subgroups=await subgroup_repo.find_all_rows(),
+            teachers=await lesson_repo.find_teachers(),
+        )
+
+    def courses(self, speciality_id: int) -> Sequence[int]:
+        """Sorted course numbers of a speciality."""
+        return self._courses.get(speciality_id, ())
+
+    def streams(self, speciality_id: int, course_number: int) -> Sequence[str]:
+        """Sorted streams of a speciality course."""
+        return self._streams.get((speciality_id, course_number), ())
+
+    def groups(self, speciality_id: int, course_number: int, stream: str) -> Sequence[GroupRow]:
+        """Groups of a stream, sorted by name."""
+        return self._groups.get((speciality_id, course_number, stream), ())
+
+    def subgroups(self, group_id: int) -> Sequence[SubgroupRow]:
+        """Subgroups of a group, sorted by name."""
+        return self._subgroups.get(group_id, ())
+
+    def find_teachers(self, query: str, limit: int = 10) -> Sequence[tuple[str, str]]:
+        """Teachers whose name words start with the query words, in order.
+
+        Args:
+            query: Typed name, e.g. "Иванов" or "иванов и"
+            limit: Maximum number of teachers
+
+        Returns:
+            (teacher_key, display name) pairs, surname matches first
+        """
+        query_key = make_teacher_key(query)
+        if query_key is None:
+            return []
+        query_words = query_key.split()
+        matches = [
+            key
+            for key, words in self._teacher_words.items()
+            if _match_word_prefixes(query_words, words)
+        ]
+        matches.sort(key=lambda key: not key.startswith(query_key))
+        return [(key, self.teachers[key]) for key in matches[:limit]]
+
+
+def _match_word_prefixes(prefixes: Sequence[str], words: Sequence[str]) -> bool:
+    """Whether each prefix starts a later word than the previous one."""
+    remaining = iter(words)
+    return all(any(word.startswith(prefix) for word in remaining) for prefix in prefixes)
+
+
+class GroupCatalogStore:
+    """Holder of the current GroupCatalog.
+
+    Readers take `current` once per step and always see a complete snapshot;
+    `replace` swaps in a new catalog with a single reference assignment.
+    """
+
+    def __init__(self, catalog: GroupCatalog | None = None) -> None:
+        """Initialize GroupCatalogStore.
+
+        Args:
+            catalog: Initial catalog, empty until the first load
+        """
+        self._catalog = catalog if catalog is not None else GroupCatalog()
+
+    @property
+    def current(self) -> GroupCatalog:
+        """The catalog snapshot currently served."""
+        return self._catalog
+
+    def replace(self, catalog: GroupCatalog) -> None:
+        """Swap in a newly built catalog."""
+        self._catalog = catalog
+        logger.info(
+            "Group catalog replaced: %d specialities, %d groups, %d subgroups",
+            len(catalog.specialities),
+            len(catalog.groups_by_id),
+            len(catalog.subgroups_by_id),
+        )
@@ -0,0 +1,180 @@
+import heapq
+import re
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from typing import NamedTuple
+
+from repositories.group_repo import GroupRow
+from repositories.speciality_repo import SpecialityRow
+from repositories.subgroup_repo import SubgroupRow
+
+MIN_SIMILARITY = 0.5
+_COURSE_RE = re.compile(r"(?:(?<!\d)(\d)\s*(?:-?й\s*)?)?курс\w*")
+_WORD_RE = re.compile(r"\w+")
+
+
+class SubgroupMatch(NamedTuple):
+    """Search hit: a subgroup with its display label and similarity."""
+
+    subgroup_id: int
+    label: str
+    score: float
+
+
+def normalize(text: str) -> str:
+    """Lowercase text and fold the letter yo into ie, as users type either."""
+    return text.lower().replace("ё", "е")
+
+
+def trigrams(text: str) -> set[str]:
+    """Word trigrams padded like pg_trgm: two spaces before, one after each word."""
+    grams: set[str] = set()
+    for word in _WORD_RE.findall(normalize(text)):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class GroupSearchIndex:
+    """In-memory trigram index over speciality, group and subgroup names.
+
+    Each subgroup is a document; a query scores documents by the share of its
+    trigrams they contain, close to pg_trgm's word similarity. A "N курс"
+    phrase in the query is applied as an exact course filter instead.
+
+    Speciality names are indexed once per speciality rather than per document:
+    documents are numbered in display order, so a speciality's subgroups form
+    a contiguous range and only its first `limit` entries need scoring.
+    """
+
+    __slots__ = (
+        "_courses",
+        "_doc_postings",
+        "_doc_speciality",
+        "_labels",
+        "_ranges",
+        "_speciality_postings",
+        "_subgroup_ids",
+    )
+
+    def __init__(
+        self,
+        specialities_by_id: Mapping[int, SpecialityRow],
+        groups_by_id: Mapping[int, GroupRow],
+        subgroups: Iterable[SubgroupRow],
+    ) -> None:
+        """Build the index.
+
+        Args:
+            specialities_by_id: Specialities keyed by ID
+            groups_by_id: Groups keyed by ID
+            subgroups: All subgroups
+        """
+        documents = []
+        for subgroup in subgroups:
+            group = groups_by_id.get(subgroup.group_id)
+            speciality = group and specialities_by_id.get(group.speciality_id)
+            if group is None or speciality is None:
+                continue
+            documents.append((speciality, group, subgroup))
+        documents.sort(key=lambda d: (d[0].code, d[0].id, d[1].course_number, d[1].name, d[2].name))
+
+        self._subgroup_ids = tuple(subgroup.id for _, _, subgroup in documents)
+        self._courses = tuple(group.course_number for _, group, _ in documents)
+        self._doc_speciality = tuple(speciality.id for speciality, _, _ in documents)
+        self._labels = tuple(
+            f"{subgroup.name} — {speciality.clean_name or speciality.full_name}, "
+            f"{group.course_number} курс"
+            for speciality, group, subgroup in documents
+        )
+
+        # Contiguous document ranges per speciality and per (speciality, course)
+        ranges: dict[tuple[int, int | None], tuple[int, int]] = {}
+        for doc_id, (speciality, group, _) in enumerate(documents):
+            for key in ((speciality.id, None), (speciality.id, group.course_number)):
+                first, _ = ranges.get(key, (doc_id, doc_id))
+                ranges[key] = (first, doc_id + 1)
+        self._ranges = ranges
+
+        speciality_postings: dict[str, list[int]] = {}
+        for speciality_id in dict.fromkeys(self._doc_speciality):
+            speciality = specialities_by_id[speciality_id]
+            for gram in trigrams(speciality.clean_name or speciality.full_name):
+                speciality_postings.setdefault(gram, []).append(speciality_id)
+        self._speciality_postings = {g: tuple(ids) for g, ids in speciality_postings.items()}
+
+        doc_postings: dict[str, list[int]] = {}
+        for doc_id, (_, group, subgroup) in enumerate(documents):
+            for gram in trigrams(f"{group.name} {subgroup.name}"):
+                doc_postings.setdefault(gram, []).append(doc_id)
+        self._doc_postings = {g: tuple(ids) for g, ids in doc_postings.items()}
+
+    def __len__(self) -> int:
+        return len(self._subgroup_ids)
+
+    def search(self, query: str, limit: int = 10) -> Sequence[SubgroupMatch]:
+        """Find the best matching subgroups for a free-text query.
+
+        Args:
+            query: Text typed by the user, e.g. "103" or "Лечебное 2 курс"
+            limit: Maximum number of matches
+
+        Returns:
+            Matches ordered by similarity, then display order
+        """
+        query = normalize(query)
+        course = None
+        if course_match := _COURSE_RE.search(query):
+            # "курс" after a longer number ("203 курс") is only a word to drop
+            if course_match.group(1):
+                course = int(course_match.group(1))
+            query = _COURSE_RE.sub(" ", query)
+
+        grams = trigrams(query)
+        if not grams:
+            if course is None:
+                return []
+            doc_ids = [d for d, c in enumerate(self._courses) if c == course][:limit]
+            return [self._match(doc_id, 1.0) for doc_id in doc_ids]
+
+        total = len(grams)
+        scores = self._score(grams, course, limit)
+        candidates = (
+            (min(score, total), doc_id)
+            for doc_id, score in scores.items()
+            if score >= MIN_SIMILARITY * total
+        )
+        best = heapq.nsmallest(limit, candidates, key=lambda hit: (-hit[0], hit[1]))
+        return [self._match(doc_id, score / total) for score, doc_id in best]
+
+    def _score(self, grams: set[str], course: int | None, limit: int) -> dict[int, int]:
+        """Count shared trigrams for the documents that can reach the top `limit`."""
+        speciality_hits: Counter[int] = Counter()
+        doc_hits: Counter[int] = Counter()
+        for gram in grams:
+            speciality_hits.update(self._speciality_postings.get(gram, ()))
+            doc_hits.update(self._doc_postings.get(gram, ()))
+
+        scores: dict[int, int] = {}
+        for doc_id, hits in doc_hits.items():
+            if course is None or self._courses[doc_id] == course:
+                scores[doc_id] = hits + speciality_hits[self._doc_speciality[doc_id]]
+
+        # Remaining documents of a matched speciality all score the same,
+        # so only the first `limit` of its range can make the top-k
+        threshold = MIN_SIMILARITY * len(grams)
+        for speciality_id, hits in speciality_hits.items():
+            if hits < threshold:
+                continue
+            first, end = self._ranges.get((speciality_id, course), (0, 0))
+            taken = 0
+            for doc_id in range(first, end):
+                if taken == limit:
+                    break
+                if doc_id not in scores:
+                    scores[doc_id] = hits
+                    taken += 1
+        return scores
+
+    def _match(self, doc_id: int, score: float) -> SubgroupMatch:
+        return SubgroupMatch(self._subgroup_ids[doc_id], self._labels[doc_id], score)
@@ -1,14 +1,11 @@
 import logging
 from collections.abc import Sequence
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from models.group import Group
-from models.speciality import Speciality
-from models.subgroup import Subgroup
-from repositories.group_repo import GroupRepository
-from repositories.speciality_repo import SpecialityRepository
-from repositories.subgroup_repo import SubgroupRepository
+from repositories.group_repo import GroupRow
+from repositories.speciality_repo import SpecialityRow
+from repositories.subgroup_repo import SubgroupRow
+from .group_catalog import GroupCatalogStore
+from .group_search import SubgroupMatch
 
 logger = logging.getLogger(__name__)
 
@@ -18,35 +15,26 @@ class GroupSelectionService:
 
     Provides step-by-step data retrieval for user onboarding questionnaire:
     speciality -> course -> stream -> group -> subgroup.
+
+    Every step is served from the in-memory GroupCatalog snapshot, so
+    onboarding performs no database queries.
     """
 
-    def __init__(
-        self,
-        session: AsyncSession,
-        speciality_repo: SpecialityRepository,
-        group_repo: GroupRepository,
-        subgroup_repo: SubgroupRepository,
-    ) -> None:
-        """Initialize GroupSelectionService with repositories.
+    def __init__(self, catalog_store: GroupCatalogStore) -> None:
+        """Initialize GroupSelectionService.
 
         Args:
-            session: AsyncSession for database operations
-            speciality_repo: Repository for specialities
-            group_repo: Repository for groups
-            subgroup_repo: Repository for subgroups
+            catalog_store: Holder of the current group catalog snapshot
         """
-        self.session = session
-        self.speciality_repo = speciality_repo
-        self.group_repo = group_repo
-        self.subgroup_repo = subgroup_repo
+        self.catalog_store = catalog_store
 
-    async def get_all_specialities(self) -> Sequence[Speciality]:
+    async def get_all_specialities(self) -> Sequence[SpecialityRow]:
         """Get all available specialities.
 
         Returns:
-            Sequence of Speciality objects
+            Sequence of SpecialityRow tuples sorted by code
         """
-        return await self.speciality_repo.find_all()
+        return self.catalog_store.current.specialities
 
     async def get_courses_by_speciality(self, speciality_id: int) -> Sequence[int]:
         """Get all distinct course numbers for a speciality.
@@ -57,7 +45,7 @@ class GroupSelectionService:
         Returns:
             Sorted sequence of course numbers
         """
-        return await self.group_repo.find_distinct_courses(speciality_id)
+        return self.catalog_store.current.courses(speciality_id)
 
     async def get_streams_by_speciality_course(
         self, speciality_id: int, course_number: int
@@ -69,13 +57,13 @@ class GroupSelectionService:
             course_number: Course number
 
         Returns:
-            Sequence of stream identifiers
+            Sorted sequence of stream identifiers
         """
-        return await self.group_repo.find_distinct_streams(speciality_id, course_number)
+        return self.catalog_store.current.streams(speciality_id, course_number)
 
     async def get_groups_by_structure(
         self, speciality_id: int, course_number: int, stream: str
-    ) -> Sequence[Group]:
+    ) -> Sequence[GroupRow]:
         """Get all groups matching the speciality, course, and stream.
 
         Args:
@@ -84,19 +72,29 @@ class GroupSelectionService:
             stream: Stream identifier
 
         Returns:
-            Sequence of Group objects
+            Sequence of GroupRow tuples sorted by name
         """
-        return await self.group_repo.find_by_speciality_course_stream(
-            speciality_id, course_number, stream
-        )
+        return self.catalog_store.current.groups(speciality_id, course_number, stream)
 
-    async def get_subgroups_by_group(self, group_id: int) -> Sequence[Subgroup]:
+    async def get_subgroups_by_group(self, group_id: int) -> Sequence[SubgroupRow]:
         """Get all subgroups for a group.
 
         Args:
             group_id: ID of the group
 
         Returns:
-            Sequence of Subgroup objects
+            Sequence of SubgroupRow tuples sorted by name
+        """
+        return self.catalog_store.current.subgroups(group_id)
+
+    async def search_subgroups(self, query: str, limit: int = 10) -> Sequence[SubgroupMatch]:
+        """Find subgroups by a typed group number or speciality name.
+
+        Args:
+            query: Free-text query, e.g. "103" or "Лечебное 2 курс"
+            limit: Maximum number of matches
+
+        Returns:
+            Sequence of SubgroupMatch tuples, best match first
         """
-        return await self.subgroup_repo.find_by_group(group_id)
+        return self.catalog_store.current.search_index.search(query, limit)
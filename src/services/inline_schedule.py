@@ -0,0 +1,190 @@
+import logging
+import re
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from repositories.lesson_repo import LessonRow
+from .group_catalog import GroupCatalogStore
+from .group_search import SubgroupMatch, normalize
+from .schedule_service import ScheduleService
+from .schedule_versions import ScheduleVersions
+
+logger = logging.getLogger(__name__)
+
+INLINE_RESULTS_LIMIT = 5
+
+_RELATIVE_DAYS = {"вчера": -1, "сегодня": 0, "завтра": 1, "послезавтра": 2}
+_WEEKDAYS = {
+    "пн": 0,
+    "понедельник": 0,
+    "вт": 1,
+    "вторник": 1,
+    "ср": 2,
+    "среда": 2,
+    "среду": 2,
+    "чт": 3,
+    "четверг": 3,
+    "пт": 4,
+    "пятница": 4,
+    "пятницу": 4,
+    "сб": 5,
+    "суббота": 5,
+    "субботу": 5,
+    "вс": 6,
+    "воскресенье": 6,
+}
+_FILLER_WORDS = {"в", "во", "на"}
+_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})")
+
+
+class InlineLookup(NamedTuple):
+    """Parsed inline query: what to search for and which day to show."""
+
+    group_query: str
+    day: date
+
+
+class RenderedDay(NamedTuple):
+    """A day's schedule rendered as an inline result."""
+
+    text: str
+    summary: str
+
+
+def _parse_day(word: str, today: date) -> date | None:
+    if word in _RELATIVE_DAYS:
+        return today + timedelta(days=_RELATIVE_DAYS[word])
+    if word in _WEEKDAYS:
+        return today + timedelta(days=(_WEEKDAYS[word] - today.weekday()) % 7)
+    if match := _DATE_RE.fullmatch(word):
+        try:
+            return date(today.year, int(match[2]), int(match[1]))
+        except ValueError:
+            return None
+    return None
+
+
+def parse_inline_query(text: str, today: date) -> InlineLookup:
+    """Split an inline query into a group query and a day.
+
+    Day words ("завтра", "пт", "21.10") may appear anywhere in the query and
+    the last one wins; weekdays resolve to their next occurrence including
+    today. Everything else is the group query.
+
+    Args:
+        text: Query typed after the bot username, e.g. "103 завтра"
+        today: Date relative days are resolved against
+
+    Returns:
+        InlineLookup with the group query and the day, today by default
+    """
+    day = today
+    words = []
+    for word in normalize(text).split():
+        parsed = _parse_day(word, today)
+        if parsed is not None:
+            day = parsed
+        elif word not in _FILLER_WORDS:
+            words.append(word)
+    return InlineLookup(" ".join(words), day)
+
+
+class RenderedDayCache:
+    """LRU cache of rendered inline days.
+
+    Keys carry the subgroup's schedule ETag, so a sync that changes a
+    subgroup makes its old entries unreachable; they age out through LRU.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        """Initialize RenderedDayCache.
+
+        Args:
+            max_entries: Maximum number of entries before LRU eviction
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, date, str], RenderedDay] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, subgroup_id: int, day: date, etag: str) -> RenderedDay | None:
+        """Get a rendered day or None if it is not cached for this ETag."""
+        key = (subgroup_id, day, etag)
+        rendered = self._entries.get(key)
+        if rendered is not None:
+            self._entries.move_to_end(key)
+        return rendered
+
+    def put(self, subgroup_id: int, day: date, etag: str, rendered: RenderedDay) -> None:
+        """Store a rendered day."""
+        key = (subgroup_id, day, etag)
+        self._entries[key] = rendered
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class InlineScheduleService:
+    """Service answering inline schedule queries from in-memory state."""
+
+    def __init__(
+        self,
+        schedule_service: ScheduleService,
+        versions: ScheduleVersions,
+        rendered_cache: RenderedDayCache,
+        catalog_store: GroupCatalogStore | None = None,
+    ) -> None:
+        """Initialize InlineScheduleService.
+
+        Args:
+            schedule_service: Read-through source of lesson rows on a cache miss
+            versions: Per-subgroup sync generations keying the rendered cache
+            rendered_cache: Rendered days shared across requests
+            catalog_store: Catalog holding the group search index
+        """
+        self.schedule_service = schedule_service
+        self.versions = versions
+        self.rendered_cache = rendered_cache
+        self.catalog_store = catalog_store if catalog_store is not None else GroupCatalogStore()
+
+    def resolve(
+        self, group_query: str, limit: int = INLINE_RESULTS_LIMIT
+    ) -> Sequence[SubgroupMatch]:
+        """Find subgroups matching the group part of an inline query.
+
+        Args:
+            group_query: Group number or speciality name
+            limit: Maximum number of matches
+
+        Returns:
+            Sequence of SubgroupMatch tuples, best match first
+        """
+        return self.catalog_store.current.search_index.search(group_query, limit)
+
+    def own_subgroup(self, subgroup_id: int) -> SubgroupMatch | None:
+        """Match for the user's own subgroup, used when the query names no group."""
+        subgroup = self.catalog_store.current.subgroups_by_id.get(subgroup_id)
+        if subgroup is None:
+            return None
+        return SubgroupMatch(subgroup.id, subgroup.name, 1.0)
+
+    def etag(self, subgroup_id: int) -> str:
+        """ETag of a subgroup's schedule; read it before fetching lessons to render."""
+        return self.versions.etag(subgroup_id)
+
+    def cached_day(self, subgroup_id: int, day: date, etag: str) -> RenderedDay | None:
+        """Rendered day if it was rendered for this ETag."""
+        return self.rendered_cache.get(subgroup_id, day, etag)
+
+    def remember_day(self, subgroup_id: int, day: date, etag: str, rendered: RenderedDay) -> None:
+        """Cache a rendered day under the ETag read before its lessons were fetched."""
+        self.rendered_cache.put(subgroup_id, day, etag, rendered)
+
+    async def get_lessons(
+        self, subgroup_ids: Sequence[int], day: date
+    ) -> dict[int, Sequence[LessonRow]]:
+        """Lesson rows of the subgroups that missed the rendered cache, by subgroup ID."""
+        return await self.schedule_service.get_schedules_for_date(subgroup_ids, day)
@@ -0,0 +1,153 @@
+import calendar
+import logging
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date, timedelta
+from itertools import groupby
+
+from repositories.lesson_repo import LessonRepository
+
+logger = logging.getLogger(__name__)
+
+# Backward navigation reaches one semester back; later dates are all indexed
+LESSON_DATES_PAST_DAYS = 183
+
+
+class LessonDays:
+    """One subgroup's lesson days as a bitmap: bit i is set for `base` + i days."""
+
+    __slots__ = ("_base", "_bits")
+
+    def __init__(self, base: int = 0, bits: int = 0) -> None:
+        """Initialize LessonDays.
+
+        Args:
+            base: Ordinal of the date bit 0 stands for
+            bits: Bitmap of days with lessons
+        """
+        self._base = base
+        self._bits = bits
+
+    def __contains__(self, day: object) -> bool:
+        if not isinstance(day, date):
+            return False
+        offset = day.toordinal() - self._base
+        return offset >= 0 and bool(self._bits >> offset & 1)
+
+    def in_month(self, year: int, month: int) -> list[int]:
+        """Days of a month that have lessons, by scanning the month's bits."""
+        first = date(year, month, 1).toordinal() - self._base
+        end = first + calendar.monthrange(year, month)[1]
+        # Days before the bitmap are unknown
+        start = max(first, 0)
+        if end <= start:
+            return []
+        mask = self._bits >> start & ((1 << (end - start)) - 1)
+        first_day = start - first + 1
+
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(first_day + low.bit_length() - 1)
+            mask ^= low
+        return result
+
+
+class LessonDates:
+    """Immutable per-subgroup index of the dates that have lessons.
+
+    Dates are stored as sorted ordinals in a compact array per subgroup, so
+    finding the nearest lesson day before or after a date is one bisect. The
+    same dates are kept as a per-subgroup bitmap, one bit per day from
+    `start_date`, so a month view is a shift and a mask. Dates before
+    `start_date` are unknown rather than free.
+    """
+
+    __slots__ = ("_bitmaps", "_dates", "start_date")
+
+    def __init__(
+        self,
+        rows: Iterable[tuple[int, date]] = (),
+        start_date: date | None = None,
+    ) -> None:
+        """Build the index from (subgroup_id, date) pairs.
+
+        Args:
+            rows: Distinct pairs sorted by subgroup_id and date
+            start_date: First indexed date, defaults to today
+        """
+        self.start_date = start_date if start_date is not None else date.today()
+        self._dates: dict[int, array[int]] = {
+            subgroup_id: array("I", (day.toordinal() for _, day in subgroup_rows))
+            for subgroup_id, subgroup_rows in groupby(rows, key=lambda r: r[0])
+        }
+        base = self.start_date.toordinal()
+        self._bitmaps: dict[int, int] = {}
+        for subgroup_id, ordinals in self._dates.items():
+            bits = 0
+            for ordinal in ordinals:
+                if ordinal >= base:
+                    bits |= 1 << (ordinal - base)
+            self._bitmaps[subgroup_id] = bits
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    @classmethod
+    async def load(
+        cls, lesson_repo: LessonRepository, start_date: date | None = None
+    ) -> LessonDates:
+        """Load lesson dates from `start_date` on with one query."""
+        if start_date is None:
+            start_date = date.today() - timedelta(days=LESSON_DATES_PAST_DAYS)
+        return cls(await lesson_repo.find_lesson_dates(start_date), start_date)
+
+    def covers(self, subgroup_id: int, day: date) -> bool:
+        """Whether the lesson days of a subgroup around `day` are known."""
+        return subgroup_id in self._dates and day >= self.start_date
+
+    def nearest(self, subgroup_id: int, day: date, direction: int) -> date | None:
+        """Nearest lesson day strictly after (direction > 0) or before `day`.
+
+        Returns:
+            The lesson day, or None if the subgroup has none in that direction
+        """
+        dates = self._dates.get(subgroup_id)
+        if not dates:
+            return None
+        if direction > 0:
+            i = bisect_right(dates, day.toordinal())
+            return date.fromordinal(dates[i]) if i < len(dates) else None
+        i = bisect_left(dates, day.toordinal())
+        return date.fromordinal(dates[i - 1]) if i > 0 else None
+
+    def lesson_days(self, subgroup_id: int) -> LessonDays:
+        """Bitmap of a subgroup's lesson days, empty if the subgroup is unknown."""
+        return LessonDays(self.start_date.toordinal(), self._bitmaps.get(subgroup_id, 0))
+
+
+class LessonDatesStore:
+    """Holder of the current LessonDates snapshot, swapped after every sync."""
+
+    def __init__(self, lesson_dates: LessonDates | None = None) -> None:
+        """Initialize LessonDatesStore.
+
+        Args:
+            lesson_dates: Initial snapshot, empty until the first load
+        """
+        self._lesson_dates = lesson_dates if lesson_dates is not None else LessonDates()
+
+    @property
+    def current(self) -> LessonDates:
+        """The lesson-date snapshot currently served."""
+        return self._lesson_dates
+
+    def replace(self, lesson_dates: LessonDates) -> None:
+        """Swap in a newly built snapshot."""
+        self._lesson_dates = lesson_dates
+        logger.info(
+            "Lesson dates replaced: %d subgroups from %s",
+            len(lesson_dates),
+            lesson_dates.start_date,
+        )
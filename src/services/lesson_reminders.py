@@ -0,0 +1,227 @@
+import heapq
+import logging
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.academic_calendar import UNIVERSITY_TZ
+from core.schedule_renderer import render_reminder
+from repositories.lesson_repo import LessonRepository, LessonRow
+from repositories.user_repo import UserRepository
+
+logger = logging.getLogger(__name__)
+
+# Lead times offered in settings, in minutes
+REMINDER_LEADS = (10, 15, 30, 60)
+# How far ahead reminder events are scheduled
+REMINDER_HORIZON = timedelta(hours=24)
+# Reminders due this long ago are still sent, e.g. after a restart or a stall
+REMINDER_CATCH_UP = timedelta(minutes=5)
+
+
+class ReminderEvent(NamedTuple):
+    """A moment to remind a subgroup's users with one lead time of a lesson."""
+
+    fire_at: datetime
+    subgroup_id: int
+    minutes: int
+    starts_at: datetime
+
+
+class Reminder(NamedTuple):
+    """A rendered reminder and the users to send it to."""
+
+    subgroup_id: int
+    starts_at: datetime
+    minutes: int
+    text: str
+    user_ids: list[int]
+
+
+class ReminderSchedule:
+    """Min-heap of the reminder events of the next REMINDER_HORIZON.
+
+    Holds one event per subgroup, lead time and lesson start, ordered by
+    fire time, so a tick pops only what is due. The heap is rebuilt, never
+    patched: `invalidate` marks it stale after a sync or a settings change it
+    does not cover, and it also goes stale when the day changes.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[ReminderEvent] = []
+        self._lessons: dict[tuple[int, datetime], list[LessonRow]] = {}
+        self._leads: set[tuple[int, int]] = set()
+        self._built_on: date | None = None
+        self._built_generation = -1
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation."""
+        return self._generation
+
+    def invalidate(self) -> None:
+        """Mark the heap for a rebuild before the next tick."""
+        self._generation += 1
+
+    def is_stale(self, today: date) -> bool:
+        """Whether the heap must be rebuilt before use on `today`."""
+        return self._built_generation != self._generation or self._built_on != today
+
+    def covers(self, subgroup_id: int, minutes: int) -> bool:
+        """Whether events for a subgroup and lead time are already scheduled."""
+        return (subgroup_id, minutes) in self._leads
+
+    def replace(
+        self,
+        events: Iterable[ReminderEvent],
+        lessons: dict[tuple[int, datetime], list[LessonRow]],
+        leads: Iterable[tuple[int, int]],
+        built_on: date,
+        generation: int,
+    ) -> None:
+        """Swap in a rebuilt heap.
+
+        Args:
+            events: Events of the horizon, in any order
+            lessons: Lessons by (subgroup_id, start) the events refer to
+            leads: Every (subgroup_id, minutes) pair the events were built for
+            built_on: Day the heap was built on
+            generation: `generation` before the rebuild read the database;
+                an invalidation after that keeps the heap stale
+        """
+        self._heap = list(events)
+        heapq.heapify(self._heap)
+        self._lessons = lessons
+        self._leads = set(leads)
+        self._built_on = built_on
+        self._built_generation = generation
+
+    def pop_due(self, now: datetime) -> list[ReminderEvent]:
+        """Remove and return the events due by `now`, earliest first."""
+        due = []
+        while self._heap and self._heap[0].fire_at <= now:
+            due.append(heapq.heappop(self._heap))
+        return due
+
+    def lessons(self, subgroup_id: int, starts_at: datetime) -> list[LessonRow]:
+        """Lessons of a subgroup starting at a moment."""
+        return self._lessons.get((subgroup_id, starts_at), [])
+
+
+class LessonReminderService:
+    """Builds the reminders of lessons about to start."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        lesson_repo: LessonRepository,
+        user_repo: UserRepository,
+        schedule: ReminderSchedule,
+    ) -> None:
+        """Initialize LessonReminderService.
+
+        Args:
+            session: AsyncSession for database operations
+            lesson_repo: Repository for lessons
+            user_repo: Repository for users
+            schedule: Heap of upcoming reminder events
+        """
+        self.session = session
+        self.lesson_repo = lesson_repo
+        self.user_repo = user_repo
+        self.schedule = schedule
+
+    async def rebuild(self, now: datetime) -> int:
+        """Rebuild the reminder heap for the REMINDER_HORIZON from `now`.
+
+        Two queries whatever the number of users: the lead times chosen per
+        subgroup, and the lessons of those subgroups in the horizon.
+
+        Args:
+            now: Current time, timezone-aware in any zone
+
+        Returns:
+            Number of scheduled events
+        """
+        generation = self.schedule.generation
+        leads = await self.user_repo.find_reminder_leads()
+        minutes_by_subgroup: dict[int, list[int]] = {}
+        for subgroup_id, minutes in leads:
+            minutes_by_subgroup.setdefault(subgroup_id, []).append(minutes)
+
+        # Lesson dates and times are Moscow time, whatever zone `now` is in
+        now = now.astimezone(UNIVERSITY_TZ)
+        end = now + REMINDER_HORIZON
+        rows: dict[int, list[LessonRow]] = {}
+        if minutes_by_subgroup:
+            rows = await self.lesson_repo.find_rows_for_subgroups_in_range(
+                minutes_by_subgroup, now.date(), end.date()
+            )
+
+        events: list[ReminderEvent] = []
+        lessons: dict[tuple[int, datetime], list[LessonRow]] = {}
+        for subgroup_id, subgroup_rows in rows.items():
+            for row in subgroup_rows:
+                starts_at = datetime.combine(row.date, row.start_time, tzinfo=UNIVERSITY_TZ)
+                if not now < starts_at <= end:
+                    continue
+                slot = lessons.setdefault((subgroup_id, starts_at), [])
+                slot.append(row)
+                if len(slot) > 1:
+                    continue
+                for minutes in minutes_by_subgroup[subgroup_id]:
+                    fire_at = starts_at - timedelta(minutes=minutes)
+                    if fire_at >= now - REMINDER_CATCH_UP:
+                        events.append(ReminderEvent(fire_at, subgroup_id, minutes, starts_at))
+
+        self.schedule.replace(events, lessons, leads, now.date(), generation)
+        logger.info(
+            "Reminder schedule rebuilt: %d events for %d subgroups",
+            len(events),
+            len(minutes_by_subgroup),
+        )
+        return len(events)
+
+    async def build_reminders(self, now: datetime) -> list[Reminder]:
+        """Render the reminders due by `now` once per subgroup, lead time and lesson.
+
+        Recipients of every due event come from one query, so a tick never
+        queries per user or per lesson, and a minute with nothing due costs
+        no query at all.
+
+        Args:
+            now: Current local time, timezone-aware
+
+        Returns:
+            Reminders that have recipients
+        """
+        due = [
+            event
+            for event in self.schedule.pop_due(now)
+            if event.fire_at >= now - REMINDER_CATCH_UP and event.starts_at > now
+        ]
+        if not due:
+            return []
+
+        recipients = await self.user_repo.find_reminder_recipients(
+            {(event.subgroup_id, event.minutes) for event in due}
+        )
+        reminders = []
+        for event in due:
+            user_ids = recipients.get((event.subgroup_id, event.minutes))
+            if not user_ids:
+                continue
+            text = render_reminder(
+                event.minutes, self.schedule.lessons(event.subgroup_id, event.starts_at)
+            )
+            reminders.append(
+                Reminder(event.subgroup_id, event.starts_at, event.minutes, text, user_ids)
+            )
+        logger.info("Built %d reminders from %d due events", len(reminders), len(due))
+        return reminders
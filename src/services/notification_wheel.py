@@ -0,0 +1,127 @@
+import logging
+from collections.abc import Iterable
+from datetime import time
+
+logger = logging.getLogger(__name__)
+
+# (hour, minute, subgroup_id) of a scheduled subscriber
+_Entry = tuple[int, int, int]
+
+
+class NotificationWheel:
+    """Daily timing wheel of subscribers keyed by notification time.
+
+    Two levels: 24 hour slots, each allocated on demand as 60 minute slots
+    mapping user ID to subgroup ID. A tick reads one minute slot, so it costs
+    O(due users) and an empty hour costs nothing. Settings changes update the
+    wheel in place; `reconcile` rebuilds it from the database, keeping changes
+    made while the reconciliation was reading.
+    """
+
+    def __init__(self) -> None:
+        self._hours: list[list[dict[int, int]] | None] = [None] * 24
+        self._hour_sizes = [0] * 24
+        self._entries: dict[int, _Entry] = {}
+        self._version = 0
+        self._changed: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._entries
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every incremental change."""
+        return self._version
+
+    def due(self, at: time) -> dict[int, int]:
+        """Subscribers due at a minute as {user_id: subgroup_id}."""
+        minutes = self._hours[at.hour]
+        return dict(minutes[at.minute]) if minutes else {}
+
+    def schedule(self, user_id: int, at: time, subgroup_id: int) -> None:
+        """Add a subscriber or move them to a new time and subgroup."""
+        self._remove(user_id)
+        self._insert(user_id, (at.hour, at.minute, subgroup_id))
+        self._touch(user_id)
+
+    def unschedule(self, user_id: int) -> bool:
+        """Remove a subscriber. Returns whether they were scheduled."""
+        self._touch(user_id)
+        return self._remove(user_id) is not None
+
+    def move(self, user_id: int, at: time) -> bool:
+        """Change a scheduled subscriber's time. Returns whether they were scheduled."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return False
+        self.schedule(user_id, at, entry[2])
+        return True
+
+    def set_subgroup(self, user_id: int, subgroup_id: int) -> bool:
+        """Change a scheduled subscriber's subgroup. Returns whether they were scheduled."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return False
+        hour, minute, _ = entry
+        self.schedule(user_id, time(hour, minute), subgroup_id)
+        return True
+
+    def reconcile(self, rows: Iterable[tuple[int, time, int]], since: int) -> int:
+        """Rebuild the wheel from (user_id, notification_time, subgroup_id) rows.
+
+        Args:
+            rows: Every subscriber with a subgroup, read from the database
+            since: `version` before the rows were read; users changed after
+                that keep their in-memory state, which is newer than the rows
+
+        Returns:
+            Number of users whose state differed from the rows
+        """
+        fresh = {user_id: (at.hour, at.minute, subgroup_id) for user_id, at, subgroup_id in rows}
+        for user_id, version in self._changed.items():
+            if version > since:
+                entry = self._entries.get(user_id)
+                if entry is None:
+                    fresh.pop(user_id, None)
+                else:
+                    fresh[user_id] = entry
+
+        drift = sum(1 for user_id, entry in fresh.items() if self._entries.get(user_id) != entry)
+        drift += sum(1 for user_id in self._entries if user_id not in fresh)
+
+        self._hours = [None] * 24
+        self._hour_sizes = [0] * 24
+        self._entries = {}
+        for user_id, entry in fresh.items():
+            self._insert(user_id, entry)
+        self._changed = {u: v for u, v in self._changed.items() if v > since}
+        return drift
+
+    def _insert(self, user_id: int, entry: _Entry) -> None:
+        hour, minute, subgroup_id = entry
+        minutes = self._hours[hour]
+        if minutes is None:
+            minutes = self._hours[hour] = [{} for _ in range(60)]
+        minutes[minute][user_id] = subgroup_id
+        self._hour_sizes[hour] += 1
+        self._entries[user_id] = entry
+
+    def _remove(self, user_id: int) -> _Entry | None:
+        entry = self._entries.pop(user_id, None)
+        if entry is None:
+            return None
+        hour, minute, _ = entry
+        minutes = self._hours[hour]
+        if minutes is not None:
+            minutes[minute].pop(user_id, None)
+            self._hour_sizes[hour] -= 1
+            if not self._hour_sizes[hour]:
+                self._hours[hour] = None
+        return entry
+
+    def _touch(self, user_id: int) -> None:
+        self._version += 1
+        self._changed[user_id] = self._version
@@ -0,0 +1,105 @@
+import logging
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories.outbox_repo import OutboxRepository, OutboxRow
+
+logger = logging.getLogger(__name__)
+
+# A claimed message not settled within the lease is claimed again
+OUTBOX_LEASE = timedelta(minutes=5)
+OUTBOX_MAX_ATTEMPTS = 5
+# Delay before the first retry of a failed message, doubled on every attempt
+OUTBOX_RETRY_DELAY = timedelta(seconds=30)
+
+
+class OutboxService:
+    """Service for the persistent queue of outgoing messages."""
+
+    def __init__(self, session: AsyncSession, outbox_repo: OutboxRepository) -> None:
+        """Initialize OutboxService.
+
+        Args:
+            session: AsyncSession for database operations
+            outbox_repo: Repository for the outbox
+        """
+        self.session = session
+        self.outbox_repo = outbox_repo
+
+    async def enqueue(self, messages: Iterable[tuple[str | None, int, str]]) -> int:
+        """Persist messages to be sent.
+
+        Args:
+            messages: (key, chat_id, text) messages; a message whose key is
+                already in the outbox is skipped, so producers that run
+                twice, e.g. after a restart or on two replicas, enqueue once
+
+        Returns:
+            Number of messages enqueued
+        """
+        rows = [{"key": key, "chat_id": chat_id, "body": text} for key, chat_id, text in messages]
+        if not rows:
+            return 0
+        count = await self.outbox_repo.append(rows)
+        await self.session.commit()
+        logger.info("Enqueued %d of %d messages", count, len(rows))
+        return count
+
+    async def claim_batch(self, limit: int) -> Sequence[OutboxRow]:
+        """Claim up to `limit` due messages for OUTBOX_LEASE.
+
+        Returns:
+            Claimed messages in enqueue order
+        """
+        rows = await self.outbox_repo.claim(limit, OUTBOX_LEASE)
+        await self.session.commit()
+        return rows
+
+    async def settle(
+        self,
+        sent: Sequence[int],
+        blocked: Sequence[int],
+        failed: Sequence[OutboxRow],
+    ) -> None:
+        """Record the outcome of a claimed batch in one transaction.
+
+        Failed messages are retried with exponential backoff until they
+        reach OUTBOX_MAX_ATTEMPTS.
+
+        Args:
+            sent: IDs of delivered messages
+            blocked: IDs of messages to chats that blocked the bot
+            failed: Messages that could not be delivered
+        """
+        await self.outbox_repo.mark_done(sent)
+        await self.outbox_repo.mark_done(blocked, error="blocked")
+
+        retries: dict[int, list[int]] = {}
+        given_up: list[int] = []
+        for row in failed:
+            if row.attempts >= OUTBOX_MAX_ATTEMPTS:
+                given_up.append(row.id)
+            else:
+                retries.setdefault(row.attempts, []).append(row.id)
+        await self.outbox_repo.mark_done(given_up, error="failed")
+        for attempts, ids in retries.items():
+            await self.outbox_repo.release(ids, OUTBOX_RETRY_DELAY * 2 ** (attempts - 1))
+        await self.session.commit()
+
+        if given_up:
+            logger.warning(
+                "Gave up on %d messages after %d attempts", len(given_up), OUTBOX_MAX_ATTEMPTS
+            )
+
+    async def purge(self, done_before: datetime) -> int:
+        """Delete messages settled before a moment.
+
+        Returns:
+            Number of messages deleted
+        """
+        count = await self.outbox_repo.purge(done_before)
+        await self.session.commit()
+        logger.info("Purged %d settled outbox messages", count)
+        return count
@@ -0,0 +1,177 @@
+import logging
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import date, time, timedelta
+from itertools import groupby
+from typing import NamedTuple
+
+from repositories.lesson_repo import LessonRepository, RoomSlotRow
+
+logger = logging.getLogger(__name__)
+
+ROOM_OCCUPANCY_DAYS = 14
+
+RoomKey = tuple[str, str]
+
+
+class RoomSlot(NamedTuple):
+    """A lesson held in a room."""
+
+    start_time: time
+    end_time: time
+    subject: str
+
+
+class FreeRoom(NamedTuple):
+    """A room free for the requested time, with when it becomes busy next."""
+
+    address: str
+    room: str
+    free_until: time | None
+
+
+class _RoomDay(NamedTuple):
+    """One room's day: merged busy intervals for bisect and the raw slots."""
+
+    starts: tuple[time, ...]
+    ends: tuple[time, ...]
+    slots: tuple[RoomSlot, ...]
+
+
+def _merge_busy(slots: Sequence[RoomSlot]) -> tuple[tuple[time, ...], tuple[time, ...]]:
+    """Merge overlapping slots sorted by start into disjoint busy intervals."""
+    starts: list[time] = []
+    ends: list[time] = []
+    for slot in slots:
+        if ends and slot.start_time < ends[-1]:
+            ends[-1] = max(ends[-1], slot.end_time)
+        else:
+            starts.append(slot.start_time)
+            ends.append(slot.end_time)
+    return tuple(starts), tuple(ends)
+
+
+class RoomOccupancy:
+    """Immutable per-date index of busy intervals for every (address, room).
+
+    Built at sync time for a fixed window of dates. Busy intervals of a room
+    are merged and kept sorted, so checking a room is one bisect over its
+    interval ends instead of a scan over lessons. Dates outside the window
+    are unknown rather than free.
+    """
+
+    __slots__ = ("_days", "end_date", "rooms", "start_date")
+
+    def __init__(
+        self,
+        rows: Iterable[RoomSlotRow] = (),
+        start_date: date | None = None,
+        days: int = 0,
+    ) -> None:
+        """Build the index from room slot rows.
+
+        Args:
+            rows: Slots sorted by date, address, room and start_time
+            start_date: First date of the window, defaults to today
+            days: Number of dates covered
+        """
+        self.start_date = start_date if start_date is not None else date.today()
+        self.end_date = self.start_date + timedelta(days=days)
+
+        rooms: set[RoomKey] = set()
+        self._days: dict[date, dict[RoomKey, _RoomDay]] = {}
+        for (day, address, room), room_rows in groupby(rows, key=lambda r: r[:3]):
+            key = (address or "", room)
+            slots = tuple(
+                dict.fromkeys(RoomSlot(r.start_time, r.end_time, r.subject) for r in room_rows)
+            )
+            self._days.setdefault(day, {})[key] = _RoomDay(*_merge_busy(slots), slots)
+            rooms.add(key)
+        self.rooms = tuple(sorted(rooms))
+
+    @classmethod
+    async def load(
+        cls,
+        lesson_repo: LessonRepository,
+        start_date: date | None = None,
+        days: int = ROOM_OCCUPANCY_DAYS,
+    ) -> RoomOccupancy:
+        """Load occupancy for `days` dates from `start_date` with one query."""
+        start_date = start_date if start_date is not None else date.today()
+        rows = await lesson_repo.find_room_slots(start_date, start_date + timedelta(days=days - 1))
+        return cls(rows, start_date, days)
+
+    def covers(self, day: date) -> bool:
+        """Whether occupancy for `day` is known."""
+        return self.start_date <= day < self.end_date
+
+    def free_rooms(
+        self,
+        day: date,
+        start: time,
+        end: time | None = None,
+        address: str | None = None,
+    ) -> Sequence[FreeRoom]:
+        """Rooms with no lesson at `start`, or during [start, end) if given.
+
+        Args:
+            day: Date to check
+            start: Time, or start of the period
+            end: End of the period
+            address: Only rooms at this address
+
+        Returns:
+            Free rooms sorted by address and room
+        """
+        if not self.covers(day):
+            return []
+        end = end if end is not None and end > start else start
+        occupied = self._days.get(day, {})
+
+        free = []
+        for key in self.rooms:
+            if address is not None and key[0] != address:
+                continue
+            room_day = occupied.get(key)
+            if room_day is None:
+                free.append(FreeRoom(*key, free_until=None))
+                continue
+            # First busy interval that ends after `start`
+            i = bisect_right(room_day.ends, start)
+            if i == len(room_day.starts):
+                free.append(FreeRoom(*key, free_until=None))
+            elif room_day.starts[i] > start and room_day.starts[i] >= end:
+                free.append(FreeRoom(*key, free_until=room_day.starts[i]))
+        return free
+
+    def room_schedule(self, day: date, address: str, room: str) -> Sequence[RoomSlot]:
+        """Lessons held in a room on a date, sorted by start time."""
+        room_day = self._days.get(day, {}).get((address, room))
+        return room_day.slots if room_day is not None else ()
+
+
+class RoomOccupancyStore:
+    """Holder of the current RoomOccupancy snapshot, swapped after every sync."""
+
+    def __init__(self, occupancy: RoomOccupancy | None = None) -> None:
+        """Initialize RoomOccupancyStore.
+
+        Args:
+            occupancy: Initial snapshot, empty until the first load
+        """
+        self._occupancy = occupancy if occupancy is not None else RoomOccupancy()
+
+    @property
+    def current(self) -> RoomOccupancy:
+        """The occupancy snapshot currently served."""
+        return self._occupancy
+
+    def replace(self, occupancy: RoomOccupancy) -> None:
+        """Swap in a newly built snapshot."""
+        self._occupancy = occupancy
+        logger.info(
+            "Room occupancy replaced: %d rooms from %s to %s",
+            len(occupancy.rooms),
+            occupancy.start_date,
+            occupancy.end_date,
+        )
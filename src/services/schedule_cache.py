@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from datetime import date
+
+from repositories.lesson_repo import LessonRow
+
+ScheduleKey = tuple[int, date, date]
+
+
+class ScheduleCache:
+    """In-memory LRU cache of lesson rows with a per-entry TTL.
+
+    Entries are keyed by (subgroup_id, start_date, end_date), so a day view is
+    cached as a single-day range and a week view as a seven-day range.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize ScheduleCache.
+
+        Args:
+            ttl_seconds: Lifetime of a cached entry
+            max_entries: Maximum number of entries before LRU eviction
+            clock: Monotonic time source
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[ScheduleKey, tuple[float, Sequence[LessonRow]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: ScheduleKey) -> bool:
+        return self.get(*key) is not None
+
+    def get(self, subgroup_id: int, start_date: date, end_date: date) -> Sequence[LessonRow] | None:
+        """Get cached rows or None if the entry is missing or expired."""
+        key = (subgroup_id, start_date, end_date)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, rows = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return rows
+
+    def put(
+        self,
+        subgroup_id: int,
+        start_date: date,
+        end_date: date,
+        rows: Sequence[LessonRow],
+    ) -> None:
+        """Store rows for a subgroup and date range."""
+        key = (subgroup_id, start_date, end_date)
+        self._entries[key] = (self._clock() + self.ttl_seconds, tuple(rows))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries, e.g. after a schedule sync."""
+        self._entries.clear()
@@ -0,0 +1,213 @@
+import hashlib
+import logging
+from collections.abc import Iterable
+from datetime import date, time, timedelta
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.schedule_renderer import LESSON_TYPE_TITLES, day_header, format_lesson, time_range
+from repositories.lesson_repo import LessonRow
+from repositories.user_repo import UserRepository
+from .outbox import OutboxService
+
+logger = logging.getLogger(__name__)
+
+# Days from today a sync compares and alerts about
+CHANGE_WINDOW_DAYS = 14
+# Entries listed in one alert; the rest are summed up in a closing line
+CHANGE_ALERT_MAX_ENTRIES = 20
+
+# (subgroup_id, date, start_time, subject): uq_lesson_unique, a lesson's identity
+LessonKey = tuple[int, date, time, str]
+
+
+class LessonSnapshot(NamedTuple):
+    """A subgroup's lessons from a sync, up to an exclusive date."""
+
+    until: date
+    lessons: frozenset[LessonRow]
+
+
+class LessonSnapshots:
+    """Lessons of the upcoming days per schedule and subgroup as of the last sync.
+
+    The baseline a sync diffs its parsed lessons against, so changes are
+    found without reading the lessons table back. Snapshots are kept per
+    schedule, as several schedules may feed one subgroup and a sync only
+    answers for the lessons its own schedule produced.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: dict[int, dict[int, LessonSnapshot]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(by_schedule) for by_schedule in self._snapshots.values())
+
+    def get(self, schedule_id: int, subgroup_id: int) -> LessonSnapshot | None:
+        """Last snapshot of a subgroup from a schedule, if any."""
+        return self._snapshots.get(subgroup_id, {}).get(schedule_id)
+
+    def others(self, schedule_id: int, subgroup_id: int) -> list[LessonSnapshot]:
+        """Last snapshots of a subgroup from every other schedule."""
+        by_schedule = self._snapshots.get(subgroup_id, {})
+        return [snapshot for other, snapshot in by_schedule.items() if other != schedule_id]
+
+    def put(self, schedule_id: int, subgroup_id: int, snapshot: LessonSnapshot) -> None:
+        """Store a subgroup's snapshot after a schedule's lessons were committed."""
+        self._snapshots.setdefault(subgroup_id, {})[schedule_id] = snapshot
+
+
+class LessonChanges(NamedTuple):
+    """Lessons of a subgroup added, removed and modified by a sync."""
+
+    subgroup_id: int
+    added: list[LessonRow]
+    removed: list[LessonRow]
+    modified: list[tuple[LessonRow, LessonRow]]
+
+
+def diff_lessons(
+    subgroup_id: int, old: Iterable[LessonRow], new: Iterable[LessonRow]
+) -> LessonChanges | None:
+    """Compare two sets of a subgroup's lessons.
+
+    A lesson only in the new set is paired with one only in the old set as
+    a modification when they share a day and start time, e.g. a new room or
+    teacher, or failing that a day and subject, e.g. a new time.
+
+    Returns:
+        The changes, or None if the sets are equal
+    """
+    old_set, new_set = set(old), set(new)
+    removed = sorted(old_set - new_set)
+    added = sorted(new_set - old_set)
+    modified: list[tuple[LessonRow, LessonRow]] = []
+    for key in (
+        lambda lesson: (lesson.date, lesson.start_time),
+        lambda lesson: (lesson.date, lesson.subject),
+    ):
+        unmatched = {key(lesson): lesson for lesson in removed}
+        still_added = []
+        for lesson in added:
+            before = unmatched.pop(key(lesson), None)
+            if before is None:
+                still_added.append(lesson)
+            else:
+                modified.append((before, lesson))
+        added, removed = still_added, sorted(unmatched.values())
+
+    if not (added or removed or modified):
+        return None
+    return LessonChanges(subgroup_id, added, removed, sorted(modified, key=lambda m: m[1]))
+
+
+def lesson_key(subgroup_id: int, lesson: LessonRow) -> LessonKey:
+    """Identity of a stored lesson."""
+    return (subgroup_id, lesson.date, lesson.start_time, lesson.subject)
+
+
+def _previous_values(old: LessonRow, new: LessonRow) -> str:
+    parts = []
+    if old.subject != new.subject:
+        parts.append(old.subject)
+    if (old.start_time, old.end_time) != (new.start_time, new.end_time):
+        parts.append(f"🕒 {time_range(old.start_time, old.end_time)}")
+    if old.lesson_type != new.lesson_type:
+        parts.append(LESSON_TYPE_TITLES.get(old.lesson_type, old.lesson_type))
+    if old.room != new.room:
+        parts.append(f"🚪 {old.room or '—'}")
+    if old.teacher != new.teacher:
+        parts.append(f"👨‍🏫 {old.teacher or '—'}")
+    return " · ".join(parts)
+
+
+def render_changes(changes: LessonChanges) -> str:
+    """Render a subgroup's changes as one alert grouped by day."""
+    entries = [
+        (lesson.date, lesson.start_time, f"➕ {format_lesson(lesson)}") for lesson in changes.added
+    ]
+    entries += [
+        (
+            lesson.date,
+            lesson.start_time,
+            f"❌ <s>{time_range(lesson.start_time, lesson.end_time)} — {lesson.subject}</s>",
+        )
+        for lesson in changes.removed
+    ]
+    entries += [
+        (new.date, new.start_time, f"✏️ {format_lesson(new)}\n   было: {_previous_values(old, new)}")
+        for old, new in changes.modified
+    ]
+    entries.sort(key=lambda entry: (entry[0], entry[1]))
+
+    lines = ["🔄 <b>Изменения в расписании</b>"]
+    day = None
+    for entry_day, _, text in entries[:CHANGE_ALERT_MAX_ENTRIES]:
+        if entry_day != day:
+            day = entry_day
+            lines.append(f"\n{day_header(day)}")
+        lines.append(text)
+    if len(entries) > CHANGE_ALERT_MAX_ENTRIES:
+        lines.append(f"\n…и ещё изменений: {len(entries) - CHANGE_ALERT_MAX_ENTRIES}")
+    return "\n".join(lines)
+
+
+def change_window(today: date) -> tuple[date, date]:
+    """First day and exclusive end of the days a sync alerts about."""
+    return today, today + timedelta(days=CHANGE_WINDOW_DAYS)
+
+
+class ScheduleAlertService:
+    """Alerts subscribers about schedule changes found by a sync."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        user_repo: UserRepository,
+        outbox_service: OutboxService,
+    ) -> None:
+        """Initialize ScheduleAlertService.
+
+        Args:
+            session: AsyncSession for database operations
+            user_repo: Repository for users
+            outbox_service: Outbox to enqueue the alerts in
+        """
+        self.session = session
+        self.user_repo = user_repo
+        self.outbox_service = outbox_service
+
+    async def notify(self, changes: Iterable[LessonChanges]) -> int:
+        """Enqueue one alert per changed subgroup for each of its subscribers.
+
+        Subscribers of every subgroup come from one query. Alerts are keyed
+        by their text, so two replicas finding the same changes, or a retried
+        sync, enqueue them once.
+
+        Returns:
+            Number of alerts enqueued
+        """
+        changes = list(changes)
+        if not changes:
+            return 0
+        subscribers = await self.user_repo.find_subscribers_by_subgroup(
+            [change.subgroup_id for change in changes]
+        )
+
+        messages: list[tuple[str | None, int, str]] = []
+        for change in changes:
+            user_ids = subscribers.get(change.subgroup_id)
+            if not user_ids:
+                continue
+            text = render_changes(change)
+            digest = hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+            messages.extend(
+                (f"changes:{change.subgroup_id}:{digest}:{user_id}", user_id, text)
+                for user_id in user_ids
+            )
+        if not messages:
+            return 0
+        enqueued = await self.outbox_service.enqueue(messages)
+        logger.info("Enqueued %d schedule change alerts for %d subgroups", enqueued, len(changes))
+        return enqueued
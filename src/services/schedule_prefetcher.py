@@ -0,0 +1,123 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from datetime import date, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories.lesson_repo import LessonRepository
+from .schedule_cache import ScheduleCache, ScheduleKey
+from .schedule_service import ScheduleService
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulePrefetcher:
+    """Warms ScheduleCache with the anchors a user is likely to open next.
+
+    Prefetches run as background tasks with their own sessions, so they never
+    share a connection with the update that triggered them.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        cache: ScheduleCache,
+        depth: int = 2,
+        max_pending: int = 32,
+    ) -> None:
+        """Initialize SchedulePrefetcher.
+
+        Args:
+            session_factory: Factory for background (read-only) sessions
+            cache: Cache shared with ScheduleService
+            depth: Number of anchors to prefetch in the navigation direction
+            max_pending: Cap on outstanding prefetch tasks
+        """
+        self.session_factory = session_factory
+        self.cache = cache
+        self.depth = depth
+        self.max_pending = max_pending
+        self._pending: dict[ScheduleKey, asyncio.Task[None]] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of prefetches currently in flight."""
+        return len(self._pending)
+
+    def prefetch(self, subgroup_id: int, anchor: date, *, weekly: bool, direction: int) -> int:
+        """Schedule background loads of the anchors following `anchor`.
+
+        Args:
+            subgroup_id: ID of the subgroup
+            anchor: Anchor the user has just navigated to
+            weekly: Whether anchors are week starts instead of days
+            direction: 1 for forward navigation, -1 for backward
+
+        Returns:
+            Number of prefetch tasks started
+        """
+        step = timedelta(weeks=1) if weekly else timedelta(days=1)
+        targets = [anchor + step * (direction * distance) for distance in range(1, self.depth + 1)]
+        return self._start(subgroup_id, targets, weekly=weekly)
+
+    def prefetch_days(self, subgroup_id: int, days: Iterable[date]) -> int:
+        """Schedule background loads of given days, e.g. the next days with lessons.
+
+        Args:
+            subgroup_id: ID of the subgroup
+            days: Days the user is likely to open next
+
+        Returns:
+            Number of prefetch tasks started
+        """
+        return self._start(subgroup_id, days, weekly=False)
+
+    def _start(self, subgroup_id: int, targets: Iterable[date], *, weekly: bool) -> int:
+        span = timedelta(days=6) if weekly else timedelta(0)
+        started = 0
+
+        for target in targets:
+            if len(self._pending) >= self.max_pending:
+                break
+
+            key = (subgroup_id, target, target + span)
+            if key in self._pending or key in self.cache:
+                continue
+
+            task = asyncio.create_task(self._load(subgroup_id, target, weekly=weekly))
+            self._pending[key] = task
+            task.add_done_callback(lambda _task, key=key: self._pending.pop(key, None))
+            started += 1
+
+        return started
+
+    async def join(self) -> None:
+        """Wait until all outstanding prefetches finish."""
+        await asyncio.gather(*self._pending.values())
+
+    async def close(self) -> None:
+        """Cancel outstanding prefetches."""
+        tasks = list(self._pending.values())
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _load(self, subgroup_id: int, target: date, *, weekly: bool) -> None:
+        try:
+            async with self.session_factory() as session:
+                service = ScheduleService(
+                    session=session,
+                    lesson_repo=LessonRepository(session),
+                    cache=self.cache,
+                )
+                if weekly:
+                    await service.get_schedule_for_week(subgroup_id, target)
+                else:
+                    await service.get_schedule_for_date(subgroup_id, target)
+        except Exception as e:
+            logger.warning("Prefetch failed for subgroup %d at %s: %s", subgroup_id, target, e)
@@ -1,15 +1,32 @@
 import logging
 from collections.abc import Sequence
-from datetime import date, timedelta
+from datetime import date, time, timedelta
+from typing import NamedTuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models.lesson import Lesson
-from repositories.lesson_repo import LessonRepository
+from models import LessonType
+from repositories.lesson_repo import LessonRepository, LessonRow
+from .group_catalog import GroupCatalogStore
+from .lesson_dates import LessonDatesStore, LessonDays
+from .room_occupancy import FreeRoom, RoomOccupancyStore, RoomSlot
+from .schedule_cache import ScheduleCache
 
 logger = logging.getLogger(__name__)
 
 
+class TeacherLesson(NamedTuple):
+    """A teacher's lesson with all subgroups attending it."""
+
+    date: date
+    start_time: time
+    end_time: time
+    subject: str
+    lesson_type: LessonType
+    room: str | None
+    subgroups: tuple[str, ...]
+
+
 class ScheduleService:
     """Service for retrieving lesson schedules."""
 
@@ -17,17 +34,33 @@ class ScheduleService:
         self,
         session: AsyncSession,
         lesson_repo: LessonRepository,
+        cache: ScheduleCache | None = None,
+        catalog_store: GroupCatalogStore | None = None,
+        room_store: RoomOccupancyStore | None = None,
+        lesson_dates_store: LessonDatesStore | None = None,
     ) -> None:
         """Initialize ScheduleService with repository.
 
         Args:
             session: AsyncSession for database operations
             lesson_repo: Repository for lessons
+            cache: Optional read-through cache for lesson rows
+            catalog_store: Catalog used for teacher lookup and subgroup names
+            room_store: Room occupancy snapshot for free-room lookups
+            lesson_dates_store: Lesson-date index for jumping between lesson days
         """
         self.session = session
         self.lesson_repo = lesson_repo
+        self.cache = cache
+        self.catalog_store = catalog_store if catalog_store is not None else GroupCatalogStore()
+        self.room_store = room_store if room_store is not None else RoomOccupancyStore()
+        self.lesson_dates_store = (
+            lesson_dates_store if lesson_dates_store is not None else LessonDatesStore()
+        )
 
-    async def get_schedule_for_date(self, subgroup_id: int, target_date: date) -> Sequence[Lesson]:
+    async def get_schedule_for_date(
+        self, subgroup_id: int, target_date: date
+    ) -> Sequence[LessonRow]:
         """Get all lessons for a subgroup on a specific date.
 
         Args:
@@ -35,13 +68,56 @@ class ScheduleService:
             target_date: Date to retrieve lessons for
 
         Returns:
-            List of Lesson objects sorted by start_time
+            List of LessonRow projections sorted by start_time
         """
-        return await self.lesson_repo.find_for_subgroup_on_date(subgroup_id, target_date)
+        if self.cache is not None:
+            cached = self.cache.get(subgroup_id, target_date, target_date)
+            if cached is not None:
+                return cached
+
+        rows = await self.lesson_repo.find_rows_for_subgroup_on_date(subgroup_id, target_date)
+        if self.cache is not None:
+            self.cache.put(subgroup_id, target_date, target_date, rows)
+        return rows
+
+    async def get_schedules_for_date(
+        self, subgroup_ids: Sequence[int], target_date: date
+    ) -> dict[int, Sequence[LessonRow]]:
+        """Get lessons of several subgroups on a date, fetching cache misses with one query.
+
+        Args:
+            subgroup_ids: IDs of the subgroups
+            target_date: Date to retrieve lessons for
+
+        Returns:
+            LessonRow projections sorted by start_time, by subgroup ID
+        """
+        schedules: dict[int, Sequence[LessonRow]] = {}
+        missing = []
+        for subgroup_id in subgroup_ids:
+            cached = (
+                self.cache.get(subgroup_id, target_date, target_date)
+                if self.cache is not None
+                else None
+            )
+            if cached is None:
+                missing.append(subgroup_id)
+            else:
+                schedules[subgroup_id] = cached
+        if not missing:
+            return schedules
+
+        rows = await self.lesson_repo.find_rows_for_subgroups_on_date(missing, target_date)
+        for subgroup_id in missing:
+            subgroup_rows = rows.get(subgroup_id, [])
+            if self.cache is not None:
+                self.cache.put(subgroup_id, target_date, target_date, subgroup_rows)
+            schedules[subgroup_id] = subgroup_rows
+        return schedules
 
     async def get_schedule_for_week(
         self, subgroup_id: int, week_start_date: date
-    ) -> Sequence[Lesson]:
+    ) -> Sequence[LessonRow]:
         """Get all lessons for a subgroup in a week starting from a date.
 
         Args:
@@ -49,33 +125,175 @@ class ScheduleService:
             week_start_date: Date to start the week from
 
         Returns:
-            Sequence of Lesson objects sorted by date and start_time
+            Sequence of LessonRow projections sorted by date and start_time
         """
         week_end_date = week_start_date + timedelta(days=6)
-        return await self.lesson_repo.find_for_subgroup_in_range(
+        if self.cache is not None:
+            cached = self.cache.get(subgroup_id, week_start_date, week_end_date)
+            if cached is not None:
+                return cached
+
+        rows = await self.lesson_repo.find_rows_for_subgroup_in_range(
             subgroup_id, week_start_date, week_end_date
         )
+        if self.cache is not None:
+            self.cache.put(subgroup_id, week_start_date, week_end_date, rows)
+        return rows
 
-    async def get_today_schedule(self, subgroup_id: int) -> Sequence[Lesson]:
+    async def get_today_schedule(self, subgroup_id: int) -> Sequence[LessonRow]:
         """Get all lessons for a subgroup today.
 
         Args:
             subgroup_id: ID of the subgroup
 
         Returns:
-            Sequence of Lesson objects sorted by start_time
+            Sequence of LessonRow projections sorted by start_time
         """
         today = date.today()
         return await self.get_schedule_for_date(subgroup_id, today)
 
-    async def get_tomorrow_schedule(self, subgroup_id: int) -> Sequence[Lesson]:
+    async def get_tomorrow_schedule(self, subgroup_id: int) -> Sequence[LessonRow]:
         """Get all lessons for a subgroup tomorrow.
 
         Args:
             subgroup_id: ID of the subgroup
 
         Returns:
-            Sequence of Lesson objects sorted by start_time
+            Sequence of LessonRow projections sorted by start_time
         """
         tomorrow = date.today() + timedelta(days=1)
         return await self.get_schedule_for_date(subgroup_id, tomorrow)
+
+    def find_lesson_day(self, subgroup_id: int, from_date: date, direction: int) -> date | None:
+        """Find the nearest day with lessons after or before a date, in memory.
+
+        Where the lesson-date index does not know the subgroup or the dates,
+        this falls back to the adjacent calendar day.
+
+        Args:
+            subgroup_id: ID of the subgroup
+            from_date: Date to move from
+            direction: 1 for the next lesson day, -1 for the previous one
+
+        Returns:
+            The day to show, or None if there are no later lessons
+        """
+        lesson_dates = self.lesson_dates_store.current
+        if not lesson_dates.covers(subgroup_id, from_date):
+            return from_date + timedelta(days=direction)
+
+        day = lesson_dates.nearest(subgroup_id, from_date, direction)
+        if day is None and direction < 0:
+            # Earlier lessons may exist before the indexed window
+            return from_date - timedelta(days=1)
+        return day
+
+    def get_lesson_days(self, subgroup_id: int) -> LessonDays:
+        """Get the bitmap of a subgroup's days with lessons for calendar views.
+
+        Args:
+            subgroup_id: ID of the subgroup
+
+        Returns:
+            LessonDays supporting `day in lesson_days` and month scans
+        """
+        return self.lesson_dates_store.current.lesson_days(subgroup_id)
+
+    async def find_teachers(self, query: str) -> Sequence[tuple[str, str]]:
+        """Find teachers by a typed name.
+
+        Args:
+            query: Teacher name or its beginning
+
+        Returns:
+            (teacher_key, display name) pairs
+        """
+        return self.catalog_store.current.find_teachers(query)
+
+    async def get_teacher_schedule_for_date(
+        self, teacher_key: str, target_date: date
+    ) -> Sequence[TeacherLesson]:
+        """Get a teacher's lessons across all subgroups on a specific date.
+
+        Args:
+            teacher_key: Normalized teacher key
+            target_date: Date to retrieve lessons for
+
+        Returns:
+            Sequence of TeacherLesson sorted by start_time
+        """
+        return await self._get_teacher_schedule(teacher_key, target_date, target_date)
+
+    async def get_teacher_schedule_for_week(
+        self, teacher_key: str, week_start_date: date
+    ) -> Sequence[TeacherLesson]:
+        """Get a teacher's lessons across all subgroups in a week starting from a date.
+
+        Args:
+            teacher_key: Normalized teacher key
+            week_start_date: Date to start the week from
+
+        Returns:
+            Sequence of TeacherLesson sorted by date and start_time
+        """
+        week_end_date = week_start_date + timedelta(days=6)
+        return await self._get_teacher_schedule(teacher_key, week_start_date, week_end_date)
+
+    async def _get_teacher_schedule(
+        self, teacher_key: str, start_date: date, end_date: date
+    ) -> Sequence[TeacherLesson]:
+        """Fetch teacher rows in one indexed query and merge subgroups of the same lesson."""
+        rows = await self.lesson_repo.find_rows_for_teacher_in_range(
+            teacher_key, start_date, end_date
+        )
+        subgroups_by_id = self.catalog_store.current.subgroups_by_id
+        # Rows come in (date, start_time) order; dict keeps it while merging
+        slots: dict[tuple, list[str]] = {}
+        for row in rows:
+            names = slots.setdefault(row[:6], [])
+            if (subgroup := subgroups_by_id.get(row.subgroup_id)) is not None:
+                names.append(subgroup.name)
+        return [
+            TeacherLesson(*slot, subgroups=tuple(sorted(names))) for slot, names in slots.items()
+        ]
+
+    async def find_free_rooms(
+        self,
+        target_date: date,
+        start_time: time,
+        end_time: time | None = None,
+    ) -> Sequence[FreeRoom] | None:
+        """Find rooms without lessons at a time or during a period.
+
+        Args:
+            target_date: Date to check
+            start_time: Time, or start of the period
+            end_time: End of the period
+
+        Returns:
+            Free rooms sorted by address and room, or None if the date is
+            outside the precomputed occupancy window
+        """
+        occupancy = self.room_store.current
+        if not occupancy.covers(target_date):
+            return None
+        return occupancy.free_rooms(target_date, start_time, end_time)
+
+    async def get_room_schedule(
+        self, target_date: date, address: str, room: str
+    ) -> Sequence[RoomSlot] | None:
+        """Get lessons held in a room on a date.
+
+        Args:
+            target_date: Date to retrieve lessons for
+            address: Building address
+            room: Room number
+
+        Returns:
+            Room slots sorted by start time, or None if the date is outside
+            the precomputed occupancy window
+        """
+        occupancy = self.room_store.current
+        if not occupancy.covers(target_date):
+            return None
+        return occupancy.room_schedule(target_date, address, room)
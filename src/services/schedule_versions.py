@@ -0,0 +1,85 @@
+import hashlib
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduleVersion(NamedTuple):
+    """Sync generation of one subgroup's lessons."""
+
+    generation: int
+    updated_at: datetime
+    # Digest of the fingerprints of every schedule feeding the subgroup
+    digest: str = ""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+class ScheduleVersions:
+    """Per-subgroup sync generations.
+
+    A sync records a fingerprint of every subgroup it persisted; the
+    generation only moves when the fingerprint differs from the previous
+    one, so derived artifacts (ETags, cached exports) stay valid across
+    syncs that change nothing for a subgroup. Fingerprints are kept per
+    schedule, so schedules feeding the same subgroup in turn don't move its
+    generation on every sync. ETags of synced subgroups derive from the
+    fingerprints alone, so they survive restarts and agree across replicas.
+    """
+
+    def __init__(self, clock: Callable[[], datetime] = _utcnow) -> None:
+        """Initialize ScheduleVersions.
+
+        Args:
+            clock: Source of the current time
+        """
+        self._clock = clock
+        self._started_at = clock()
+        # Distinguishes unsynced subgroups of this process from earlier ones
+        self._epoch = f"{int(self._started_at.timestamp()):x}"
+        self._fingerprints: dict[int, dict[int, str]] = {}
+        self._versions: dict[int, ScheduleVersion] = {}
+
+    def record(self, schedule_id: int, subgroup_id: int, fingerprint: str) -> bool:
+        """Record a subgroup's lessons after a sync committed them.
+
+        Args:
+            schedule_id: ID of the synced schedule
+            subgroup_id: ID of the subgroup
+            fingerprint: Stable digest of the subgroup's lessons from this schedule
+
+        Returns:
+            True if the subgroup moved to a new generation
+        """
+        by_schedule = self._fingerprints.setdefault(subgroup_id, {})
+        if by_schedule.get(schedule_id) == fingerprint:
+            return False
+        by_schedule[schedule_id] = fingerprint
+        digest = hashlib.blake2b(digest_size=8)
+        for schedule_fingerprint in sorted(by_schedule.values()):
+            digest.update(schedule_fingerprint.encode())
+        previous = self.get(subgroup_id)
+        self._versions[subgroup_id] = ScheduleVersion(
+            previous.generation + 1, self._clock(), digest.hexdigest()
+        )
+        return True
+
+    def get(self, subgroup_id: int) -> ScheduleVersion:
+        """Current version of a subgroup, generation 0 until its first sync."""
+        return self._versions.get(subgroup_id, ScheduleVersion(0, self._started_at))
+
+    def etag(self, subgroup_id: int, variant: str | None = None) -> str:
+        """Strong ETag for content derived from a subgroup's lessons.
+
+        Args:
+            subgroup_id: ID of the subgroup
+            variant: What else the content depends on, e.g. the exported term
+        """
+        digest = self.get(subgroup_id).digest or f"{self._epoch}-0"
+        suffix = f"-{variant}" if variant else ""
+        return f'"{subgroup_id}-{digest}{suffix}"'
@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.user import User
 from repositories.user_repo import UserRepository
+from .lesson_reminders import ReminderSchedule
+from .notification_wheel import NotificationWheel
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +19,21 @@ class SettingsService:
         self,
         session: AsyncSession,
         user_repo: UserRepository,
+        wheel: NotificationWheel | None = None,
+        reminders: ReminderSchedule | None = None,
     ) -> None:
         """Initialize SettingsService with repository.
 
         Args:
             session: AsyncSession for database operations
             user_repo: Repository for users
+            wheel: Notification wheel kept in step with committed changes
+            reminders: Reminder heap to invalidate when a new lead time is chosen
         """
         self.session = session
         self.user_repo = user_repo
+        self.wheel = wheel
+        self.reminders = reminders
 
     async def toggle_notifications(self, telegram_id: int, is_subscribed: bool) -> bool:
         """Toggle notifications on or off for a user.
@@ -40,8 +48,35 @@ class SettingsService:
         is_updated = await self.user_repo.update_subscription(telegram_id, is_subscribed)
         await self.session.commit()
         logger.info("User %d notifications toggled: %s", telegram_id, is_subscribed)
+
+        if self.wheel is not None and is_updated:
+            if not is_subscribed:
+                self.wheel.unschedule(telegram_id)
+            else:
+                user = await self.user_repo.find_by_id(telegram_id)
+                if user and user.subgroup_id is not None:
+                    self.wheel.schedule(telegram_id, user.notification_time, user.subgroup_id)
         return is_updated
 
+    async def unsubscribe_users(self, telegram_ids: Sequence[int]) -> int:
+        """Turn off notifications for users who can no longer be messaged.
+
+        Args:
+            telegram_ids: Telegram user IDs, e.g. users who blocked the bot
+
+        Returns:
+            Number of users unsubscribed
+        """
+        if not telegram_ids:
+            return 0
+        count = await self.user_repo.unsubscribe_many(telegram_ids)
+        await self.session.commit()
+        if self.wheel is not None:
+            for telegram_id in telegram_ids:
+                self.wheel.unschedule(telegram_id)
+        logger.info("Unsubscribed %d of %d unreachable users", count, len(telegram_ids))
+        return count
+
     async def set_notification_time(self, telegram_id: int, notification_time: time) -> bool:
         """Set notification time for a user.
 
@@ -55,8 +90,55 @@ class SettingsService:
         is_updated = await self.user_repo.update_notification_time(telegram_id, notification_time)
         await self.session.commit()
         logger.info("User %d notification time set to %s", telegram_id, notification_time)
+        if self.wheel is not None and is_updated:
+            self.wheel.move(telegram_id, notification_time)
         return is_updated
 
+    async def set_reminder(self, telegram_id: int, minutes: int | None) -> bool:
+        """Set how many minutes before each lesson a user is reminded.
+
+        Args:
+            telegram_id: Telegram user ID
+            minutes: Lead time, or None to turn reminders off
+
+        Returns:
+            True if user was updated, False otherwise
+        """
+        is_updated = await self.user_repo.update_reminder(telegram_id, minutes)
+        await self.session.commit()
+        logger.info("User %d reminder set to %s minutes", telegram_id, minutes)
+
+        # Recipients are read when a reminder fires, so only a lead time the
+        # heap has no events for needs a rebuild
+        if self.reminders is not None and is_updated and minutes is not None:
+            user = await self.user_repo.find_by_id(telegram_id)
+            if (
+                user
+                and user.subgroup_id is not None
+                and not self.reminders.covers(user.subgroup_id, minutes)
+            ):
+                self.reminders.invalidate()
+        return is_updated
+
+    async def reconcile_notification_wheel(self) -> int:
+        """Rebuild the notification wheel from the users table.
+
+        Catches changes the incremental updates missed, such as edits made
+        directly in the database or by another process.
+
+        Returns:
+            Number of subscribers whose wheel entry was out of date
+        """
+        if self.wheel is None:
+            return 0
+        since = self.wheel.version
+        rows = await self.user_repo.find_subscriptions()
+        drift = self.wheel.reconcile(rows, since)
+        logger.info(
+            "Notification wheel reconciled: %d subscribers, %d drifted", len(self.wheel), drift
+        )
+        return drift
+
     async def get_users_for_notification_batch(self, target_time: time) -> Sequence[User]:
         """Get all subscribed users with a specific notification time.
 
@@ -1,14 +1,38 @@
+import hashlib
 import logging
+from collections.abc import Iterable
+from datetime import date
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.client import ScheduleAPIClient
-from core.schedule_parser import ParsedGroupSchedule, ParsedSchedule, ScheduleParser
+from core.schedule_parser import (
+    ParsedGroupSchedule,
+    ParsedLesson,
+    ParsedSchedule,
+    ScheduleParser,
+)
 from repositories.group_repo import GroupRepository
-from repositories.lesson_repo import LessonRepository
+from repositories.lesson_repo import LessonRepository, LessonRow
 from repositories.speciality_repo import SpecialityRepository
 from repositories.subgroup_repo import SubgroupRepository
 from .exceptions import SyncError
+from .group_catalog import GroupCatalog, GroupCatalogStore
+from .lesson_dates import LessonDates, LessonDatesStore
+from .lesson_reminders import ReminderSchedule
+from .room_occupancy import RoomOccupancy, RoomOccupancyStore
+from .schedule_cache import ScheduleCache
+from .schedule_changes import (
+    LessonChanges,
+    LessonKey,
+    LessonSnapshot,
+    LessonSnapshots,
+    ScheduleAlertService,
+    change_window,
+    diff_lessons,
+    lesson_key,
+)
+from .schedule_versions import ScheduleVersions
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +48,14 @@ class SyncService:
         group_repo: GroupRepository,
         subgroup_repo: SubgroupRepository,
         lesson_repo: LessonRepository,
+        schedule_cache: ScheduleCache | None = None,
+        catalog_store: GroupCatalogStore | None = None,
+        room_store: RoomOccupancyStore | None = None,
+        schedule_versions: ScheduleVersions | None = None,
+        lesson_dates_store: LessonDatesStore | None = None,
+        reminder_schedule: ReminderSchedule | None = None,
+        lesson_snapshots: LessonSnapshots | None = None,
+        alert_service: ScheduleAlertService | None = None,
     ) -> None:
         """Initialize SyncService.
 
@@ -34,6 +66,14 @@ class SyncService:
             group_repo: Group repository
             subgroup_repo: Subgroup repository
             lesson_repo: Lesson repository
+            schedule_cache: Schedule cache to invalidate after a sync
+            catalog_store: Group catalog holder to rebuild after a full sync
+            room_store: Room occupancy holder to rebuild after a full sync
+            schedule_versions: Per-subgroup generations to advance after a commit
+            lesson_dates_store: Lesson-date index holder to rebuild after a full sync
+            reminder_schedule: Reminder heap to invalidate after a commit
+            lesson_snapshots: Upcoming lessons per subgroup to diff a sync against
+            alert_service: Service alerting subscribers about the changes found
         """
         self.session = session
         self.api_client = api_client
@@ -41,10 +81,23 @@ class SyncService:
         self.group_repo = group_repo
         self.subgroup_repo = subgroup_repo
         self.lesson_repo = lesson_repo
+        self.schedule_cache = schedule_cache
+        self.catalog_store = catalog_store
+        self.room_store = room_store
+        self.schedule_versions = schedule_versions
+        self.lesson_dates_store = lesson_dates_store
+        self.reminder_schedule = reminder_schedule
+        self.lesson_snapshots = lesson_snapshots
+        self.alert_service = alert_service
 
     async def sync_single_schedule(self, schedule_id: int) -> None:
         """Synchronize a single schedule.
 
+        Lessons of the change window are diffed in memory against the snapshot
+        this schedule left for each subgroup on its last sync; those gone from
+        the feed are deleted in the same transaction, and subscribers get one
+        alert per changed subgroup once the sync is committed.
+
         Args:
             schedule_id: ID of the schedule to sync
 
@@ -57,14 +110,23 @@ class SyncService:
 
         try:
             parsed = ScheduleParser.parse(schedule_detail)
-            await self._persist_schedule(parsed)
+            lessons = await self._persist_schedule(parsed)
+            changes, snapshots = await self._apply_lesson_changes(schedule_id, lessons)
             await self.session.commit()
             logger.info("Successfully synced schedule %d", schedule_id)
+            self._publish_committed(schedule_id, lessons, snapshots)
 
         except Exception as e:
             await self.session.rollback()
             raise SyncError(f"Error syncing schedule {schedule_id}: {e!s}") from e
 
+        # The lessons are committed by now, so a failed alert must not fail the sync
+        if changes and self.alert_service is not None:
+            try:
+                await self.alert_service.notify(changes)
+            except Exception as e:
+                logger.error("Change alerts for schedule %d failed: %s", schedule_id, e)
+
     async def sync_all_schedules(self) -> None:
         """Synchronize all available schedules.
 
@@ -89,23 +151,142 @@ class SyncService:
                 for schedule_id, error in failed_schedules:
                     logger.error("  - Schedule %d: %s", schedule_id, error)
 
+            await self.refresh_catalog()
+            await self.refresh_room_occupancy()
+            await self.refresh_lesson_dates()
+
         except Exception as e:
             raise SyncError(f"Error during sync_all_schedules: {e!s}") from e
 
-    async def _persist_schedule(self, parsed: ParsedSchedule) -> None:
+    async def refresh_catalog(self) -> None:
+        """Rebuild the group catalog from the database and swap it in."""
+        if self.catalog_store is None:
+            return
+
+        catalog = await GroupCatalog.load(
+            self.speciality_repo, self.group_repo, self.subgroup_repo, self.lesson_repo
+        )
+        self.catalog_store.replace(catalog)
+
+    async def refresh_room_occupancy(self) -> None:
+        """Rebuild room occupancy for the coming days and swap it in."""
+        if self.room_store is None:
+            return
+
+        self.room_store.replace(await RoomOccupancy.load(self.lesson_repo))
+
+    async def refresh_lesson_dates(self) -> None:
+        """Rebuild the per-subgroup lesson-date index and swap it in."""
+        if self.lesson_dates_store is None:
+            return
+
+        self.lesson_dates_store.replace(await LessonDates.load(self.lesson_repo))
+
+    def _publish_committed(
+        self,
+        schedule_id: int,
+        lessons: dict[int, frozenset[ParsedLesson]],
+        snapshots: dict[int, LessonSnapshot],
+    ) -> None:
+        """Update the in-memory state that must only reflect committed lessons."""
+        # Only committed lessons may back a new generation
+        if self.schedule_versions is not None:
+            for subgroup_id, subgroup_lessons in lessons.items():
+                self.schedule_versions.record(
+                    schedule_id, subgroup_id, lesson_fingerprint(subgroup_lessons)
+                )
+
+        if self.lesson_snapshots is not None:
+            for subgroup_id, snapshot in snapshots.items():
+                self.lesson_snapshots.put(schedule_id, subgroup_id, snapshot)
+
+        if self.schedule_cache is not None:
+            self.schedule_cache.clear()
+
+        if self.reminder_schedule is not None:
+            self.reminder_schedule.invalidate()
+
+    async def _apply_lesson_changes(
+        self, schedule_id: int, lessons: dict[int, frozenset[ParsedLesson]]
+    ) -> tuple[list[LessonChanges], dict[int, LessonSnapshot]]:
+        """Diff persisted lessons against the snapshots and delete the stale ones.
+
+        Only the days both the snapshot and the change window cover are
+        compared. A subgroup without a snapshot from this schedule just gets
+        its first one, and a subgroup parsed without any lessons is left alone,
+        as an empty feed is far likelier a glitch than a cancelled term. Only
+        lessons this schedule produced before are deleted, and none another
+        schedule still produces for the subgroup.
+
+        Args:
+            schedule_id: ID of the synced schedule
+            lessons: Persisted lessons per subgroup ID
+
+        Returns:
+            Changes per changed subgroup and the snapshots to store once committed
+        """
+        if self.lesson_snapshots is None:
+            return [], {}
+
+        start, end = change_window(date.today())
+        changes = []
+        snapshots = {}
+        stale_keys: list[LessonKey] = []
+        for subgroup_id, subgroup_lessons in lessons.items():
+            if not subgroup_lessons:
+                continue
+            rows = frozenset(
+                _lesson_row(lesson) for lesson in subgroup_lessons if start <= lesson.date < end
+            )
+            snapshots[subgroup_id] = LessonSnapshot(end, rows)
+
+            previous = self.lesson_snapshots.get(schedule_id, subgroup_id)
+            if previous is None:
+                continue
+            until = min(previous.until, end)
+            old = {row for row in previous.lessons if start <= row.date < until}
+            new = {row for row in rows if row.date < until}
+            subgroup_changes = diff_lessons(subgroup_id, old, new)
+            if subgroup_changes is None:
+                continue
+            changes.append(subgroup_changes)
+            # A modified lesson keeping its key was already updated by the upsert
+            kept = {lesson_key(subgroup_id, row) for row in new}
+            for other in self.lesson_snapshots.others(schedule_id, subgroup_id):
+                kept.update(lesson_key(subgroup_id, row) for row in other.lessons)
+            stale_keys.extend({lesson_key(subgroup_id, row) for row in old - new} - kept)
+
+        if stale_keys:
+            deleted = await self.lesson_repo.delete_by_keys(stale_keys)
+            logger.info("Deleted %d lessons gone from the schedule", deleted)
+        return changes, snapshots
+
+    async def _persist_schedule(self, parsed: ParsedSchedule) -> dict[int, frozenset[ParsedLesson]]:
         """Persist parsed schedule to database.
 
         Args:
             parsed: ParsedSchedule from ScheduleParser
+
+        Returns:
+            Persisted lessons per subgroup ID, across every group resolving to it
         """
+        await self.lesson_repo.ensure_partitions(
+            lesson.date for group in parsed.groups for lesson in group.lessons
+        )
+        lessons: dict[int, set[ParsedLesson]] = {}
         for group in parsed.groups:
-            await self._persist_group(group)
+            subgroup_id = await self._persist_group(group)
+            lessons.setdefault(subgroup_id, set()).update(group.lessons)
+        return {subgroup_id: frozenset(rows) for subgroup_id, rows in lessons.items()}
 
-    async def _persist_group(self, group: ParsedGroupSchedule) -> None:
+    async def _persist_group(self, group: ParsedGroupSchedule) -> int:
         """Persist a single parsed group to database.
 
         Args:
             group: ParsedGroupSchedule
+
+        Returns:
+            ID of the persisted subgroup
         """
         speciality = await self.speciality_repo.upsert(
             code=group.speciality_code,
@@ -136,6 +317,7 @@ class SyncService:
                 "start_time": lesson.start_time,
                 "end_time": lesson.end_time,
                 "teacher": lesson.teacher,
+                "teacher_key": lesson.teacher_key,
                 "address": lesson.address,
                 "room": lesson.room,
             }
@@ -144,3 +326,26 @@ class SyncService:
 
         if lessons_data:
             await self.lesson_repo.bulk_upsert(lessons_data)
+        return subgroup.id
+
+
+def lesson_fingerprint(lessons: Iterable[ParsedLesson]) -> str:
+    """Digest of a set of lessons, unlike hash() equal across processes."""
+    digest = hashlib.blake2b(digest_size=8)
+    for line in sorted(map(repr, lessons)):
+        digest.update(line.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _lesson_row(lesson: ParsedLesson) -> LessonRow:
+    """Project a parsed lesson onto the columns a stored one is compared by."""
+    return LessonRow(
+        lesson.date,
+        lesson.start_time,
+        lesson.end_time,
+        lesson.subject,
+        lesson.lesson_type,
+        lesson.teacher,
+        lesson.room,
+    )
@@ -5,6 +5,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from models.user import User
 from repositories.user_repo import UserRepository
 from .exceptions import UserNotFoundError
+from .lesson_reminders import ReminderSchedule
+from .notification_wheel import NotificationWheel
 
 logger = logging.getLogger(__name__)
 
@@ -16,15 +18,21 @@ class UserService:
         self,
         session: AsyncSession,
         user_repo: UserRepository,
+        wheel: NotificationWheel | None = None,
+        reminders: ReminderSchedule | None = None,
     ) -> None:
         """Initialize UserService with repositories.
 
         Args:
             session: AsyncSession for database operations
             user_repo: Repository for users
+            wheel: Notification wheel kept in step with subgroup changes
+            reminders: Reminder heap to invalidate when a subgroup gains a lead time
         """
         self.session = session
         self.user_repo = user_repo
+        self.wheel = wheel
+        self.reminders = reminders
 
     async def get_or_create_user(
         self, telegram_id: int, username: str | None, full_name: str
@@ -79,4 +87,21 @@ class UserService:
             logger.error("Error setting subgroup for user %d: %s", telegram_id, e)
             raise UserNotFoundError(f"Failed to set subgroup: {e!s}") from e
         logger.info("User %d assigned to subgroup %d", telegram_id, subgroup_id)
+
+        user: User | None = None
+        if (
+            self.wheel is not None
+            and is_updated
+            and not self.wheel.set_subgroup(telegram_id, subgroup_id)
+        ):
+            # A subscriber without a subgroup joins the wheel once they pick one
+            user = await self.user_repo.find_by_id(telegram_id)
+            if user and user.is_subscribed:
+                self.wheel.schedule(telegram_id, user.notification_time, subgroup_id)
+
+        if self.reminders is not None and is_updated:
+            user = user or await self.user_repo.find_by_id(telegram_id)
+            minutes = user.remind_before_minutes if user else None
+            if minutes is not None and not self.reminders.covers(subgroup_id, minutes):
+                self.reminders.invalidate()
         return is_updated
@@ -0,0 +1,96 @@
+"""Benchmark: ORM entity hydration vs. column projections for a week view.
+
+Seeds a realistic week (40 lessons) for one subgroup and compares the cost of
+loading it through ``find_for_subgroup_in_range`` (ORM ``Lesson`` entities) with
+``find_rows_for_subgroup_in_range`` (``LessonRow`` tuples).
+"""
+
+import time as perf
+from datetime import date, time, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Group, Lesson, LessonType, Speciality, Subgroup
+from repositories.lesson_repo import LessonRepository, LessonRow
+
+pytestmark = pytest.mark.benchmark
+
+WEEK_START = date(2025, 9, 1)
+LESSONS_PER_DAY = 8
+DAYS = 5
+ITERATIONS = 200
+
+
+@pytest_asyncio.fixture
+async def week_subgroup_id(setup_db_schema, async_session: AsyncSession) -> int:
+    speciality = Speciality(code="31.05.01", full_name="Лечебное дело (bench)", clean_name="ЛД")
+    async_session.add(speciality)
+    await async_session.flush()
+
+    group = Group(speciality_id=speciality.id, course_number=2, stream="А", name="203")
+    async_session.add(group)
+    await async_session.flush()
+
+    subgroup = Subgroup(group_id=group.id, name="203А")
+    async_session.add(subgroup)
+    await async_session.flush()
+
+    async_session.add_all(
+        Lesson(
+            subgroup_id=subgroup.id,
+            subject=f"Дисциплина {day}-{slot}",
+            lesson_type=LessonType.SEMINAR if slot % 2 else LessonType.LECTURE,
+            date=WEEK_START + timedelta(days=day),
+            start_time=time(8 + slot, 0),
+            end_time=time(8 + slot, 45),
+            teacher=f"Преподаватель {slot}",
+            address="Пискарёвский пр., 47",
+            room=f"{100 + slot}",
+        )
+        for day in range(DAYS)
+        for slot in range(LESSONS_PER_DAY)
+    )
+    await async_session.flush()
+    return subgroup.id
+
+
+async def _measure(session: AsyncSession, load) -> float:
+    started = perf.perf_counter()
+    for _ in range(ITERATIONS):
+        await load()
+        session.expunge_all()
+    return perf.perf_counter() - started
+
+
+@pytest.mark.asyncio
+async def test_week_view_projection_is_faster_than_orm(
+    week_subgroup_id: int,
+    async_session: AsyncSession,
+) -> None:
+    repo = LessonRepository(async_session)
+    week_end = WEEK_START + timedelta(days=6)
+
+    rows = await repo.find_rows_for_subgroup_in_range(week_subgroup_id, WEEK_START, week_end)
+    entities = await repo.find_for_subgroup_in_range(week_subgroup_id, WEEK_START, week_end)
+    assert len(rows) == len(entities) == DAYS * LESSONS_PER_DAY
+    assert all(isinstance(row, LessonRow) for row in rows)
+    assert [(r.date, r.start_time, r.subject) for r in rows] == [
+        (e.date, e.start_time, e.subject) for e in entities
+    ]
+
+    orm_seconds = await _measure(
+        async_session,
+        lambda: repo.find_for_subgroup_in_range(week_subgroup_id, WEEK_START, week_end),
+    )
+    rows_seconds = await _measure(
+        async_session,
+        lambda: repo.find_rows_for_subgroup_in_range(week_subgroup_id, WEEK_START, week_end),
+    )
+
+    print(  # noqa: T201
+        f"\nweek view x{ITERATIONS}: ORM {orm_seconds * 1000:.1f} ms, "
+        f"rows {rows_seconds * 1000:.1f} ms, speedup {orm_seconds / rows_seconds:.2f}x"
+    )
+    assert rows_seconds < orm_seconds
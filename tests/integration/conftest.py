@@ -18,11 +18,13 @@ from sqlalchemy.ext.asyncio.engine import AsyncEngine
 from testcontainers.postgres import PostgresContainer
 
 from di.providers.api_client import ApiProvider
+from di.providers.bot import BotProvider
 from di.providers.config import ConfigProvider
 from di.providers.database import DatabaseProvider
 from di.providers.repositories import RepositoryProvider
 from di.providers.services import ServiceProvider
 from models.base import Base
+from repositories.session import ReadOnlySession
 
 
 def pytest_configure(config):
@@ -144,6 +146,16 @@ async def di_container(
             async def provide_session(self) -> AsyncSession:
                 return async_session
 
+            @provide(scope=Scope.REQUEST)
+            async def provide_read_session(self) -> AsyncGenerator[ReadOnlySession]:
+                # Same savepoint-bound connection, so reads see the test's data
+                async with ReadOnlySession(
+                    bind=async_session.bind,
+                    expire_on_commit=False,
+                    autoflush=False,
+                ) as session:
+                    yield session
+
         # Create container with test session provider
         # We exclude the default DatabaseProvider session and add our override
         container = make_async_container(
@@ -152,6 +164,7 @@ async def di_container(
             ApiProvider(),
             RepositoryProvider(),
             ServiceProvider(),
+            BotProvider(),
             TestSessionProvider(),  # Override the session provider
             AiogramProvider(),
         )
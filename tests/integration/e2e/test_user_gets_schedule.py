@@ -5,7 +5,8 @@ User story:
 2. Opens main menu (/start)
 3. Presses "Get schedule" button (📅 Расписание)
 4. Bot fetches schedule and replies with schedule message
-5. No DB changes are made
+5. Switches to the week view and pages to the next week
+6. No DB changes are made
 """
 
 from datetime import date, time
@@ -214,7 +215,7 @@ async def test_user_gets_schedule(
     async_session: AsyncSession,
     message_manager: MockMessageManager,
 ):
-    """User story: User requests schedule from main menu and views it."""
+    """User story: User requests schedule from main menu, views it and pages it."""
     user = setup_test_data["user"]
     lesson = setup_test_data["lesson"]
     test_user_id = 123456789
@@ -231,6 +232,18 @@ async def test_user_gets_schedule(
     assert lesson.subject in message.text
     assert "Лекция" in message.text or "лекция" in message.text.lower()
     assert lesson.room in message.text
+    message_manager.reset_history()
+
+    await bot_client.click(message=message, locator=InlineButtonTextLocator(regex=".*День"))
+    week = message_manager.one_message()
+    assert "Расписание на неделю" in week.text
+    message_manager.reset_history()
+
+    # The navigation handler gets the app-wide render coalescer injected
+    await bot_client.click(message=week, locator=InlineButtonTextLocator(regex="▶️"))
+    next_week = message_manager.one_message()
+    assert "Расписание на неделю" in next_week.text
+    assert next_week.text.splitlines()[0] != week.text.splitlines()[0]
 
     db_user = await async_session.get(User, test_user_id)
     assert db_user is not None
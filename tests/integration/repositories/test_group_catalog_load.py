@@ -0,0 +1,52 @@
+"""Integration tests for loading the group catalog from projection rows."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Group, Speciality, Subgroup
+from repositories.group_repo import GroupRepository
+from repositories.lesson_repo import LessonRepository
+from repositories.speciality_repo import SpecialityRepository
+from repositories.subgroup_repo import SubgroupRepository
+from services.group_catalog import GroupCatalog
+
+
+@pytest_asyncio.fixture
+async def speciality_id(setup_db_schema, async_session: AsyncSession) -> int:
+    speciality = Speciality(code="33.05.01", full_name="Фармация (catalog)", clean_name="Ф")
+    async_session.add(speciality)
+    await async_session.flush()
+
+    groups = [
+        Group(speciality_id=speciality.id, course_number=course, stream=stream, name=name)
+        for course, stream, name in [(2, "Б", "212"), (1, "А", "112"), (1, "А", "111")]
+    ]
+    async_session.add_all(groups)
+    await async_session.flush()
+
+    async_session.add_all(
+        Subgroup(group_id=group.id, name=f"{group.name}{suffix}")
+        for group in groups
+        for suffix in "БА"
+    )
+    await async_session.flush()
+    return speciality.id
+
+
+@pytest.mark.asyncio
+async def test_catalog_load_builds_tree(speciality_id: int, async_session: AsyncSession) -> None:
+    catalog = await GroupCatalog.load(
+        SpecialityRepository(async_session),
+        GroupRepository(async_session),
+        SubgroupRepository(async_session),
+        LessonRepository(async_session),
+    )
+
+    assert catalog.specialities_by_id[speciality_id].clean_name == "Ф"
+    assert catalog.courses(speciality_id) == (1, 2)
+    assert catalog.streams(speciality_id, 1) == ("А",)
+
+    groups = catalog.groups(speciality_id, 1, "А")
+    assert [g.name for g in groups] == ["111", "112"]
+    assert [sg.name for sg in catalog.subgroups(groups[0].id)] == ["111А", "111Б"]
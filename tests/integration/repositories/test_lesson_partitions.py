@@ -0,0 +1,124 @@
+"""Integration tests for semester partitions of the lessons table."""
+
+from datetime import date, time
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.academic_calendar import get_semester_term
+from models import Group, Lesson, LessonType, Speciality, Subgroup
+from repositories.lesson_repo import LessonRepository
+
+FALL_DAY = date(2031, 10, 6)
+SPRING_DAY = date(2032, 3, 9)
+
+
+@pytest_asyncio.fixture
+async def subgroup_id(setup_db_schema, async_session: AsyncSession) -> int:
+    speciality = Speciality(
+        code="32.05.01", full_name="Медико-профилактическое дело (partitions)", clean_name="МПД"
+    )
+    async_session.add(speciality)
+    await async_session.flush()
+
+    group = Group(speciality_id=speciality.id, course_number=3, stream="Б", name="301")
+    async_session.add(group)
+    await async_session.flush()
+
+    subgroup = Subgroup(group_id=group.id, name="301А")
+    async_session.add(subgroup)
+    await async_session.flush()
+    return subgroup.id
+
+
+def _lesson_data(subgroup_id: int, lesson_date: date, subject: str = "Гигиена") -> dict:
+    return {
+        "subgroup_id": subgroup_id,
+        "subject": subject,
+        "lesson_type": LessonType.LECTURE,
+        "date": lesson_date,
+        "start_time": time(9, 0),
+        "end_time": time(10, 30),
+        "teacher": None,
+        "address": None,
+        "room": "12",
+    }
+
+
+async def _partition_of(session: AsyncSession, lesson_id: int) -> str:
+    stmt = (
+        select(text("tableoid::regclass::text")).select_from(Lesson).where(Lesson.id == lesson_id)
+    )
+    return (await session.execute(stmt)).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_one_per_term(
+    subgroup_id: int,
+    async_session: AsyncSession,
+) -> None:
+    repo = LessonRepository(async_session)
+
+    created = await repo.ensure_partitions([FALL_DAY, FALL_DAY, SPRING_DAY])
+    again = await repo.ensure_partitions([FALL_DAY])
+
+    assert created == ["lessons_2031_2032_fall", "lessons_2031_2032_spring"]
+    assert again == []
+    assert set(created) <= set(await repo.find_partitions())
+
+    [lesson] = await repo.bulk_upsert([_lesson_data(subgroup_id, SPRING_DAY)])
+    assert await _partition_of(async_session, lesson.id) == "lessons_2031_2032_spring"
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_moves_rows_out_of_default(
+    subgroup_id: int,
+    async_session: AsyncSession,
+) -> None:
+    repo = LessonRepository(async_session)
+    [lesson] = await repo.bulk_upsert([_lesson_data(subgroup_id, FALL_DAY)])
+    assert await _partition_of(async_session, lesson.id) == "lessons_default"
+
+    await repo.ensure_partitions([FALL_DAY])
+
+    assert await _partition_of(async_session, lesson.id) == "lessons_2031_2032_fall"
+    rows = await repo.find_rows_for_subgroup_on_date(subgroup_id, FALL_DAY)
+    assert [row.subject for row in rows] == ["Гигиена"]
+
+
+@pytest.mark.asyncio
+async def test_upsert_conflict_on_partitioned_table(
+    subgroup_id: int,
+    async_session: AsyncSession,
+) -> None:
+    repo = LessonRepository(async_session)
+    await repo.ensure_partitions([FALL_DAY])
+
+    [first] = await repo.bulk_upsert([_lesson_data(subgroup_id, FALL_DAY)])
+    [second] = await repo.bulk_upsert([{**_lesson_data(subgroup_id, FALL_DAY), "room": "14"}])
+
+    assert first.id == second.id
+    rows = await repo.find_rows_for_subgroup_on_date(subgroup_id, FALL_DAY)
+    assert [row.room for row in rows] == ["14"]
+
+
+@pytest.mark.asyncio
+async def test_detach_and_drop_term(
+    subgroup_id: int,
+    async_session: AsyncSession,
+) -> None:
+    repo = LessonRepository(async_session)
+    term = get_semester_term(FALL_DAY)
+    await repo.ensure_partitions([FALL_DAY])
+    await repo.bulk_upsert([_lesson_data(subgroup_id, FALL_DAY)])
+
+    assert await repo.detach_partition(term) is True
+    assert "lessons_2031_2032_fall" not in await repo.find_partitions()
+    assert await repo.find_rows_for_subgroup_on_date(subgroup_id, FALL_DAY) == []
+
+    assert await repo.drop_partition(term) is True
+    assert await async_session.scalar(select(func.to_regclass("lessons_2031_2032_fall"))) is None
+    assert await repo.drop_partition(term) is False
+    assert await repo.detach_partition(term) is False
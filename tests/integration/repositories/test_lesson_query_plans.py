@@ -0,0 +1,184 @@
+"""Query-plan audit for the hot lesson lookups.
+
+Seeds enough rows for the planner to prefer indexes, captures the SQL that
+LessonRepository actually emits and fails if its EXPLAIN plan contains a
+sequential scan or an explicit sort.
+"""
+
+import json
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Group, Speciality, Subgroup
+from repositories.lesson_repo import LessonRepository
+
+SUBGROUPS = 100
+WEEKS = 16
+FORBIDDEN_NODES = {"Seq Scan", "Sort", "Incremental Sort"}
+INDEX_NODES = {"Index Scan", "Index Only Scan"}
+SEMESTER_START = date(2025, 9, 1)
+
+
+@pytest_asyncio.fixture
+async def seeded_subgroup_id(setup_db_schema, async_session: AsyncSession) -> int:
+    speciality = Speciality(code="31.05.01", full_name="Лечебное дело (plans)", clean_name="ЛД")
+    async_session.add(speciality)
+    await async_session.flush()
+
+    group = Group(speciality_id=speciality.id, course_number=1, stream="А", name="101")
+    async_session.add(group)
+    await async_session.flush()
+
+    subgroups = [Subgroup(group_id=group.id, name=f"101-{i}") for i in range(SUBGROUPS)]
+    async_session.add_all(subgroups)
+    await async_session.flush()
+
+    # Six weekdays x three pairs per day for every subgroup over the semester
+    await async_session.execute(
+        text(
+            """
+            INSERT INTO lessons (subgroup_id, subject, lesson_type, date, start_time, end_time,
+                                 teacher, teacher_key, address, room)
+            SELECT sg.id, 'Дисциплина ' || pair, 'LECTURE', CAST(:start AS date) + day,
+                   make_time(8 + pair * 2, 0, 0), make_time(9 + pair * 2, 30, 0),
+                   'Преподаватель ' || sg.id % 10, 'преподаватель ' || sg.id % 10,
+                   'Пискарёвский пр., 47', '10' || pair
+            FROM unnest(CAST(:ids AS integer[])) AS sg(id),
+                 generate_series(0, :days - 1) AS day,
+                 generate_series(0, 2) AS pair
+            WHERE extract(isodow FROM CAST(:start AS date) + day) < 7
+            """
+        ),
+        {"ids": [sg.id for sg in subgroups], "start": SEMESTER_START, "days": WEEKS * 7},
+    )
+    await async_session.execute(text("ANALYZE lessons"))
+    return subgroups[SUBGROUPS // 2].id
+
+
+def _plan_nodes(plan: dict[str, Any]) -> Iterator[str]:
+    yield plan["Node Type"]
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _plan_indexes(plan: dict[str, Any]) -> Iterator[str]:
+    if "Index Name" in plan:
+        yield plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from _plan_indexes(child)
+
+
+async def _explain(
+    session: AsyncSession,
+    call: Callable[[], Awaitable[object]],
+) -> dict[str, Any]:
+    """Run a repository call, capture its SQL and return the EXPLAIN plan."""
+    captured: list[tuple[str, Any]] = []
+    sync_engine = (await session.connection()).sync_engine
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany) -> None:  # type: ignore[no-untyped-def]
+        captured.append((statement, parameters))
+
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    assert len(captured) == 1
+    statement, parameters = captured[0]
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    raw = result.scalar_one()
+    return (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    ["day_rows", "week_rows", "day_entities", "week_entities"],
+)
+async def test_lesson_lookups_use_index_without_sort(
+    query: str,
+    seeded_subgroup_id: int,
+    async_session: AsyncSession,
+) -> None:
+    repo = LessonRepository(async_session)
+    day = SEMESTER_START + timedelta(weeks=5, days=2)
+    week_end = day + timedelta(days=6)
+    calls: dict[str, Callable[[], Awaitable[object]]] = {
+        "day_rows": lambda: repo.find_rows_for_subgroup_on_date(seeded_subgroup_id, day),
+        "week_rows": lambda: repo.find_rows_for_subgroup_in_range(
+            seeded_subgroup_id, day, week_end
+        ),
+        "day_entities": lambda: repo.find_for_subgroup_on_date(seeded_subgroup_id, day),
+        "week_entities": lambda: repo.find_for_subgroup_in_range(seeded_subgroup_id, day, week_end),
+    }
+
+    plan = await _explain(async_session, calls[query])
+
+    nodes = set(_plan_nodes(plan))
+    assert not nodes & FORBIDDEN_NODES, f"{query} plan uses {nodes & FORBIDDEN_NODES}: {plan}"
+    assert nodes & INDEX_NODES, f"{query} plan does not use an index: {plan}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("days", [1, 7])
+async def test_teacher_lookups_use_teacher_index(
+    days: int,
+    seeded_subgroup_id: int,
+    async_session: AsyncSession,
+) -> None:
+    # A teacher's rows are spread over many subgroups, so the planner may pick
+    # a bitmap scan and sort the few matches instead of an ordered index scan
+    repo = LessonRepository(async_session)
+    day = SEMESTER_START + timedelta(weeks=5, days=2)
+
+    plan = await _explain(
+        async_session,
+        lambda: repo.find_rows_for_teacher_in_range(
+            "преподаватель 3", day, day + timedelta(days=days - 1)
+        ),
+    )
+
+    assert "Seq Scan" not in set(_plan_nodes(plan)), plan
+    assert any("teacher_key" in name for name in _plan_indexes(plan)), plan
+
+
+@pytest.mark.asyncio
+async def test_semester_chunks_use_index_without_sort(
+    seeded_subgroup_id: int,
+    async_session: AsyncSession,
+) -> None:
+    repo = LessonRepository(async_session)
+    semester_end = SEMESTER_START + timedelta(weeks=WEEKS)
+    chunks = repo.iter_rows_for_subgroup_in_range(
+        seeded_subgroup_id, SEMESTER_START, semester_end, chunk_size=50
+    )
+    first = await anext(chunks)
+
+    # The second chunk carries the keyset predicate continuing after the first
+    plan = await _explain(async_session, lambda: anext(chunks))
+
+    nodes = set(_plan_nodes(plan))
+    assert not nodes & FORBIDDEN_NODES, f"keyset chunk plan uses {nodes & FORBIDDEN_NODES}: {plan}"
+    assert nodes & INDEX_NODES, f"keyset chunk plan does not use an index: {plan}"
+
+    streamed = [
+        row
+        async for chunk in repo.iter_rows_for_subgroup_in_range(
+            seeded_subgroup_id, SEMESTER_START, semester_end, chunk_size=50
+        )
+        for row in chunk
+    ]
+    expected = await repo.find_rows_for_subgroup_in_range(
+        seeded_subgroup_id, SEMESTER_START, semester_end
+    )
+    assert len(first) == 50
+    assert streamed == list(expected)
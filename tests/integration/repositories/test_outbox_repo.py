@@ -0,0 +1,76 @@
+"""Integration tests for claiming messages from the outbox."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from models import OutboxMessage
+from repositories.outbox_repo import OutboxRepository
+
+LEASE = timedelta(minutes=5)
+
+
+def _messages(prefix: str, count: int) -> list[dict]:
+    return [{"key": f"{prefix}:{i}", "chat_id": i, "body": f"text {i}"} for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_append_skips_known_keys(setup_db_schema, async_session: AsyncSession) -> None:
+    repo = OutboxRepository(async_session)
+
+    assert await repo.append(_messages("append", 3)) == 3
+    assert await repo.append(_messages("append", 5)) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_claimed_again(setup_db_schema, async_session: AsyncSession) -> None:
+    repo = OutboxRepository(async_session)
+    await repo.append(_messages("lease", 2))
+
+    first = await repo.claim(10, timedelta(0))
+    second = await repo.claim(10, timedelta(0))
+
+    assert [row.id for row in second] == [row.id for row in first]
+    assert [row.attempts for row in second] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_settled_messages_are_not_claimed(
+    setup_db_schema, async_session: AsyncSession
+) -> None:
+    repo = OutboxRepository(async_session)
+    await repo.append(_messages("settle", 3))
+    done, released, _ = await repo.claim(10, timedelta(0))
+
+    await repo.mark_done([done.id])
+    await repo.release([released.id], timedelta(hours=1))
+
+    assert [row.chat_id for row in await repo.claim(10, LEASE)] == [2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_are_disjoint(setup_db_schema, db_engine: AsyncEngine) -> None:
+    async with AsyncSession(db_engine) as session:
+        await OutboxRepository(session).append(_messages("skip-locked", 4))
+        await session.commit()
+
+    try:
+        async with AsyncSession(db_engine) as first, AsyncSession(db_engine) as second:
+            # The first claim's transaction stays open, holding its rows locked
+            claimed_first = await OutboxRepository(first).claim(2, LEASE)
+            claimed_second = await OutboxRepository(second).claim(10, LEASE)
+            await first.commit()
+            await second.commit()
+
+            assert len(claimed_first) == 2
+            assert len(claimed_second) == 2
+            assert {row.id for row in claimed_first}.isdisjoint(row.id for row in claimed_second)
+            assert await OutboxRepository(second).claim(10, LEASE) == []
+    finally:
+        async with AsyncSession(db_engine) as session:
+            await session.execute(
+                delete(OutboxMessage).where(OutboxMessage.key.like("skip-locked:%"))
+            )
+            await session.commit()
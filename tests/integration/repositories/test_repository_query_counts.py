@@ -0,0 +1,349 @@
+"""Query-count regression tests for every repository method.
+
+Relationships default to ``lazy="raise"``, so a repository call should emit
+exactly the statements it builds. Any new lazy or eager cascade shows up here
+as an extra query.
+"""
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, time, timedelta
+from typing import NamedTuple
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.academic_calendar import get_semester_term
+from models import Group, Lesson, LessonType, Speciality, Subgroup, User
+from repositories.group_repo import GroupRepository
+from repositories.lesson_repo import LessonRepository
+from repositories.outbox_repo import OutboxRepository
+from repositories.speciality_repo import SpecialityRepository
+from repositories.subgroup_repo import SubgroupRepository
+from repositories.user_repo import UserRepository
+
+LESSON_DATE = date(2033, 10, 3)
+TELEGRAM_ID = 9_000_000_033
+
+
+class Seed(NamedTuple):
+    speciality_id: int
+    group_id: int
+    subgroup_id: int
+
+
+@pytest_asyncio.fixture
+async def seed(setup_db_schema, async_session: AsyncSession) -> Seed:
+    speciality = Speciality(code="34.05.01", full_name="Сестринское дело (counts)", clean_name="СД")
+    async_session.add(speciality)
+    await async_session.flush()
+
+    group = Group(speciality_id=speciality.id, course_number=1, stream="А", name="141")
+    async_session.add(group)
+    await async_session.flush()
+
+    subgroups = [Subgroup(group_id=group.id, name=f"141{suffix}") for suffix in "АБВ"]
+    async_session.add_all(subgroups)
+    await async_session.flush()
+
+    async_session.add(
+        User(
+            telegram_id=TELEGRAM_ID,
+            username="counts",
+            full_name="Query Counts",
+            is_subscribed=True,
+            notification_time=time(7, 0),
+            subgroup_id=subgroups[0].id,
+        )
+    )
+    await async_session.flush()
+    async_session.expunge_all()
+    return Seed(speciality.id, group.id, subgroups[0].id)
+
+
+def _lesson_data(subgroup_id: int, slot: int = 0) -> dict:
+    return {
+        "subgroup_id": subgroup_id,
+        "subject": f"Анатомия {slot}",
+        "lesson_type": LessonType.LECTURE,
+        "date": LESSON_DATE,
+        "start_time": time(9 + slot, 0),
+        "end_time": time(9 + slot, 45),
+        "teacher": None,
+        "address": None,
+        "room": "1",
+    }
+
+
+async def _count_queries(session: AsyncSession, call: Callable[[], Awaitable[object]]) -> int:
+    """Run a repository call and count the statements it sends."""
+    statements: list[str] = []
+    sync_engine = (await session.connection()).sync_engine
+
+    def capture(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+    return len(statements)
+
+
+RepoCall = Callable[[AsyncSession, Seed], Awaitable[object]]
+
+CASES: list[tuple[str, RepoCall, int]] = [
+    (
+        "speciality.upsert",
+        lambda s, _: SpecialityRepository(s).upsert("34.05.01", "Сестринское дело (counts)", "СД"),
+        1,
+    ),
+    ("speciality.find_by_id", lambda s, d: SpecialityRepository(s).find_by_id(d.speciality_id), 1),
+    (
+        "speciality.find_by_id+groups",
+        lambda s, d: SpecialityRepository(s).find_by_id(d.speciality_id, load_groups=True),
+        2,
+    ),
+    ("speciality.find_by_code", lambda s, _: SpecialityRepository(s).find_by_code("34.05.01"), 1),
+    ("speciality.find_all", lambda s, _: SpecialityRepository(s).find_all(), 1),
+    ("speciality.find_all_rows", lambda s, _: SpecialityRepository(s).find_all_rows(), 1),
+    (
+        "group.upsert",
+        lambda s, d: GroupRepository(s).upsert(d.speciality_id, 1, "А", "141"),
+        1,
+    ),
+    ("group.find_by_id", lambda s, d: GroupRepository(s).find_by_id(d.group_id), 1),
+    (
+        "group.find_by_id+subgroups",
+        lambda s, d: GroupRepository(s).find_by_id(d.group_id, load_subgroups=True),
+        2,
+    ),
+    (
+        "group.find_by_structure",
+        lambda s, d: GroupRepository(s).find_by_structure(d.speciality_id, 1, "А", "141"),
+        1,
+    ),
+    (
+        "group.find_by_speciality_course_stream",
+        lambda s, d: GroupRepository(s).find_by_speciality_course_stream(d.speciality_id, 1, "А"),
+        1,
+    ),
+    (
+        "group.find_distinct_courses",
+        lambda s, d: GroupRepository(s).find_distinct_courses(d.speciality_id),
+        1,
+    ),
+    (
+        "group.find_distinct_streams",
+        lambda s, d: GroupRepository(s).find_distinct_streams(d.speciality_id, 1),
+        1,
+    ),
+    ("group.find_all_rows", lambda s, _: GroupRepository(s).find_all_rows(), 1),
+    ("subgroup.upsert", lambda s, d: SubgroupRepository(s).upsert(d.group_id, "141А"), 1),
+    ("subgroup.find_by_id", lambda s, d: SubgroupRepository(s).find_by_id(d.subgroup_id), 1),
+    (
+        "subgroup.find_by_name_and_group",
+        lambda s, d: SubgroupRepository(s).find_by_name_and_group(d.group_id, "141А"),
+        1,
+    ),
+    ("subgroup.find_by_group", lambda s, d: SubgroupRepository(s).find_by_group(d.group_id), 1),
+    ("subgroup.find_all_rows", lambda s, _: SubgroupRepository(s).find_all_rows(), 1),
+    (
+        "lesson.upsert",
+        lambda s, d: LessonRepository(s).upsert(**_lesson_data(d.subgroup_id)),
+        1,
+    ),
+    (
+        "lesson.bulk_upsert",
+        lambda s, d: LessonRepository(s).bulk_upsert(
+            [_lesson_data(d.subgroup_id, slot) for slot in range(4)]
+        ),
+        1,
+    ),
+    (
+        "lesson.find_for_subgroup_on_date",
+        lambda s, d: LessonRepository(s).find_for_subgroup_on_date(d.subgroup_id, LESSON_DATE),
+        1,
+    ),
+    (
+        "lesson.find_for_subgroup_in_range",
+        lambda s, d: LessonRepository(s).find_for_subgroup_in_range(
+            d.subgroup_id, LESSON_DATE, LESSON_DATE
+        ),
+        1,
+    ),
+    (
+        "lesson.find_rows_for_subgroup_on_date",
+        lambda s, d: LessonRepository(s).find_rows_for_subgroup_on_date(d.subgroup_id, LESSON_DATE),
+        1,
+    ),
+    (
+        "lesson.find_rows_for_subgroup_in_range",
+        lambda s, d: LessonRepository(s).find_rows_for_subgroup_in_range(
+            d.subgroup_id, LESSON_DATE, LESSON_DATE
+        ),
+        1,
+    ),
+    (
+        "lesson.find_rows_for_subgroups_on_date",
+        lambda s, d: LessonRepository(s).find_rows_for_subgroups_on_date(
+            [d.subgroup_id, d.subgroup_id + 1], LESSON_DATE
+        ),
+        1,
+    ),
+    (
+        "lesson.find_rows_for_subgroups_in_range",
+        lambda s, d: LessonRepository(s).find_rows_for_subgroups_in_range(
+            [d.subgroup_id, d.subgroup_id + 1], LESSON_DATE, LESSON_DATE
+        ),
+        1,
+    ),
+    (
+        "lesson.delete_by_keys",
+        lambda s, d: LessonRepository(s).delete_by_keys(
+            [
+                (d.subgroup_id, LESSON_DATE, time(9, 0), "Анатомия"),
+                (1, LESSON_DATE, time(11, 0), "x"),
+            ]
+        ),
+        1,
+    ),
+    (
+        "lesson.find_rows_for_teacher_in_range",
+        lambda s, _: LessonRepository(s).find_rows_for_teacher_in_range(
+            "иванов и и", LESSON_DATE, LESSON_DATE
+        ),
+        1,
+    ),
+    (
+        "lesson.find_room_slots",
+        lambda s, _: LessonRepository(s).find_room_slots(LESSON_DATE, LESSON_DATE),
+        1,
+    ),
+    (
+        "lesson.find_lesson_dates",
+        lambda s, _: LessonRepository(s).find_lesson_dates(LESSON_DATE),
+        1,
+    ),
+    ("lesson.find_teachers", lambda s, _: LessonRepository(s).find_teachers(), 1),
+    ("lesson.find_partitions", lambda s, _: LessonRepository(s).find_partitions(), 1),
+    (
+        "user.upsert",
+        lambda s, _: UserRepository(s).upsert(TELEGRAM_ID, "counts", "Query Counts"),
+        1,
+    ),
+    ("user.find_by_id", lambda s, _: UserRepository(s).find_by_id(TELEGRAM_ID), 1),
+    (
+        "user.update_subscription",
+        lambda s, _: UserRepository(s).update_subscription(TELEGRAM_ID, is_subscribed=False),
+        1,
+    ),
+    (
+        "user.unsubscribe_many",
+        lambda s, _: UserRepository(s).unsubscribe_many([TELEGRAM_ID, TELEGRAM_ID + 1]),
+        1,
+    ),
+    (
+        "user.update_notification_time",
+        lambda s, _: UserRepository(s).update_notification_time(TELEGRAM_ID, time(8, 0)),
+        1,
+    ),
+    (
+        "user.update_subgroup",
+        lambda s, d: UserRepository(s).update_subgroup(TELEGRAM_ID, d.subgroup_id),
+        1,
+    ),
+    (
+        "user.update_reminder",
+        lambda s, _: UserRepository(s).update_reminder(TELEGRAM_ID, 15),
+        1,
+    ),
+    (
+        "user.find_subscribed_users_by_time",
+        lambda s, _: UserRepository(s).find_subscribed_users_by_time(time(7, 0)),
+        1,
+    ),
+    ("user.find_subscriptions", lambda s, _: UserRepository(s).find_subscriptions(), 1),
+    ("user.find_subscribed_users", lambda s, _: UserRepository(s).find_subscribed_users(), 1),
+    ("user.find_reminder_leads", lambda s, _: UserRepository(s).find_reminder_leads(), 1),
+    (
+        "user.find_reminder_recipients",
+        lambda s, d: UserRepository(s).find_reminder_recipients([(d.subgroup_id, 15), (1, 30)]),
+        1,
+    ),
+    (
+        "user.find_subscribers_by_subgroup",
+        lambda s, d: UserRepository(s).find_subscribers_by_subgroup([d.subgroup_id, 1]),
+        1,
+    ),
+    (
+        "outbox.append",
+        lambda s, _: OutboxRepository(s).append(
+            [{"key": f"counts:{i}", "chat_id": TELEGRAM_ID, "body": "x"} for i in range(4)]
+        ),
+        1,
+    ),
+    ("outbox.claim", lambda s, _: OutboxRepository(s).claim(100, timedelta(minutes=5)), 1),
+    ("outbox.mark_done", lambda s, _: OutboxRepository(s).mark_done([1, 2]), 1),
+    ("outbox.release", lambda s, _: OutboxRepository(s).release([1, 2], timedelta(0)), 1),
+    (
+        "outbox.purge",
+        lambda s, _: OutboxRepository(s).purge(datetime(2033, 1, 1, tzinfo=UTC)),
+        1,
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("call", "expected"), [c[1:] for c in CASES], ids=[c[0] for c in CASES])
+async def test_repository_query_count(
+    call: RepoCall,
+    expected: int,
+    seed: Seed,
+    async_session: AsyncSession,
+) -> None:
+    assert await _count_queries(async_session, lambda: call(async_session, seed)) == expected
+
+
+@pytest.mark.asyncio
+async def test_partition_maintenance_query_counts(seed: Seed, async_session: AsyncSession) -> None:
+    repo = LessonRepository(async_session)
+    term = get_semester_term(LESSON_DATE)
+
+    # to_regclass lookup, then CREATE / move / ATTACH
+    assert await _count_queries(async_session, lambda: repo.ensure_partitions([LESSON_DATE])) == 4
+    assert await _count_queries(async_session, lambda: repo.ensure_partitions([LESSON_DATE])) == 1
+    assert await _count_queries(async_session, lambda: repo.detach_partition(term)) == 2
+    assert await _count_queries(async_session, lambda: repo.drop_partition(term)) == 2
+
+
+@pytest.mark.asyncio
+async def test_relationships_raise_unless_loaded(seed: Seed, async_session: AsyncSession) -> None:
+    speciality = await SpecialityRepository(async_session).find_by_id(seed.speciality_id)
+    assert speciality is not None
+    with pytest.raises(InvalidRequestError):
+        _ = speciality.groups
+
+    group = await GroupRepository(async_session).find_by_id(seed.group_id, load_subgroups=True)
+    assert group is not None
+    assert sorted(sg.name for sg in group.subgroups) == ["141А", "141Б", "141В"]
+    with pytest.raises(InvalidRequestError):
+        _ = group.speciality
+
+
+@pytest.mark.asyncio
+async def test_upsert_returns_current_row_without_refresh(
+    seed: Seed,
+    async_session: AsyncSession,
+) -> None:
+    repo = LessonRepository(async_session)
+    lesson = await repo.upsert(**_lesson_data(seed.subgroup_id))
+    assert isinstance(lesson, Lesson)
+
+    updated = await repo.upsert(**{**_lesson_data(seed.subgroup_id), "room": "2"})
+
+    assert updated is lesson
+    assert updated.room == "2"
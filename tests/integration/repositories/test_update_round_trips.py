@@ -0,0 +1,129 @@
+"""Round trips per interactive update with and without the connection tuning.
+
+An interactive update upserts the user on the primary and reads the lesson
+rows for a day. The baseline runs both in transactions with psycopg's default
+prepare threshold; the tuned path prepares statements on second use and reads
+through the autocommit ReplicaPool session, as DatabaseProvider configures it.
+
+Round trips are counted from the libpq protocol trace: the server answers
+every simple query and every extended-protocol Sync with one ReadyForQuery.
+"""
+
+import tempfile
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from psycopg import pq
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from testcontainers.postgres import PostgresContainer
+
+from models import User
+from repositories.lesson_repo import LessonRepository
+from repositories.session import ReplicaPool
+from repositories.user_repo import UserRepository
+
+TELEGRAM_ID = 9_000_000_031
+
+
+@pytest_asyncio.fixture
+async def engines(
+    setup_db_schema,
+    postgres_container: PostgresContainer,
+) -> AsyncGenerator[tuple[AsyncEngine, AsyncEngine]]:
+    url = postgres_container.get_connection_url()
+    baseline = create_async_engine(url, pool_size=2)
+    tuned = create_async_engine(url, pool_size=2, connect_args={"prepare_threshold": 1})
+    try:
+        yield baseline, tuned
+    finally:
+        async with tuned.begin() as conn:
+            await conn.execute(delete(User).where(User.telegram_id == TELEGRAM_ID))
+        await baseline.dispose()
+        await tuned.dispose()
+
+
+class RoundTrips:
+    """Counts server round trips of the sessions traced with it."""
+
+    def __init__(self) -> None:
+        self._trace = tempfile.TemporaryFile("w+")  # noqa: SIM115
+        self._traced: list[pq.abc.PGconn] = []
+
+    async def trace(self, session: AsyncSession) -> None:
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        pgconn = raw_connection.driver_connection.pgconn
+        pgconn.trace(self._trace.fileno())
+        pgconn.set_trace_flags(pq.Trace.SUPPRESS_TIMESTAMPS | pq.Trace.REGRESS_MODE)
+        self._traced.append(pgconn)
+
+    def count(self) -> int:
+        self.untrace()
+        self._trace.seek(0)
+        return sum(line.startswith("B\t") and "\tReadyForQuery\t" in line for line in self._trace)
+
+    def untrace(self) -> None:
+        for pgconn in self._traced:
+            pgconn.untrace()
+        self._traced.clear()
+
+    def close(self) -> None:
+        self.untrace()
+        self._trace.close()
+
+
+@asynccontextmanager
+async def round_trips() -> AsyncIterator[RoundTrips]:
+    counter = RoundTrips()
+    try:
+        yield counter
+    finally:
+        counter.close()
+
+
+async def _update(session: AsyncSession, read_session: AsyncSession) -> None:
+    await UserRepository(session).upsert(TELEGRAM_ID, "bench", "Bench User")
+    await session.commit()
+    await LessonRepository(read_session).find_rows_for_subgroup_on_date(1, date(2025, 9, 1))
+
+
+@pytest.mark.asyncio
+async def test_tuned_update_saves_round_trips(engines: tuple[AsyncEngine, AsyncEngine]) -> None:
+    baseline, tuned = engines
+    pool = ReplicaPool(primary=tuned)
+
+    async with round_trips() as counter:
+        async with AsyncSession(baseline) as session, AsyncSession(baseline) as read_session:
+            await counter.trace(session)
+            await counter.trace(read_session)
+            await _update(session, read_session)
+        # BEGIN, INSERT ... RETURNING, COMMIT; BEGIN, SELECT, ROLLBACK
+        assert counter.count() == 6
+
+    async with round_trips() as counter:
+        async with AsyncSession(tuned) as session, pool.session() as read_session:
+            await counter.trace(session)
+            await counter.trace(read_session)
+            await _update(session, read_session)
+        # BEGIN, INSERT ... RETURNING, COMMIT; SELECT
+        assert counter.count() == 4
+
+
+@pytest.mark.asyncio
+async def test_tuned_engine_reuses_prepared_statements(
+    engines: tuple[AsyncEngine, AsyncEngine],
+) -> None:
+    _, tuned = engines
+    pool = ReplicaPool(primary=tuned)
+    async with pool.session() as read_session:
+        repo = LessonRepository(read_session)
+        for _ in range(3):
+            await repo.find_rows_for_subgroup_on_date(1, date(2025, 9, 1))
+        prepared = await read_session.scalar(
+            text("SELECT count(*) FROM pg_prepared_statements WHERE statement LIKE '%lessons%'")
+        )
+    assert prepared == 1
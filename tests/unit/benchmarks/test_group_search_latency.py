@@ -0,0 +1,60 @@
+"""Benchmark: top-k group search latency over a university-sized catalog."""
+
+import statistics
+import time
+
+import pytest
+
+from src.repositories.group_repo import GroupRow
+from src.repositories.speciality_repo import SpecialityRow
+from src.repositories.subgroup_repo import SubgroupRow
+from src.services.group_catalog import GroupCatalog
+
+pytestmark = pytest.mark.benchmark
+
+SPECIALITIES = 24
+COURSES = 6
+GROUPS_PER_COURSE = 8
+SUBGROUPS_PER_GROUP = 3
+QUERIES = ["103", "2105", "Лечебное 2 курс", "медико 4 курс", "стомат", "фармация 305", "1 курс"]
+ROUNDS = 200
+BUDGET_MS = 1.0
+
+
+def _catalog() -> GroupCatalog:
+    names = ["Лечебное дело", "Медико-профилактическое дело", "Стоматология", "Фармация"]
+    specialities = [
+        SpecialityRow(s, f"3{s % 10}.05.{s:02d}", f"{names[s % 4]} {s}", names[s % 4].lower())
+        for s in range(SPECIALITIES)
+    ]
+    groups = [
+        GroupRow(s * 1000 + c * 100 + g, s, c, "АБ"[g % 2], f"{c}{s % 10}{g}{'' if s < 10 else s}")
+        for s in range(SPECIALITIES)
+        for c in range(1, COURSES + 1)
+        for g in range(GROUPS_PER_COURSE)
+    ]
+    subgroups = [
+        SubgroupRow(group.id * 10 + i, group.id, f"{group.name}{'АБВ'[i]}")
+        for group in groups
+        for i in range(SUBGROUPS_PER_GROUP)
+    ]
+    return GroupCatalog(specialities, groups, subgroups)
+
+
+def test_search_is_sub_millisecond() -> None:
+    index = _catalog().search_index
+    assert len(index) == SPECIALITIES * COURSES * GROUPS_PER_COURSE * SUBGROUPS_PER_GROUP
+
+    samples = []
+    for _ in range(ROUNDS):
+        for query in QUERIES:
+            started = time.perf_counter()
+            index.search(query)
+            samples.append(time.perf_counter() - started)
+
+    median_ms = statistics.median(samples) * 1000
+    p95_ms = statistics.quantiles(samples, n=20)[-1] * 1000
+    print(  # noqa: T201
+        f"\nsearch over {len(index)} subgroups: median {median_ms:.3f} ms, p95 {p95_ms:.3f} ms"
+    )
+    assert median_ms < BUDGET_MS
@@ -0,0 +1,112 @@
+"""Benchmark: inline query latency while users type group numbers."""
+
+import statistics
+import time
+from datetime import date
+from datetime import time as clock_time
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.bot.handlers.inline import get_rendered_days
+from src.models.enums import LessonType
+from src.repositories.group_repo import GroupRow
+from src.repositories.lesson_repo import LessonRow
+from src.repositories.speciality_repo import SpecialityRow
+from src.repositories.subgroup_repo import SubgroupRow
+from src.services.group_catalog import GroupCatalog, GroupCatalogStore
+from src.services.inline_schedule import (
+    InlineScheduleService,
+    RenderedDayCache,
+    parse_inline_query,
+)
+from src.services.schedule_service import ScheduleService
+from src.services.schedule_versions import ScheduleVersions
+
+pytestmark = pytest.mark.benchmark
+
+SPECIALITIES = 12
+COURSES = 6
+GROUPS_PER_COURSE = 8
+USERS = 50
+# Simulated database round trip on a rendered-cache miss
+DB_LATENCY_S = 0.002
+P99_BUDGET_MS = 50.0
+TODAY = date(2024, 9, 4)
+
+
+def _catalog() -> GroupCatalog:
+    specialities = [
+        SpecialityRow(s, f"31.05.{s:02d}", f"Лечебное дело {s}", f"лечебное дело {s}")
+        for s in range(SPECIALITIES)
+    ]
+    groups = [
+        GroupRow(s * 1000 + c * 100 + g, s, c, "А", f"{c}{s:02d}{g}")
+        for s in range(SPECIALITIES)
+        for c in range(1, COURSES + 1)
+        for g in range(GROUPS_PER_COURSE)
+    ]
+    subgroups = [
+        SubgroupRow(group.id * 10 + i, group.id, f"{group.name}{'АБВ'[i]}")
+        for group in groups
+        for i in range(3)
+    ]
+    return GroupCatalog(specialities, groups, subgroups)
+
+
+def _keystrokes(query: str) -> list[str]:
+    return [query[:i] for i in range(1, len(query) + 1)]
+
+
+@pytest.mark.asyncio
+async def test_inline_p99_under_budget() -> None:
+    lessons = [
+        LessonRow(
+            TODAY,
+            clock_time(9 + 2 * i),
+            clock_time(10 + 2 * i, 30),
+            f"Дисциплина {i}",
+            LessonType.LECTURE,
+            "Иванов И.И.",
+            f"10{i}",
+        )
+        for i in range(4)
+    ]
+
+    async def get_schedules_for_date(
+        subgroup_ids: list[int], _day: date
+    ) -> dict[int, list[LessonRow]]:
+        # asyncio.sleep is patched out in unit tests, so block for the round trip
+        time.sleep(DB_LATENCY_S)  # noqa: ASYNC251
+        return dict.fromkeys(subgroup_ids, lessons)
+
+    schedule_service = create_autospec(ScheduleService, instance=True)
+    schedule_service.get_schedules_for_date.side_effect = get_schedules_for_date
+    service = InlineScheduleService(
+        schedule_service=schedule_service,
+        versions=ScheduleVersions(),
+        rendered_cache=RenderedDayCache(),
+        catalog_store=GroupCatalogStore(_catalog()),
+    )
+
+    # Users of a few popular groups typing "<group> <day>" at the same time
+    queries = [
+        f"{1 + u % COURSES}{u % SPECIALITIES:02d}{u % 3} {('завтра', 'пт', '')[u % 3]}".strip()
+        for u in range(USERS)
+    ]
+    samples = []
+    for query in queries:
+        for text in _keystrokes(query):
+            started = time.perf_counter()
+            lookup = parse_inline_query(text, TODAY)
+            await get_rendered_days(service, service.resolve(lookup.group_query), lookup.day)
+            samples.append(time.perf_counter() - started)
+
+    misses = schedule_service.get_schedules_for_date.await_count
+    p99_ms = statistics.quantiles(samples, n=100)[-1] * 1000
+    print(  # noqa: T201
+        f"\n{len(samples)} keystrokes, {misses} lesson fetches: "
+        f"median {statistics.median(samples) * 1000:.3f} ms, p99 {p99_ms:.3f} ms"
+    )
+    assert misses < len(samples)
+    assert p99_ms < P99_BUDGET_MS
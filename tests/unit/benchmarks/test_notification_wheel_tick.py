@@ -0,0 +1,45 @@
+"""Benchmark: notification wheel tick cost with a large subscriber base."""
+
+import statistics
+import time
+from datetime import time as clock_time
+
+import pytest
+
+from src.services.notification_wheel import NotificationWheel
+
+pytestmark = pytest.mark.benchmark
+
+SUBSCRIBERS = 100_000
+ROUNDS = 2_000
+BUDGET_US = 50.0
+
+
+def _wheel() -> NotificationWheel:
+    # Everyone at 07:00 except a sparse spread over the rest of the day
+    rows = [
+        (user_id, clock_time(7, 0) if user_id % 100 else clock_time(user_id % 24, user_id % 60), 1)
+        for user_id in range(SUBSCRIBERS)
+    ]
+    wheel = NotificationWheel()
+    wheel.reconcile(rows, since=0)
+    return wheel
+
+
+def test_tick_cost_does_not_grow_with_subscribers() -> None:
+    wheel = _wheel()
+    assert len(wheel) == SUBSCRIBERS
+
+    samples = []
+    for i in range(ROUNDS):
+        # Quiet minutes: the 07:00 crowd must not slow them down
+        minute = clock_time(12 + i % 10, i % 60)
+        started = time.perf_counter()
+        wheel.due(minute)
+        samples.append(time.perf_counter() - started)
+
+    median_us = statistics.median(samples) * 1_000_000
+    print(  # noqa: T201
+        f"\nwheel tick over {SUBSCRIBERS} subscribers: median {median_us:.2f} µs"
+    )
+    assert median_us < BUDGET_US
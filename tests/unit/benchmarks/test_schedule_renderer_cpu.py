@@ -0,0 +1,100 @@
+"""Benchmark: CPU time of rendering a week view, against the previous renderer."""
+
+import statistics
+import time
+from datetime import date, timedelta
+from datetime import time as clock_time
+
+import pytest
+
+from src.core.schedule_renderer import format_date_title, render_week
+from src.models.enums import LessonType
+from src.repositories.lesson_repo import LessonRow
+
+pytestmark = pytest.mark.benchmark
+
+WEEK_START = date(2024, 9, 2)
+LESSONS_PER_DAY = 7
+ROUNDS = 50
+RENDERS_PER_ROUND = 20
+
+
+def _week() -> list[LessonRow]:
+    # Six study days with a full day of pairs each: 42 lessons
+    return [
+        LessonRow(
+            WEEK_START + timedelta(days=day),
+            clock_time(8 + pair * 2),
+            clock_time(9 + pair * 2, 30),
+            f"Дисциплина {pair}",
+            (LessonType.LECTURE, LessonType.SEMINAR)[pair % 2],
+            "Иванов Иван Иванович",
+            f"{day + 1}0{pair}",
+        )
+        for day in range(6)
+        for pair in range(LESSONS_PER_DAY)
+    ]
+
+
+def _legacy_format_lesson(lesson: LessonRow) -> str:
+    lesson_type_display = {
+        "лекционного": "Лекция",
+        "семинарского": "Семинар",
+    }.get(lesson.lesson_type, lesson.lesson_type)
+
+    time_str = f"{lesson.start_time:%H:%M}–{lesson.end_time:%H:%M}"
+    header = f"🕒 {time_str} — <b>{lesson.subject}</b>"
+    meta_parts: list[str] = [lesson_type_display]
+    if lesson.room:
+        meta_parts.append(f"🚪 {lesson.room}")
+    if lesson.teacher:
+        meta_parts.append(f"👨‍🏫 {lesson.teacher}")
+    meta = " · ".join(meta_parts)
+    return f"{header}\n   {meta}"
+
+
+def _legacy_render_week(title: str, lessons: list[LessonRow]) -> str:
+    """Week rendering as get_schedule did it before core.schedule_renderer."""
+    schedule_text = title + "\n\n"
+    current_date = None
+    for lesson in lessons:
+        if lesson.date != current_date:
+            if current_date is not None:
+                schedule_text += "\n"
+            day_display = (
+                "Понедельник",
+                "Вторник",
+                "Среда",
+                "Четверг",
+                "Пятница",
+                "Суббота",
+                "Воскресенье",
+            )[lesson.date.weekday()]
+            schedule_text += f"<b>{day_display} · {lesson.date:%d.%m}</b>\n"
+            current_date = lesson.date
+        schedule_text += _legacy_format_lesson(lesson) + "\n\n"
+    return schedule_text
+
+
+def _cpu_per_render(render, title: str, lessons: list[LessonRow]) -> float:  # type: ignore[no-untyped-def]
+    samples = []
+    for _ in range(ROUNDS):
+        started = time.process_time()
+        for _ in range(RENDERS_PER_ROUND):
+            render(title, lessons)
+        samples.append((time.process_time() - started) / RENDERS_PER_ROUND)
+    return statistics.median(samples)
+
+
+def test_week_render_uses_less_cpu_than_legacy() -> None:
+    lessons = _week()
+    title = format_date_title(WEEK_START, "week")
+    assert render_week(title, lessons) == _legacy_render_week(title, lessons)
+
+    legacy_us = _cpu_per_render(_legacy_render_week, title, lessons) * 1e6
+    current_us = _cpu_per_render(render_week, title, lessons) * 1e6
+    print(  # noqa: T201
+        f"\n{len(lessons)}-lesson week: legacy {legacy_us:.1f} us, "
+        f"renderer {current_us:.1f} us per render"
+    )
+    assert current_us < legacy_us
@@ -0,0 +1,38 @@
+"""Unit tests for schedule dialog navigation."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from src.bot.coalescing import RenderCoalescer
+from src.bot.dialogs.schedule import callbacks
+from src.services.schedule_prefetcher import SchedulePrefetcher
+from src.services.schedule_service import ScheduleService
+
+LESSON_DAYS = [date(2024, 9, 2), date(2024, 9, 4), date(2024, 9, 9), date(2024, 9, 11)]
+
+
+def _find_lesson_day(_subgroup_id: int, from_date: date, direction: int) -> date | None:
+    days = LESSON_DAYS if direction > 0 else list(reversed(LESSON_DAYS))
+    return next((day for day in days if (day - from_date).days * direction > 0), None)
+
+
+@pytest.mark.asyncio
+async def test_day_navigation_prefetches_next_lesson_days() -> None:
+    """Test ▶️ in day mode with empty days skipped prefetches the next days with lessons."""
+    schedule_service = create_autospec(ScheduleService, instance=True)
+    schedule_service.find_lesson_day.side_effect = _find_lesson_day
+    prefetcher = create_autospec(SchedulePrefetcher, instance=True)
+    prefetcher.depth = 2
+    coalescer = create_autospec(RenderCoalescer, instance=True)
+    manager = MagicMock()
+    manager.dialog_data = {"subgroup_id": 7, "mode": "day", "anchor_date": "2024-09-02"}
+
+    await callbacks._navigate(  # noqa: SLF001
+        AsyncMock(), manager, schedule_service, prefetcher, coalescer, 1
+    )
+
+    assert manager.dialog_data["anchor_date"] == "2024-09-04"
+    prefetcher.prefetch_days.assert_called_once_with(7, [date(2024, 9, 9), date(2024, 9, 11)])
+    coalescer.coalesce.assert_called_once_with(manager)
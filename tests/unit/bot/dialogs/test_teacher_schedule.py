@@ -0,0 +1,44 @@
+"""Unit tests for the teacher schedule dialog getters."""
+
+from datetime import date, time
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+from dishka import Provider, Scope, make_async_container
+
+from src.bot.dialogs.teacher_schedule import getters
+from src.models.enums import LessonType
+from src.services.schedule_service import ScheduleService, TeacherLesson
+
+DAY = date(2024, 9, 2)
+
+
+@pytest.mark.asyncio
+async def test_teacher_schedule_shows_lesson_type_titles() -> None:
+    """Test lesson types are shown by their display titles, not enum values."""
+    schedule_service = create_autospec(ScheduleService, instance=True)
+    schedule_service.get_teacher_schedule_for_date.return_value = [
+        TeacherLesson(
+            DAY, time(9, 0), time(10, 30), "Анатомия", LessonType.LECTURE, "101", ("103А",)
+        ),
+        TeacherLesson(DAY, time(11, 0), time(12, 30), "Анатомия", LessonType.SEMINAR, None, ()),
+    ]
+    provider = Provider(scope=Scope.APP)
+    # Bot code imports services without the src prefix, so key on its own class
+    provider.provide(lambda: schedule_service, provides=getters.ScheduleService)
+    container = make_async_container(provider)
+    manager = MagicMock()
+    manager.dialog_data = {
+        "teacher_key": "иванов",
+        "teacher_name": "Иванов И.И.",
+        "mode": "day",
+        "anchor_date": DAY.isoformat(),
+    }
+
+    result = await getters.get_teacher_schedule(dialog_manager=manager, dishka_container=container)
+
+    text = result["schedule_text"]
+    assert "🕒 09:00–10:30 — <b>Анатомия</b>\n   Лекция · 🚪 101 · 👥 103А" in text
+    assert text.endswith("🕒 11:00–12:30 — <b>Анатомия</b>\n   Семинар")
+    assert LessonType.LECTURE.value not in text
+    await container.close()
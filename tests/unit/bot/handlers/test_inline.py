@@ -0,0 +1,106 @@
+"""Unit tests for the inline schedule handler."""
+
+from collections.abc import AsyncIterator
+from datetime import date, time
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+import pytest_asyncio
+from dishka import AsyncContainer, Provider, Scope, make_async_container
+
+from src.bot.handlers import inline
+from src.models.enums import LessonType
+from src.repositories.group_repo import GroupRow
+from src.repositories.lesson_repo import LessonRow
+from src.repositories.speciality_repo import SpecialityRow
+from src.repositories.subgroup_repo import SubgroupRow
+from src.services.group_catalog import GroupCatalog, GroupCatalogStore
+from src.services.inline_schedule import InlineScheduleService, RenderedDayCache
+from src.services.schedule_service import ScheduleService
+from src.services.schedule_versions import ScheduleVersions
+from src.services.user_service import UserService
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def mock_schedule_service() -> AsyncMock:
+    """Create mock ScheduleService with one lesson for subgroup 100."""
+    service = create_autospec(ScheduleService, instance=True)
+    row = LessonRow(TODAY, time(9), time(10, 30), "Анатомия", LessonType.LECTURE, None, None)
+
+    async def get_schedules_for_date(subgroup_ids, _day):  # type: ignore[no-untyped-def]
+        return {subgroup_id: [row] if subgroup_id == 100 else [] for subgroup_id in subgroup_ids}
+
+    service.get_schedules_for_date.side_effect = get_schedules_for_date
+    return service
+
+
+@pytest.fixture
+def inline_service(mock_schedule_service: AsyncMock) -> InlineScheduleService:
+    """Create InlineScheduleService over a catalog with two subgroups of group 103."""
+    catalog = GroupCatalog(
+        specialities=[SpecialityRow(1, "31.05.01", "Лечебное дело", "Лечебное дело")],
+        groups=[GroupRow(10, 1, 1, "А", "103")],
+        subgroups=[SubgroupRow(100, 10, "103А"), SubgroupRow(101, 10, "103Б")],
+    )
+    return InlineScheduleService(
+        schedule_service=mock_schedule_service,
+        versions=ScheduleVersions(),
+        rendered_cache=RenderedDayCache(),
+        catalog_store=GroupCatalogStore(catalog),
+    )
+
+
+@pytest_asyncio.fixture
+async def container(inline_service: InlineScheduleService) -> AsyncIterator[AsyncContainer]:
+    """Create a container providing the inline and user services."""
+    user_service = create_autospec(UserService, instance=True)
+    user_service.get_by_telegram_id.return_value = MagicMock(subgroup_id=100)
+    provider = Provider(scope=Scope.APP)
+    # Bot code imports services without the src prefix, so key on its own classes
+    provider.provide(lambda: inline_service, provides=inline.InlineScheduleService)
+    provider.provide(lambda: user_service, provides=inline.UserService)
+    container = make_async_container(provider)
+    yield container
+    await container.close()
+
+
+def _query(text: str) -> MagicMock:
+    query = MagicMock()
+    query.query = text
+    query.from_user.id = 1
+    query.answer = AsyncMock()
+    return query
+
+
+@pytest.mark.asyncio
+async def test_group_query_answers_are_shared(
+    container: AsyncContainer, mock_schedule_service: AsyncMock
+) -> None:
+    """Test a query naming a group is fetched with one query and not marked personal."""
+    query = _query("103")
+
+    await inline.inline_schedule(inline_query=query, dishka_container=container)
+
+    mock_schedule_service.get_schedules_for_date.assert_awaited_once()
+    (subgroup_ids, _day) = mock_schedule_service.get_schedules_for_date.await_args.args
+    assert sorted(subgroup_ids) == [100, 101]
+    (results,) = query.answer.await_args.args
+    assert len(results) == 2
+    assert query.answer.await_args.kwargs["is_personal"] is False
+
+    await inline.inline_schedule(inline_query=_query("103"), dishka_container=container)
+    mock_schedule_service.get_schedules_for_date.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bare_day_answers_are_personal(container: AsyncContainer) -> None:
+    """Test a bare day word shows the user's own subgroup and is marked personal."""
+    query = _query("сегодня")
+
+    await inline.inline_schedule(inline_query=query, dishka_container=container)
+
+    (results,) = query.answer.await_args.args
+    assert [result.title for result in results] == ["103А"]
+    assert query.answer.await_args.kwargs["is_personal"] is True
@@ -0,0 +1,200 @@
+"""Unit tests for the rate-limited broadcaster."""
+
+from collections.abc import Iterator
+from itertools import pairwise
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
+
+import pytest
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError, TelegramRetryAfter
+from aiogram.methods import SendMessage
+
+from src.bot.broadcaster import (
+    CHAT_INTERVAL_SECONDS,
+    Broadcaster,
+    BroadcastProgress,
+    Delivery,
+    TokenBucket,
+)
+from src.services.settings_service import SettingsService
+from tests.unit.conftest import FakeClock
+
+METHOD = SendMessage(chat_id=1, text="x")
+
+
+@pytest.fixture
+def clock(clock: FakeClock) -> Iterator[FakeClock]:
+    """Virtual clock that asyncio.sleep advances."""
+    with patch("asyncio.sleep", new=clock.sleep):
+        yield clock
+
+
+@pytest.fixture
+def settings_service() -> AsyncMock:
+    """Create mock SettingsService."""
+    return create_autospec(SettingsService, instance=True)
+
+
+@pytest.fixture
+def bot(clock: FakeClock) -> AsyncMock:
+    """Create mock Bot recording the virtual time of every send."""
+    bot = AsyncMock(spec=Bot)
+    bot.sent_at = []
+
+    async def send_message(chat_id: int, text: str) -> None:
+        bot.sent_at.append((clock.now, chat_id))
+
+    bot.send_message.side_effect = send_message
+    return bot
+
+
+@pytest.fixture
+def broadcaster(bot: AsyncMock, clock: FakeClock, settings_service: AsyncMock) -> Broadcaster:
+    """Create Broadcaster over a container resolving the mocked settings service."""
+    request = MagicMock()
+    request.get = AsyncMock(return_value=settings_service)
+    container = MagicMock()
+    container.return_value.__aenter__ = AsyncMock(return_value=request)
+    container.return_value.__aexit__ = AsyncMock(return_value=None)
+    return Broadcaster(bot, container, rate=30, clock=clock)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_paces_acquisitions(self, clock: FakeClock) -> None:
+        """Test tokens are handed out at the configured rate."""
+        bucket = TokenBucket(10, clock=clock)
+
+        for _ in range(5):
+            await bucket.acquire()
+
+        assert clock.now == pytest.approx(0.4)
+
+    @pytest.mark.asyncio
+    async def test_pause_blocks_until_deadline(self, clock: FakeClock) -> None:
+        """Test a pause holds back the next token."""
+        bucket = TokenBucket(10, clock=clock)
+        bucket.pause(3)
+
+        await bucket.acquire()
+
+        assert clock.now >= 3
+
+
+class TestBroadcaster:
+    """Tests for Broadcaster."""
+
+    @pytest.mark.asyncio
+    async def test_holds_global_rate(
+        self, broadcaster: Broadcaster, bot: AsyncMock, clock: FakeClock
+    ) -> None:
+        """Test a large broadcast runs at the limit and never above it."""
+        progress = await broadcaster.broadcast(range(90), "hi")
+
+        assert progress.sent == 90
+        times = [t for t, _ in bot.sent_at]
+        assert clock.now == pytest.approx(89 / 30)
+        # No sliding one-second window holds more than 30 sends
+        assert all(times[i + 30] - times[i] >= 1 - 1e-9 for i in range(len(times) - 30))
+
+    @pytest.mark.asyncio
+    async def test_paces_messages_to_same_chat(
+        self, broadcaster: Broadcaster, bot: AsyncMock
+    ) -> None:
+        """Test messages to one chat are spaced by the per-chat interval."""
+        await broadcaster.send_all([(1, "a"), (1, "b"), (1, "c"), (2, "a")])
+
+        times = [t for t, chat_id in bot.sent_at if chat_id == 1]
+        assert len(times) == 3
+        assert all(b - a >= CHAT_INTERVAL_SECONDS - 1e-9 for a, b in pairwise(times))
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_and_retries(
+        self, broadcaster: Broadcaster, bot: AsyncMock, clock: FakeClock
+    ) -> None:
+        """Test flood control pauses every sender and the message is resent."""
+        bot.send_message.side_effect = _replay(
+            [TelegramRetryAfter(METHOD, "Too Many Requests", retry_after=5)],
+            bot.send_message.side_effect,
+        )
+
+        progress = await broadcaster.broadcast([1, 2], "hi")
+
+        assert (progress.sent, progress.retried) == (2, 1)
+        assert clock.now >= 5
+        assert bot.send_message.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_blocked_users_are_unsubscribed_in_bulk(
+        self, broadcaster: Broadcaster, bot: AsyncMock, settings_service: AsyncMock
+    ) -> None:
+        """Test chats that blocked the bot are unsubscribed with one call."""
+
+        async def send_message(chat_id: int, text: str) -> None:
+            if chat_id % 2:
+                raise TelegramForbiddenError(METHOD, "Forbidden: bot was blocked by the user")
+
+        bot.send_message.side_effect = send_message
+
+        progress = await broadcaster.broadcast(range(6), "hi")
+
+        assert (progress.sent, progress.blocked, progress.failed) == (3, 3, 0)
+        settings_service.unsubscribe_users.assert_awaited_once()
+        assert sorted(settings_service.unsubscribe_users.await_args.args[0]) == [1, 3, 5]
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_counted_as_failed(
+        self, broadcaster: Broadcaster, bot: AsyncMock, settings_service: AsyncMock
+    ) -> None:
+        """Test an API error fails one message without unsubscribing anybody."""
+        bot.send_message.side_effect = TelegramBadRequest(METHOD, "Bad Request: chat not found")
+
+        progress = await broadcaster.broadcast([1], "hi")
+
+        assert (progress.sent, progress.failed) == (0, 1)
+        settings_service.unsubscribe_users.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deliver_all_reports_each_outcome(
+        self, broadcaster: Broadcaster, bot: AsyncMock
+    ) -> None:
+        """Test outcomes come back in message order whatever order workers finish in."""
+
+        async def send_message(chat_id: int, text: str) -> None:
+            if chat_id == 2:
+                raise TelegramForbiddenError(METHOD, "Forbidden: bot was blocked by the user")
+            if chat_id == 3:
+                raise TelegramBadRequest(METHOD, "Bad Request: chat not found")
+
+        bot.send_message.side_effect = send_message
+
+        outcomes = await broadcaster.deliver_all([(1, "a"), (2, "b"), (3, "c"), (1, "d")])
+
+        assert outcomes == [Delivery.SENT, Delivery.BLOCKED, Delivery.FAILED, Delivery.SENT]
+
+    @pytest.mark.asyncio
+    async def test_reports_final_progress(self, broadcaster: Broadcaster) -> None:
+        """Test the progress callback receives the final counts."""
+        reports: list[tuple[int, int]] = []
+
+        async def on_progress(progress: BroadcastProgress) -> None:
+            reports.append((progress.done, progress.total))
+
+        await broadcaster.broadcast(range(3), "hi", on_progress=on_progress)
+
+        assert reports == [(3, 3)]
+
+
+def _replay(errors: list[Exception], then):  # type: ignore[no-untyped-def]
+    """Raise `errors` on the first calls, then delegate to `then`."""
+    pending = iter(errors)
+
+    async def side_effect(*args, **kwargs):  # type: ignore[no-untyped-def]
+        error = next(pending, None)
+        if error is not None:
+            raise error
+        return await then(*args, **kwargs)
+
+    return side_effect
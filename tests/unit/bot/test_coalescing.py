@@ -0,0 +1,118 @@
+"""Unit tests for the navigation render coalescer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.types import Chat
+from aiogram_dialog import ShowMode
+
+from src.bot.coalescing import RenderCoalescer
+from tests.unit.conftest import FakeClock
+
+
+def _manager(chat_id: int) -> MagicMock:
+    manager = MagicMock()
+    manager.middleware_data = {"event_chat": Chat(id=chat_id, type="private")}
+    manager.show_mode = ShowMode.AUTO
+    manager.bg.return_value = AsyncMock()
+    return manager
+
+
+@pytest.fixture
+def coalescer(clock: FakeClock) -> RenderCoalescer:
+    """Create RenderCoalescer with a half-second window."""
+    return RenderCoalescer(window=0.5, clock=clock)
+
+
+async def _drain(coalescer: RenderCoalescer) -> None:
+    await asyncio.gather(*coalescer._pending.values())  # noqa: SLF001
+
+
+class TestRenderCoalescer:
+    """Tests for RenderCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_burst_renders_first_and_final_state_once(
+        self, coalescer: RenderCoalescer, clock: FakeClock
+    ) -> None:
+        """Test a burst renders its first step at once and the rest in one deferred render."""
+        first = _manager(1)
+        assert coalescer.coalesce(first)
+        assert first.show_mode is ShowMode.AUTO
+
+        steps = []
+        for _ in range(4):
+            clock.now += 0.1
+            step = _manager(1)
+            assert not coalescer.coalesce(step)
+            assert step.show_mode is ShowMode.NO_UPDATE
+            steps.append(step)
+        assert coalescer.pending == 1
+
+        await _drain(coalescer)
+
+        # Only the step that opened the deferral schedules the render
+        bg = steps[0].bg.return_value
+        bg.update.assert_awaited_once_with({}, show_mode=ShowMode.EDIT)
+        for step in steps[1:]:
+            step.bg.assert_not_called()
+        # asyncio.sleep is patched by the unit-test conftest
+        assert asyncio.sleep.await_args.args[0] == pytest.approx(0.4)  # type: ignore[attr-defined]
+        assert coalescer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_steps_apart_render_immediately(
+        self, coalescer: RenderCoalescer, clock: FakeClock
+    ) -> None:
+        """Test steps further apart than the window are not delayed."""
+        assert coalescer.coalesce(_manager(1))
+        clock.now += 0.5
+        assert coalescer.coalesce(_manager(1))
+        assert coalescer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_deferred_render_opens_a_new_window(
+        self, coalescer: RenderCoalescer, clock: FakeClock
+    ) -> None:
+        """Test a step right after a deferred render is deferred again."""
+        coalescer.coalesce(_manager(1))
+        clock.now += 0.1
+        coalescer.coalesce(_manager(1))
+        clock.now += 0.4
+        await _drain(coalescer)
+
+        clock.now += 0.1
+        assert not coalescer.coalesce(_manager(1))
+        await _drain(coalescer)
+
+    @pytest.mark.asyncio
+    async def test_chats_are_independent(self, coalescer: RenderCoalescer) -> None:
+        """Test one chat's burst never defers another chat."""
+        assert coalescer.coalesce(_manager(1))
+        assert not coalescer.coalesce(_manager(1))
+        assert coalescer.coalesce(_manager(2))
+        await _drain(coalescer)
+
+    @pytest.mark.asyncio
+    async def test_failed_render_clears_pending(
+        self, coalescer: RenderCoalescer, clock: FakeClock
+    ) -> None:
+        """Test a failing deferred render does not block later ones."""
+        coalescer.coalesce(_manager(1))
+        step = _manager(1)
+        step.bg.return_value.update.side_effect = RuntimeError("no context")
+        coalescer.coalesce(step)
+
+        await _drain(coalescer)
+
+        assert coalescer.pending == 0
+        clock.now += 1
+        assert coalescer.coalesce(_manager(1))
+
+    def test_event_without_chat_renders(self, coalescer: RenderCoalescer) -> None:
+        """Test steps without a chat are never coalesced."""
+        manager = _manager(1)
+        manager.middleware_data = {}
+
+        assert coalescer.coalesce(manager)
@@ -0,0 +1,188 @@
+"""Unit tests for the update concurrency limiter."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from aiogram import Bot
+from aiogram.types import Update, User
+
+from src.bot.concurrency import UpdateLimiter
+
+
+def _user(user_id: int) -> User:
+    return User(id=user_id, is_bot=False, first_name="Test")
+
+
+def _click(update_id: int, user_id: int) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": update_id,
+            "callback_query": {
+                "id": str(update_id),
+                "from": {"id": user_id, "is_bot": False, "first_name": "Test"},
+                "message": {
+                    "message_id": 1,
+                    "date": 0,
+                    "chat": {"id": user_id, "type": "private"},
+                    "text": "schedule",
+                },
+                "chat_instance": "chat",
+                "data": "next",
+            },
+        }
+    )
+
+
+def _message(update_id: int, user_id: int) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": user_id, "type": "private"},
+                "from": {"id": user_id, "is_bot": False, "first_name": "Test"},
+                "text": "hi",
+            },
+        }
+    )
+
+
+async def _settle() -> None:
+    """Let every ready task run until it blocks again."""
+    loop = asyncio.get_running_loop()
+    for _ in range(10):
+        future = loop.create_future()
+        loop.call_soon(future.set_result, None)
+        await future
+
+
+class GatedHandler:
+    """Handler recording started updates and blocking each until released."""
+
+    def __init__(self) -> None:
+        self.started: list[int] = []
+        self.finished: list[int] = []
+        self.gates: dict[int, asyncio.Event] = {}
+
+    async def __call__(self, event: Update, _data: dict[str, Any]) -> int:
+        self.started.append(event.update_id)
+        gate = self.gates.setdefault(event.update_id, asyncio.Event())
+        await gate.wait()
+        self.finished.append(event.update_id)
+        return event.update_id
+
+    def release(self, update_id: int) -> None:
+        self.gates.setdefault(update_id, asyncio.Event()).set()
+
+
+@pytest.fixture
+def handler() -> GatedHandler:
+    """Create a GatedHandler."""
+    return GatedHandler()
+
+
+@pytest.fixture
+def bot() -> AsyncMock:
+    """Create mock Bot."""
+    return AsyncMock(spec=Bot)
+
+
+def _feed(
+    limiter: UpdateLimiter, handler: GatedHandler, bot: AsyncMock, event: Update, user_id: int
+) -> asyncio.Task[Any]:
+    data = {"event_from_user": _user(user_id), "bot": bot}
+    return asyncio.create_task(limiter(handler, event, data))
+
+
+class TestUpdateLimiter:
+    """Tests for UpdateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_serializes_updates_of_one_user(
+        self, handler: GatedHandler, bot: AsyncMock
+    ) -> None:
+        """Test a user's updates run one at a time in arrival order."""
+        limiter = UpdateLimiter(limit=10)
+        tasks = [_feed(limiter, handler, bot, _message(i, 1), 1) for i in range(3)]
+        await _settle()
+
+        assert handler.started == [0]
+        assert limiter.stats.queued == 2
+
+        for i in range(3):
+            handler.release(i)
+        assert await asyncio.gather(*tasks) == [0, 1, 2]
+        assert handler.started == handler.finished == [0, 1, 2]
+        assert limiter.stats.handled == 3
+        assert not limiter._lanes  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_bounds_updates_across_users(self, handler: GatedHandler, bot: AsyncMock) -> None:
+        """Test no more than `limit` updates run at once, the rest wait for a slot."""
+        limiter = UpdateLimiter(limit=2)
+        tasks = [_feed(limiter, handler, bot, _message(i, i), i) for i in range(3)]
+        await _settle()
+
+        assert handler.started == [0, 1]
+        stats = limiter.stats
+        assert (stats.running, stats.waiting, stats.peak_waiting) == (2, 1, 1)
+
+        handler.release(0)
+        await _settle()
+        assert handler.started == [0, 1, 2]
+
+        handler.release(1)
+        handler.release(2)
+        await asyncio.gather(*tasks)
+        assert limiter.stats.running == 0
+
+    @pytest.mark.asyncio
+    async def test_every_queued_click_is_applied(self, bot: AsyncMock) -> None:
+        """Test N queued ▶️ clicks move the anchor by exactly N steps."""
+        limiter = UpdateLimiter(limit=10)
+        anchor = 0
+
+        async def step(_event: Update, _data: dict[str, Any]) -> int:
+            nonlocal anchor
+            current = anchor
+            await asyncio.sleep(0)
+            anchor = current + 1
+            return anchor
+
+        data = {"event_from_user": _user(1), "bot": bot}
+        tasks = [asyncio.create_task(limiter(step, _click(i, 1), data)) for i in range(5)]
+
+        assert await asyncio.gather(*tasks) == [1, 2, 3, 4, 5]
+        assert anchor == 5
+        assert limiter.stats.handled == 5
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(
+        self, handler: GatedHandler, bot: AsyncMock
+    ) -> None:
+        """Test an update cancelled while queued is no longer counted."""
+        limiter = UpdateLimiter(limit=10)
+        first = _feed(limiter, handler, bot, _message(0, 1), 1)
+        second = _feed(limiter, handler, bot, _message(1, 1), 1)
+        await _settle()
+
+        second.cancel()
+        await _settle()
+        assert limiter.stats.queued == 0
+
+        handler.release(0)
+        await first
+        assert handler.started == [0]
+        assert not limiter._lanes  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_update_without_user_takes_a_slot(self, handler: GatedHandler) -> None:
+        """Test updates without a user skip the per-user queue but not the limit."""
+        limiter = UpdateLimiter(limit=1)
+        handler.release(0)
+
+        assert await limiter(handler, _message(0, 1), {}) == 0
+        assert limiter.stats.handled == 1
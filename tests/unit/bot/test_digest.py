@@ -0,0 +1,163 @@
+"""Unit tests for the digest dispatcher."""
+
+import time as pytime
+from datetime import UTC, date, datetime, time, timedelta
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from src.bot.digest import DIGEST_CATCH_UP_MINUTES, DigestDispatcher, local_now
+from src.services.daily_digest import DailyDigestService, Digest
+from src.services.outbox import OutboxService
+from src.services.settings_service import SettingsService
+
+NOW = datetime(2024, 9, 2, 7, 0, 12, tzinfo=UTC)
+
+
+@pytest.fixture
+def digest_service() -> AsyncMock:
+    """Create mock DailyDigestService returning no digests."""
+    service = create_autospec(DailyDigestService, instance=True)
+    service.build_digests = AsyncMock(return_value=[])
+    return service
+
+
+@pytest.fixture
+def outbox_service() -> AsyncMock:
+    """Create mock OutboxService recording enqueued messages."""
+    service = create_autospec(OutboxService, instance=True)
+    service.enqueued = []
+
+    async def enqueue(messages) -> int:  # type: ignore[no-untyped-def]
+        messages = list(messages)
+        service.enqueued.extend(messages)
+        return len(messages)
+
+    service.enqueue = AsyncMock(side_effect=enqueue)
+    return service
+
+
+@pytest.fixture
+def dispatcher(outbox_service: AsyncMock, digest_service: AsyncMock) -> DigestDispatcher:
+    """Create DigestDispatcher over a container resolving the mocked services."""
+
+    async def get(dependency: type) -> AsyncMock:
+        # src code imports the services without the "src." prefix, so match by name
+        if dependency.__name__ == "OutboxService":
+            return outbox_service
+        return digest_service
+
+    request = MagicMock()
+    request.get = AsyncMock(side_effect=get)
+    container = MagicMock()
+    container.return_value.__aenter__ = AsyncMock(return_value=request)
+    container.return_value.__aexit__ = AsyncMock(return_value=None)
+    return DigestDispatcher(container, clock=lambda: NOW)
+
+
+def _due_times(digest_service: AsyncMock) -> list[time]:
+    return [call.args[0] for call in digest_service.build_digests.await_args_list]
+
+
+def test_local_now_is_moscow_time_on_any_host(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the dispatchers' clock ignores the host timezone."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    pytime.tzset()
+    try:
+        now = local_now()
+    finally:
+        monkeypatch.undo()
+        pytime.tzset()
+
+    assert now.utcoffset() == timedelta(hours=3)
+    assert abs(now - datetime.now(UTC)) < timedelta(seconds=5)
+
+
+class TestDigestDispatcher:
+    """Tests for DigestDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_fans_out_each_digest(
+        self,
+        dispatcher: DigestDispatcher,
+        outbox_service: AsyncMock,
+        digest_service: AsyncMock,
+    ) -> None:
+        """Test one rendered text is enqueued for every subscriber of its subgroup at once."""
+        digest_service.build_digests.return_value = [
+            Digest(1, "A", [100, 101]),
+            Digest(2, "B", [200]),
+        ]
+
+        assert await dispatcher.dispatch(NOW.replace(second=0)) == 3
+
+        digest_service.build_digests.assert_awaited_once_with(time(7, 0), date(2024, 9, 2))
+        outbox_service.enqueue.assert_awaited_once()
+        assert outbox_service.enqueued == [
+            ("digest:2024-09-02T07:00:100", 100, "A"),
+            ("digest:2024-09-02T07:00:101", 101, "A"),
+            ("digest:2024-09-02T07:00:200", 200, "B"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_no_digests_skips_enqueue(
+        self, dispatcher: DigestDispatcher, outbox_service: AsyncMock
+    ) -> None:
+        """Test a minute without digests enqueues nothing."""
+        assert await dispatcher.tick(NOW) == 0
+        outbox_service.enqueue.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_tick_catches_up(
+        self, dispatcher: DigestDispatcher, digest_service: AsyncMock
+    ) -> None:
+        """Test a restart re-dispatches the last minutes, which the outbox keys deduplicate."""
+        await dispatcher.tick(NOW)
+
+        assert _due_times(digest_service) == [
+            (NOW - timedelta(minutes=i)).time().replace(second=0)
+            for i in reversed(range(DIGEST_CATCH_UP_MINUTES))
+        ]
+
+    @pytest.mark.asyncio
+    async def test_same_minute_is_dispatched_once(
+        self, dispatcher: DigestDispatcher, digest_service: AsyncMock
+    ) -> None:
+        """Test a second tick within the minute does not resend."""
+        await dispatcher.tick(NOW)
+        digest_service.build_digests.reset_mock()
+        await dispatcher.tick(NOW + timedelta(seconds=30))
+
+        assert _due_times(digest_service) == []
+
+    @pytest.mark.asyncio
+    async def test_missed_minutes_are_caught_up(
+        self, dispatcher: DigestDispatcher, digest_service: AsyncMock
+    ) -> None:
+        """Test minutes skipped between ticks are dispatched, up to the catch-up limit."""
+        await dispatcher.tick(NOW)
+        digest_service.build_digests.reset_mock()
+        await dispatcher.tick(NOW + timedelta(minutes=3))
+        await dispatcher.tick(NOW + timedelta(minutes=30))
+
+        assert _due_times(digest_service) == [
+            time(7, 1),
+            time(7, 2),
+            time(7, 3),
+            *(time(7, 30 - i) for i in reversed(range(DIGEST_CATCH_UP_MINUTES))),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reconcile_rebuilds_wheel(self) -> None:
+        """Test reconciliation goes through SettingsService in its own request scope."""
+        settings_service = create_autospec(SettingsService, instance=True)
+        settings_service.reconcile_notification_wheel = AsyncMock(return_value=2)
+        request = MagicMock()
+        request.get = AsyncMock(return_value=settings_service)
+        container = MagicMock()
+        container.return_value.__aenter__ = AsyncMock(return_value=request)
+        container.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        assert await DigestDispatcher(container).reconcile() == 2
+        # src code imports the service without the "src." prefix, so compare by name
+        assert request.get.await_args.args[0].__name__ == "SettingsService"
@@ -0,0 +1,96 @@
+"""Unit tests for the outbox worker."""
+
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from src.bot.broadcaster import Broadcaster, Delivery
+from src.bot.outbox import OUTBOX_BATCH_SIZE, BatchStats, OutboxWorker
+from src.repositories.outbox_repo import OutboxRow
+from src.services.outbox import OutboxService
+
+ROWS = [
+    OutboxRow(1, 100, "A", 1),
+    OutboxRow(2, 200, "B", 1),
+    OutboxRow(3, 300, "C", 2),
+]
+
+
+@pytest.fixture
+def outbox_service() -> AsyncMock:
+    """Create mock OutboxService with three claimable messages."""
+    service = create_autospec(OutboxService, instance=True)
+    service.claim_batch = AsyncMock(return_value=ROWS)
+    return service
+
+
+@pytest.fixture
+def broadcaster() -> AsyncMock:
+    """Create mock Broadcaster with one outcome of each kind."""
+    broadcaster = create_autospec(Broadcaster, instance=True)
+    broadcaster.deliver_all = AsyncMock(
+        return_value=[Delivery.SENT, Delivery.BLOCKED, Delivery.FAILED]
+    )
+    return broadcaster
+
+
+@pytest.fixture
+def container(outbox_service: AsyncMock) -> MagicMock:
+    """Create container resolving the mocked service and counting request scopes."""
+    request = MagicMock()
+    request.get = AsyncMock(return_value=outbox_service)
+    container = MagicMock()
+    container.return_value.__aenter__ = AsyncMock(return_value=request)
+    container.return_value.__aexit__ = AsyncMock(return_value=None)
+    return container
+
+
+@pytest.fixture
+def worker(broadcaster: AsyncMock, container: MagicMock) -> OutboxWorker:
+    """Create OutboxWorker with a clock advancing two seconds per reading."""
+    ticks = iter(range(0, 100, 2))
+    return OutboxWorker(broadcaster, container, clock=lambda: float(next(ticks)))
+
+
+class TestOutboxWorker:
+    """Tests for OutboxWorker."""
+
+    @pytest.mark.asyncio
+    async def test_settles_outcomes_of_a_batch(
+        self,
+        worker: OutboxWorker,
+        broadcaster: AsyncMock,
+        outbox_service: AsyncMock,
+        container: MagicMock,
+    ) -> None:
+        """Test a batch is sent outside any session and settled by outcome."""
+        stats = await worker.process_batch()
+
+        outbox_service.claim_batch.assert_awaited_once_with(OUTBOX_BATCH_SIZE)
+        assert list(broadcaster.deliver_all.await_args.args[0]) == [
+            (100, "A"),
+            (200, "B"),
+            (300, "C"),
+        ]
+        outbox_service.settle.assert_awaited_once_with([1], [2], [ROWS[2]])
+        # Claim and settle each hold a session only for their own transaction
+        assert container.call_count == 2
+        assert stats == BatchStats(claimed=3, sent=1, blocked=1, failed=1, seconds=2.0)
+        assert stats.rate == pytest.approx(1.5)
+
+    @pytest.mark.asyncio
+    async def test_empty_outbox_sends_nothing(
+        self,
+        worker: OutboxWorker,
+        broadcaster: AsyncMock,
+        outbox_service: AsyncMock,
+    ) -> None:
+        """Test an empty claim skips delivery and settlement."""
+        outbox_service.claim_batch.return_value = []
+
+        stats = await worker.process_batch()
+
+        assert stats.claimed == 0
+        assert stats.rate == 0.0
+        broadcaster.deliver_all.assert_not_called()
+        outbox_service.settle.assert_not_called()
@@ -0,0 +1,104 @@
+"""Unit tests for the reminder dispatcher."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from src.bot.reminders import ReminderDispatcher
+from src.services.lesson_reminders import LessonReminderService, Reminder, ReminderSchedule
+from src.services.outbox import OutboxService
+
+NOW = datetime(2024, 9, 2, 8, 45, tzinfo=UTC)
+STARTS_AT = datetime(2024, 9, 2, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def reminder_service() -> AsyncMock:
+    """Create mock LessonReminderService over a fresh heap."""
+    service = create_autospec(LessonReminderService, instance=True)
+    service.schedule = ReminderSchedule()
+    service.build_reminders = AsyncMock(return_value=[])
+    return service
+
+
+@pytest.fixture
+def outbox_service() -> AsyncMock:
+    """Create mock OutboxService counting enqueued messages."""
+    service = create_autospec(OutboxService, instance=True)
+    service.enqueued = []
+
+    async def enqueue(messages) -> int:  # type: ignore[no-untyped-def]
+        messages = list(messages)
+        service.enqueued.extend(messages)
+        return len(messages)
+
+    service.enqueue = AsyncMock(side_effect=enqueue)
+    return service
+
+
+@pytest.fixture
+def dispatcher(reminder_service: AsyncMock, outbox_service: AsyncMock) -> ReminderDispatcher:
+    """Create ReminderDispatcher over a container resolving the mocked services."""
+
+    async def get(dependency: type) -> AsyncMock:
+        # src code imports the services without the "src." prefix, so match by name
+        if dependency.__name__ == "OutboxService":
+            return outbox_service
+        return reminder_service
+
+    request = MagicMock()
+    request.get = AsyncMock(side_effect=get)
+    container = MagicMock()
+    container.return_value.__aenter__ = AsyncMock(return_value=request)
+    container.return_value.__aexit__ = AsyncMock(return_value=None)
+    return ReminderDispatcher(container, clock=lambda: NOW)
+
+
+class TestReminderDispatcher:
+    """Tests for ReminderDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_enqueues_reminders_keyed_by_lesson(
+        self,
+        dispatcher: ReminderDispatcher,
+        reminder_service: AsyncMock,
+        outbox_service: AsyncMock,
+    ) -> None:
+        """Test each rendered reminder is enqueued for every recipient."""
+        reminder_service.build_reminders.return_value = [
+            Reminder(1, STARTS_AT, 15, "A", [100, 101]),
+            Reminder(2, STARTS_AT, 15, "B", [200]),
+            # 100 switched to an hour ahead after the 15-minute reminder was sent
+            Reminder(1, STARTS_AT, 60, "C", [100]),
+        ]
+
+        assert await dispatcher.tick(NOW) == 4
+
+        assert outbox_service.enqueued == [
+            ("remind:2024-09-02T09:00:15:100", 100, "A"),
+            ("remind:2024-09-02T09:00:15:101", 101, "A"),
+            ("remind:2024-09-02T09:00:15:200", 200, "B"),
+            ("remind:2024-09-02T09:00:60:100", 100, "C"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_stale_schedule_only(
+        self, dispatcher: ReminderDispatcher, reminder_service: AsyncMock
+    ) -> None:
+        """Test the heap is rebuilt before use only while it is stale."""
+        await dispatcher.tick(NOW)
+        reminder_service.rebuild.assert_awaited_once_with(NOW)
+
+        schedule = reminder_service.schedule
+        schedule.replace([], {}, [], NOW.date(), schedule.generation)
+        await dispatcher.tick(NOW)
+        reminder_service.rebuild.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_reminders_skips_enqueue(
+        self, dispatcher: ReminderDispatcher, outbox_service: AsyncMock
+    ) -> None:
+        """Test a tick without due reminders enqueues nothing."""
+        assert await dispatcher.tick(NOW) == 0
+        outbox_service.enqueue.assert_not_called()
@@ -0,0 +1,113 @@
+"""Unit tests for the webhook server."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from aiogram import Bot, Dispatcher, Router
+from aiogram.types import Message
+from aiohttp.test_utils import TestClient, TestServer
+from pydantic import SecretStr
+
+from src.bot.webhook import create_webhook_app, run_webhook
+from src.core.config import BotSettings
+
+SECRET = "s3cret_token-1"  # noqa: S105
+UPDATE = {
+    "update_id": 1,
+    "message": {
+        "message_id": 1,
+        "date": 0,
+        "chat": {"id": 100, "type": "private"},
+        "from": {"id": 100, "is_bot": False, "first_name": "Test"},
+        "text": "hi",
+    },
+}
+
+
+@pytest.fixture
+def settings() -> BotSettings:
+    """Create BotSettings in webhook mode on an ephemeral port."""
+    return BotSettings.model_construct(
+        token=SecretStr("42:TEST"),
+        webhook_url="https://bot.example.com/",
+        webhook_path="/webhook",
+        webhook_host="127.0.0.1",
+        webhook_port=0,
+        webhook_secret=SecretStr(SECRET),
+        webhook_max_connections=40,
+    )
+
+
+@pytest.fixture
+def dispatcher() -> Dispatcher:
+    """Create Dispatcher recording the texts of handled messages."""
+    dispatcher = Dispatcher()
+    dispatcher["handled"] = []
+    router = Router()
+
+    @router.message()
+    async def on_message(message: Message, handled: list[str]) -> None:
+        handled.append(message.text or "")
+
+    dispatcher.include_router(router)
+    return dispatcher
+
+
+class TestWebhookApp:
+    """Tests for create_webhook_app."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_requests_without_secret(
+        self, dispatcher: Dispatcher, settings: BotSettings
+    ) -> None:
+        """Test an update without the right secret token is refused and not handled."""
+        bot = Bot("42:TEST")
+        app = create_webhook_app(dispatcher, bot, settings)
+        async with TestClient(TestServer(app)) as client:
+            missing = await client.post("/webhook", json=UPDATE)
+            wrong = await client.post(
+                "/webhook", json=UPDATE, headers={"X-Telegram-Bot-Api-Secret-Token": "nope"}
+            )
+
+        assert (missing.status, wrong.status) == (401, 401)
+        assert dispatcher["handled"] == []
+
+    @pytest.mark.asyncio
+    async def test_handles_update_before_responding(
+        self, dispatcher: Dispatcher, settings: BotSettings
+    ) -> None:
+        """Test an update is processed within its request."""
+        bot = Bot("42:TEST")
+        app = create_webhook_app(dispatcher, bot, settings)
+        async with TestClient(TestServer(app)) as client:
+            response = await client.post(
+                "/webhook", json=UPDATE, headers={"X-Telegram-Bot-Api-Secret-Token": SECRET}
+            )
+            assert response.status == 200
+            assert dispatcher["handled"] == ["hi"]
+
+
+class TestRunWebhook:
+    """Tests for run_webhook."""
+
+    @pytest.mark.asyncio
+    async def test_sets_webhook_and_keeps_it_on_shutdown(
+        self, dispatcher: Dispatcher, settings: BotSettings
+    ) -> None:
+        """Test the webhook is set with the secret and left in place when stopping."""
+        bot = AsyncMock(spec=Bot)
+        bot.session = AsyncMock()
+        stop = asyncio.Event()
+        bot.set_webhook.side_effect = lambda **_: stop.set()
+
+        await asyncio.wait_for(run_webhook(dispatcher, bot, settings, stop), timeout=5)
+
+        bot.set_webhook.assert_awaited_once_with(
+            url="https://bot.example.com/webhook",
+            secret_token=SECRET,
+            allowed_updates=["message"],
+            max_connections=40,
+        )
+        bot.delete_webhook.assert_not_called()
+        bot.session.close.assert_awaited()
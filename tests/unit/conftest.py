@@ -1,10 +1,34 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand, or by sleep where it replaces asyncio.sleep."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        wake = self.now + delay
+        await _real_sleep(0)
+        self.now = max(self.now, wake)
+
 
 @pytest.fixture(autouse=True)
 def mock_asyncio_sleep():
     """Mock asyncio.sleep to speed up async tests."""
     with patch("asyncio.sleep", new_callable=AsyncMock):
         yield
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a FakeClock starting at zero."""
+    return FakeClock()
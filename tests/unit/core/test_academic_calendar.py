@@ -5,9 +5,11 @@ from datetime import time as dt_time
 
 from src.core.academic_calendar import (
     DAY_NAME_MAP,
+    Semester,
     WeekDay,
     calculate_lesson_date,
     calculate_semester_start_date,
+    get_semester_term,
     get_semester_week_dates,
     parse_academic_year,
     parse_time_string,
@@ -173,7 +175,7 @@ class TestGetSemesterWeekDates:
     def test_get_semester_week_dates_second_week(self) -> None:
         """Test second week dates."""
         semester_start = date(2024, 9, 2)
-        start, end = get_semester_week_dates(semester_start, 2)
+        start, _end = get_semester_week_dates(semester_start, 2)
         first_start, _ = get_semester_week_dates(semester_start, 1)
         assert (start - first_start).days == 7
 
@@ -183,3 +185,41 @@ class TestGetSemesterWeekDates:
         for week in range(1, 5):
             start, end = get_semester_week_dates(semester_start, week)
             assert (end - start).days == 6
+
+
+class TestGetSemesterTerm:
+    """Tests for get_semester_term function."""
+
+    def test_fall_term(self) -> None:
+        """Test autumn dates belong to the fall term of the same academic year."""
+        term = get_semester_term(date(2024, 10, 15))
+        assert term.semester == Semester.FALL
+        assert term.academic_year_start == 2024
+        assert term.start_date == date(2024, 8, 1)
+        assert term.end_date == date(2025, 2, 1)
+
+    def test_january_belongs_to_previous_fall(self) -> None:
+        """Test winter exam dates stay in the fall term."""
+        term = get_semester_term(date(2025, 1, 20))
+        assert term == get_semester_term(date(2024, 9, 2))
+
+    def test_spring_term(self) -> None:
+        """Test spring dates belong to the spring term."""
+        term = get_semester_term(date(2025, 2, 10))
+        assert term.semester == Semester.SPRING
+        assert term.academic_year_start == 2024
+        assert term.start_date == date(2025, 2, 1)
+        assert term.end_date == date(2025, 8, 1)
+
+    def test_terms_are_contiguous(self) -> None:
+        """Test each term ends where the next one starts."""
+        fall = get_semester_term(date(2024, 9, 1))
+        spring = get_semester_term(fall.end_date)
+        next_fall = get_semester_term(spring.end_date)
+        assert spring.start_date == fall.end_date
+        assert next_fall.start_date == spring.end_date
+
+    def test_slug(self) -> None:
+        """Test slug identifies academic year and season."""
+        assert get_semester_term(date(2024, 9, 1)).slug == "2024_2025_fall"
+        assert get_semester_term(date(2025, 3, 1)).slug == "2024_2025_spring"
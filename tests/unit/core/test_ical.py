@@ -0,0 +1,105 @@
+"""Unit tests for iCalendar rendering."""
+
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, date, datetime, time
+
+import pytest
+
+from src.core.ical import escape_text, fold_line, iter_calendar, render_event
+from src.models.enums import LessonType
+from src.repositories.lesson_repo import LessonRow
+
+DTSTAMP = datetime(2024, 9, 1, 12, 0, tzinfo=UTC)
+LESSON = LessonRow(
+    date=date(2024, 9, 2),
+    start_time=time(9, 0),
+    end_time=time(10, 30),
+    subject="Анатомия человека",
+    lesson_type=LessonType.LECTURE,
+    teacher="Иванов И.И.",
+    room="101",
+)
+
+
+async def _chunks(*chunks: Sequence[LessonRow]) -> AsyncIterator[Sequence[LessonRow]]:
+    for chunk in chunks:
+        yield chunk
+
+
+class TestTextHelpers:
+    """Tests for escaping and line folding."""
+
+    def test_escape_text(self) -> None:
+        """Test RFC 5545 TEXT special characters are escaped."""
+        assert escape_text("a,b;c\\d\ne") == "a\\,b\\;c\\\\d\\ne"
+
+    def test_short_line_is_not_folded(self) -> None:
+        """Test lines within 75 octets are only terminated."""
+        assert fold_line("SUMMARY:Анатомия") == "SUMMARY:Анатомия\r\n"
+
+    def test_fold_keeps_lines_within_limit(self) -> None:
+        """Test folding never exceeds 75 octets nor splits a character."""
+        line = "SUMMARY:" + "Анатомия " * 20
+
+        folded = fold_line(line)
+
+        parts = folded.removesuffix("\r\n").split("\r\n")
+        assert all(len(part.encode()) <= 75 for part in parts)
+        assert all(part.startswith(" ") for part in parts[1:])
+        assert "".join(part.removeprefix(" ") for part in parts) == line
+
+
+class TestRenderEvent:
+    """Tests for render_event."""
+
+    def test_event_properties(self) -> None:
+        """Test a lesson renders with local times, location and teacher."""
+        event = render_event(LESSON, "42", DTSTAMP)
+
+        assert event.startswith("BEGIN:VEVENT\r\n")
+        assert event.endswith("END:VEVENT\r\n")
+        assert "DTSTART;TZID=Europe/Moscow:20240902T090000\r\n" in event
+        assert "DTEND;TZID=Europe/Moscow:20240902T103000\r\n" in event
+        assert "DTSTAMP:20240901T120000Z\r\n" in event
+        assert "SUMMARY:Анатомия человека (Лекция)\r\n" in event
+        assert "LOCATION:ауд. 101\r\n" in event
+        assert "DESCRIPTION:Иванов И.И.\r\n" in event
+
+    def test_uid_is_stable(self) -> None:
+        """Test the same lesson keeps its UID so calendar apps update it in place."""
+        first = render_event(LESSON, "42", DTSTAMP).split("\r\n")[1]
+        second = render_event(LESSON._replace(room="202"), "42", DTSTAMP).split("\r\n")[1]
+
+        assert first == second
+        assert first.startswith("UID:42-20240902T090000-")
+
+    def test_optional_fields_omitted(self) -> None:
+        """Test lessons without room or teacher omit those properties."""
+        event = render_event(LESSON._replace(room=None, teacher=None), "42", DTSTAMP)
+
+        assert "LOCATION" not in event
+        assert "DESCRIPTION" not in event
+
+
+class TestIterCalendar:
+    """Tests for iter_calendar."""
+
+    @pytest.mark.asyncio
+    async def test_streams_one_part_per_chunk(self) -> None:
+        """Test the header, one part per chunk and the footer are yielded in order."""
+        second = LESSON._replace(date=date(2024, 9, 3))
+
+        parts = [
+            part
+            async for part in iter_calendar(
+                "Расписание 101А", _chunks([LESSON], [second]), "42", DTSTAMP
+            )
+        ]
+
+        assert len(parts) == 4
+        calendar = b"".join(parts).decode()
+        assert calendar.startswith("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n")
+        assert "X-WR-CALNAME:Расписание 101А\r\n" in calendar
+        assert "BEGIN:VTIMEZONE\r\n" in calendar
+        assert calendar.count("BEGIN:VEVENT") == 2
+        assert calendar.endswith("END:VCALENDAR\r\n")
@@ -7,6 +7,7 @@ from src.core.schedule_parser import (
     ParsedGroupSchedule,
     ParsedLesson,
     ParsedSchedule,
+    make_teacher_key,
 )
 from src.models.enums import EducationLevel, LessonType
 
@@ -45,6 +46,22 @@ class TestParsedLesson:
         assert lesson.teacher is None
         assert lesson.address is None
         assert lesson.room is None
+        assert lesson.teacher_key is None
+
+
+class TestMakeTeacherKey:
+    """Tests for make_teacher_key."""
+
+    def test_folds_case_yo_and_punctuation(self) -> None:
+        """Test spelling variants of one teacher share a key."""
+        assert make_teacher_key("Сёмин И.И.") == "семин и и"
+        assert make_teacher_key("  семин  и. и. ") == "семин и и"
+
+    def test_empty_names(self) -> None:
+        """Test missing or punctuation-only names have no key."""
+        assert make_teacher_key(None) is None
+        assert make_teacher_key("") is None
+        assert make_teacher_key("...") is None
 
 
 class TestParsedGroupSchedule:
@@ -0,0 +1,99 @@
+"""Unit tests for schedule text rendering."""
+
+from datetime import date, time
+
+from src.core.schedule_renderer import (
+    format_date_title,
+    format_lesson,
+    render_day,
+    render_reminder,
+    render_week,
+)
+from src.models.enums import LessonType
+from src.repositories.lesson_repo import LessonRow
+
+TODAY = date(2024, 9, 4)
+LECTURE = LessonRow(
+    date=date(2024, 9, 2),
+    start_time=time(9, 0),
+    end_time=time(10, 30),
+    subject="Анатомия",
+    lesson_type=LessonType.LECTURE,
+    teacher="Иванов И.И.",
+    room="101",
+)
+SEMINAR = LessonRow(
+    date=date(2024, 9, 3),
+    start_time=time(11, 0),
+    end_time=time(12, 30),
+    subject="Химия",
+    lesson_type=LessonType.SEMINAR,
+    teacher=None,
+    room=None,
+)
+
+
+class TestFormatLesson:
+    """Tests for format_lesson."""
+
+    def test_full_lesson(self) -> None:
+        """Test a lesson with room and teacher lists both after its type."""
+        assert format_lesson(LECTURE) == (
+            "🕒 09:00–10:30 — <b>Анатомия</b>\n   Лекция · 🚪 101 · 👨‍🏫 Иванов И.И."
+        )
+
+    def test_lesson_without_details(self) -> None:
+        """Test a lesson without room or teacher shows only its type."""
+        assert format_lesson(SEMINAR) == "🕒 11:00–12:30 — <b>Химия</b>\n   Семинар"
+
+
+class TestFormatDateTitle:
+    """Tests for format_date_title."""
+
+    def test_day_titles(self) -> None:
+        """Test today and tomorrow are named, other days show their weekday."""
+        assert format_date_title(TODAY, "day", TODAY) == "📅 <b>Расписание на сегодня</b> (04.09)"
+        assert (
+            format_date_title(date(2024, 9, 5), "day", TODAY)
+            == "📅 <b>Расписание на завтра</b> (05.09)"
+        )
+        assert (
+            format_date_title(date(2024, 9, 9), "day", TODAY)
+            == "📅 <b>Расписание на 09.09</b> (пн)"
+        )
+
+    def test_week_title(self) -> None:
+        """Test a week title spans seven days."""
+        assert (
+            format_date_title(date(2024, 9, 2), "week", TODAY)
+            == "📅 <b>Расписание на неделю</b> (02.09 — 08.09)"
+        )
+
+
+class TestRender:
+    """Tests for render_day and render_week."""
+
+    def test_empty_views(self) -> None:
+        """Test views without lessons say so under the title."""
+        assert render_day("T", []) == "T\n\n📭 Занятий нет"
+        assert render_week("T", []) == "T\n\n📭 Занятий нет"
+
+    def test_day(self) -> None:
+        """Test lessons of a day are separated by blank lines."""
+        assert render_day("T", [LECTURE, SEMINAR]) == (
+            f"T\n\n{format_lesson(LECTURE)}\n\n{format_lesson(SEMINAR)}"
+        )
+
+    def test_week_groups_lessons_by_day(self) -> None:
+        """Test every day of a week starts with its weekday header."""
+        assert render_week("T", [LECTURE, SEMINAR]) == (
+            "T\n\n"
+            f"<b>Понедельник · 02.09</b>\n{format_lesson(LECTURE)}\n\n"
+            f"\n<b>Вторник · 03.09</b>\n{format_lesson(SEMINAR)}\n\n"
+        )
+
+    def test_reminder(self) -> None:
+        """Test a reminder names the lead time above the lessons."""
+        assert render_reminder(15, [LECTURE]) == (
+            f"⏰ <b>Через 15 мин</b>\n\n{format_lesson(LECTURE)}"
+        )
@@ -0,0 +1,148 @@
+"""Unit tests for read-replica session routing."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.util import greenlet_spawn
+
+from src.repositories.session import ReadOnlySession, ReplicaPool
+from tests.unit.conftest import FakeClock
+
+
+def make_engine(name: str) -> MagicMock:
+    """Create mock engine whose connect() returns a named connection."""
+    engine = MagicMock(name=name)
+    engine.url.host = name
+    connection = MagicMock(name=f"{name}-conn")
+    connection.execution_options = AsyncMock(return_value=connection)
+    engine.connect = AsyncMock(return_value=connection)
+    return engine
+
+
+def fail_connect(engine: MagicMock) -> None:
+    """Make engine.connect() raise like an unreachable server."""
+    engine.connect.side_effect = OperationalError("connect", {}, Exception("refused"))
+
+
+class TestReplicaPool:
+    """Tests for ReplicaPool."""
+
+    @pytest.mark.asyncio
+    async def test_connect_without_replicas_uses_primary(self) -> None:
+        """Test connections go to the primary when no replicas are configured."""
+        primary = make_engine("primary")
+        pool = ReplicaPool(primary)
+
+        connection = await pool.connect()
+
+        assert connection is primary.connect.return_value
+
+    @pytest.mark.asyncio
+    async def test_connect_uses_autocommit(self) -> None:
+        """Test read connections skip transactions."""
+        primary = make_engine("primary")
+        pool = ReplicaPool(primary)
+
+        connection = await pool.connect()
+
+        connection.execution_options.assert_awaited_once_with(isolation_level="AUTOCOMMIT")
+
+    @pytest.mark.asyncio
+    async def test_connect_round_robins_replicas(self) -> None:
+        """Test connections rotate over replicas and skip the primary."""
+        primary = make_engine("primary")
+        first, second = make_engine("r1"), make_engine("r2")
+        pool = ReplicaPool(primary, [first, second])
+
+        connections = [await pool.connect() for _ in range(3)]
+
+        assert connections == [
+            first.connect.return_value,
+            second.connect.return_value,
+            first.connect.return_value,
+        ]
+        primary.connect.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_connect_falls_back_to_primary(self) -> None:
+        """Test primary is used when every replica fails to connect."""
+        primary = make_engine("primary")
+        replica = make_engine("r1")
+        fail_connect(replica)
+        pool = ReplicaPool(primary, [replica])
+
+        connection = await pool.connect()
+
+        assert connection is primary.connect.return_value
+
+    @pytest.mark.asyncio
+    async def test_failed_replica_is_skipped_until_retry(self, clock: FakeClock) -> None:
+        """Test failed replica is not retried before retry_after elapses."""
+        primary = make_engine("primary")
+        replica = make_engine("r1")
+        fail_connect(replica)
+        pool = ReplicaPool(primary, [replica], retry_after=30, clock=clock)
+
+        await pool.connect()
+        await pool.connect()
+        assert replica.connect.await_count == 1
+
+        clock.now = 31
+        replica.connect.side_effect = None
+        connection = await pool.connect()
+
+        assert connection is replica.connect.return_value
+
+    @pytest.mark.asyncio
+    async def test_connect_fails_over_to_next_replica(self) -> None:
+        """Test a failing replica hands over to the next healthy one."""
+        primary = make_engine("primary")
+        broken, healthy = make_engine("r1"), make_engine("r2")
+        fail_connect(broken)
+        pool = ReplicaPool(primary, [broken, healthy])
+
+        connection = await pool.connect()
+
+        assert connection is healthy.connect.return_value
+        primary.connect.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_primary_errors_propagate(self) -> None:
+        """Test primary connection errors are not swallowed."""
+        primary = make_engine("primary")
+        fail_connect(primary)
+        pool = ReplicaPool(primary)
+
+        with pytest.raises(OperationalError):
+            await pool.connect()
+
+    @pytest.mark.asyncio
+    async def test_session_connects_on_first_statement(self) -> None:
+        """Test session() takes no connection until a statement needs one."""
+        primary = make_engine("primary")
+        connection = primary.connect.return_value
+        connection.close = AsyncMock()
+        pool = ReplicaPool(primary)
+
+        async with pool.session() as session:
+            assert isinstance(session, ReadOnlySession)
+            primary.connect.assert_not_awaited()
+
+            for _ in range(2):
+                bind = await greenlet_spawn(session.sync_session.get_bind)
+                assert bind is connection.sync_connection
+            primary.connect.assert_awaited_once()
+
+        connection.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unused_session_takes_no_connection(self) -> None:
+        """Test a session without statements never connects."""
+        primary = make_engine("primary")
+        pool = ReplicaPool(primary)
+
+        async with pool.session():
+            pass
+
+        primary.connect.assert_not_awaited()
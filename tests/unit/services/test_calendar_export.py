@@ -0,0 +1,152 @@
+"""Unit tests for calendar export and schedule versions."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, time, timedelta
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from src.models.enums import LessonType
+from src.repositories.lesson_repo import LessonRepository, LessonRow
+from src.repositories.subgroup_repo import SubgroupRow
+from src.services.calendar_export import CalendarExportService, CalendarFileCache
+from src.services.group_catalog import GroupCatalog, GroupCatalogStore
+from src.services.schedule_versions import ScheduleVersions
+
+STARTED_AT = datetime(2024, 9, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def versions() -> ScheduleVersions:
+    """Create ScheduleVersions with a clock advancing one minute per call."""
+    ticks = iter(STARTED_AT + timedelta(minutes=i) for i in range(100))
+    return ScheduleVersions(clock=lambda: next(ticks))
+
+
+@pytest.fixture
+def mock_lesson_repo() -> MagicMock:
+    """Create mock LessonRepository."""
+    return create_autospec(LessonRepository, instance=True)
+
+
+@pytest.fixture
+def export_service(
+    versions: ScheduleVersions, mock_lesson_repo: MagicMock
+) -> CalendarExportService:
+    """Create CalendarExportService over a catalog with one subgroup."""
+    return CalendarExportService(
+        session=AsyncMock(),
+        lesson_repo=mock_lesson_repo,
+        versions=versions,
+        file_cache=CalendarFileCache(),
+        catalog_store=GroupCatalogStore(GroupCatalog(subgroups=[SubgroupRow(7, 1, "101А")])),
+    )
+
+
+class TestScheduleVersions:
+    """Tests for ScheduleVersions."""
+
+    def test_unsynced_subgroup_is_generation_zero(self, versions: ScheduleVersions) -> None:
+        """Test subgroups start at generation 0 stamped with the start time."""
+        assert versions.get(7).generation == 0
+        assert versions.get(7).updated_at == STARTED_AT
+
+    def test_generation_moves_only_on_change(self, versions: ScheduleVersions) -> None:
+        """Test recording the same fingerprint keeps the generation and ETag."""
+        assert versions.record(1, 7, "111")
+        etag = versions.etag(7)
+
+        assert not versions.record(1, 7, "111")
+        assert versions.etag(7) == etag
+
+        assert versions.record(1, 7, "222")
+        assert versions.get(7).generation == 2
+        assert versions.etag(7) != etag
+
+    def test_schedules_sharing_a_subgroup_keep_its_generation(
+        self, versions: ScheduleVersions
+    ) -> None:
+        """Test schedules feeding one subgroup in turn don't move its generation."""
+        assert versions.record(1, 7, "111")
+        assert versions.record(2, 7, "222")
+
+        assert not versions.record(1, 7, "111")
+        assert not versions.record(2, 7, "222")
+        assert versions.get(7).generation == 2
+
+    def test_synced_etag_is_shared_across_processes(self, versions: ScheduleVersions) -> None:
+        """Test a replica started later derives the same ETag from the same lessons."""
+        later = ScheduleVersions(clock=lambda: STARTED_AT + timedelta(hours=1))
+        assert versions.etag(7) != later.etag(7)
+
+        for instance in (versions, later):
+            instance.record(2, 7, "222")
+            instance.record(1, 7, "111")
+        later.record(1, 7, "111")
+
+        assert versions.etag(7) == later.etag(7)
+
+    def test_etag_is_per_subgroup(self, versions: ScheduleVersions) -> None:
+        """Test a change to one subgroup leaves other ETags alone."""
+        other = versions.etag(8)
+
+        versions.record(1, 7, "111")
+
+        assert versions.etag(8) == other
+
+
+class TestCalendarExportService:
+    """Tests for CalendarExportService."""
+
+    def test_file_id_cached_until_etag_changes(
+        self,
+        export_service: CalendarExportService,
+        versions: ScheduleVersions,
+    ) -> None:
+        """Test an uploaded file is reused until a sync changes the subgroup."""
+        etag = export_service.etag(7)
+        export_service.remember_file_id(7, etag, "file-1")
+
+        assert export_service.cached_file_id(7, export_service.etag(7)) == "file-1"
+
+        versions.record(1, 7, "111")
+
+        assert export_service.cached_file_id(7, export_service.etag(7)) is None
+
+    def test_etag_is_per_semester(self, export_service: CalendarExportService) -> None:
+        """Test a cached calendar of the fall is not reused once spring starts."""
+        fall = export_service.etag(7, date(2025, 1, 31))
+
+        assert export_service.etag(7, date(2024, 9, 2)) == fall
+        assert export_service.etag(7, date(2025, 2, 1)) != fall
+
+    def test_filename_uses_subgroup_name(self, export_service: CalendarExportService) -> None:
+        """Test the document is named after the subgroup."""
+        assert export_service.filename(7) == "schedule_101А.ics"
+        assert export_service.filename(99) == "schedule_99.ics"
+
+    @pytest.mark.asyncio
+    async def test_stream_semester_reads_term_in_chunks(
+        self,
+        export_service: CalendarExportService,
+        mock_lesson_repo: MagicMock,
+    ) -> None:
+        """Test the semester is streamed from repository chunks."""
+        lesson = LessonRow(
+            date(2024, 9, 2), time(9), time(10, 30), "Анатомия", LessonType.LECTURE, None, "1"
+        )
+
+        async def chunks(*_args: object) -> AsyncIterator[list[LessonRow]]:
+            yield [lesson]
+            yield [lesson._replace(date=date(2024, 9, 3))]
+
+        mock_lesson_repo.iter_rows_for_subgroup_in_range = MagicMock(side_effect=chunks)
+
+        parts = [part async for part in export_service.stream_semester(7, date(2024, 10, 1))]
+
+        mock_lesson_repo.iter_rows_for_subgroup_in_range.assert_called_once_with(
+            7, date(2024, 8, 1), date(2025, 1, 31)
+        )
+        calendar = b"".join(parts).decode()
+        assert calendar.count("BEGIN:VEVENT") == 2
+        assert "X-WR-CALNAME:Расписание 101А" in calendar
@@ -0,0 +1,120 @@
+"""Unit tests for the daily digest service."""
+
+from datetime import date, time
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.enums import LessonType
+from src.repositories.lesson_repo import LessonRepository, LessonRow
+from src.services.daily_digest import DailyDigestService, Digest, digest_day
+from src.services.notification_wheel import NotificationWheel
+
+TODAY = date(2024, 9, 2)
+
+
+def _lesson(subject: str) -> LessonRow:
+    return LessonRow(TODAY, time(9, 0), time(10, 30), subject, LessonType.LECTURE, None, "101")
+
+
+@pytest.fixture
+def wheel() -> NotificationWheel:
+    """Create an empty NotificationWheel."""
+    return NotificationWheel()
+
+
+@pytest.fixture
+def mock_lesson_repo() -> AsyncMock:
+    """Create mock LessonRepository."""
+    return create_autospec(LessonRepository, instance=True)
+
+
+@pytest.fixture
+def digest_service(wheel: NotificationWheel, mock_lesson_repo: AsyncMock) -> DailyDigestService:
+    """Create DailyDigestService with mocked dependencies."""
+    return DailyDigestService(
+        session=AsyncMock(spec=AsyncSession),
+        lesson_repo=mock_lesson_repo,
+        wheel=wheel,
+    )
+
+
+class TestDigestDay:
+    """Tests for digest_day."""
+
+    def test_morning_announces_today(self) -> None:
+        """Test a morning digest covers the current day."""
+        assert digest_day(time(7, 0), TODAY) == TODAY
+
+    def test_evening_announces_tomorrow(self) -> None:
+        """Test an evening digest covers the next day."""
+        assert digest_day(time(20, 0), TODAY) == date(2024, 9, 3)
+
+
+class TestDailyDigestService:
+    """Tests for DailyDigestService."""
+
+    @pytest.mark.asyncio
+    async def test_renders_once_per_subgroup(
+        self,
+        digest_service: DailyDigestService,
+        wheel: NotificationWheel,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test subscribers of a subgroup share one digest fetched in one query."""
+        wheel.reconcile(
+            [
+                (102, time(7, 0), 1),
+                (200, time(7, 0), 2),
+                (100, time(7, 0), 1),
+                (101, time(7, 0), 1),
+            ],
+            since=0,
+        )
+        mock_lesson_repo.find_rows_for_subgroups_on_date = AsyncMock(
+            return_value={1: [_lesson("Анатомия")], 2: [_lesson("Гистология")]}
+        )
+
+        digests = await digest_service.build_digests(time(7, 0), TODAY)
+
+        mock_lesson_repo.find_rows_for_subgroups_on_date.assert_awaited_once()
+        subgroup_ids, day = mock_lesson_repo.find_rows_for_subgroups_on_date.await_args.args
+        assert list(subgroup_ids) == [1, 2]
+        assert day == TODAY
+
+        assert [(d.subgroup_id, d.user_ids) for d in digests] == [(1, [100, 101, 102]), (2, [200])]
+        assert "Расписание на сегодня" in digests[0].text
+        assert "Анатомия" in digests[0].text
+        assert "Гистология" in digests[1].text
+
+    @pytest.mark.asyncio
+    async def test_skips_subgroups_without_lessons(
+        self,
+        digest_service: DailyDigestService,
+        wheel: NotificationWheel,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a free day sends nothing to that subgroup."""
+        wheel.reconcile([(100, time(7, 0), 1), (200, time(7, 0), 2)], since=0)
+        mock_lesson_repo.find_rows_for_subgroups_on_date = AsyncMock(
+            return_value={2: [_lesson("Гистология")]}
+        )
+
+        digests = await digest_service.build_digests(time(7, 0), TODAY)
+
+        assert [d.subgroup_id for d in digests] == [2]
+        assert isinstance(digests[0], Digest)
+
+    @pytest.mark.asyncio
+    async def test_no_subscribers_skips_lesson_query(
+        self,
+        digest_service: DailyDigestService,
+        wheel: NotificationWheel,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a minute without subscribers costs no query."""
+        wheel.schedule(100, time(7, 0), 1)
+
+        assert await digest_service.build_digests(time(7, 1), TODAY) == []
+        mock_lesson_repo.find_rows_for_subgroups_on_date.assert_not_called()
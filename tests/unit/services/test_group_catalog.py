@@ -0,0 +1,129 @@
+"""Unit tests for the group catalog snapshot."""
+
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from src.repositories.group_repo import GroupRepository, GroupRow
+from src.repositories.lesson_repo import LessonRepository
+from src.repositories.speciality_repo import SpecialityRepository, SpecialityRow
+from src.repositories.subgroup_repo import SubgroupRepository, SubgroupRow
+from src.services.group_catalog import GroupCatalog, GroupCatalogStore
+
+
+@pytest.fixture
+def catalog() -> GroupCatalog:
+    """Create catalog with two courses and streams for one speciality."""
+    return GroupCatalog(
+        specialities=[SpecialityRow(1, "31.05.01", "Лечебное дело", "ЛД")],
+        groups=[
+            GroupRow(3, 1, 2, "Б", "204"),
+            GroupRow(1, 1, 2, "А", "202"),
+            GroupRow(2, 1, 2, "А", "201"),
+            GroupRow(4, 1, 1, "А", "101"),
+        ],
+        subgroups=[SubgroupRow(20, 2, "201Б"), SubgroupRow(10, 2, "201А")],
+    )
+
+
+class TestGroupCatalog:
+    """Tests for GroupCatalog."""
+
+    def test_empty_catalog(self) -> None:
+        """Test empty catalog answers every step with nothing."""
+        catalog = GroupCatalog()
+
+        assert catalog.specialities == ()
+        assert catalog.courses(1) == ()
+        assert catalog.streams(1, 1) == ()
+        assert catalog.groups(1, 1, "А") == ()
+        assert catalog.subgroups(1) == ()
+
+    def test_children_are_sorted(self, catalog: GroupCatalog) -> None:
+        """Test every level is precomputed in display order."""
+        assert catalog.courses(1) == (1, 2)
+        assert catalog.streams(1, 2) == ("А", "Б")
+        assert [g.name for g in catalog.groups(1, 2, "А")] == ["201", "202"]
+        assert [sg.name for sg in catalog.subgroups(2)] == ["201А", "201Б"]
+
+    def test_lookups_by_id(self, catalog: GroupCatalog) -> None:
+        """Test nodes are indexed by ID."""
+        assert catalog.specialities_by_id[1].clean_name == "ЛД"
+        assert catalog.groups_by_id[3].stream == "Б"
+        assert catalog.subgroups_by_id[10].group_id == 2
+
+    def test_children_are_immutable(self, catalog: GroupCatalog) -> None:
+        """Test children are served as tuples that callers cannot modify."""
+        assert isinstance(catalog.courses(1), tuple)
+        assert isinstance(catalog.groups(1, 2, "А"), tuple)
+        assert isinstance(catalog.subgroups(2), tuple)
+
+    @pytest.mark.asyncio
+    async def test_load_uses_projection_rows(self) -> None:
+        """Test load builds the catalog from one row query per table."""
+        speciality_repo = create_autospec(SpecialityRepository, instance=True)
+        group_repo = create_autospec(GroupRepository, instance=True)
+        subgroup_repo = create_autospec(SubgroupRepository, instance=True)
+        lesson_repo = create_autospec(LessonRepository, instance=True)
+        speciality_repo.find_all_rows = AsyncMock(
+            return_value=[SpecialityRow(1, "31.05.01", "Лечебное дело", "ЛД")]
+        )
+        group_repo.find_all_rows = AsyncMock(return_value=[GroupRow(2, 1, 1, "А", "101")])
+        subgroup_repo.find_all_rows = AsyncMock(return_value=[SubgroupRow(3, 2, "101А")])
+        lesson_repo.find_teachers = AsyncMock(return_value=[("иванов и и", "Иванов И.И.")])
+
+        catalog = await GroupCatalog.load(speciality_repo, group_repo, subgroup_repo, lesson_repo)
+
+        assert catalog.subgroups(2) == (SubgroupRow(3, 2, "101А"),)
+        assert catalog.teachers == {"иванов и и": "Иванов И.И."}
+        speciality_repo.find_all.assert_not_called()
+
+
+class TestTeacherDirectory:
+    """Tests for GroupCatalog.find_teachers."""
+
+    @pytest.fixture
+    def catalog(self) -> GroupCatalog:
+        """Create catalog with a few teachers."""
+        return GroupCatalog(
+            teachers=[
+                ("петров иван и", "Петров Иван И."),
+                ("иванова а п", "Иванова А.П."),
+                ("иванов и и", "Иванов И.И."),
+            ]
+        )
+
+    def test_surname_prefix(self, catalog: GroupCatalog) -> None:
+        """Test surname prefix matches, with names starting with it first."""
+        assert [key for key, _ in catalog.find_teachers("Иван")] == [
+            "иванов и и",
+            "иванова а п",
+            "петров иван и",
+        ]
+
+    def test_every_word_must_match(self, catalog: GroupCatalog) -> None:
+        """Test initials narrow the match and punctuation is ignored."""
+        assert catalog.find_teachers("иванов И.") == [("иванов и и", "Иванов И.И.")]
+
+    def test_limit_and_empty_query(self, catalog: GroupCatalog) -> None:
+        """Test limit caps results and a blank query matches nothing."""
+        assert len(catalog.find_teachers("иван", limit=1)) == 1
+        assert catalog.find_teachers(" . ") == []
+
+
+class TestGroupCatalogStore:
+    """Tests for GroupCatalogStore."""
+
+    def test_starts_empty(self) -> None:
+        """Test store serves an empty catalog until the first load."""
+        assert GroupCatalogStore().current.specialities == ()
+
+    def test_replace_swaps_snapshot(self, catalog: GroupCatalog) -> None:
+        """Test replace swaps the whole snapshot and keeps the old one intact."""
+        store = GroupCatalogStore()
+        previous = store.current
+
+        store.replace(catalog)
+
+        assert store.current is catalog
+        assert previous.courses(1) == ()
@@ -0,0 +1,99 @@
+"""Unit tests for the in-memory group search index."""
+
+import pytest
+
+from src.repositories.group_repo import GroupRow
+from src.repositories.speciality_repo import SpecialityRow
+from src.repositories.subgroup_repo import SubgroupRow
+from src.services.group_search import GroupSearchIndex, trigrams
+
+SPECIALITIES = {
+    1: SpecialityRow(1, "31.05.01", "31.05.01 Лечебное дело (специалитет)", "лечебное дело"),
+    2: SpecialityRow(2, "32.05.01", "32.05.01 Медико-профилактическое дело", "мпд"),
+}
+GROUPS = {
+    10: GroupRow(10, 1, 1, "А", "103"),
+    11: GroupRow(11, 1, 2, "А", "203"),
+    12: GroupRow(12, 2, 1, "Б", "1031"),
+    13: GroupRow(13, 2, 3, "Б", "305"),
+}
+SUBGROUPS = [
+    SubgroupRow(101, 10, "103Б"),
+    SubgroupRow(100, 10, "103А"),
+    SubgroupRow(110, 11, "203А"),
+    SubgroupRow(120, 12, "1031А"),
+    SubgroupRow(130, 13, "305А"),
+    SubgroupRow(999, 404, "orphan"),
+]
+
+
+@pytest.fixture
+def index() -> GroupSearchIndex:
+    """Create index over two specialities."""
+    return GroupSearchIndex(SPECIALITIES, GROUPS, SUBGROUPS)
+
+
+class TestTrigrams:
+    """Tests for trigram extraction."""
+
+    def test_words_are_padded(self) -> None:
+        """Test each word is padded like pg_trgm."""
+        assert trigrams("103") == {"  1", " 10", "103", "03 "}
+
+    def test_case_and_yo_are_folded(self) -> None:
+        """Test case and ё do not affect trigrams."""
+        assert trigrams("Учёба") == trigrams("учеба")
+
+    def test_empty_text(self) -> None:
+        """Test punctuation-only text has no trigrams."""
+        assert trigrams(" - ") == set()
+
+
+class TestGroupSearchIndex:
+    """Tests for GroupSearchIndex."""
+
+    def test_skips_orphan_subgroups(self, index: GroupSearchIndex) -> None:
+        """Test subgroups without a known group are not indexed."""
+        assert len(index) == 5
+
+    def test_group_number_ranks_exact_match_first(self, index: GroupSearchIndex) -> None:
+        """Test exact group number outranks a longer number sharing its prefix."""
+        matches = index.search("103")
+
+        assert [m.subgroup_id for m in matches[:2]] == [100, 101]
+        assert matches[0].score == 1.0
+        assert matches[-1].subgroup_id == 120
+        assert matches[-1].score < 1.0
+
+    def test_speciality_and_course(self, index: GroupSearchIndex) -> None:
+        """Test "N курс" is applied as a filter on top of the name match."""
+        matches = index.search("Лечебное 2 курс")
+
+        assert [m.subgroup_id for m in matches] == [110]
+        assert matches[0].label == "203А — лечебное дело, 2 курс"
+
+    def test_course_only(self, index: GroupSearchIndex) -> None:
+        """Test a bare course phrase lists that course in display order."""
+        assert [m.subgroup_id for m in index.search("3 курс")] == [130]
+
+    @pytest.mark.parametrize(("query", "subgroup_id"), [("203 курс", 110), ("1031 курс", 120)])
+    def test_group_number_before_course_word(
+        self, index: GroupSearchIndex, query: str, subgroup_id: int
+    ) -> None:
+        """Test the last digit of a group number is not read as a course."""
+        assert index.search(query)[0].subgroup_id == subgroup_id
+
+    def test_tolerates_typos(self, index: GroupSearchIndex) -> None:
+        """Test a misspelled speciality still matches."""
+        matches = index.search("лечебнле")
+
+        assert {m.subgroup_id for m in matches} == {100, 101, 110}
+
+    def test_limit(self, index: GroupSearchIndex) -> None:
+        """Test results are capped at limit."""
+        assert len(index.search("дело", limit=2)) == 2
+
+    @pytest.mark.parametrize("query", ["", "   ", "zzz", "9 курс"])
+    def test_no_matches(self, index: GroupSearchIndex, query: str) -> None:
+        """Test empty, unknown and out-of-range queries return nothing."""
+        assert index.search(query) == []
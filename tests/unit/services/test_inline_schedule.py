@@ -0,0 +1,143 @@
+"""Unit tests for inline schedule lookups."""
+
+from datetime import date, time
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from src.models.enums import LessonType
+from src.repositories.group_repo import GroupRow
+from src.repositories.lesson_repo import LessonRow
+from src.repositories.speciality_repo import SpecialityRow
+from src.repositories.subgroup_repo import SubgroupRow
+from src.services.group_catalog import GroupCatalog, GroupCatalogStore
+from src.services.inline_schedule import (
+    InlineLookup,
+    InlineScheduleService,
+    RenderedDay,
+    RenderedDayCache,
+    parse_inline_query,
+)
+from src.services.schedule_service import ScheduleService
+from src.services.schedule_versions import ScheduleVersions
+
+TODAY = date(2024, 9, 4)  # Wednesday
+
+
+@pytest.fixture
+def mock_schedule_service() -> AsyncMock:
+    """Create mock ScheduleService."""
+    return create_autospec(ScheduleService, instance=True)
+
+
+@pytest.fixture
+def versions() -> ScheduleVersions:
+    """Create ScheduleVersions."""
+    return ScheduleVersions()
+
+
+@pytest.fixture
+def inline_service(
+    mock_schedule_service: AsyncMock, versions: ScheduleVersions
+) -> InlineScheduleService:
+    """Create InlineScheduleService over a catalog with two subgroups of group 103."""
+    catalog = GroupCatalog(
+        specialities=[SpecialityRow(1, "31.05.01", "Лечебное дело", "Лечебное дело")],
+        groups=[GroupRow(10, 1, 1, "А", "103")],
+        subgroups=[SubgroupRow(100, 10, "103А"), SubgroupRow(101, 10, "103Б")],
+    )
+    return InlineScheduleService(
+        schedule_service=mock_schedule_service,
+        versions=versions,
+        rendered_cache=RenderedDayCache(),
+        catalog_store=GroupCatalogStore(catalog),
+    )
+
+
+class TestParseInlineQuery:
+    """Tests for parse_inline_query."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("103", InlineLookup("103", TODAY)),
+            ("103 завтра", InlineLookup("103", date(2024, 9, 5))),
+            ("Послезавтра 103А", InlineLookup("103а", date(2024, 9, 6))),
+            ("103 в пятницу", InlineLookup("103", date(2024, 9, 6))),
+            ("103 ср", InlineLookup("103", TODAY)),
+            ("103 пн", InlineLookup("103", date(2024, 9, 9))),
+            ("103 21.10", InlineLookup("103", date(2024, 10, 21))),
+            ("завтра", InlineLookup("", date(2024, 9, 5))),
+            ("", InlineLookup("", TODAY)),
+        ],
+    )
+    def test_parse(self, text: str, expected: InlineLookup) -> None:
+        """Test day words are taken out of the group query."""
+        assert parse_inline_query(text, TODAY) == expected
+
+    def test_invalid_date_stays_in_query(self) -> None:
+        """Test an impossible date is not treated as a day."""
+        assert parse_inline_query("31.02", TODAY) == InlineLookup("31.02", TODAY)
+
+
+class TestRenderedDayCache:
+    """Tests for RenderedDayCache."""
+
+    def test_entries_are_keyed_by_etag(self) -> None:
+        """Test an entry is not served for another ETag."""
+        cache = RenderedDayCache()
+        cache.put(100, TODAY, '"a-100-1"', RenderedDay("text", "summary"))
+
+        assert cache.get(100, TODAY, '"a-100-1"') == RenderedDay("text", "summary")
+        assert cache.get(100, TODAY, '"a-100-2"') is None
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted first."""
+        cache = RenderedDayCache(max_entries=2)
+        cache.put(1, TODAY, "e", RenderedDay("1", ""))
+        cache.put(2, TODAY, "e", RenderedDay("2", ""))
+        cache.get(1, TODAY, "e")
+        cache.put(3, TODAY, "e", RenderedDay("3", ""))
+
+        assert len(cache) == 2
+        assert cache.get(2, TODAY, "e") is None
+        assert cache.get(1, TODAY, "e") is not None
+
+
+class TestInlineScheduleService:
+    """Tests for InlineScheduleService."""
+
+    def test_resolve_uses_search_index(self, inline_service: InlineScheduleService) -> None:
+        """Test a group number resolves to its subgroups without I/O."""
+        matches = inline_service.resolve("103")
+
+        assert [m.subgroup_id for m in matches] == [100, 101]
+
+    def test_own_subgroup(self, inline_service: InlineScheduleService) -> None:
+        """Test the user's own subgroup is matched by ID."""
+        assert inline_service.own_subgroup(100).label == "103А"
+        assert inline_service.own_subgroup(999) is None
+
+    def test_rendered_day_invalidated_by_sync(
+        self, inline_service: InlineScheduleService, versions: ScheduleVersions
+    ) -> None:
+        """Test a sync changing the subgroup makes its rendered days stale."""
+        etag = inline_service.etag(100)
+        inline_service.remember_day(100, TODAY, etag, RenderedDay("text", "summary"))
+
+        assert inline_service.cached_day(100, TODAY, inline_service.etag(100)) is not None
+
+        versions.record(1, 100, "1")
+
+        assert inline_service.cached_day(100, TODAY, inline_service.etag(100)) is None
+
+    @pytest.mark.asyncio
+    async def test_get_lessons_reads_through_schedule_service(
+        self, inline_service: InlineScheduleService, mock_schedule_service: AsyncMock
+    ) -> None:
+        """Test lessons come from the cached schedule service."""
+        row = LessonRow(TODAY, time(9), time(10, 30), "Анатомия", LessonType.LECTURE, None, None)
+        mock_schedule_service.get_schedules_for_date.return_value = {100: [row], 101: []}
+
+        assert await inline_service.get_lessons([100, 101], TODAY) == {100: [row], 101: []}
+        mock_schedule_service.get_schedules_for_date.assert_awaited_once_with([100, 101], TODAY)
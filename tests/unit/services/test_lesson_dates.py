@@ -0,0 +1,119 @@
+"""Unit tests for the in-memory lesson-date index."""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from src.repositories.lesson_repo import LessonRepository
+from src.services.lesson_dates import (
+    LESSON_DATES_PAST_DAYS,
+    LessonDates,
+    LessonDatesStore,
+    LessonDays,
+)
+
+START = date(2024, 9, 1)
+ROWS = [
+    (1, date(2024, 9, 2)),
+    (1, date(2024, 9, 4)),
+    (1, date(2024, 9, 9)),
+    (2, date(2024, 9, 3)),
+]
+
+
+class TestLessonDates:
+    """Tests for LessonDates."""
+
+    @pytest.mark.parametrize(
+        ("day", "direction", "expected"),
+        [
+            (date(2024, 9, 2), 1, date(2024, 9, 4)),
+            (date(2024, 9, 5), 1, date(2024, 9, 9)),
+            (date(2024, 9, 9), 1, None),
+            (date(2024, 9, 9), -1, date(2024, 9, 4)),
+            (date(2024, 9, 3), -1, date(2024, 9, 2)),
+            (date(2024, 9, 2), -1, None),
+        ],
+    )
+    def test_nearest(self, day: date, direction: int, expected: date | None) -> None:
+        """Test the nearest lesson day strictly before or after a date."""
+        assert LessonDates(ROWS, START).nearest(1, day, direction) == expected
+
+    def test_subgroups_are_separate(self) -> None:
+        """Test one subgroup's dates do not leak into another's."""
+        lesson_dates = LessonDates(ROWS, START)
+
+        assert len(lesson_dates) == 2
+        assert lesson_dates.nearest(2, date(2024, 9, 3), 1) is None
+        assert lesson_dates.nearest(3, date(2024, 9, 3), 1) is None
+
+    def test_covers(self) -> None:
+        """Test coverage needs a known subgroup and a date within the index."""
+        lesson_dates = LessonDates(ROWS, START)
+
+        assert lesson_dates.covers(1, START)
+        assert not lesson_dates.covers(1, START - timedelta(days=1))
+        assert not lesson_dates.covers(3, START)
+
+    @pytest.mark.asyncio
+    async def test_load_reads_from_past_window(self) -> None:
+        """Test the index is loaded with one query reaching a semester back."""
+        lesson_repo = create_autospec(LessonRepository, instance=True)
+        lesson_repo.find_lesson_dates = AsyncMock(return_value=ROWS)
+
+        lesson_dates = await LessonDates.load(lesson_repo)
+
+        expected_start = date.today() - timedelta(days=LESSON_DATES_PAST_DAYS)
+        lesson_repo.find_lesson_dates.assert_awaited_once_with(expected_start)
+        assert lesson_dates.start_date == expected_start
+
+
+class TestLessonDays:
+    """Tests for the per-subgroup lesson-day bitmap."""
+
+    def test_contains(self) -> None:
+        """Test membership is a bit test against the subgroup's days."""
+        lesson_days = LessonDates(ROWS, START).lesson_days(1)
+
+        assert date(2024, 9, 4) in lesson_days
+        assert date(2024, 9, 3) not in lesson_days
+        assert date(2024, 8, 31) not in lesson_days
+        assert "2024-09-04" not in lesson_days
+
+    def test_in_month(self) -> None:
+        """Test a month scan lists only that month's lesson days."""
+        rows = [(1, date(2024, 9, 30)), (1, date(2024, 10, 1)), (1, date(2024, 10, 31))]
+        lesson_days = LessonDates(rows, START).lesson_days(1)
+
+        assert lesson_days.in_month(2024, 9) == [30]
+        assert lesson_days.in_month(2024, 10) == [1, 31]
+        assert lesson_days.in_month(2024, 11) == []
+
+    def test_month_partly_before_index(self) -> None:
+        """Test days before the index start are skipped, not shifted."""
+        lesson_days = LessonDates([(1, date(2024, 9, 20))], date(2024, 9, 15)).lesson_days(1)
+
+        assert lesson_days.in_month(2024, 9) == [20]
+        assert lesson_days.in_month(2024, 8) == []
+
+    def test_unknown_subgroup_is_empty(self) -> None:
+        """Test an unknown subgroup has no lesson days."""
+        lesson_days = LessonDates(ROWS, START).lesson_days(99)
+
+        assert isinstance(lesson_days, LessonDays)
+        assert lesson_days.in_month(2024, 9) == []
+
+
+class TestLessonDatesStore:
+    """Tests for LessonDatesStore."""
+
+    def test_replace_swaps_snapshot(self) -> None:
+        """Test replace serves the new snapshot."""
+        store = LessonDatesStore()
+        assert len(store.current) == 0
+
+        snapshot = LessonDates(ROWS, START)
+        store.replace(snapshot)
+
+        assert store.current is snapshot
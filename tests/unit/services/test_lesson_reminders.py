@@ -0,0 +1,234 @@
+"""Unit tests for the lesson reminder heap and service."""
+
+from datetime import UTC, date, datetime, time, timedelta
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.academic_calendar import UNIVERSITY_TZ
+from src.models.enums import LessonType
+from src.repositories.lesson_repo import LessonRepository, LessonRow
+from src.repositories.user_repo import UserRepository
+from src.services.lesson_reminders import (
+    LessonReminderService,
+    Reminder,
+    ReminderEvent,
+    ReminderSchedule,
+)
+
+TODAY = date(2024, 9, 2)
+NOW = datetime(2024, 9, 2, 8, 0, tzinfo=UNIVERSITY_TZ)
+
+
+def _at(hour: int, minute: int = 0, day: date = TODAY) -> datetime:
+    return datetime.combine(day, time(hour, minute), tzinfo=UNIVERSITY_TZ)
+
+
+def _lesson(start: time, subject: str = "Анатомия", day: date = TODAY) -> LessonRow:
+    end = (datetime.combine(day, start) + timedelta(minutes=90)).time()
+    return LessonRow(day, start, end, subject, LessonType.LECTURE, None, "101")
+
+
+@pytest.fixture
+def schedule() -> ReminderSchedule:
+    """Create an empty ReminderSchedule."""
+    return ReminderSchedule()
+
+
+@pytest.fixture
+def mock_lesson_repo() -> AsyncMock:
+    """Create mock LessonRepository."""
+    return create_autospec(LessonRepository, instance=True)
+
+
+@pytest.fixture
+def mock_user_repo() -> AsyncMock:
+    """Create mock UserRepository."""
+    return create_autospec(UserRepository, instance=True)
+
+
+@pytest.fixture
+def reminder_service(
+    schedule: ReminderSchedule, mock_lesson_repo: AsyncMock, mock_user_repo: AsyncMock
+) -> LessonReminderService:
+    """Create LessonReminderService with mocked repositories."""
+    return LessonReminderService(
+        session=AsyncMock(spec=AsyncSession),
+        lesson_repo=mock_lesson_repo,
+        user_repo=mock_user_repo,
+        schedule=schedule,
+    )
+
+
+class TestReminderSchedule:
+    """Tests for ReminderSchedule."""
+
+    def test_pops_due_events_in_order(self, schedule: ReminderSchedule) -> None:
+        """Test only events due by now are popped, earliest first."""
+        events = [
+            ReminderEvent(_at(9, 30), 1, 30, _at(10)),
+            ReminderEvent(_at(8, 50), 2, 10, _at(9)),
+            ReminderEvent(_at(8, 45), 1, 15, _at(9)),
+        ]
+        schedule.replace(events, {}, [], TODAY, schedule.generation)
+
+        assert schedule.pop_due(_at(8, 50)) == [events[2], events[1]]
+        assert schedule.pop_due(_at(8, 50)) == []
+        assert len(schedule) == 1
+
+    def test_goes_stale_on_invalidation_and_new_day(self, schedule: ReminderSchedule) -> None:
+        """Test a rebuilt heap stays fresh until invalidated or the day changes."""
+        assert schedule.is_stale(TODAY)
+
+        schedule.replace([], {}, [(1, 10)], TODAY, schedule.generation)
+        assert not schedule.is_stale(TODAY)
+        assert schedule.is_stale(TODAY + timedelta(days=1))
+        assert schedule.covers(1, 10)
+        assert not schedule.covers(1, 15)
+
+        schedule.invalidate()
+        assert schedule.is_stale(TODAY)
+
+    def test_invalidation_during_rebuild_keeps_it_stale(self, schedule: ReminderSchedule) -> None:
+        """Test a rebuild that read before an invalidation does not clear it."""
+        generation = schedule.generation
+        schedule.invalidate()
+
+        schedule.replace([], {}, [], TODAY, generation)
+
+        assert schedule.is_stale(TODAY)
+
+
+class TestLessonReminderService:
+    """Tests for LessonReminderService."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_schedules_each_lead_time(
+        self,
+        reminder_service: LessonReminderService,
+        schedule: ReminderSchedule,
+        mock_lesson_repo: AsyncMock,
+        mock_user_repo: AsyncMock,
+    ) -> None:
+        """Test one event per lesson start and lead time, skipping started lessons."""
+        mock_user_repo.find_reminder_leads = AsyncMock(return_value=[(1, 15), (1, 60), (2, 10)])
+        mock_lesson_repo.find_rows_for_subgroups_in_range = AsyncMock(
+            return_value={
+                1: [_lesson(time(7, 30)), _lesson(time(9, 0)), _lesson(time(9, 0), "Химия")],
+                2: [_lesson(time(8, 5)), _lesson(time(9, 0), day=TODAY + timedelta(days=2))],
+            }
+        )
+
+        assert await reminder_service.rebuild(NOW) == 3
+
+        subgroup_ids, start, end = mock_lesson_repo.find_rows_for_subgroups_in_range.await_args.args
+        assert sorted(subgroup_ids) == [1, 2]
+        assert (start, end) == (TODAY, TODAY + timedelta(days=1))
+        assert schedule.pop_due(_at(23)) == [
+            # Due 5 minutes ago, still within the catch-up window
+            ReminderEvent(_at(7, 55), 2, 10, _at(8, 5)),
+            ReminderEvent(_at(8, 0), 1, 60, _at(9)),
+            ReminderEvent(_at(8, 45), 1, 15, _at(9)),
+        ]
+        assert [lesson.subject for lesson in schedule.lessons(1, _at(9))] == ["Анатомия", "Химия"]
+        assert not schedule.is_stale(TODAY)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_reads_lesson_times_as_moscow_time(
+        self,
+        reminder_service: LessonReminderService,
+        schedule: ReminderSchedule,
+        mock_lesson_repo: AsyncMock,
+        mock_user_repo: AsyncMock,
+    ) -> None:
+        """Test a UTC clock gets the Moscow day's lessons at their Moscow start."""
+        mock_user_repo.find_reminder_leads = AsyncMock(return_value=[(1, 15)])
+        mock_lesson_repo.find_rows_for_subgroups_in_range = AsyncMock(
+            return_value={1: [_lesson(time(9, 0))]}
+        )
+        # 22:30 UTC on the eve is already 01:30 of TODAY in Moscow
+        utc_now = datetime(2024, 9, 1, 22, 30, tzinfo=UTC)
+
+        assert await reminder_service.rebuild(utc_now) == 1
+
+        _, start, _ = mock_lesson_repo.find_rows_for_subgroups_in_range.await_args.args
+        assert start == TODAY
+        (event,) = schedule.pop_due(utc_now + timedelta(days=1))
+        assert event.starts_at == datetime(2024, 9, 2, 6, 0, tzinfo=UTC)
+        assert event.fire_at == datetime(2024, 9, 2, 5, 45, tzinfo=UTC)
+        assert not schedule.is_stale(TODAY)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_without_opted_in_users_skips_lesson_query(
+        self,
+        reminder_service: LessonReminderService,
+        mock_lesson_repo: AsyncMock,
+        mock_user_repo: AsyncMock,
+    ) -> None:
+        """Test nobody opted in costs a single query."""
+        mock_user_repo.find_reminder_leads = AsyncMock(return_value=[])
+
+        assert await reminder_service.rebuild(NOW) == 0
+        mock_lesson_repo.find_rows_for_subgroups_in_range.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_renders_once_per_subgroup_and_fans_out(
+        self,
+        reminder_service: LessonReminderService,
+        schedule: ReminderSchedule,
+        mock_user_repo: AsyncMock,
+    ) -> None:
+        """Test due events share one recipients query and one render each."""
+        schedule.replace(
+            [
+                ReminderEvent(_at(8, 45), 1, 15, _at(9)),
+                ReminderEvent(_at(8, 50), 2, 10, _at(9)),
+                ReminderEvent(_at(9, 45), 1, 15, _at(10)),
+            ],
+            {(1, _at(9)): [_lesson(time(9, 0))], (2, _at(9)): [_lesson(time(9, 0), "Химия")]},
+            [(1, 15), (2, 10)],
+            TODAY,
+            schedule.generation,
+        )
+        mock_user_repo.find_reminder_recipients = AsyncMock(
+            return_value={(1, 15): [100, 101], (2, 10): [200]}
+        )
+
+        reminders = await reminder_service.build_reminders(_at(8, 50))
+
+        mock_user_repo.find_reminder_recipients.assert_awaited_once_with({(1, 15), (2, 10)})
+        assert [(r.subgroup_id, r.user_ids) for r in reminders] == [(1, [100, 101]), (2, [200])]
+        assert isinstance(reminders[0], Reminder)
+        assert "Через 15 мин" in reminders[0].text
+        assert "Химия" in reminders[1].text
+
+    @pytest.mark.asyncio
+    async def test_nothing_due_skips_query(
+        self, reminder_service: LessonReminderService, mock_user_repo: AsyncMock
+    ) -> None:
+        """Test a minute without due events costs no query."""
+        assert await reminder_service.build_reminders(NOW) == []
+        mock_user_repo.find_reminder_recipients.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_overdue_events_are_dropped(
+        self,
+        reminder_service: LessonReminderService,
+        schedule: ReminderSchedule,
+        mock_user_repo: AsyncMock,
+    ) -> None:
+        """Test events past the catch-up window or of started lessons are not sent."""
+        schedule.replace(
+            [
+                ReminderEvent(_at(7, 0), 1, 60, _at(8, 30)),
+                ReminderEvent(_at(7, 58), 2, 10, _at(8, 0)),
+            ],
+            {},
+            [],
+            TODAY,
+            schedule.generation,
+        )
+
+        assert await reminder_service.build_reminders(NOW) == []
+        mock_user_repo.find_reminder_recipients.assert_not_called()
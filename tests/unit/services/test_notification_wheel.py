@@ -0,0 +1,87 @@
+"""Unit tests for the notification timing wheel."""
+
+from datetime import time
+
+from src.services.notification_wheel import NotificationWheel
+
+ROWS = [(1, time(7, 0), 10), (2, time(7, 0), 20), (3, time(8, 30), 10)]
+
+
+def _wheel() -> NotificationWheel:
+    wheel = NotificationWheel()
+    wheel.reconcile(ROWS, since=0)
+    return wheel
+
+
+class TestNotificationWheel:
+    """Tests for NotificationWheel."""
+
+    def test_due_returns_only_that_minute(self) -> None:
+        """Test a tick yields the subscribers of its minute with their subgroups."""
+        wheel = _wheel()
+
+        assert wheel.due(time(7, 0)) == {1: 10, 2: 20}
+        assert wheel.due(time(8, 30)) == {3: 10}
+        assert wheel.due(time(7, 1)) == {}
+        assert wheel.due(time(23, 59)) == {}
+
+    def test_move_and_unschedule(self) -> None:
+        """Test incremental changes move and remove subscribers."""
+        wheel = _wheel()
+
+        assert wheel.move(1, time(9, 15))
+        assert wheel.unschedule(2)
+        assert not wheel.move(99, time(9, 15))
+        assert not wheel.unschedule(99)
+
+        assert wheel.due(time(7, 0)) == {}
+        assert wheel.due(time(9, 15)) == {1: 10}
+        assert len(wheel) == 2
+        assert 2 not in wheel
+
+    def test_set_subgroup_keeps_time(self) -> None:
+        """Test a subgroup change keeps the subscriber's minute."""
+        wheel = _wheel()
+
+        assert wheel.set_subgroup(3, 30)
+        assert not wheel.set_subgroup(99, 30)
+
+        assert wheel.due(time(8, 30)) == {3: 30}
+
+    def test_empty_hour_slot_is_released(self) -> None:
+        """Test the minute slots of an hour are dropped with its last subscriber."""
+        wheel = _wheel()
+
+        wheel.unschedule(3)
+
+        assert wheel._hours[8] is None  # noqa: SLF001
+        assert wheel._hours[7] is not None  # noqa: SLF001
+
+    def test_reconcile_reports_drift(self) -> None:
+        """Test reconciliation adopts the database state and counts differences."""
+        wheel = _wheel()
+
+        drift = wheel.reconcile([(1, time(7, 0), 10), (3, time(8, 45), 10), (4, time(6, 0), 40)], 0)
+
+        assert drift == 3
+        assert wheel.due(time(7, 0)) == {1: 10}
+        assert wheel.due(time(8, 45)) == {3: 10}
+        assert wheel.due(time(6, 0)) == {4: 40}
+
+    def test_reconcile_keeps_changes_made_while_reading(self) -> None:
+        """Test rows read before an incremental change do not revert it."""
+        wheel = _wheel()
+        since = wheel.version
+        wheel.move(1, time(9, 0))
+        wheel.unschedule(2)
+        wheel.schedule(5, time(7, 0), 50)
+
+        # Rows read before the changes above committed
+        wheel.reconcile(ROWS, since)
+
+        assert wheel.due(time(7, 0)) == {5: 50}
+        assert wheel.due(time(9, 0)) == {1: 10}
+
+        # Once reconciled past them, the database wins again
+        wheel.reconcile(ROWS, wheel.version)
+        assert wheel.due(time(7, 0)) == {1: 10, 2: 20}
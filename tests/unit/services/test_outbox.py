@@ -0,0 +1,130 @@
+"""Unit tests for the outbox service."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, call, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.outbox_repo import OutboxRepository, OutboxRow
+from src.services.outbox import (
+    OUTBOX_LEASE,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RETRY_DELAY,
+    OutboxService,
+)
+
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """Create mock AsyncSession."""
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def mock_outbox_repo() -> AsyncMock:
+    """Create mock OutboxRepository."""
+    return create_autospec(OutboxRepository, instance=True)
+
+
+@pytest.fixture
+def outbox_service(mock_session: AsyncMock, mock_outbox_repo: AsyncMock) -> OutboxService:
+    """Create OutboxService with mocked dependencies."""
+    return OutboxService(session=mock_session, outbox_repo=mock_outbox_repo)
+
+
+class TestOutboxService:
+    """Tests for OutboxService."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_appends_in_one_call(
+        self,
+        outbox_service: OutboxService,
+        mock_outbox_repo: AsyncMock,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test messages are appended in bulk and committed."""
+        mock_outbox_repo.append = AsyncMock(return_value=1)
+
+        result = await outbox_service.enqueue([("k1", 100, "A"), (None, 200, "B")])
+
+        mock_outbox_repo.append.assert_awaited_once_with(
+            [
+                {"key": "k1", "chat_id": 100, "body": "A"},
+                {"key": None, "chat_id": 200, "body": "B"},
+            ]
+        )
+        mock_session.commit.assert_awaited_once()
+        assert result == 1
+
+    @pytest.mark.asyncio
+    async def test_enqueue_nothing_skips_query(
+        self,
+        outbox_service: OutboxService,
+        mock_outbox_repo: AsyncMock,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test an empty enqueue touches no table."""
+        assert await outbox_service.enqueue([]) == 0
+
+        mock_outbox_repo.append.assert_not_called()
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_claim_batch_commits_lease(
+        self,
+        outbox_service: OutboxService,
+        mock_outbox_repo: AsyncMock,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test a claim is committed so other workers see the lease at once."""
+        rows = [OutboxRow(1, 100, "A", 1)]
+        mock_outbox_repo.claim = AsyncMock(return_value=rows)
+
+        assert await outbox_service.claim_batch(50) == rows
+
+        mock_outbox_repo.claim.assert_awaited_once_with(50, OUTBOX_LEASE)
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_settle_backs_off_and_gives_up(
+        self,
+        outbox_service: OutboxService,
+        mock_outbox_repo: AsyncMock,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test failed messages are retried later, and dropped after the last attempt."""
+        failed = [
+            OutboxRow(3, 300, "C", 1),
+            OutboxRow(4, 400, "D", 3),
+            OutboxRow(5, 500, "E", OUTBOX_MAX_ATTEMPTS),
+        ]
+
+        await outbox_service.settle([1], [2], failed)
+
+        assert mock_outbox_repo.mark_done.await_args_list == [
+            call([1]),
+            call([2], error="blocked"),
+            call([5], error="failed"),
+        ]
+        assert mock_outbox_repo.release.await_args_list == [
+            call([3], OUTBOX_RETRY_DELAY),
+            call([4], OUTBOX_RETRY_DELAY * 4),
+        ]
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_purge(
+        self,
+        outbox_service: OutboxService,
+        mock_outbox_repo: AsyncMock,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test purging deletes settled messages and commits."""
+        mock_outbox_repo.purge = AsyncMock(return_value=7)
+        before = datetime(2024, 9, 1, tzinfo=UTC)
+
+        assert await outbox_service.purge(before) == 7
+
+        mock_outbox_repo.purge.assert_awaited_once_with(before)
+        mock_session.commit.assert_awaited_once()
@@ -0,0 +1,112 @@
+"""Unit tests for the room occupancy index."""
+
+from datetime import date, time
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from src.repositories.lesson_repo import LessonRepository, RoomSlotRow
+from src.services.room_occupancy import (
+    FreeRoom,
+    RoomOccupancy,
+    RoomOccupancyStore,
+    RoomSlot,
+)
+
+DAY = date(2024, 9, 2)
+MAIN = "Пискарёвский пр., 47"
+
+
+def _row(room: str, start: int, end: int, subject: str = "Анатомия") -> RoomSlotRow:
+    return RoomSlotRow(DAY, MAIN, room, time(start), time(end), subject)
+
+
+@pytest.fixture
+def occupancy() -> RoomOccupancy:
+    """Create occupancy with three rooms busy at different times."""
+    rows = [
+        _row("101", 9, 11),
+        _row("101", 9, 11),  # same lecture for another subgroup
+        _row("101", 10, 12, "Физиология"),
+        _row("101", 14, 16),
+        _row("102", 13, 15),
+        RoomSlotRow(date(2024, 9, 3), MAIN, "103", time(9), time(10), "Химия"),
+    ]
+    return RoomOccupancy(rows, start_date=DAY, days=7)
+
+
+class TestRoomOccupancy:
+    """Tests for RoomOccupancy."""
+
+    def test_rooms_known_from_any_date(self, occupancy: RoomOccupancy) -> None:
+        """Test rooms seen on any date of the window are tracked."""
+        assert occupancy.rooms == ((MAIN, "101"), (MAIN, "102"), (MAIN, "103"))
+
+    def test_free_at_time(self, occupancy: RoomOccupancy) -> None:
+        """Test a point query reports free rooms and when they become busy."""
+        assert occupancy.free_rooms(DAY, time(12, 30)) == [
+            FreeRoom(MAIN, "101", time(14)),
+            FreeRoom(MAIN, "102", time(13)),
+            FreeRoom(MAIN, "103", None),
+        ]
+
+    def test_busy_at_interval_boundaries(self, occupancy: RoomOccupancy) -> None:
+        """Test a room is busy from its start and free again at its end."""
+        assert [r.room for r in occupancy.free_rooms(DAY, time(13))] == ["101", "103"]
+        assert [r.room for r in occupancy.free_rooms(DAY, time(15))] == ["102", "103"]
+
+    def test_overlapping_lessons_are_merged(self, occupancy: RoomOccupancy) -> None:
+        """Test overlapping lessons keep the room busy until the last one ends."""
+        assert "101" not in [r.room for r in occupancy.free_rooms(DAY, time(11, 30))]
+
+    def test_free_for_period(self, occupancy: RoomOccupancy) -> None:
+        """Test a period query excludes rooms busy during any part of it."""
+        assert [r.room for r in occupancy.free_rooms(DAY, time(12), time(14))] == ["101", "103"]
+        assert [r.room for r in occupancy.free_rooms(DAY, time(12), time(13, 30))] == [
+            "101",
+            "103",
+        ]
+
+    def test_address_filter(self, occupancy: RoomOccupancy) -> None:
+        """Test rooms can be limited to one building."""
+        assert occupancy.free_rooms(DAY, time(8), address="Другой адрес") == []
+
+    def test_dates_outside_window(self, occupancy: RoomOccupancy) -> None:
+        """Test dates outside the window are not covered."""
+        assert occupancy.covers(DAY)
+        assert not occupancy.covers(date(2024, 9, 9))
+        assert occupancy.free_rooms(date(2024, 9, 9), time(12)) == []
+
+    def test_room_schedule(self, occupancy: RoomOccupancy) -> None:
+        """Test a room timetable lists distinct lessons by start time."""
+        assert occupancy.room_schedule(DAY, MAIN, "101") == (
+            RoomSlot(time(9), time(11), "Анатомия"),
+            RoomSlot(time(10), time(12), "Физиология"),
+            RoomSlot(time(14), time(16), "Анатомия"),
+        )
+        assert occupancy.room_schedule(DAY, MAIN, "999") == ()
+
+    @pytest.mark.asyncio
+    async def test_load_queries_window(self) -> None:
+        """Test load reads the whole window with one repository call."""
+        lesson_repo = create_autospec(LessonRepository, instance=True)
+        lesson_repo.find_room_slots = AsyncMock(return_value=[_row("101", 9, 11)])
+
+        occupancy = await RoomOccupancy.load(lesson_repo, start_date=DAY, days=14)
+
+        lesson_repo.find_room_slots.assert_awaited_once_with(DAY, date(2024, 9, 15))
+        assert occupancy.covers(date(2024, 9, 15))
+        assert not occupancy.covers(date(2024, 9, 16))
+
+
+class TestRoomOccupancyStore:
+    """Tests for RoomOccupancyStore."""
+
+    def test_replace_swaps_snapshot(self, occupancy: RoomOccupancy) -> None:
+        """Test the store starts empty and serves the replaced snapshot."""
+        store = RoomOccupancyStore()
+        assert store.current.rooms == ()
+
+        store.replace(occupancy)
+
+        assert store.current is occupancy
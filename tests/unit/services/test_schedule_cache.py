@@ -0,0 +1,88 @@
+"""Unit tests for schedule cache."""
+
+from datetime import date, time
+
+import pytest
+
+from src.models.enums import LessonType
+from src.repositories.lesson_repo import LessonRow
+from src.services.schedule_cache import ScheduleCache
+from tests.unit.conftest import FakeClock
+
+
+@pytest.fixture
+def lesson_row() -> LessonRow:
+    """Create a lesson row."""
+    return LessonRow(
+        date=date(2024, 9, 2),
+        start_time=time(9, 0),
+        end_time=time(10, 30),
+        subject="Анатомия",
+        lesson_type=LessonType.LECTURE,
+        teacher=None,
+        room="101",
+    )
+
+
+class TestScheduleCache:
+    """Tests for ScheduleCache."""
+
+    def test_get_missing_returns_none(self, clock: FakeClock) -> None:
+        """Test get returns None for unknown keys."""
+        cache = ScheduleCache(ttl_seconds=60, clock=clock)
+
+        assert cache.get(1, date(2024, 9, 2), date(2024, 9, 2)) is None
+
+    def test_put_and_get(self, clock: FakeClock, lesson_row: LessonRow) -> None:
+        """Test stored rows are returned for the same key."""
+        cache = ScheduleCache(ttl_seconds=60, clock=clock)
+        day = date(2024, 9, 2)
+
+        cache.put(1, day, day, [lesson_row])
+
+        assert cache.get(1, day, day) == (lesson_row,)
+        assert (1, day, day) in cache
+        assert cache.get(2, day, day) is None
+
+    def test_empty_result_is_cached(self, clock: FakeClock) -> None:
+        """Test days without lessons are cached as empty tuples, not misses."""
+        cache = ScheduleCache(ttl_seconds=60, clock=clock)
+        day = date(2024, 9, 7)
+
+        cache.put(1, day, day, [])
+
+        assert cache.get(1, day, day) == ()
+
+    def test_entries_expire(self, clock: FakeClock, lesson_row: LessonRow) -> None:
+        """Test entries expire after TTL."""
+        cache = ScheduleCache(ttl_seconds=60, clock=clock)
+        day = date(2024, 9, 2)
+        cache.put(1, day, day, [lesson_row])
+
+        clock.now = 60.0
+
+        assert cache.get(1, day, day) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, clock: FakeClock) -> None:
+        """Test least recently used entry is evicted first."""
+        cache = ScheduleCache(ttl_seconds=60, max_entries=2, clock=clock)
+        d1, d2, d3 = date(2024, 9, 2), date(2024, 9, 3), date(2024, 9, 4)
+        cache.put(1, d1, d1, [])
+        cache.put(1, d2, d2, [])
+        cache.get(1, d1, d1)
+
+        cache.put(1, d3, d3, [])
+
+        assert cache.get(1, d1, d1) == ()
+        assert cache.get(1, d2, d2) is None
+        assert cache.get(1, d3, d3) == ()
+
+    def test_clear(self, clock: FakeClock) -> None:
+        """Test clear drops all entries."""
+        cache = ScheduleCache(ttl_seconds=60, clock=clock)
+        cache.put(1, date(2024, 9, 2), date(2024, 9, 2), [])
+
+        cache.clear()
+
+        assert len(cache) == 0
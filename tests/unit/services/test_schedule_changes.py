@@ -0,0 +1,198 @@
+"""Unit tests for schedule change sets and alerts."""
+
+from datetime import date, time
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.enums import LessonType
+from src.repositories.lesson_repo import LessonRow
+from src.repositories.user_repo import UserRepository
+from src.services.outbox import OutboxService
+from src.services.schedule_changes import (
+    CHANGE_ALERT_MAX_ENTRIES,
+    LessonChanges,
+    ScheduleAlertService,
+    diff_lessons,
+    render_changes,
+)
+
+DAY = date(2024, 9, 2)
+
+
+def _lesson(
+    start: time,
+    subject: str = "Анатомия",
+    room: str | None = "101",
+    teacher: str | None = None,
+    day: date = DAY,
+) -> LessonRow:
+    return LessonRow(day, start, time(start.hour + 1), subject, LessonType.LECTURE, teacher, room)
+
+
+@pytest.fixture
+def mock_user_repo() -> AsyncMock:
+    """Create mock UserRepository."""
+    return create_autospec(UserRepository, instance=True)
+
+
+@pytest.fixture
+def outbox_service() -> AsyncMock:
+    """Create mock OutboxService recording enqueued messages."""
+    service = create_autospec(OutboxService, instance=True)
+    service.enqueued = []
+
+    async def enqueue(messages) -> int:  # type: ignore[no-untyped-def]
+        messages = list(messages)
+        service.enqueued.extend(messages)
+        return len(messages)
+
+    service.enqueue = AsyncMock(side_effect=enqueue)
+    return service
+
+
+@pytest.fixture
+def alert_service(mock_user_repo: AsyncMock, outbox_service: AsyncMock) -> ScheduleAlertService:
+    """Create ScheduleAlertService with mocked dependencies."""
+    return ScheduleAlertService(
+        session=AsyncMock(spec=AsyncSession),
+        user_repo=mock_user_repo,
+        outbox_service=outbox_service,
+    )
+
+
+class TestDiffLessons:
+    """Tests for diff_lessons."""
+
+    def test_equal_sets_have_no_changes(self) -> None:
+        """Test identical lessons produce no change set."""
+        lessons = [_lesson(time(9, 0)), _lesson(time(11, 0), "Химия")]
+
+        assert diff_lessons(1, lessons, list(reversed(lessons))) is None
+
+    def test_pairs_same_slot_then_same_subject(self) -> None:
+        """Test modifications are matched by slot first, then by subject within a day."""
+        old = [
+            _lesson(time(9, 0)),
+            _lesson(time(11, 0), "Химия"),
+            _lesson(time(13, 0), "Физика"),
+        ]
+        new = [
+            _lesson(time(9, 0), teacher="Иванов И.И."),
+            _lesson(time(12, 0), "Химия"),
+            _lesson(time(15, 0), "Биология"),
+        ]
+
+        changes = diff_lessons(1, old, new)
+
+        assert changes is not None
+        assert changes.subgroup_id == 1
+        assert changes.added == [new[2]]
+        assert changes.removed == [old[2]]
+        assert changes.modified == [(old[0], new[0]), (old[1], new[1])]
+
+    def test_same_subject_on_another_day_is_not_a_move(self) -> None:
+        """Test a lesson is only paired with one of the same day."""
+        old = [_lesson(time(9, 0))]
+        new = [_lesson(time(9, 0), day=date(2024, 9, 3))]
+
+        changes = diff_lessons(1, old, new)
+
+        assert changes == LessonChanges(1, new, old, [])
+
+
+class TestRenderChanges:
+    """Tests for render_changes."""
+
+    def test_groups_entries_by_day(self) -> None:
+        """Test each kind of change is marked and listed under its day."""
+        changes = LessonChanges(
+            1,
+            added=[_lesson(time(15, 0), "Биология", day=date(2024, 9, 3))],
+            removed=[_lesson(time(13, 0), "Физика")],
+            modified=[(_lesson(time(9, 0)), _lesson(time(9, 0), room="202"))],
+        )
+
+        text = render_changes(changes)
+
+        assert text.startswith("🔄 <b>Изменения в расписании</b>")
+        assert text.count("<b>Понедельник · 02.09</b>") == 1
+        assert text.count("<b>Вторник · 03.09</b>") == 1
+        assert "➕ 🕒 15:00–16:00 — <b>Биология</b>" in text
+        assert "❌ <s>13:00–14:00 — Физика</s>" in text
+        assert "было: 🚪 101" in text
+        assert text.index("Анатомия") < text.index("Физика") < text.index("Биология")
+
+    def test_caps_listed_entries(self) -> None:
+        """Test entries past the cap are summed up in a closing line."""
+        added = [
+            _lesson(time(9, 0), f"Предмет {i}", day=date(2024, 9, 1 + i))
+            for i in range(CHANGE_ALERT_MAX_ENTRIES + 3)
+        ]
+
+        text = render_changes(LessonChanges(1, added, [], []))
+
+        assert text.count("➕") == CHANGE_ALERT_MAX_ENTRIES
+        assert text.endswith("…и ещё изменений: 3")
+
+
+class TestScheduleAlertService:
+    """Tests for ScheduleAlertService."""
+
+    @pytest.mark.asyncio
+    async def test_renders_once_per_subgroup_for_every_subscriber(
+        self,
+        alert_service: ScheduleAlertService,
+        mock_user_repo: AsyncMock,
+        outbox_service: AsyncMock,
+    ) -> None:
+        """Test subscribers come from one query and share their subgroup's alert."""
+        mock_user_repo.find_subscribers_by_subgroup = AsyncMock(return_value={1: [100, 101]})
+        changes = [
+            LessonChanges(1, [_lesson(time(9, 0))], [], []),
+            LessonChanges(2, [], [_lesson(time(9, 0))], []),
+        ]
+
+        assert await alert_service.notify(changes) == 2
+
+        mock_user_repo.find_subscribers_by_subgroup.assert_awaited_once_with([1, 2])
+        (first, second) = outbox_service.enqueued
+        assert first[1:] == (100, render_changes(changes[0]))
+        assert second[1:] == (101, render_changes(changes[0]))
+        assert first[0].startswith("changes:1:")
+        assert first[0].endswith(":100")
+        assert first[0].rsplit(":", 1)[0] == second[0].rsplit(":", 1)[0]
+
+    @pytest.mark.asyncio
+    async def test_same_changes_get_same_keys(
+        self,
+        alert_service: ScheduleAlertService,
+        mock_user_repo: AsyncMock,
+        outbox_service: AsyncMock,
+    ) -> None:
+        """Test a retried sync finding the same changes reuses the outbox keys."""
+        mock_user_repo.find_subscribers_by_subgroup = AsyncMock(return_value={1: [100]})
+        changes = [LessonChanges(1, [_lesson(time(9, 0))], [], [])]
+
+        await alert_service.notify(changes)
+        await alert_service.notify(changes)
+        await alert_service.notify([LessonChanges(1, [_lesson(time(11, 0))], [], [])])
+
+        keys = [key for key, _, _ in outbox_service.enqueued]
+        assert keys[0] == keys[1] != keys[2]
+
+    @pytest.mark.asyncio
+    async def test_without_changes_or_subscribers_enqueues_nothing(
+        self,
+        alert_service: ScheduleAlertService,
+        mock_user_repo: AsyncMock,
+        outbox_service: AsyncMock,
+    ) -> None:
+        """Test no query without changes and no enqueue without subscribers."""
+        assert await alert_service.notify([]) == 0
+        mock_user_repo.find_subscribers_by_subgroup.assert_not_called()
+
+        mock_user_repo.find_subscribers_by_subgroup = AsyncMock(return_value={})
+        assert await alert_service.notify([LessonChanges(1, [_lesson(time(9, 0))], [], [])]) == 0
+        outbox_service.enqueue.assert_not_called()
@@ -0,0 +1,144 @@
+"""Unit tests for schedule prefetcher."""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.schedule_cache import ScheduleCache
+from src.services.schedule_prefetcher import SchedulePrefetcher
+
+
+@pytest.fixture
+def cache() -> ScheduleCache:
+    """Create schedule cache."""
+    return ScheduleCache(ttl_seconds=60)
+
+
+@pytest.fixture
+def session_factory() -> MagicMock:
+    """Create session factory yielding a mock session."""
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+    factory.return_value.__aexit__ = AsyncMock(return_value=None)
+    return factory
+
+
+@pytest.fixture
+def repo_class():
+    """Patch LessonRepository used by background loads."""
+    with patch("src.services.schedule_prefetcher.LessonRepository") as repo_class:
+        repo = repo_class.return_value
+        repo.find_rows_for_subgroup_on_date = AsyncMock(return_value=[])
+        repo.find_rows_for_subgroup_in_range = AsyncMock(return_value=[])
+        yield repo_class
+
+
+class TestSchedulePrefetcher:
+    """Tests for SchedulePrefetcher."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("repo_class")
+    async def test_prefetch_days_forward_warms_cache(
+        self,
+        session_factory: MagicMock,
+        cache: ScheduleCache,
+    ) -> None:
+        """Test forward day navigation prefetches the following days."""
+        prefetcher = SchedulePrefetcher(session_factory, cache, depth=2)
+        anchor = date(2024, 9, 2)
+
+        started = prefetcher.prefetch(1, anchor, weekly=False, direction=1)
+        await prefetcher.join()
+
+        assert started == 2
+        assert prefetcher.pending == 0
+        for offset in (1, 2):
+            target = anchor + timedelta(days=offset)
+            assert cache.get(1, target, target) == ()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("repo_class")
+    async def test_prefetch_given_days(
+        self,
+        session_factory: MagicMock,
+        cache: ScheduleCache,
+    ) -> None:
+        """Test the given days are prefetched, e.g. the next days with lessons."""
+        prefetcher = SchedulePrefetcher(session_factory, cache)
+        days = [date(2024, 9, 4), date(2024, 9, 9)]
+
+        assert prefetcher.prefetch_days(1, days) == 2
+        await prefetcher.join()
+
+        for day in days:
+            assert cache.get(1, day, day) == ()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("repo_class")
+    async def test_prefetch_weeks_backward(
+        self,
+        session_factory: MagicMock,
+        cache: ScheduleCache,
+    ) -> None:
+        """Test backward week navigation prefetches previous week ranges."""
+        prefetcher = SchedulePrefetcher(session_factory, cache, depth=1)
+        anchor = date(2024, 9, 9)
+
+        prefetcher.prefetch(1, anchor, weekly=True, direction=-1)
+        await prefetcher.join()
+
+        assert cache.get(1, date(2024, 9, 2), date(2024, 9, 8)) == ()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("repo_class")
+    async def test_prefetch_skips_cached_anchors(
+        self,
+        session_factory: MagicMock,
+        cache: ScheduleCache,
+    ) -> None:
+        """Test anchors already in cache are not fetched again."""
+        prefetcher = SchedulePrefetcher(session_factory, cache, depth=2)
+        anchor = date(2024, 9, 2)
+        next_day = anchor + timedelta(days=1)
+        cache.put(1, next_day, next_day, [])
+
+        started = prefetcher.prefetch(1, anchor, weekly=False, direction=1)
+        await prefetcher.join()
+
+        assert started == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("repo_class")
+    async def test_prefetch_respects_max_pending(
+        self,
+        session_factory: MagicMock,
+        cache: ScheduleCache,
+    ) -> None:
+        """Test no more than max_pending prefetches are outstanding."""
+        prefetcher = SchedulePrefetcher(session_factory, cache, depth=5, max_pending=3)
+
+        started = prefetcher.prefetch(1, date(2024, 9, 2), weekly=False, direction=1)
+        started += prefetcher.prefetch(2, date(2024, 9, 2), weekly=False, direction=1)
+
+        assert started == 3
+        assert prefetcher.pending == 3
+        await prefetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_failure_is_logged(
+        self,
+        session_factory: MagicMock,
+        cache: ScheduleCache,
+        repo_class: MagicMock,
+    ) -> None:
+        """Test failed background loads do not propagate or poison the cache."""
+        repo_class.return_value.find_rows_for_subgroup_on_date = AsyncMock(
+            side_effect=RuntimeError("db down")
+        )
+        prefetcher = SchedulePrefetcher(session_factory, cache, depth=1)
+
+        prefetcher.prefetch(1, date(2024, 9, 2), weekly=False, direction=1)
+        await prefetcher.join()
+
+        assert len(cache) == 0
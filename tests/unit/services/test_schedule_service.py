@@ -1,13 +1,24 @@
 """Unit tests for schedule service."""
 
-from datetime import date, timedelta
+from datetime import date, time, timedelta
 from unittest.mock import AsyncMock, create_autospec
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.repositories.lesson_repo import LessonRepository
-from src.services.schedule_service import ScheduleService
+from src.models.enums import LessonType
+from src.repositories.lesson_repo import (
+    LessonRepository,
+    LessonRow,
+    RoomSlotRow,
+    TeacherLessonRow,
+)
+from src.repositories.subgroup_repo import SubgroupRow
+from src.services.group_catalog import GroupCatalog, GroupCatalogStore
+from src.services.lesson_dates import LessonDates, LessonDatesStore
+from src.services.room_occupancy import FreeRoom, RoomOccupancy, RoomOccupancyStore
+from src.services.schedule_cache import ScheduleCache
+from src.services.schedule_service import ScheduleService, TeacherLesson
 
 
 @pytest.fixture
@@ -40,11 +51,11 @@ class TestScheduleService:
         """Test get_schedule_for_date calls repository."""
         target_date = date(2024, 9, 1)
         mock_lessons = []
-        mock_lesson_repo.find_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
+        mock_lesson_repo.find_rows_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
 
         result = await schedule_service.get_schedule_for_date(1, target_date)
 
-        mock_lesson_repo.find_for_subgroup_on_date.assert_awaited_once_with(1, target_date)
+        mock_lesson_repo.find_rows_for_subgroup_on_date.assert_awaited_once_with(1, target_date)
         assert result == mock_lessons
 
     @pytest.mark.asyncio
@@ -56,12 +67,12 @@ class TestScheduleService:
         """Test get_schedule_for_week calls repository with correct date range."""
         week_start = date(2024, 9, 1)
         mock_lessons = []
-        mock_lesson_repo.find_for_subgroup_in_range = AsyncMock(return_value=mock_lessons)
+        mock_lesson_repo.find_rows_for_subgroup_in_range = AsyncMock(return_value=mock_lessons)
 
         result = await schedule_service.get_schedule_for_week(1, week_start)
 
         week_end = week_start + timedelta(days=6)
-        mock_lesson_repo.find_for_subgroup_in_range.assert_awaited_once_with(
+        mock_lesson_repo.find_rows_for_subgroup_in_range.assert_awaited_once_with(
             1, week_start, week_end
         )
         assert result == mock_lessons
@@ -74,12 +85,12 @@ class TestScheduleService:
     ) -> None:
         """Test get_today_schedule retrieves today's schedule."""
         mock_lessons = []
-        mock_lesson_repo.find_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
+        mock_lesson_repo.find_rows_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
 
         result = await schedule_service.get_today_schedule(1)
 
-        mock_lesson_repo.find_for_subgroup_on_date.assert_awaited_once()
-        call_args = mock_lesson_repo.find_for_subgroup_on_date.call_args
+        mock_lesson_repo.find_rows_for_subgroup_on_date.assert_awaited_once()
+        call_args = mock_lesson_repo.find_rows_for_subgroup_on_date.call_args
         assert call_args[0][0] == 1
         assert isinstance(call_args[0][1], date)
 
@@ -91,12 +102,12 @@ class TestScheduleService:
     ) -> None:
         """Test get_tomorrow_schedule retrieves tomorrow's schedule."""
         mock_lessons = []
-        mock_lesson_repo.find_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
+        mock_lesson_repo.find_rows_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
 
         result = await schedule_service.get_tomorrow_schedule(1)
 
-        mock_lesson_repo.find_for_subgroup_on_date.assert_awaited_once()
-        call_args = mock_lesson_repo.find_for_subgroup_on_date.call_args
+        mock_lesson_repo.find_rows_for_subgroup_on_date.assert_awaited_once()
+        call_args = mock_lesson_repo.find_rows_for_subgroup_on_date.call_args
         assert call_args[0][0] == 1
 
     @pytest.mark.asyncio
@@ -109,12 +120,12 @@ class TestScheduleService:
         date1 = date(2024, 9, 1)
         date2 = date(2024, 9, 2)
         mock_lessons = []
-        mock_lesson_repo.find_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
+        mock_lesson_repo.find_rows_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
 
         await schedule_service.get_schedule_for_date(1, date1)
         await schedule_service.get_schedule_for_date(1, date2)
 
-        assert mock_lesson_repo.find_for_subgroup_on_date.await_count == 2
+        assert mock_lesson_repo.find_rows_for_subgroup_on_date.await_count == 2
 
     @pytest.mark.asyncio
     async def test_get_schedule_for_different_subgroups(
@@ -125,11 +136,216 @@ class TestScheduleService:
         """Test getting schedule for different subgroups."""
         target_date = date(2024, 9, 1)
         mock_lessons = []
-        mock_lesson_repo.find_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
+        mock_lesson_repo.find_rows_for_subgroup_on_date = AsyncMock(return_value=mock_lessons)
 
         await schedule_service.get_schedule_for_date(1, target_date)
         await schedule_service.get_schedule_for_date(2, target_date)
 
-        calls = mock_lesson_repo.find_for_subgroup_on_date.await_args_list
+        calls = mock_lesson_repo.find_rows_for_subgroup_on_date.await_args_list
         assert calls[0][0][0] == 1
         assert calls[1][0][0] == 2
+
+
+class TestScheduleServiceCache:
+    """Tests for ScheduleService read-through caching."""
+
+    @pytest.mark.asyncio
+    async def test_get_schedule_for_date_uses_cache(
+        self,
+        mock_session: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test repeated day lookups hit the repository once."""
+        service = ScheduleService(
+            session=mock_session,
+            lesson_repo=mock_lesson_repo,
+            cache=ScheduleCache(ttl_seconds=60),
+        )
+        target_date = date(2024, 9, 2)
+        mock_lesson_repo.find_rows_for_subgroup_on_date = AsyncMock(return_value=[])
+
+        await service.get_schedule_for_date(1, target_date)
+        result = await service.get_schedule_for_date(1, target_date)
+
+        mock_lesson_repo.find_rows_for_subgroup_on_date.assert_awaited_once_with(1, target_date)
+        assert result == ()
+
+    @pytest.mark.asyncio
+    async def test_get_schedule_for_week_served_from_cache(
+        self,
+        mock_session: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test week lookups are served from a warm cache without DB access."""
+        cache = ScheduleCache(ttl_seconds=60)
+        week_start = date(2024, 9, 2)
+        cache.put(1, week_start, week_start + timedelta(days=6), [])
+        service = ScheduleService(session=mock_session, lesson_repo=mock_lesson_repo, cache=cache)
+        mock_lesson_repo.find_rows_for_subgroup_in_range = AsyncMock(return_value=[])
+
+        await service.get_schedule_for_week(1, week_start)
+
+        mock_lesson_repo.find_rows_for_subgroup_in_range.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_schedules_for_date_fetches_misses_together(
+        self,
+        mock_session: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test subgroups missing from the cache are read with one query and cached."""
+        cache = ScheduleCache(ttl_seconds=60)
+        target_date = date(2024, 9, 2)
+        cache.put(1, target_date, target_date, [])
+        service = ScheduleService(session=mock_session, lesson_repo=mock_lesson_repo, cache=cache)
+        row = LessonRow(
+            target_date, time(9), time(10, 30), "Анатомия", LessonType.LECTURE, None, None
+        )
+        mock_lesson_repo.find_rows_for_subgroups_on_date = AsyncMock(return_value={2: [row]})
+
+        result = await service.get_schedules_for_date([1, 2, 3], target_date)
+
+        mock_lesson_repo.find_rows_for_subgroups_on_date.assert_awaited_once_with(
+            [2, 3], target_date
+        )
+        assert result == {1: (), 2: [row], 3: []}
+        assert cache.get(2, target_date, target_date) == (row,)
+        assert cache.get(3, target_date, target_date) == ()
+
+
+class TestTeacherSchedule:
+    """Tests for teacher timetable lookups."""
+
+    @pytest.fixture
+    def service(self, mock_session: AsyncMock, mock_lesson_repo: AsyncMock) -> ScheduleService:
+        """Create ScheduleService with a catalog of subgroups and teachers."""
+        catalog = GroupCatalog(
+            subgroups=[SubgroupRow(1, 10, "101А"), SubgroupRow(2, 10, "101Б")],
+            teachers=[("иванов и и", "Иванов И.И.")],
+        )
+        return ScheduleService(
+            session=mock_session,
+            lesson_repo=mock_lesson_repo,
+            catalog_store=GroupCatalogStore(catalog),
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_teachers(self, service: ScheduleService) -> None:
+        """Test teachers are looked up in the catalog."""
+        assert await service.find_teachers("иванов") == [("иванов и и", "Иванов И.И.")]
+
+    @pytest.mark.asyncio
+    async def test_merges_subgroups_of_one_lesson(
+        self,
+        service: ScheduleService,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a lesson taught to several subgroups is returned once."""
+        day = date(2024, 9, 2)
+        lecture = (day, time(9, 0), time(10, 30), "Анатомия", LessonType.LECTURE, "1")
+        seminar = (day, time(11, 0), time(12, 30), "Анатомия", LessonType.SEMINAR, "2")
+        mock_lesson_repo.find_rows_for_teacher_in_range = AsyncMock(
+            return_value=[
+                TeacherLessonRow(*lecture, subgroup_id=2),
+                TeacherLessonRow(*lecture, subgroup_id=1),
+                TeacherLessonRow(*seminar, subgroup_id=2),
+            ]
+        )
+
+        result = await service.get_teacher_schedule_for_date("иванов и и", day)
+
+        mock_lesson_repo.find_rows_for_teacher_in_range.assert_awaited_once_with(
+            "иванов и и", day, day
+        )
+        assert result == [
+            TeacherLesson(*lecture, subgroups=("101А", "101Б")),
+            TeacherLesson(*seminar, subgroups=("101Б",)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_week_range(self, service: ScheduleService, mock_lesson_repo: AsyncMock) -> None:
+        """Test week lookups query seven days in one call."""
+        week_start = date(2024, 9, 2)
+        mock_lesson_repo.find_rows_for_teacher_in_range = AsyncMock(return_value=[])
+
+        assert await service.get_teacher_schedule_for_week("иванов и и", week_start) == []
+        mock_lesson_repo.find_rows_for_teacher_in_range.assert_awaited_once_with(
+            "иванов и и", week_start, week_start + timedelta(days=6)
+        )
+
+
+class TestRoomLookups:
+    """Tests for free-room and room timetable lookups."""
+
+    @pytest.fixture
+    def service(self, mock_session: AsyncMock, mock_lesson_repo: AsyncMock) -> ScheduleService:
+        """Create ScheduleService with a one-week room occupancy snapshot."""
+        occupancy = RoomOccupancy(
+            [RoomSlotRow(date(2024, 9, 2), "Корпус 1", "101", time(9), time(11), "Анатомия")],
+            start_date=date(2024, 9, 2),
+            days=7,
+        )
+        return ScheduleService(
+            session=mock_session,
+            lesson_repo=mock_lesson_repo,
+            room_store=RoomOccupancyStore(occupancy),
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_free_rooms(
+        self,
+        service: ScheduleService,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test free rooms are answered from memory."""
+        result = await service.find_free_rooms(date(2024, 9, 2), time(8))
+
+        assert result == [FreeRoom("Корпус 1", "101", time(9))]
+        assert not mock_lesson_repo.mock_calls
+
+    @pytest.mark.asyncio
+    async def test_dates_outside_window_are_unknown(self, service: ScheduleService) -> None:
+        """Test lookups outside the occupancy window return None, not free."""
+        assert await service.find_free_rooms(date(2024, 10, 1), time(8)) is None
+        assert await service.get_room_schedule(date(2024, 10, 1), "Корпус 1", "101") is None
+
+    @pytest.mark.asyncio
+    async def test_get_room_schedule(self, service: ScheduleService) -> None:
+        """Test a room timetable is served from the snapshot."""
+        result = await service.get_room_schedule(date(2024, 9, 2), "Корпус 1", "101")
+
+        assert [slot.subject for slot in result or ()] == ["Анатомия"]
+
+
+class TestLessonDayNavigation:
+    """Tests for jumping between days with lessons."""
+
+    @pytest.fixture
+    def service(self, mock_session: AsyncMock, mock_lesson_repo: AsyncMock) -> ScheduleService:
+        """Create ScheduleService with lessons on Friday and the next Monday."""
+        lesson_dates = LessonDates(
+            [(1, date(2024, 9, 6)), (1, date(2024, 9, 9))], start_date=date(2024, 9, 1)
+        )
+        return ScheduleService(
+            session=mock_session,
+            lesson_repo=mock_lesson_repo,
+            lesson_dates_store=LessonDatesStore(lesson_dates),
+        )
+
+    def test_jumps_over_days_without_lessons(
+        self, service: ScheduleService, mock_lesson_repo: AsyncMock
+    ) -> None:
+        """Test the weekend is skipped in both directions without a query."""
+        assert service.find_lesson_day(1, date(2024, 9, 6), 1) == date(2024, 9, 9)
+        assert service.find_lesson_day(1, date(2024, 9, 9), -1) == date(2024, 9, 6)
+        assert not mock_lesson_repo.mock_calls
+
+    def test_no_later_lessons(self, service: ScheduleService) -> None:
+        """Test there is nowhere to go after the last lesson day."""
+        assert service.find_lesson_day(1, date(2024, 9, 9), 1) is None
+
+    def test_falls_back_to_adjacent_day(self, service: ScheduleService) -> None:
+        """Test unknown subgroups and dates before the index step one day."""
+        assert service.find_lesson_day(2, date(2024, 9, 6), 1) == date(2024, 9, 7)
+        assert service.find_lesson_day(1, date(2024, 8, 20), -1) == date(2024, 8, 19)
+        assert service.find_lesson_day(1, date(2024, 9, 6), -1) == date(2024, 9, 5)
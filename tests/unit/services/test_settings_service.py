@@ -1,12 +1,15 @@
 """Unit tests for settings service."""
 
-from datetime import time
+from datetime import date, time
 from unittest.mock import AsyncMock, create_autospec
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.user import User
 from src.repositories.user_repo import UserRepository
+from src.services.lesson_reminders import ReminderSchedule
+from src.services.notification_wheel import NotificationWheel
 from src.services.settings_service import SettingsService
 
 
@@ -157,3 +160,201 @@ class TestSettingsService:
         result = await settings_service.get_users_for_notification_batch(time(8, 0))
 
         assert isinstance(result, (list, tuple))
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_users(
+        self,
+        settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test unsubscribe_users turns off many users with one update."""
+        mock_user_repo.unsubscribe_many = AsyncMock(return_value=2)
+
+        result = await settings_service.unsubscribe_users([1, 2, 3])
+
+        mock_user_repo.unsubscribe_many.assert_awaited_once_with([1, 2, 3])
+        mock_session.commit.assert_awaited_once()
+        assert result == 2
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_users_empty(
+        self,
+        settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test unsubscribe_users with no users touches nothing."""
+        assert await settings_service.unsubscribe_users([]) == 0
+
+        mock_user_repo.unsubscribe_many.assert_not_called()
+        mock_session.commit.assert_not_called()
+
+
+@pytest.fixture
+def wheel() -> NotificationWheel:
+    """Create a NotificationWheel with one subscriber at 07:00."""
+    wheel = NotificationWheel()
+    wheel.schedule(12345, time(7, 0), 1)
+    return wheel
+
+
+@pytest.fixture
+def wheel_settings_service(
+    mock_session: AsyncMock, mock_user_repo: AsyncMock, wheel: NotificationWheel
+) -> SettingsService:
+    """Create SettingsService that keeps a notification wheel up to date."""
+    return SettingsService(session=mock_session, user_repo=mock_user_repo, wheel=wheel)
+
+
+class TestSettingsServiceNotificationWheel:
+    """Tests for keeping the notification wheel in step with settings."""
+
+    @pytest.mark.asyncio
+    async def test_set_notification_time_moves_subscriber(
+        self,
+        wheel_settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        wheel: NotificationWheel,
+    ) -> None:
+        """Test a new time moves the subscriber to its minute slot."""
+        mock_user_repo.update_notification_time = AsyncMock(return_value=True)
+
+        await wheel_settings_service.set_notification_time(12345, time(8, 30))
+
+        assert wheel.due(time(7, 0)) == {}
+        assert wheel.due(time(8, 30)) == {12345: 1}
+
+    @pytest.mark.asyncio
+    async def test_toggle_off_unschedules(
+        self,
+        wheel_settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        wheel: NotificationWheel,
+    ) -> None:
+        """Test turning notifications off removes the subscriber."""
+        mock_user_repo.update_subscription = AsyncMock(return_value=True)
+
+        await wheel_settings_service.toggle_notifications(12345, is_subscribed=False)
+
+        assert 12345 not in wheel
+
+    @pytest.mark.asyncio
+    async def test_toggle_on_schedules_with_stored_settings(
+        self,
+        wheel_settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        wheel: NotificationWheel,
+    ) -> None:
+        """Test turning notifications on schedules the user at their saved time."""
+        mock_user_repo.update_subscription = AsyncMock(return_value=True)
+        mock_user_repo.find_by_id = AsyncMock(
+            return_value=User(telegram_id=777, notification_time=time(6, 45), subgroup_id=3)
+        )
+
+        await wheel_settings_service.toggle_notifications(777, is_subscribed=True)
+
+        assert wheel.due(time(6, 45)) == {777: 3}
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_users_unschedules(
+        self,
+        wheel_settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        wheel: NotificationWheel,
+    ) -> None:
+        """Test blocked users leave the wheel."""
+        mock_user_repo.unsubscribe_many = AsyncMock(return_value=1)
+
+        await wheel_settings_service.unsubscribe_users([12345])
+
+        assert len(wheel) == 0
+
+    @pytest.mark.asyncio
+    async def test_reconcile_loads_subscriptions(
+        self,
+        wheel_settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        wheel: NotificationWheel,
+    ) -> None:
+        """Test reconciliation rebuilds the wheel from one query."""
+        mock_user_repo.find_subscriptions = AsyncMock(
+            return_value=[(12345, time(7, 0), 1), (2, time(9, 0), 4)]
+        )
+
+        assert await wheel_settings_service.reconcile_notification_wheel() == 1
+
+        mock_user_repo.find_subscriptions.assert_awaited_once_with()
+        assert wheel.due(time(9, 0)) == {2: 4}
+
+    @pytest.mark.asyncio
+    async def test_reconcile_without_wheel(
+        self, settings_service: SettingsService, mock_user_repo: AsyncMock
+    ) -> None:
+        """Test reconciliation is a no-op when no wheel is attached."""
+        assert await settings_service.reconcile_notification_wheel() == 0
+        mock_user_repo.find_subscriptions.assert_not_called()
+
+
+class TestSettingsServiceReminders:
+    """Tests for lesson reminder settings."""
+
+    @pytest.fixture
+    def reminders(self) -> ReminderSchedule:
+        """Create a reminder heap built for subgroup 1 with a 15-minute lead."""
+        reminders = ReminderSchedule()
+        reminders.replace([], {}, [(1, 15)], date(2024, 9, 2), reminders.generation)
+        return reminders
+
+    @pytest.fixture
+    def reminder_settings_service(
+        self, mock_session: AsyncMock, mock_user_repo: AsyncMock, reminders: ReminderSchedule
+    ) -> SettingsService:
+        """Create SettingsService that invalidates the reminder heap."""
+        mock_user_repo.update_reminder = AsyncMock(return_value=True)
+        return SettingsService(session=mock_session, user_repo=mock_user_repo, reminders=reminders)
+
+    @pytest.mark.asyncio
+    async def test_new_lead_time_invalidates_heap(
+        self,
+        reminder_settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        mock_session: AsyncMock,
+        reminders: ReminderSchedule,
+    ) -> None:
+        """Test a lead time the heap has no events for triggers a rebuild."""
+        mock_user_repo.find_by_id = AsyncMock(return_value=User(telegram_id=1, subgroup_id=1))
+
+        assert await reminder_settings_service.set_reminder(1, 30) is True
+
+        mock_user_repo.update_reminder.assert_awaited_once_with(1, 30)
+        mock_session.commit.assert_awaited_once()
+        assert reminders.is_stale(date(2024, 9, 2))
+
+    @pytest.mark.asyncio
+    async def test_covered_lead_time_keeps_heap(
+        self,
+        reminder_settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        reminders: ReminderSchedule,
+    ) -> None:
+        """Test joining an already scheduled lead time needs no rebuild."""
+        mock_user_repo.find_by_id = AsyncMock(return_value=User(telegram_id=1, subgroup_id=1))
+
+        await reminder_settings_service.set_reminder(1, 15)
+
+        assert not reminders.is_stale(date(2024, 9, 2))
+
+    @pytest.mark.asyncio
+    async def test_turning_off_needs_no_lookup(
+        self,
+        reminder_settings_service: SettingsService,
+        mock_user_repo: AsyncMock,
+        reminders: ReminderSchedule,
+    ) -> None:
+        """Test recipients read at fire time make turning off free."""
+        await reminder_settings_service.set_reminder(1, None)
+
+        mock_user_repo.update_reminder.assert_awaited_once_with(1, None)
+        mock_user_repo.find_by_id.assert_not_called()
+        assert not reminders.is_stale(date(2024, 9, 2))
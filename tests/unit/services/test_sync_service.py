@@ -1,17 +1,53 @@
 """Unit tests for sync service."""
 
-from unittest.mock import AsyncMock, create_autospec
+from datetime import date, time, timedelta
+from unittest.mock import AsyncMock, create_autospec, patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.client import ScheduleAPIClient
-from src.repositories.group_repo import GroupRepository
-from src.repositories.lesson_repo import LessonRepository
-from src.repositories.speciality_repo import SpecialityRepository
-from src.repositories.subgroup_repo import SubgroupRepository
+from src.core.schedule_parser import ParsedGroupSchedule, ParsedLesson, ParsedSchedule
+from src.models.enums import LessonType
+from src.repositories.group_repo import GroupRepository, GroupRow
+from src.repositories.lesson_repo import LessonRepository, LessonRow, RoomSlotRow
+from src.repositories.speciality_repo import SpecialityRepository, SpecialityRow
+from src.repositories.subgroup_repo import SubgroupRepository, SubgroupRow
 from src.services.exceptions import SyncError
-from src.services.sync_service import SyncService
+from src.services.group_catalog import GroupCatalogStore
+from src.services.lesson_dates import LessonDatesStore
+from src.services.lesson_reminders import ReminderSchedule
+from src.services.room_occupancy import RoomOccupancyStore
+from src.services.schedule_cache import ScheduleCache
+from src.services.schedule_changes import (
+    LessonSnapshot,
+    LessonSnapshots,
+    ScheduleAlertService,
+)
+from src.services.schedule_versions import ScheduleVersions
+from src.services.sync_service import SyncService, lesson_fingerprint
+
+TODAY = date.today()
+
+
+def _parsed(
+    start: time, subject: str = "Анатомия", room: str = "101", day: date = TODAY
+) -> ParsedLesson:
+    return ParsedLesson(
+        subject, LessonType.LECTURE, day, start, time(start.hour + 1), None, None, room
+    )
+
+
+def _row(lesson: ParsedLesson) -> LessonRow:
+    return LessonRow(
+        lesson.date,
+        lesson.start_time,
+        lesson.end_time,
+        lesson.subject,
+        lesson.lesson_type,
+        lesson.teacher,
+        lesson.room,
+    )
 
 
 @pytest.fixture
@@ -135,3 +171,475 @@ class TestSyncService:
 
         with pytest.raises(SyncError):
             await sync_service.sync_all_schedules()
+
+    @pytest.mark.asyncio
+    async def test_sync_all_schedules_replaces_group_catalog(
+        self,
+        mock_session: AsyncMock,
+        mock_api_client: AsyncMock,
+        mock_speciality_repo: AsyncMock,
+        mock_group_repo: AsyncMock,
+        mock_subgroup_repo: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a full sync rebuilds the group catalog snapshot."""
+        store = GroupCatalogStore()
+        previous = store.current
+        sync_service = SyncService(
+            session=mock_session,
+            api_client=mock_api_client,
+            speciality_repo=mock_speciality_repo,
+            group_repo=mock_group_repo,
+            subgroup_repo=mock_subgroup_repo,
+            lesson_repo=mock_lesson_repo,
+            catalog_store=store,
+        )
+        mock_api_client.get_all_schedules = AsyncMock(return_value=[])
+        mock_speciality_repo.find_all_rows = AsyncMock(
+            return_value=[SpecialityRow(1, "31.05.01", "Лечебное дело", "ЛД")]
+        )
+        mock_group_repo.find_all_rows = AsyncMock(return_value=[GroupRow(10, 1, 2, "А", "203")])
+        mock_subgroup_repo.find_all_rows = AsyncMock(return_value=[SubgroupRow(100, 10, "203А")])
+        mock_lesson_repo.find_teachers = AsyncMock(return_value=[])
+
+        await sync_service.sync_all_schedules()
+
+        assert store.current is not previous
+        assert store.current.subgroups(10) == (SubgroupRow(100, 10, "203А"),)
+
+    @pytest.mark.asyncio
+    async def test_refresh_room_occupancy_replaces_snapshot(
+        self,
+        mock_session: AsyncMock,
+        mock_api_client: AsyncMock,
+        mock_speciality_repo: AsyncMock,
+        mock_group_repo: AsyncMock,
+        mock_subgroup_repo: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test room occupancy is rebuilt from the lesson repository."""
+        store = RoomOccupancyStore()
+        sync_service = SyncService(
+            session=mock_session,
+            api_client=mock_api_client,
+            speciality_repo=mock_speciality_repo,
+            group_repo=mock_group_repo,
+            subgroup_repo=mock_subgroup_repo,
+            lesson_repo=mock_lesson_repo,
+            room_store=store,
+        )
+        mock_lesson_repo.find_room_slots = AsyncMock(
+            return_value=[RoomSlotRow(date.today(), "Корпус 1", "101", time(9), time(11), "А")]
+        )
+
+        await sync_service.refresh_room_occupancy()
+
+        assert store.current.rooms == (("Корпус 1", "101"),)
+        mock_lesson_repo.find_room_slots.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_lesson_dates_replaces_snapshot(
+        self,
+        mock_session: AsyncMock,
+        mock_api_client: AsyncMock,
+        mock_speciality_repo: AsyncMock,
+        mock_group_repo: AsyncMock,
+        mock_subgroup_repo: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test the lesson-date index is rebuilt from the lesson repository."""
+        store = LessonDatesStore()
+        sync_service = SyncService(
+            session=mock_session,
+            api_client=mock_api_client,
+            speciality_repo=mock_speciality_repo,
+            group_repo=mock_group_repo,
+            subgroup_repo=mock_subgroup_repo,
+            lesson_repo=mock_lesson_repo,
+            lesson_dates_store=store,
+        )
+        mock_lesson_repo.find_lesson_dates = AsyncMock(return_value=[(100, date.today())])
+
+        await sync_service.refresh_lesson_dates()
+
+        assert store.current.covers(100, date.today())
+        mock_lesson_repo.find_lesson_dates.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_catalog_without_store_is_noop(
+        self,
+        sync_service: SyncService,
+        mock_speciality_repo: AsyncMock,
+    ) -> None:
+        """Test refresh_catalog skips loading when no store is configured."""
+        await sync_service.refresh_catalog()
+
+        mock_speciality_repo.find_all_rows.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_sync_single_schedule_clears_schedule_cache(
+        self,
+        mock_session: AsyncMock,
+        mock_api_client: AsyncMock,
+        mock_speciality_repo: AsyncMock,
+        mock_group_repo: AsyncMock,
+        mock_subgroup_repo: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a successful sync invalidates cached schedule views."""
+        cache = ScheduleCache(ttl_seconds=60)
+        cache.put(1, date(2024, 9, 2), date(2024, 9, 2), [])
+        sync_service = SyncService(
+            session=mock_session,
+            api_client=mock_api_client,
+            speciality_repo=mock_speciality_repo,
+            group_repo=mock_group_repo,
+            subgroup_repo=mock_subgroup_repo,
+            lesson_repo=mock_lesson_repo,
+            schedule_cache=cache,
+        )
+        mock_api_client.get_schedule_details = AsyncMock(return_value=AsyncMock())
+
+        with patch(
+            "src.services.sync_service.ScheduleParser.parse",
+            return_value=ParsedSchedule(groups=[]),
+        ):
+            await sync_service.sync_single_schedule(1)
+
+        mock_session.commit.assert_awaited_once()
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_sync_single_schedule_invalidates_reminders(
+        self,
+        mock_session: AsyncMock,
+        mock_api_client: AsyncMock,
+        mock_speciality_repo: AsyncMock,
+        mock_group_repo: AsyncMock,
+        mock_subgroup_repo: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a successful sync marks the reminder heap for a rebuild."""
+        reminders = ReminderSchedule()
+        reminders.replace([], {}, [], date(2024, 9, 2), reminders.generation)
+        sync_service = SyncService(
+            session=mock_session,
+            api_client=mock_api_client,
+            speciality_repo=mock_speciality_repo,
+            group_repo=mock_group_repo,
+            subgroup_repo=mock_subgroup_repo,
+            lesson_repo=mock_lesson_repo,
+            reminder_schedule=reminders,
+        )
+        mock_api_client.get_schedule_details = AsyncMock(return_value=AsyncMock())
+
+        with patch(
+            "src.services.sync_service.ScheduleParser.parse",
+            return_value=ParsedSchedule(groups=[]),
+        ):
+            await sync_service.sync_single_schedule(1)
+
+        assert reminders.is_stale(date(2024, 9, 2))
+
+    @pytest.mark.asyncio
+    async def test_sync_single_schedule_records_versions_after_commit(
+        self,
+        mock_session: AsyncMock,
+        mock_api_client: AsyncMock,
+        mock_speciality_repo: AsyncMock,
+        mock_group_repo: AsyncMock,
+        mock_subgroup_repo: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test subgroup generations advance only for committed, changed lessons."""
+        versions = ScheduleVersions()
+        sync_service = SyncService(
+            session=mock_session,
+            api_client=mock_api_client,
+            speciality_repo=mock_speciality_repo,
+            group_repo=mock_group_repo,
+            subgroup_repo=mock_subgroup_repo,
+            lesson_repo=mock_lesson_repo,
+            schedule_versions=versions,
+        )
+        mock_api_client.get_schedule_details = AsyncMock(return_value=AsyncMock())
+        persist = AsyncMock(return_value={7: frozenset()})
+
+        with (
+            patch(
+                "src.services.sync_service.ScheduleParser.parse",
+                return_value=ParsedSchedule(groups=[]),
+            ),
+            patch.object(sync_service, "_persist_schedule", persist),
+        ):
+            await sync_service.sync_single_schedule(1)
+            await sync_service.sync_single_schedule(1)
+            assert versions.get(7).generation == 1
+
+            # Another schedule feeding subgroup 7 doesn't undo schedule 1's fingerprint
+            persist.return_value = {7: frozenset({_parsed(time(11, 0))})}
+            await sync_service.sync_single_schedule(2)
+            persist.return_value = {7: frozenset()}
+            await sync_service.sync_single_schedule(1)
+            assert versions.get(7).generation == 2
+
+            mock_session.commit.side_effect = RuntimeError("commit failed")
+            persist.return_value = {7: frozenset({_parsed(time(9, 0))})}
+            with pytest.raises(SyncError):
+                await sync_service.sync_single_schedule(1)
+
+        assert versions.get(7).generation == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_single_schedule_ensures_partitions_first(
+        self,
+        sync_service: SyncService,
+        mock_api_client: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test lesson partitions are created before any lessons are written."""
+        lesson = ParsedLesson(
+            subject="Анатомия",
+            lesson_type=LessonType.LECTURE,
+            date=date(2024, 9, 2),
+            start_time=time(9, 0),
+            end_time=time(10, 30),
+            teacher=None,
+            address=None,
+            room=None,
+        )
+        group = ParsedGroupSchedule(
+            speciality_code="31.05.01",
+            speciality_full_name="31.05.01 Лечебное дело",
+            speciality_clean_name="Лечебное дело",
+            speciality_level=None,
+            course_number=1,
+            stream="А",
+            group_name="101",
+            subgroup_name="101А",
+            lessons=[lesson],
+        )
+        calls: list[str] = []
+        ensured: list[date] = []
+
+        async def ensure_partitions(dates) -> list[str]:
+            ensured.extend(dates)
+            calls.append("ensure")
+            return []
+
+        mock_lesson_repo.ensure_partitions = AsyncMock(side_effect=ensure_partitions)
+        mock_lesson_repo.bulk_upsert = AsyncMock(side_effect=lambda _data: calls.append("upsert"))
+
+        mock_api_client.get_schedule_details = AsyncMock(return_value=AsyncMock())
+
+        with patch(
+            "src.services.sync_service.ScheduleParser.parse",
+            return_value=ParsedSchedule(groups=[group]),
+        ):
+            await sync_service.sync_single_schedule(1)
+
+        assert calls == ["ensure", "upsert"]
+        assert ensured == [date(2024, 9, 2)]
+
+
+class TestSyncLessonChanges:
+    """Tests for the change sets a sync diffs against the lesson snapshots."""
+
+    @pytest.fixture
+    def snapshots(self) -> LessonSnapshots:
+        """Create LessonSnapshots holding schedule 1's lessons of subgroup 7."""
+        snapshots = LessonSnapshots()
+        end = TODAY + timedelta(days=14)
+        snapshots.put(
+            1,
+            7,
+            LessonSnapshot(
+                end,
+                frozenset(
+                    {
+                        _row(_parsed(time(9, 0))),
+                        _row(_parsed(time(11, 0), "Химия")),
+                        _row(_parsed(time(13, 0), "Физика")),
+                    }
+                ),
+            ),
+        )
+        return snapshots
+
+    @pytest.fixture
+    def alert_service(self) -> AsyncMock:
+        """Create mock ScheduleAlertService."""
+        return create_autospec(ScheduleAlertService, instance=True)
+
+    @pytest.fixture
+    def sync_service(
+        self,
+        sync_service: SyncService,
+        snapshots: LessonSnapshots,
+        alert_service: AsyncMock,
+    ) -> SyncService:
+        """Create SyncService diffing against the snapshots."""
+        sync_service.lesson_snapshots = snapshots
+        sync_service.alert_service = alert_service
+        return sync_service
+
+    async def _sync(
+        self, sync_service: SyncService, lessons: set[ParsedLesson], schedule_id: int = 1
+    ) -> None:
+        sync_service.api_client.get_schedule_details = AsyncMock(return_value=AsyncMock())
+        with (
+            patch(
+                "src.services.sync_service.ScheduleParser.parse",
+                return_value=ParsedSchedule(groups=[]),
+            ),
+            patch.object(
+                sync_service, "_persist_schedule", AsyncMock(return_value={7: frozenset(lessons)})
+            ),
+        ):
+            await sync_service.sync_single_schedule(schedule_id)
+
+    @pytest.mark.asyncio
+    async def test_alerts_and_deletes_stale_lessons(
+        self,
+        sync_service: SyncService,
+        snapshots: LessonSnapshots,
+        alert_service: AsyncMock,
+        mock_session: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a changed subgroup is alerted once and its gone lessons deleted."""
+        mock_lesson_repo.delete_by_keys = AsyncMock(return_value=2)
+        lessons = {
+            _parsed(time(9, 0), room="202"),
+            _parsed(time(12, 0), "Химия"),
+            _parsed(time(15, 0), "Биология"),
+            # Beyond the window: persisted, but neither compared nor kept
+            _parsed(time(9, 0), day=TODAY + timedelta(days=20)),
+        }
+
+        await self._sync(sync_service, lessons)
+
+        (changes,) = alert_service.notify.await_args.args
+        (subgroup_changes,) = changes
+        assert [lesson.subject for lesson in subgroup_changes.added] == ["Биология"]
+        assert [lesson.subject for lesson in subgroup_changes.removed] == ["Физика"]
+        assert [(old.room, new.room) for old, new in subgroup_changes.modified] == [
+            ("101", "202"),
+            ("101", "101"),
+        ]
+        (keys,) = mock_lesson_repo.delete_by_keys.await_args.args
+        assert sorted(keys) == [
+            (7, TODAY, time(11, 0), "Химия"),
+            (7, TODAY, time(13, 0), "Физика"),
+        ]
+        mock_session.commit.assert_awaited_once()
+        assert len(snapshots.get(1, 7).lessons) == 3
+
+    @pytest.mark.asyncio
+    async def test_unchanged_schedule_is_silent(
+        self,
+        sync_service: SyncService,
+        alert_service: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a sync matching the snapshot neither alerts nor deletes."""
+        await self._sync(
+            sync_service,
+            {_parsed(time(9, 0)), _parsed(time(11, 0), "Химия"), _parsed(time(13, 0), "Физика")},
+        )
+
+        alert_service.notify.assert_not_called()
+        mock_lesson_repo.delete_by_keys.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_feed_keeps_lessons(
+        self,
+        sync_service: SyncService,
+        snapshots: LessonSnapshots,
+        alert_service: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a subgroup parsed without lessons is treated as a glitch."""
+        await self._sync(sync_service, set())
+
+        alert_service.notify.assert_not_called()
+        mock_lesson_repo.delete_by_keys.assert_not_called()
+        assert len(snapshots.get(1, 7).lessons) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_alert_does_not_fail_sync(
+        self,
+        sync_service: SyncService,
+        alert_service: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test the committed sync survives an alert failure."""
+        mock_lesson_repo.delete_by_keys = AsyncMock(return_value=0)
+        alert_service.notify.side_effect = RuntimeError("outbox down")
+
+        await self._sync(sync_service, {_parsed(time(9, 0))})
+
+        alert_service.notify.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_other_schedules_lessons_are_kept(
+        self,
+        sync_service: SyncService,
+        snapshots: LessonSnapshots,
+        alert_service: AsyncMock,
+        mock_lesson_repo: AsyncMock,
+    ) -> None:
+        """Test a sync neither diffs nor deletes lessons another schedule feeds its subgroup."""
+        mock_lesson_repo.delete_by_keys = AsyncMock(return_value=1)
+        second = {_parsed(time(13, 0), "Физика"), _parsed(time(15, 0), "Биология")}
+
+        # Schedule 2's first sync only records its own baseline
+        await self._sync(sync_service, second, schedule_id=2)
+        alert_service.notify.assert_not_called()
+        mock_lesson_repo.delete_by_keys.assert_not_called()
+
+        # Schedule 1 drops Физика, which schedule 2 still produces
+        await self._sync(sync_service, {_parsed(time(9, 0)), _parsed(time(11, 0), "Химия")})
+
+        (changes,) = alert_service.notify.await_args.args
+        assert [lesson.subject for lesson in changes[0].removed] == ["Физика"]
+        mock_lesson_repo.delete_by_keys.assert_not_called()
+        assert len(snapshots.get(2, 7).lessons) == 2
+
+    @pytest.mark.asyncio
+    async def test_groups_sharing_a_subgroup_are_merged(
+        self,
+        sync_service: SyncService,
+        mock_speciality_repo: AsyncMock,
+        mock_group_repo: AsyncMock,
+        mock_subgroup_repo: AsyncMock,
+    ) -> None:
+        """Test lessons of every parsed group resolving to one subgroup are diffed together."""
+        mock_speciality_repo.upsert.return_value = SpecialityRow(1, "31.05.01", "ЛД", "ЛД")
+        mock_group_repo.upsert.return_value = GroupRow(1, 1, 1, "А", "103")
+        mock_subgroup_repo.upsert.return_value = SubgroupRow(7, 1, "103А")
+        # Two spellings of one speciality resolve to the same subgroup
+        groups = [
+            ParsedGroupSchedule("31.05.01", full_name, "ЛД", None, 1, "А", "103", "103А", lessons)
+            for full_name, lessons in (
+                ("31.05.01 ЛД", [_parsed(time(9, 0)), _parsed(time(11, 0), "Химия")]),
+                ("31.05.01  ЛД", [_parsed(time(13, 0), "Физика")]),
+            )
+        ]
+
+        lessons = await sync_service._persist_schedule(ParsedSchedule(groups))  # noqa: SLF001
+
+        assert lessons == {
+            7: frozenset(
+                {_parsed(time(9, 0)), _parsed(time(11, 0), "Химия"), _parsed(time(13, 0), "Физика")}
+            )
+        }
+
+
+def test_lesson_fingerprint_is_stable() -> None:
+    """Test the fingerprint ignores order and doesn't depend on the process's hash seed."""
+    lessons = [_parsed(time(9, 0)), _parsed(time(11, 0), "Химия", day=date(2024, 9, 2))]
+
+    assert lesson_fingerprint(lessons) == lesson_fingerprint(reversed(lessons))
+    assert lesson_fingerprint(lessons[:1]) != lesson_fingerprint(lessons)
+    assert lesson_fingerprint([lessons[1]]) == "58f1de124dc02c22"
@@ -1,5 +1,6 @@
 """Unit tests for user service."""
 
+from datetime import date, time
 from unittest.mock import AsyncMock, create_autospec
 
 import pytest
@@ -8,6 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.user import User
 from src.repositories.user_repo import UserRepository
 from src.services.exceptions import UserNotFoundError
+from src.services.lesson_reminders import ReminderSchedule
+from src.services.notification_wheel import NotificationWheel
 from src.services.user_service import UserService
 
 
@@ -161,3 +164,59 @@ class TestUserService:
             await user_service.set_user_subgroup(12345, 5)
 
         mock_session.rollback.assert_awaited_once()
+
+
+class TestUserServiceNotificationWheel:
+    """Tests for keeping the notification wheel in step with subgroup changes."""
+
+    @pytest.mark.asyncio
+    async def test_set_user_subgroup_moves_subscriber(
+        self, mock_session: AsyncMock, mock_user_repo: AsyncMock
+    ) -> None:
+        """Test a scheduled subscriber keeps their time under the new subgroup."""
+        wheel = NotificationWheel()
+        wheel.schedule(12345, time(7, 0), 1)
+        service = UserService(session=mock_session, user_repo=mock_user_repo, wheel=wheel)
+        mock_user_repo.update_subgroup = AsyncMock(return_value=True)
+
+        await service.set_user_subgroup(12345, 5)
+
+        assert wheel.due(time(7, 0)) == {12345: 5}
+        mock_user_repo.find_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_user_subgroup_schedules_waiting_subscriber(
+        self, mock_session: AsyncMock, mock_user_repo: AsyncMock
+    ) -> None:
+        """Test a subscriber without a subgroup joins the wheel once they pick one."""
+        wheel = NotificationWheel()
+        service = UserService(session=mock_session, user_repo=mock_user_repo, wheel=wheel)
+        mock_user_repo.update_subgroup = AsyncMock(return_value=True)
+        mock_user_repo.find_by_id = AsyncMock(
+            return_value=User(telegram_id=12345, is_subscribed=True, notification_time=time(8, 0))
+        )
+
+        await service.set_user_subgroup(12345, 5)
+
+        assert wheel.due(time(8, 0)) == {12345: 5}
+
+
+class TestUserServiceReminders:
+    """Tests for keeping the reminder heap in step with subgroup changes."""
+
+    @pytest.mark.asyncio
+    async def test_set_user_subgroup_invalidates_reminders(
+        self, mock_session: AsyncMock, mock_user_repo: AsyncMock
+    ) -> None:
+        """Test moving a user with reminders to a subgroup without their lead time."""
+        reminders = ReminderSchedule()
+        reminders.replace([], {}, [(1, 15)], date(2024, 9, 2), reminders.generation)
+        service = UserService(session=mock_session, user_repo=mock_user_repo, reminders=reminders)
+        mock_user_repo.update_subgroup = AsyncMock(return_value=True)
+        mock_user_repo.find_by_id = AsyncMock(
+            return_value=User(telegram_id=12345, subgroup_id=5, remind_before_minutes=15)
+        )
+
+        await service.set_user_subgroup(12345, 5)
+
+        assert reminders.is_stale(date(2024, 9, 2))